@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2014-2016 Stefan van den Akker <srvandenakker.dev@gmail.com>
+#
+# This file is part of Power Format Pack.
+#
+# Power Format Pack is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# Power Format Pack is distributed in the hope that it will be
+# useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General
+# Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Power Format Pack. If not, see http://www.gnu.org/licenses/.
+
+"""
+Convert the Markdown in the fields of many notes at once, without going
+through the editor.
+"""
+
+import time
+
+from aqt import mw
+from aqt.utils import askUser, getText, showInfo, tooltip
+from PyQt4 import QtGui, QtCore
+
+import utility
+import const
+import preferences
+
+
+def prepare_field(html):
+    """
+    Take the contents `html` of a field that contains Markdown syntax and
+    return a tuple with the Markdown to render and the escaped Markdown to
+    store in the field. Return `None` when the field is empty or already
+    contains Markdown data.
+    """
+    assert isinstance(html, unicode), "Input `html` is not Unicode"
+    if not html or const.START_HTML_MARKER in html:
+        return None
+    has_def_list = "<dl>" in html
+    if has_def_list:
+        html = utility.put_colons_in_html_def_list(html, put_breaks=True)
+    clean_md = utility.convert_html_to_markdown(html)
+    if has_def_list:
+        clean_md = utility.remove_leading_whitespace_from_dd_element(clean_md)
+    clean_md = utility.remove_whitespace_before_abbreviation_definition(
+            clean_md)
+    if not clean_md:
+        return None
+    return (clean_md, utility.escape_html_chars(clean_md))
+
+
+def finish_field(new_html, clean_md_escaped, unique_id):
+    """
+    Return the HTML `new_html` rendered from the Markdown of a field, ready
+    to be put back in that field.
+    """
+    # needed for proper display of images
+    if "<img" in new_html:
+        new_html = utility.unescape_html(new_html)
+    new_html = utility.align_html_elements(
+            new_html, preferences.PREFS.get(const.MARKDOWN_CODE_DIRECTION))
+    return utility.make_data_ready_to_insert(
+            unique_id, "True", clean_md_escaped, new_html)
+
+
+def convert_field_to_markdown(html, unique_id):
+    """
+    Take the contents `html` of a field that contains Markdown syntax and
+    return the rendered HTML with the Markdown data appended to it, like
+    the Markdown button does. Return `None` when the field is empty or
+    already contains Markdown data.
+    """
+    prepared = prepare_field(html)
+    if prepared is None:
+        return None
+    (clean_md, clean_md_escaped) = prepared
+    return finish_field(utility.convert_markdown_to_html(clean_md),
+                        clean_md_escaped, unique_id)
+
+
+class BatchMarkdown(object):
+    """
+    Convert the Markdown in all fields of the notes that match a search.
+    Nothing is written to the collection until all notes are converted, so
+    canceling leaves the collection untouched.
+    """
+
+    def __init__(self, browser):
+        self.browser    = browser
+        self.c          = utility.get_config()
+        self.canceled   = False
+
+    def run(self):
+        default_search = self.browser.form.searchEdit.lineEdit().text()
+        (search, ok) = getText(
+                self.c.label("batch_markdown_search_label"),
+                parent=self.browser,
+                default=default_search,
+                title=self.c.window_title("batch_markdown"))
+        if not ok:
+            return
+        note_ids = mw.col.findNotes(search)
+        if not note_ids:
+            tooltip(self.c.label("batch_markdown_no_notes_label"),
+                    parent=self.browser)
+            return
+
+        start_time = time.time()
+        notes = self.convert_notes(note_ids)
+        if self.canceled:
+            return
+
+        if notes:
+            mw.checkpoint(self.c.window_title("batch_markdown"))
+            mw.progress.start(immediate=True)
+            try:
+                for note in notes:
+                    note.flush()
+            finally:
+                mw.progress.finish()
+            self.browser.model.reset()
+            mw.requireReset()
+
+        tooltip(self.c.label("batch_markdown_done_label").format(
+                               len(notes), time.time() - start_time),
+                parent=self.browser)
+
+    def convert_notes(self, note_ids):
+        """
+        Convert the fields of the notes in `note_ids`, updating a cancelable
+        progress dialog after each chunk. The fields are read first, then
+        all Markdown is rendered in bulk with `utility.iter_render_many`.
+        Return a list with the notes that have been changed.
+        """
+        progress = QtGui.QProgressDialog(
+                self.c.label("batch_markdown_read_label"),
+                self.c.label("batch_markdown_cancel_label"),
+                0, len(note_ids), self.browser)
+        progress.setWindowTitle(self.c.window_title("batch_markdown"))
+        progress.setWindowModality(QtCore.Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.setValue(0)
+
+        try:
+            fields = self.read_fields(note_ids, progress)
+            if self.canceled:
+                return list()
+            return self.render_fields(fields, progress)
+        finally:
+            progress.close()
+
+    def update_progress(self, progress, value):
+        progress.setValue(value)
+        QtGui.QApplication.processEvents()
+        if progress.wasCanceled():
+            self.canceled = True
+        return self.canceled
+
+    def read_fields(self, note_ids, progress):
+        """
+        Return a list of tuples (note, index of field, Markdown, escaped
+        Markdown) for the fields of the notes in `note_ids` that contain
+        Markdown that has not been converted yet.
+        """
+        fields = list()
+        for start in xrange(0, len(note_ids), const.BATCH_CHUNK_SIZE):
+            for nid in note_ids[start:start + const.BATCH_CHUNK_SIZE]:
+                note = mw.col.getNote(nid)
+                for (index, html) in enumerate(note.fields):
+                    prepared = prepare_field(html)
+                    if prepared is not None:
+                        fields.append((note, index) + prepared)
+            if self.update_progress(progress, min(start + const.BATCH_CHUNK_SIZE,
+                                                  len(note_ids))):
+                break
+        return fields
+
+    def render_fields(self, fields, progress):
+        """
+        Render the Markdown of `fields` (see `read_fields`) and put the
+        result in the notes. Return a list with the notes that have been
+        changed.
+        """
+        progress.setLabelText(self.c.label("batch_markdown_progress_label"))
+        progress.setMaximum(len(fields))
+        progress.setValue(0)
+
+        changed_notes = list()
+        htmls = utility.iter_render_many([field[2] for field in fields])
+        try:
+            for (num, new_html) in enumerate(htmls, 1):
+                (note, index, _md, clean_md_escaped) = fields[num - 1]
+                unique_id = str(note.id) + "-{:03}".format(index)
+                note.fields[index] = finish_field(new_html, clean_md_escaped,
+                                                  unique_id)
+                if not changed_notes or changed_notes[-1] is not note:
+                    changed_notes.append(note)
+                if num % const.BATCH_CHUNK_SIZE == 0:
+                    if self.update_progress(progress, num):
+                        return list()
+        finally:
+            # stop the worker processes when canceled
+            htmls.close()
+
+        return changed_notes
+
+
+class MarkdownDataMigration(object):
+    """
+    Rewrite all Markdown data in the collection that is still stored in the
+    uncompressed format, and report how much space this saved.
+    """
+
+    def __init__(self, parent_window):
+        self.parent_window  = parent_window
+        self.c              = utility.get_config()
+
+    def run(self):
+        title = self.c.window_title("md_data_migration")
+        if not askUser(self.c.warning("md_data_migration_confirm"),
+                       parent=self.parent_window, title=title):
+            return
+
+        note_ids = mw.col.db.list("select id from notes where flds like ?",
+                                  u"%{}%".format(const.START_HTML_MARKER))
+        mw.checkpoint(title)
+        mw.progress.start(max=len(note_ids), immediate=True)
+        num_notes = size_before = size_after = 0
+        try:
+            for (num, nid) in enumerate(note_ids):
+                note = mw.col.getNote(nid)
+                new_fields = [utility.compress_md_data(html)
+                              for html in note.fields]
+                if new_fields != note.fields:
+                    size_before += sum(len(html) for html in note.fields)
+                    size_after += sum(len(html) for html in new_fields)
+                    note.fields = new_fields
+                    note.flush()
+                    num_notes += 1
+                if num % const.BATCH_CHUNK_SIZE == 0:
+                    mw.progress.update(value=num)
+        finally:
+            mw.progress.finish()
+        mw.reset()
+
+        saved = size_before - size_after
+        percentage = (100.0 * saved / size_before) if size_before else 0.0
+        showInfo(self.c.label("md_data_migration_done_label").format(
+                                num_notes, saved / 1024.0, percentage),
+                 parent=self.parent_window)
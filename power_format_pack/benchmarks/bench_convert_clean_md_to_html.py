@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare `utility.convert_clean_md_to_html` with the version that parses its
+output with BeautifulSoup, on stored Markdown of about 50 KB.
+
+Run from the root of the repository:
+
+    python -m power_format_pack.benchmarks.bench_convert_clean_md_to_html
+"""
+
+import sys
+import timeit
+if "/usr/share/anki/" not in sys.path:
+    sys.path.append("/usr/share/anki/")
+from power_format_pack import utility
+
+FIELD = u"""\
+# Heading
+
+Some *text* with a [link](http://example.com) & an ![image](a.jpg).
+
+| a | b |
+|:-:|--:|
+| 1 | 2 |
+
+    def fn(x):
+        return x < 1 and "yes" or 'no'
+
+Term
+: Definition
+
+Пицца и паста.[^1]
+
+[^1]: The note.
+
+
+"""
+SIZE = 50 * 1024
+REPEAT = 5
+
+
+def make_md(size=SIZE):
+    md = utility.escape_html_chars(FIELD)
+    return (md * (size // len(md) + 1))[:size]
+
+
+def main():
+    md = make_md()
+    for put_breaks in (False, True):
+        expected = utility._convert_clean_md_to_html_with_soup(md, put_breaks)
+        result = utility.convert_clean_md_to_html(md, put_breaks)
+        if expected != result:
+            print "Output differs (put_breaks={})".format(put_breaks)
+            return 1
+        old = min(timeit.repeat(
+                lambda: utility._convert_clean_md_to_html_with_soup(
+                    md, put_breaks), number=1, repeat=REPEAT))
+        new = min(timeit.repeat(
+                lambda: utility.convert_clean_md_to_html(md, put_breaks),
+                number=1, repeat=REPEAT))
+        print "put_breaks={}: {:.1f} ms -> {:.1f} ms ({:.0f}x faster)".format(
+                put_breaks, old * 1000, new * 1000, old / new)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
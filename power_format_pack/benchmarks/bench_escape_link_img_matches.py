@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare the escaping of Markdown links and images in
+`utility.escape_link_img_matches` with three calls to the old
+`replace_link_img_matches`, on a field with 200 images.
+
+Run from the root of the repository:
+
+    python -m power_format_pack.benchmarks.bench_escape_link_img_matches
+"""
+
+import re
+import sys
+import timeit
+if "/usr/share/anki/" not in sys.path:
+    sys.path.append("/usr/share/anki/")
+from power_format_pack import const
+from power_format_pack import utility
+
+NUM_IMAGES = 200
+REPEAT = 5
+SUBSTITUTIONS = ((re.compile(ur"\\\("), u"&#40;"),
+                 (re.compile(ur"\\\)"), u"&#41;"),
+                 (re.compile(ur"\s+"), u"&#32;"))
+
+
+def old_replace_link_img_matches(regex, new, s):
+    """
+    `utility.replace_link_img_matches` before it walked the string once.
+    """
+    positions1 = utility.get_indices(s, "`")
+    positions3 = utility.get_indices(s, "```")
+    utility.filter_indices(positions1, positions3)
+    positions_combined = filter(lambda x: x[0] > -1 and x[1] > -1,
+                                positions1 + positions3)
+    for match in re.finditer(const.IS_LINK_OR_IMG_REGEX, s):
+        skip = False
+        start_match, end_match = match.span()
+        for (start_code, end_code) in positions_combined:
+            if start_match >= start_code and end_match <= end_code:
+                skip = True
+                break
+        if not skip:
+            str_to_be_replaced = match.group(0)
+            start = s.find(str_to_be_replaced)
+            end = start + len(str_to_be_replaced)
+            s = s[:start] + re.sub(regex, new, str_to_be_replaced) + s[end:]
+    return s
+
+
+def old_escape(s):
+    for (regex, new) in SUBSTITUTIONS:
+        s = old_replace_link_img_matches(regex, new, s)
+    return s
+
+
+def make_md(num_images=NUM_IMAGES):
+    lines = list()
+    for i in xrange(num_images):
+        lines.append(u"Image {0} with `code {0}`:".format(i))
+        lines.append(u"![image {0}](paste \\({0}\\) image.jpg)".format(i))
+    return u"\n".join(lines)
+
+
+def main():
+    md = make_md()
+    expected = old_escape(md)
+    result = utility.escape_link_img_matches(md, SUBSTITUTIONS)
+    if expected != result:
+        print "Output differs"
+        return 1
+    old = min(timeit.repeat(lambda: old_escape(md), number=1, repeat=REPEAT))
+    new = min(timeit.repeat(
+            lambda: utility.escape_link_img_matches(md, SUBSTITUTIONS),
+            number=1, repeat=REPEAT))
+    print "{} images: {:.1f} ms -> {:.1f} ms ({:.0f}x faster)".format(
+            NUM_IMAGES, old * 1000, new * 1000, old / new)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
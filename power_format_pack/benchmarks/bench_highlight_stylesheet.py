@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""
+Time the rendering of a field with many small code blocks, with the
+stylesheet tables of `HtmlFormatter` shared between formatters ("after")
+and built again for every code block ("before").
+
+Run from the root of the repository:
+
+    python -m power_format_pack.benchmarks.bench_highlight_stylesheet
+"""
+
+import importlib
+import os
+import sys
+import timeit
+
+import headless
+headless.setup()
+
+from power_format_pack import utility
+
+# the codehilite extension imports Pygments as a top level package
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+html_formatter = importlib.import_module("pygments.formatters.html")
+
+NUM_BLOCKS = 100
+REPEAT = 5
+
+
+class NoCache(dict):
+    """
+    Cache that forgets everything, like the formatter before the cache.
+    """
+
+    def __setitem__(self, key, value):
+        pass
+
+
+def make_md(num_blocks=NUM_BLOCKS):
+    blocks = list()
+    for i in xrange(num_blocks):
+        blocks.append(u"Step {0}:\n\n```python\nx = f({0}) + 1  # add\n```"
+                      .format(i))
+    return u"\n\n".join(blocks)
+
+
+def render(md):
+    return utility.convert_markdown_to_html(md)
+
+
+def main():
+    md = make_md()
+    cache = html_formatter._stylesheet_cache
+    new_html = render(md)
+    html_formatter._stylesheet_cache = NoCache()
+    try:
+        old_html = render(md)
+        old = min(timeit.repeat(lambda: render(md), number=1, repeat=REPEAT))
+    finally:
+        html_formatter._stylesheet_cache = cache
+    if old_html != new_html:
+        print "Output differs"
+        return 1
+    new = min(timeit.repeat(lambda: render(md), number=1, repeat=REPEAT))
+    print "{} code blocks: {:.1f} ms -> {:.1f} ms ({:.0f}% faster)".format(
+            NUM_BLOCKS, old * 1000, new * 1000, 100 * (old - new) / old)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+"""
+Highlight a code block taken from this repository, as the add-on does,
+changing one of its lines back and forth: all of it again each time
+("before") and only the lines that changed ("after"). Print the time per
+highlight.
+
+Run from the root of the repository:
+
+    python -m power_format_pack.benchmarks.bench_incremental_highlight
+"""
+
+import codecs
+import importlib
+import os
+import sys
+import timeit
+
+# Pygments is imported as a top level package by the add-on
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+codehilite = importlib.import_module(
+        "power_format_pack.markdown.extensions.codehilite")
+
+SAMPLE = os.path.join(PACKAGE_DIR, "markdown", "extensions", "codehilite.py")
+STYLE = "tango"
+# where in the sample a line is changed
+POSITIONS = (0.1, 0.5, 0.9)
+REPEAT = 20
+
+
+def hilite(text, incremental):
+    return codehilite.CodeHilite(text, lang="python", style=STYLE,
+                                 noclasses=True,
+                                 incremental=incremental).hilite()
+
+
+def main():
+    with codecs.open(SAMPLE, encoding="utf8") as f:
+        lines = f.read().splitlines(True)
+    for position in POSITIONS:
+        index = int(len(lines) * position)
+        text = u"".join(lines)
+        edited = u"".join(lines[:index] + [u"x = 1  # edited\n"] +
+                          lines[index + 1:])
+        times = list()
+        for incremental in (False, True):
+            def run():
+                hilite(text, incremental)
+                return hilite(edited, incremental)
+            if run() != hilite(edited, False):
+                print "line {}: HTML differs".format(index + 1)
+                return 1
+            # two highlights, each after a change
+            times.append(min(timeit.repeat(run, number=1,
+                                           repeat=REPEAT)) / 2)
+        (old, new) = times
+        print "{} lines, line {:>3} changed: {:6.1f} ms -> {:6.1f} ms".format(
+                len(lines), index + 1, old * 1000, new * 1000)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""
+Time the lexing of large samples of source code taken from this
+repository, with the rules of each state tried one by one ("before") and
+combined into one regular expression per state ("after").
+
+Run from the root of the repository:
+
+    python -m power_format_pack.benchmarks.bench_lexer_engine
+"""
+
+import codecs
+import glob
+import importlib
+import os
+import sys
+import timeit
+
+# Pygments is imported as a top level package by the add-on
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+lexers = importlib.import_module("pygments.lexers")
+
+REPO_DIR = os.path.dirname(PACKAGE_DIR)
+# language -> files of the sample, which is repeated up to MIN_SIZE
+SAMPLES = (("python", os.path.join(PACKAGE_DIR, "markdown", "*.py")),
+           ("css", os.path.join(PACKAGE_DIR, "docs", "*.css")),
+           ("html", os.path.join(PACKAGE_DIR, "docs", "*.html")),
+           ("bash", os.path.join(REPO_DIR, "zip_files_into_package")),
+           ("ini", os.path.join(PACKAGE_DIR, "config.ini")))
+MIN_SIZE = 100000
+REPEAT = 3
+
+
+def read_sample(pattern, min_size=MIN_SIZE):
+    text = u""
+    for path in sorted(glob.glob(pattern)):
+        with codecs.open(path, encoding="utf8") as f:
+            text += f.read()
+    if not text:
+        return text
+    return text * (min_size // len(text) + 1)
+
+
+def lex(lexer, text):
+    for _ in lexer.get_tokens_unprocessed(text):
+        pass
+
+
+def main():
+    for (language, pattern) in SAMPLES:
+        text = read_sample(pattern)
+        if not text:
+            continue
+        times = list()
+        tokens = list()
+        for engine in ("rules", "combined"):
+            lexer = lexers.get_lexer_by_name(language, engine=engine)
+            tokens.append(list(lexer.get_tokens_unprocessed(text)))
+            times.append(min(timeit.repeat(lambda: lex(lexer, text),
+                                           number=1, repeat=REPEAT)))
+        if tokens[0] != tokens[1]:
+            print "{}: tokens differ".format(language)
+            return 1
+        (old, new) = times
+        print "{:<7} {:>4} kB: {:6.1f} ms -> {:6.1f} ms ({:.2f}x)".format(
+                language, len(text) // 1024, old * 1000, new * 1000,
+                old / new)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
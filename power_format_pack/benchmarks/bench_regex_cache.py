@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""
+Time the processing of the token definitions of some common lexers, as
+the first code block of each language in a session does, with the
+compiled regular expressions read from the cache ("after") and compiled
+with `re.compile` ("before").
+
+Run from the root of the repository:
+
+    python -m power_format_pack.benchmarks.bench_regex_cache
+"""
+
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+# Pygments is imported as a top level package by the add-on
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+lexer = importlib.import_module("pygments.lexer")
+lexers = importlib.import_module("pygments.lexers")
+regexcache = importlib.import_module("pygments.regexcache")
+
+LANGUAGES = ("python", "c", "cpp", "java", "javascript", "html", "css",
+             "bash", "sql", "ruby", "php", "haskell")
+REPEAT = 5
+
+
+def process_token_definitions(classes):
+    for cls in classes:
+        if "_tokens" in cls.__dict__:
+            del cls._tokens
+        cls()
+
+
+def main():
+    classes = [type(lexers.get_lexer_by_name(name)) for name in LANGUAGES]
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        lexer.regex_cache = None
+        old = min(timeit.repeat(lambda: process_token_definitions(classes),
+                                number=1, repeat=REPEAT))
+        # fill the files, then time new caches that have to read them
+        lexer.regex_cache = regexcache.RegexCache(tmp_dir)
+        process_token_definitions(classes)
+        times = list()
+        for _ in xrange(REPEAT):
+            lexer.regex_cache = regexcache.RegexCache(tmp_dir)
+            times.append(min(timeit.repeat(
+                    lambda: process_token_definitions(classes),
+                    number=1, repeat=1)))
+        new = min(times)
+        if lexer.regex_cache.misses:
+            print "Cache misses: {}".format(lexer.regex_cache.misses)
+            return 1
+    finally:
+        lexer.regex_cache = None
+        shutil.rmtree(tmp_dir)
+    print "{} lexers: {:.1f} ms -> {:.1f} ms ({:.0f}% faster)".format(
+            len(classes), old * 1000, new * 1000, 100 * (old - new) / old)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""
+Per-call latency of the utility functions that use the precompiled
+regular expressions in `const`. "before" adds the `re.compile` call that
+each function used to make on every call, "after" is the function as it
+is now.
+
+Run from the root of the repository:
+
+    python -m power_format_pack.benchmarks.bench_regexes
+"""
+
+import re
+import sys
+import timeit
+if "/usr/share/anki/" not in sys.path:
+    sys.path.append("/usr/share/anki/")
+from power_format_pack import const
+from power_format_pack import utility
+from power_format_pack.htmltomarkdown import MarkdownLineFilter
+
+NUMBER = 20000
+REPEAT = 3
+
+MD = u"""\
+1\\. first ![image](a \\(1\\).jpg)
+2\\. second [link](http://example.com/a b)
+
+Term
+    : Definition
+Other term
+    : Other definition
+
+  *[HTML]: Hyper Text Markup Language
+"""
+
+
+def filter_lines():
+    sink = MarkdownLineFilter()
+    sink.write(MD)
+    return sink.close()
+
+
+# (name, function, patterns the function compiled on every call)
+CASES = (
+    ("escape_link_img_matches",
+     lambda: utility.escape_link_img_matches(MD, const.LINK_IMG_ESCAPES),
+     [regex for (regex, _) in const.LINK_IMG_ESCAPES]),
+    ("MarkdownLineFilter (dot escaping)",
+     filter_lines,
+     [const.ESCAPED_NUMBER_DOT_REGEX]),
+    ("check_size_heading",
+     lambda: utility.check_size_heading(u"### heading"),
+     [const.HEADING_HASHES_REGEX]),
+    ("remove_whitespace_before_abbreviation_definition",
+     lambda: utility.remove_whitespace_before_abbreviation_definition(MD),
+     [const.ABBR_DEFINITION_WHITESPACE_REGEX]),
+    ("remove_leading_whitespace_from_dd_element",
+     lambda: utility.remove_leading_whitespace_from_dd_element(MD),
+     [const.INDENTED_DD_REGEX]),
+)
+
+
+def time_call(fn):
+    """
+    Return the time of one call of `fn` in microseconds.
+    """
+    return min(timeit.repeat(fn, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+
+
+def run():
+    """
+    Return a dictionary that maps the name of every case to a dictionary
+    with the latency before and after in microseconds.
+    """
+    results = dict()
+    for (name, fn, patterns) in CASES:
+        def before(fn=fn, patterns=patterns):
+            for regex in patterns:
+                re.compile(regex.pattern, regex.flags)
+            return fn()
+        results[name] = dict(before=time_call(before), after=time_call(fn))
+    return results
+
+
+def main():
+    results = run()
+    for (name, _, _) in CASES:
+        print "{:<50} {:8.2f} us -> {:8.2f} us".format(
+                name, results[name]["before"], results[name]["after"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
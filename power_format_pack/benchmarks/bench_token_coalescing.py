@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+"""
+Highlight large samples of source code taken from this repository with
+inline styles, as the add-on does, with the tokens of the lexer passed
+to the formatter as they are ("before") and coalesced ("after"). Print
+the number of tokens and <span> elements, the size of the HTML and the
+time taken.
+
+Run from the root of the repository:
+
+    python -m power_format_pack.benchmarks.bench_token_coalescing
+"""
+
+import codecs
+import glob
+import importlib
+import os
+import re
+import sys
+import timeit
+
+# Pygments is imported as a top level package by the add-on
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+pygments = importlib.import_module("pygments")
+filters = importlib.import_module("pygments.filters")
+formatters = importlib.import_module("pygments.formatters")
+lexers = importlib.import_module("pygments.lexers")
+
+REPO_DIR = os.path.dirname(PACKAGE_DIR)
+# language -> files of the sample, which is repeated up to MIN_SIZE
+SAMPLES = (("python", os.path.join(PACKAGE_DIR, "markdown", "*.py")),
+           ("css", os.path.join(PACKAGE_DIR, "docs", "*.css")),
+           ("html", os.path.join(PACKAGE_DIR, "docs", "*.html")),
+           ("bash", os.path.join(REPO_DIR, "zip_files_into_package")),
+           # not JSON: most characters are Error tokens of their own
+           ("json", os.path.join(PACKAGE_DIR, "config.ini")))
+STYLE = "tango"
+MIN_SIZE = 100000
+REPEAT = 10
+TAG_RE = re.compile(r"<[^>]*>")
+
+
+def read_sample(pattern, min_size=MIN_SIZE):
+    text = u""
+    for path in sorted(glob.glob(pattern)):
+        with codecs.open(path, encoding="utf8") as f:
+            text += f.read()
+    if not text:
+        return text
+    return text * (min_size // len(text) + 1)
+
+
+def main():
+    formatter = formatters.get_formatter_by_name("html", style=STYLE,
+                                                 noclasses=True)
+    for (language, pattern) in SAMPLES:
+        text = read_sample(pattern)
+        if not text:
+            continue
+        results = list()
+        for coalesce in (False, True):
+            lexer = lexers.get_lexer_by_name(language)
+            if coalesce:
+                lexer.add_filter("coalesce", style=STYLE)
+            html = pygments.highlight(text, lexer, formatter)
+            tokens = sum(1 for _ in lexer.get_tokens(text))
+            time = min(timeit.repeat(
+                    lambda: pygments.highlight(text, lexer, formatter),
+                    number=1, repeat=REPEAT))
+            results.append((tokens, html, time))
+        ((old_tokens, old_html, old), (new_tokens, new_html, new)) = results
+        if TAG_RE.sub(u"", old_html) != TAG_RE.sub(u"", new_html):
+            print "{}: text differs".format(language)
+            return 1
+        print ("{:<7} tokens {:>6} -> {:>6}, spans {:>6} -> {:>6}, "
+               "{:>4} kB -> {:>4} kB, {:6.1f} ms -> {:6.1f} ms").format(
+                language, old_tokens, new_tokens,
+                old_html.count(u"<span"), new_html.count(u"<span"),
+                len(old_html) // 1024, len(new_html) // 1024,
+                old * 1000, new * 1000)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+"""
+Markdown of realistic fields, to be repeated for larger sizes.
+"""
+
+FIELDS = dict(
+table=u"""\
+| Language | Typing  | Year |
+|:---------|:-------:|-----:|
+| Python   | dynamic | 1991 |
+| Haskell  | static  | 1990 |
+| Пролог   | dynamic | 1972 |
+
+""",
+code=u"""\
+```python
+def fib(n):
+    \"\"\"Return the n-th Fibonacci number.\"\"\"
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b  # keep going
+    return a
+```
+
+Call it with `fib(10)`, which returns *55*.
+
+""",
+footnotes=u"""\
+The **mitochondrion** is the powerhouse of the cell.[^mito] It has its
+own DNA.[^dna]
+
+[^mito]: Found in most eukaryotic organisms.
+[^dna]: Inherited from the mother.
+
+""",
+images=u"""\
+![diagram](paste \\(1\\) image.jpg) and ![photo](photo 2.png "A photo")
+with a [link to the source](http://example.com/some page).
+
+""",
+deflist=u"""\
+Apple
+: A red or green fruit.
+
+Orange
+: A citrus fruit.
+: A color.
+
+*[HTML]: Hyper Text Markup Language
+
+HTML is used in every card.
+
+""",
+)
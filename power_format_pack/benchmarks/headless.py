@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+"""
+Set up Anki and Power Format Pack for benchmarks that run without the
+Anki GUI.
+"""
+
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+if "/usr/share/anki/" not in sys.path:
+    sys.path.append("/usr/share/anki/")
+# Pygments is imported as a top level package by the add-on
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+
+
+class HeadlessProfileManager(object):
+
+    def addonFolder(self):
+        # the folder that contains the power_format_pack folder
+        return os.path.dirname(os.path.dirname(os.path.dirname(
+                os.path.abspath(__file__))))
+
+
+class HeadlessMainWindow(object):
+    """
+    Stand-in for `aqt.mw`, which is only set when Anki is running.
+    """
+
+    def __init__(self):
+        self.pm     = HeadlessProfileManager()
+        self.col    = None
+
+
+class HeadlessWeb(object):
+    """
+    Webview that ignores all JavaScript.
+    """
+
+    def eval(self, js):
+        pass
+
+    def setFocus(self):
+        pass
+
+
+class HeadlessNote(object):
+
+    def __init__(self, nid, fields):
+        self.id     = nid
+        self.fields = fields
+        self.tags   = list()
+
+
+class HeadlessEditor(object):
+    """
+    Editor with a single field, as far as `Markdowner` uses it.
+    """
+
+    def __init__(self, note):
+        from power_format_pack.jsbuffer import JSCommandBuffer
+        self.note           = note
+        self.currentField   = 0
+        self.web            = HeadlessWeb()
+        self.js_buffer      = JSCommandBuffer(self.web)
+        self.parentWindow   = None
+
+    def saveNow(self):
+        pass
+
+
+def setup():
+    """
+    Install the stand-in main window and load the default preferences.
+    The compiled regular expressions of the lexers are kept in a temporary
+    folder instead of the add-on folder, so every run starts without them.
+    Call this before any other Power Format Pack module is imported.
+    """
+    import aqt
+    if aqt.mw is None:
+        aqt.mw = HeadlessMainWindow()
+    from power_format_pack import utility  # avoid a circular import
+    from power_format_pack import preferences
+    from power_format_pack.prefhelper import PrefHelper
+    preferences.PREFS = PrefHelper.get_default_preferences()
+    # Pygments must not be imported before Markdown is first rendered, so
+    # only point the regex cache that is set up then at a temporary folder
+    regex_cache_dir = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, regex_cache_dir, True)
+    PrefHelper.get_regex_cache_path = staticmethod(lambda: regex_cache_dir)
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+"""
+Report how long importing the add-on takes, module by module, in the
+format of `python -X importtime` (which Python 2 doesn't have), and which
+of the heavy dependencies are imported before any Markdown is rendered.
+
+Run from the root of the repository:
+
+    python -m power_format_pack.benchmarks.importtime
+    python -m power_format_pack.benchmarks.importtime --min-us 1000
+"""
+
+import __builtin__
+import argparse
+import sys
+import timeit
+
+import headless
+
+# the modules `extra_buttons` imports, apart from the Anki GUI
+ADDON_MODULES = ("utility", "markdowner", "batchmarkdown", "menu",
+                 "abbreviation", "blockquote", "deflist", "heading",
+                 "hyperlink", "orderedlist", "table")
+
+# dependencies that should only be imported when Markdown is used
+HEAVY_MODULES = ("markdown", "pygments", "html2text", "pkg_resources")
+
+
+class ImportTimer(object):
+    """
+    Context manager that times every import of a new module in its body.
+    `entries` is a list of tuples (depth, module names, self time,
+    cumulative time) in the order in which the imports finished, with the
+    times in microseconds.
+    """
+
+    def __init__(self, clock=timeit.default_timer):
+        self.clock      = clock
+        self.entries    = list()
+        self._depth     = 0
+        self._children  = [0.0]
+        self._claimed   = set()
+        self._import    = None
+
+    def __enter__(self):
+        self._import = __builtin__.__import__
+        __builtin__.__import__ = self.timed_import
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        __builtin__.__import__ = self._import
+        return False
+
+    def timed_import(self, *args, **kwargs):
+        before = set(sys.modules)
+        self._depth += 1
+        self._children.append(0.0)
+        start = self.clock()
+        try:
+            return self._import(*args, **kwargs)
+        finally:
+            cumulative = (self.clock() - start) * 1e6
+            children = self._children.pop()
+            self._depth -= 1
+            # Python 2 stores `None` for failed implicit relative imports
+            new = set(name for name in set(sys.modules) - before
+                      if sys.modules[name] is not None) - self._claimed
+            if new:
+                self._claimed.update(new)
+                self.entries.append((self._depth, sorted(new),
+                                     cumulative - children, cumulative))
+                self._children[-1] += cumulative
+            else:
+                # nothing new was imported: the time belongs to the caller
+                self._children[-1] += children
+
+    def total(self):
+        return sum(entry[3] for entry in self.entries if entry[0] == 0)
+
+    def report(self, min_us=0):
+        lines = ["import time: self [us] | cumulative | imported package"]
+        for (depth, names, self_us, cumulative_us) in self.entries:
+            if cumulative_us < min_us:
+                continue
+            lines.append("import time: {:>9.0f} | {:>10.0f} | {}{}".format(
+                    self_us, cumulative_us, "  " * depth, ", ".join(names)))
+        return "\n".join(lines)
+
+
+def is_imported(name):
+    """
+    Return True when the module `name` is imported, either at the top level
+    or as part of the add-on.
+    """
+    return any(module is not None and
+               (key == name or key.endswith("." + name))
+               for (key, module) in sys.modules.items())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--min-us", type=float, default=0,
+                        help="hide imports that took less time")
+    args = parser.parse_args(argv)
+
+    with ImportTimer() as timer:
+        headless.setup()
+        for name in ADDON_MODULES:
+            __import__("power_format_pack." + name)
+    print timer.report(args.min_us)
+    print
+    print "add-on imported in {:.1f} ms".format(timer.total() / 1000)
+    for name in HEAVY_MODULES:
+        print "{:<15} {}".format(
+                name, "imported" if is_imported(name) else "not imported")
+
+    from power_format_pack import utility
+    start = timeit.default_timer()
+    utility.convert_markdown_to_html(u"```python\nx = 1\n```")
+    print "first Markdown rendered in {:.1f} ms".format(
+            (timeit.default_timer() - start) * 1000)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare benchmark results of two revisions.
+"""
+
+
+def compare(old, new, threshold=0.1):
+    """
+    Compare the timings of the results `old` and `new`. Return a list of
+    tuples (key, old time, new time, relative change, status) sorted by
+    key, where status is "regression" or "improvement" when the relative
+    change is larger than `threshold`, and "" otherwise.
+    """
+    report = list()
+    for key in sorted(set(old["timings"]) & set(new["timings"])):
+        old_time = old["timings"][key]
+        new_time = new["timings"][key]
+        change = (new_time - old_time) / old_time if old_time else 0.0
+        if change > threshold:
+            status = "regression"
+        elif change < -threshold:
+            status = "improvement"
+        else:
+            status = ""
+        report.append((key, old_time, new_time, change, status))
+    return report
+
+
+def print_report(report):
+    for (key, old_time, new_time, change, status) in report:
+        print "{:<50} {:9.2f} ms {:9.2f} ms {:+7.1%} {}".format(
+                key, old_time * 1000, new_time * 1000, change, status)
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+"""
+Time the Markdown round-trip pipeline on the fields in `corpus` at
+several sizes, and compare the results with those of another revision.
+
+Run from the root of the repository:
+
+    python -m power_format_pack.benchmarks.run --output new.json
+    python -m power_format_pack.benchmarks.run --output new.json \\
+        --compare old.json --threshold 0.1
+
+The exit status is 1 when the comparison finds a regression.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+
+import headless
+headless.setup()
+
+from power_format_pack import const
+from power_format_pack import preferences
+from power_format_pack import utility
+from power_format_pack.markdowner import Markdowner
+from power_format_pack.rendercache import RENDER_CACHE
+import corpus
+from report import compare, print_report
+
+SIZES = (1, 4, 16)
+
+
+def apply_markdown(field):
+    """
+    Toggle the Markdown of a converted field back to Markdown, which
+    compares the field with the stored Markdown.
+    """
+    RENDER_CACHE.clear()
+    note = headless.HeadlessNote(1, [field])
+    editor = headless.HeadlessEditor(note)
+    Markdowner(editor, None, note, field, 0, u"").apply_markdown()
+
+
+def make_cases(md):
+    """
+    Return a list of tuples (name of case, function to time) for the
+    Markdown `md`.
+    """
+    md_escaped = utility.escape_html_chars(md)
+    typed_html = utility.convert_clean_md_to_html(md_escaped, put_breaks=True)
+    html = utility.convert_markdown_to_html(md)
+    field = utility.make_data_ready_to_insert(
+            u"1-000", u"True", md_escaped, html)
+    return [
+        ("convert_html_to_markdown",
+         lambda: utility.convert_html_to_markdown(typed_html)),
+        ("convert_markdown_to_html",
+         lambda: utility.convert_markdown_to_html(md)),
+        ("convert_clean_md_to_html",
+         lambda: utility.convert_clean_md_to_html(md_escaped,
+                                                  put_breaks=True)),
+        ("put_colons_in_html_def_list",
+         lambda: utility.put_colons_in_html_def_list(html, put_breaks=True)),
+        ("apply_markdown", lambda: apply_markdown(field)),
+    ]
+
+
+def get_revision():
+    try:
+        return subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"]).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes=SIZES, number=3, repeat=3):
+    """
+    Return a dictionary with the fastest time in seconds of every case, for
+    every field and size, keyed by "case/field/size".
+    """
+    # don't show the conflict dialog when the Markdown has changed
+    preferences.PREFS[const.MARKDOWN_ALWAYS_REVERT] = True
+    timings = dict()
+    for (field_name, md) in sorted(corpus.FIELDS.items()):
+        for size in sizes:
+            for (case, fn) in make_cases(md * size):
+                key = u"{}/{}/{:03d}".format(case, field_name, size)
+                timings[key] = min(timeit.repeat(
+                        fn, number=number, repeat=repeat)) / number
+    return dict(revision=get_revision(),
+                python=platform.python_version(),
+                time=time.time(),
+                timings=timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", help="write the results to this file")
+    parser.add_argument("--compare", help="results of another revision")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="relative change that counts as a regression")
+    parser.add_argument("--number", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    results = run(number=args.number, repeat=args.repeat)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if not args.compare:
+        for (key, seconds) in sorted(results["timings"].items()):
+            print "{:<50} {:9.2f} ms".format(key, seconds * 1000)
+        return 0
+
+    with open(args.compare) as f:
+        old = json.load(f)
+    report = compare(old, results, args.threshold)
+    print_report(report)
+    regressions = [row for row in report if row[4] == "regression"]
+    print "{} regression(s) above {:.0%}".format(len(regressions),
+                                                 args.threshold)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2014-2016 Stefan van den Akker <srvandenakker.dev@gmail.com>
+#
+# This file is part of Power Format Pack.
+#
+# Power Format Pack is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# Power Format Pack is distributed in the hope that it will be
+# useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General
+# Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Power Format Pack. If not, see http://www.gnu.org/licenses/.
+
+"""
+Process-wide cache for the parsed contents of config.ini.
+"""
+
+import os
+import time
+
+from power_format_pack.python_modules import ConfigParser
+
+import const
+
+
+class ConfigCache(object):
+    """
+    Lazily parsed config file. The file is parsed again when its
+    modification time changes, which is checked at most once every
+    `check_interval` seconds, so reading a value usually doesn't touch the
+    file system.
+    """
+
+    def __init__(self, path, check_interval=const.CONFIG_CHECK_INTERVAL):
+        self.path           = path
+        self.check_interval = check_interval
+        self._parser        = None
+        self._mtime         = None
+        self._last_check    = 0
+
+    @staticmethod
+    def get_mtime(path):
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return None
+
+    def load(self):
+        """
+        Parse the config file and return the new parser.
+        """
+        mtime = self.get_mtime(self.path)
+        config = ConfigParser.ConfigParser()
+        ret = config.read(self.path)
+        if not ret:
+            raise Exception("Could not read config file {!r}".format(self.path))
+        self._parser = config
+        self._mtime = mtime
+        self._last_check = time.time()
+        return config
+
+    def parser(self):
+        """
+        Return the ConfigParser for the config file, parsing the file only
+        when it is read for the first time or when it has changed.
+        """
+        if self._parser is None:
+            return self.load()
+        now = time.time()
+        if now - self._last_check >= self.check_interval:
+            self._last_check = now
+            if self.get_mtime(self.path) != self._mtime:
+                return self.load()
+        return self._parser
+
+    def get(self, section, option):
+        return self.parser().get(section, option)
+
+    def getint(self, section, option):
+        return self.parser().getint(section, option)
+
+    def label(self, option):
+        return self.get(const.CONFIG_LABELS, option)
+
+    def tooltip(self, option):
+        return self.get(const.CONFIG_TOOLTIPS, option)
+
+    def warning(self, option):
+        return self.get(const.CONFIG_WARNINGS, option)
+
+    def window_title(self, option):
+        return self.get(const.CONFIG_WINDOW_TITLES, option)
+
+    def menu_name(self, option):
+        return self.get(const.CONFIG_MENU_NAMES, option)
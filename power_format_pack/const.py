@@ -94,6 +94,9 @@ MARKDOWN_LINE_NUMS            = "markdown_line_nums"
 MARKDOWN_CODE_DIRECTION       = "markdown_code_direction"
 MARKDOWN_ALWAYS_REVERT        = "markdown_always_revert"
 MARKDOWN_OVERRIDE_EDITING     = "markdown_override_editing"
+MARKDOWN_PERSIST_CACHE        = "markdown_persist_cache"
+PROFILING                     = "profiling"
+MARKDOWN_WARM_UP              = "markdown_warm_up"
 BUTTON_PLACEMENT              = "button_placement"
 STYLE_TABLE                   = "style_table"
 
@@ -109,6 +112,12 @@ FUNCTION_KEYS                 = ("f1", "f2", "f3", "f4", "f5", "f6",
 # markers to be wrapped around Markdown data in fields
 START_HTML_MARKER             = "<!----SBAdata:"
 END_HTML_MARKER               = "---->"
+# first byte of Markdown data that is compressed with zlib; data without
+# it is plain JSON, the format used by earlier versions
+MD_DATA_FORMAT_ZLIB           = "\x01"
+# separates the header fields from each other and from the Markdown data;
+# this character never occurs in base64
+MD_DATA_HEADER_SEPARATOR      = u":"
 
 # change field to this background color
 MARKDOWN_BG_COLOR             = "#FFEDD3"
@@ -122,8 +131,82 @@ MARKDOWN_PREFS                = dict(disable_buttons=False,
 # max number of bytes read from preference file
 MAX_BYTES_PREFS               = 32768
 
+# max number of characters kept in the Markdown render cache
+RENDER_CACHE_MAX_SIZE         = 4 * 1024 * 1024
+# file in the addon folder the render cache is saved to
+RENDER_CACHE_FILENAME         = ".render_cache"
+# folder in the addon folder Pygments keeps the compiled regular
+# expressions of its lexers in
+REGEX_CACHE_DIRNAME           = ".regex_cache"
+# default file in the addon folder the profiling data is saved to
+PROFILING_FILENAME            = "profiling.json"
+
+# number of notes converted between updates of the progress dialog
+BATCH_CHUNK_SIZE              = 200
+
+# minimum number of Markdown strings each worker process has to render
+# before bulk rendering is spread over multiple processes
+RENDER_POOL_MIN_BATCH_SIZE    = 64
+# max number of Markdown strings that is sent to a worker process at once
+RENDER_POOL_MAX_CHUNK_SIZE    = 32
+
+# milliseconds between loading the profile and the start of the warm-up of
+# the Markdown rendering, and between the steps of the warm-up
+WARM_UP_DELAY                 = 5000
+WARM_UP_STEP_INTERVAL         = 100
+# rendered during the warm-up, to set up the extensions that are used most
+WARM_UP_MARKDOWN              = u"""\
+*a* **b** `c`[^1] HTML
+
+| d | e |
+|---|---|
+| f | g |
+
+h
+: i
+
+```text
+j
+```
+
+[^1]: k
+
+*[HTML]: l
+"""
+# code block without a language, to set up the guessing of its language
+WARM_UP_CODE                  = u"""\
+import m
+
+def n(o):
+    return o
+"""
+
+# compiled regular expressions
 # check if image present in Markdown
 IS_LINK_OR_IMG_REGEX = re.compile(r"!?\[[^\]]*\]\(.*?(?<!\\)\)")
+# characters in links and images that would prematurely end the Markdown
+# syntax, with their replacements
+LINK_IMG_ESCAPES              = ((re.compile(ur"\\\("), u"&#40;"),
+                                 (re.compile(ur"\\\)"), u"&#41;"),
+                                 (re.compile(ur"\s+"), u"&#32;"))
+# dots after numbers that are escaped by html2text
+ESCAPED_NUMBER_DOT_REGEX      = re.compile(ur"(\d+)\\(\.\s)")
+# leading hashes of a Markdown heading
+HEADING_HASHES_REGEX          = re.compile(ur"^(#{1,6})")
+# whitespace that html2text puts before an abbreviation definition
+ABBR_DEFINITION_WHITESPACE_REGEX = re.compile(r"( |\&nbsp;)+(\*\[.*?\]:)")
+# indented definition of a definition list
+INDENTED_DD_REGEX             = re.compile(r"(\n) {4}(: .*?\n)")
+# id of a footnote
+FOOTNOTE_ID_REGEX             = re.compile(r"fn:")
+# runs of spaces that become alternating spaces and non-breaking spaces
+SPACE_RUN_REGEX               = re.compile(u" +")
+# character and entity references as read by the SGML parser of BeautifulSoup
+SGML_REFERENCE_REGEX          = re.compile(
+        u"&(?:#([0-9]+)|([a-zA-Z][-.a-zA-Z0-9]*));?")
+# characters that BeautifulSoup escapes when it outputs text
+BARE_AMPERSAND_OR_BRACKET_REGEX = re.compile(
+        r"[<>]|&(?!#\d+;|#x[0-9a-fA-F]+;|\w+;)")
 # to unescape image data
 HTML_PARSER                   = HTMLParser.HTMLParser()
 
@@ -139,6 +222,8 @@ CONFIG_KEYBINDINGS            = "Keybindings"
 CONFIG_WARNINGS               = "Warnings"
 CONFIG_QT                     = "Qt"
 CONFIG_FORMAT_SETTINGS        = "FormatSettings"
+# minimum number of seconds between checks whether the config file changed
+CONFIG_CHECK_INTERVAL         = 2
 
 # stylesheet for QGroupBox
 QGROUPBOX_STYLE = """
@@ -34,8 +34,13 @@ import const
 import preferences
 from preferences import Preferences
 from prefhelper import PrefHelper
+from profiling import PROFILER
+from rendercache import RENDER_CACHE
+from jsbuffer import JSCommandBuffer
+from warmup import WARM_UP
 from menu import ExtraButtons_Options
 from markdowner import Markdowner
+from batchmarkdown import BatchMarkdown
 from anki_modules.aqt import editor as myeditor
 from anki_modules.aqt.editor import create_button
 from abbreviation import Abbreviation
@@ -554,6 +559,7 @@ def toggleHyperlink(self):
     Hyperlink(self, self.parentWindow, selected)
 
 
+@PROFILER.profile
 def toggleMarkdown(self):
     utility.start_safe_block(const.MARKDOWN_PREFS)
     self.saveNow()
@@ -568,15 +574,18 @@ def toggleMarkdown(self):
         html_field = u""
     if not selected:
         selected = u""
-    markdowner = Markdowner(self, self.parentWindow, self.note,
-                            html_field, current_field, selected)
-    markdowner.apply_markdown()
+    # evaluate the JavaScript of the Markdowner in one go
+    with self.js_buffer.batch():
+        markdowner = Markdowner(self, self.parentWindow, self.note,
+                                html_field, current_field, selected)
+        markdowner.apply_markdown()
     self.saveNow()
     self.web.setFocus()
     self.web.eval("focusField(%d);" % self.currentField)
     utility.end_safe_block(const.MARKDOWN_PREFS)
 
 
+@PROFILER.profile
 def on_focus_gained(self, note, field):
 
     tags = note.tags
@@ -592,40 +601,98 @@ def on_focus_gained(self, note, field):
 
     if const.MARKDOWN_PREFS.get("safe_block"):
         return
+
+    # the Markdown state of a field only depends on its Markdown data, so
+    # when the data hasn't changed since the field was last focused, the
+    # editor already shows the right state
+    html_field = note.fields[field] or u""
+    cache_key = (note.id, field, utility.get_md_data_key(html_field))
+    markdown_state = self.markdown_focus_cache.get(cache_key)
+    if markdown_state is not None:
+        const.MARKDOWN_PREFS.update(markdown_state)
     else:
         utility.start_safe_block(const.MARKDOWN_PREFS)
-        try:
-            time.sleep(0.001)
-            self.saveNow()
-        except AttributeError as e:
-            print e  # TODO: log error
+        with PROFILER.stage(u"extra_buttons.on_focus_gained.save"):
+            try:
+                time.sleep(0.001)
+                self.saveNow()
+            except AttributeError as e:
+                print e  # TODO: log error
         html_field = note.fields[field]
         # if not isinstance(html_field, unicode):
         #     html_field = unicode(html_field)
         if not html_field:
             html_field = u""
-        markdowner = Markdowner(self, self.parentWindow, note,
-                                html_field, field, u"")
-        markdowner.on_focus_gained()
-        self.web.setFocus()
-        self.web.eval("focusField(%d);" % self.currentField)
+        with PROFILER.stage(u"extra_buttons.on_focus_gained.markdowner"), \
+                self.js_buffer.batch():
+            markdowner = Markdowner(self, self.parentWindow, note,
+                                    html_field, field, u"")
+            markdowner.on_focus_gained()
+            self.markdown_focus_cache[
+                    (note.id, field,
+                     utility.get_md_data_key(html_field))] = dict(
+                        isconverted=const.MARKDOWN_PREFS.get("isconverted"),
+                        disable_buttons=const.MARKDOWN_PREFS.get(
+                                "disable_buttons"))
+            self.web.setFocus()
+            self.js_buffer.eval("focusField(%d);" % self.currentField)
         note.tags = tags
-        try:
-            time.sleep(0.001)
-            self.updateTags()
-        except AttributeError as e:
-            print e  # TODO: log error
+        with PROFILER.stage(u"extra_buttons.on_focus_gained.update_tags"):
+            try:
+                time.sleep(0.001)
+                self.updateTags()
+            except AttributeError as e:
+                print e  # TODO: log error
         utility.end_safe_block(const.MARKDOWN_PREFS)
 
 
+def clear_markdown_focus_cache(self):
+    """
+    Forget the Markdown state of the fields: loading a note recreates the
+    fields in the editor, without the Markdown warnings.
+    """
+    self.markdown_focus_cache.clear()
+
+
 def init_hook(self, mw, widget, parentWindow, addMode=False):
+    # (note id, field index, key of Markdown data) -> Markdown state
+    self.markdown_focus_cache = dict()
+    self.js_buffer = JSCommandBuffer(self.web)
     addHook("editFocusGained", self.on_focus_gained)
 
+
+def setup_browser_menu(browser):
+    c = utility.get_config()
+    action = QtGui.QAction(c.get(const.CONFIG_MENU_NAMES,
+                                 "batch_markdown_action"), browser)
+    action.triggered.connect(lambda: BatchMarkdown(browser).run())
+    browser.form.menuEdit.addSeparator()
+    browser.form.menuEdit.addAction(action)
+
+
+def save_render_cache():
+    if preferences.PREFS.get(const.MARKDOWN_PERSIST_CACHE):
+        try:
+            RENDER_CACHE.save(PrefHelper.get_render_cache_path())
+        except IOError as e:
+            print e  # TODO: log error
+
 Preferences.init()
 
+PROFILER.enabled = bool(preferences.PREFS.get(const.PROFILING))
+
+if preferences.PREFS.get(const.MARKDOWN_PERSIST_CACHE):
+    RENDER_CACHE.load(PrefHelper.get_render_cache_path())
+addHook("unloadProfile", save_render_cache)
+
 if preferences.PREFS.get(const.MARKDOWN):
     editor.Editor.on_focus_gained = on_focus_gained
     editor.Editor.__init__ = wrap(editor.Editor.__init__, init_hook)
+    editor.Editor.loadNote = wrap(editor.Editor.loadNote,
+                                  clear_markdown_focus_cache, "before")
+    addHook("browser.setupMenus", setup_browser_menu)
+    if preferences.PREFS.get(const.MARKDOWN_WARM_UP):
+        addHook("profileLoaded", WARM_UP.start)
 
 editor.Editor.create_button = create_button
 editor.Editor.toggleMarkdown = toggleMarkdown
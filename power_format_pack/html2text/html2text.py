@@ -94,6 +94,10 @@ unifiable_n = {}
 for k in unifiable.keys():
     unifiable_n[name2cp(k)] = unifiable[k]
 
+# non-breaking spaces are kept as a placeholder until the output is closed
+del unifiable_n[name2cp('nbsp')]
+unifiable['nbsp'] = '&nbsp_place_holder;'
+
 ### End Entity Nonsense ###
 
 def onlywhite(line):
@@ -204,6 +208,8 @@ class HTML2Text(HTMLParser.HTMLParser):
         self.ul_item_mark = '*'
         self.emphasis_mark = '_'
         self.strong_mark = '**'
+        # function that escapes markdown-sensitive characters in text
+        self.escape_md_section = escape_md_section
 
         if out is None:
             self.out = self.outtextf
@@ -246,10 +252,6 @@ class HTML2Text(HTMLParser.HTMLParser):
         self.abbr_list = {}  # stack of abbreviations to write later
         self.baseurl = baseurl
 
-        try: del unifiable_n[name2cp('nbsp')]
-        except KeyError: pass
-        unifiable['nbsp'] = '&nbsp_place_holder;'
-
 
     def feed(self, data):
         data = data.replace("</' + 'script>", "</ignore>")
@@ -593,7 +595,7 @@ class HTML2Text(HTMLParser.HTMLParser):
                     self.drop_white_space = 0
 
             if puredata and not self.pre:
-                data = re.sub('\s+', ' ', data)
+                data = whitespace_matcher.sub(' ', data)
                 if data and data[0] == ' ':
                     self.space = 1
                     data = data[1:]
@@ -680,7 +682,7 @@ class HTML2Text(HTMLParser.HTMLParser):
                 self.maybe_automatic_link = None
 
         if not self.code and not self.pre:
-            data = escape_md_section(data, snob=self.escape_snob)
+            data = self.escape_md_section(data, snob=self.escape_snob)
         self.o(data, 1)
 
     def unknown_decl(self, data): pass
@@ -757,6 +759,7 @@ class HTML2Text(HTMLParser.HTMLParser):
                     newlines += 1
         return result
 
+whitespace_matcher = re.compile(r'\s+')
 ordered_list_matcher = re.compile(r'\d+\.\s')
 unordered_list_matcher = re.compile(r'[-\*\+]\s')
 md_chars_matcher = re.compile(r"([\\\[\]\(\)])")
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2014-2016 Stefan van den Akker <srvandenakker.dev@gmail.com>
+#
+# This file is part of Power Format Pack.
+#
+# Power Format Pack is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# Power Format Pack is distributed in the hope that it will be
+# useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General
+# Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Power Format Pack. If not, see http://www.gnu.org/licenses/.
+
+"""
+Reusable converter from HTML to Markdown, built on html2text.
+"""
+
+from html2text import html2text
+from html2text_overrides import escape_md_section_override
+import const
+
+
+class MarkdownLineFilter(object):
+    """
+    Output sink for html2text that collects the Markdown as a list of lines.
+    Every line is cleaned up as soon as it is complete, so the output is
+    traversed only once: the placeholder for non-breaking spaces is
+    replaced, empty lines are dropped unless `keep_empty_lines` is set, and
+    the html2text escaping of dots after numbers (which interferes with the
+    creation of ordered lists) is undone.
+    """
+
+    NBSP_PLACEHOLDER    = u"&nbsp_place_holder;"
+
+    def __init__(self, keep_empty_lines=False):
+        self.keep_empty_lines   = keep_empty_lines
+        self.lines              = list()
+        self._pieces            = list()
+
+    def write(self, s):
+        if u"\n" not in s:
+            self._pieces.append(s)
+            return
+        lines = s.split(u"\n")
+        self._pieces.append(lines[0])
+        lines[0] = u"".join(self._pieces)
+        last = lines.pop()
+        self._pieces = [last] if last else list()
+        for line in lines:
+            self.add_line(line + u"\n")
+
+    def add_line(self, line):
+        """
+        Add the cleaned up `line`, which ends with a newline unless it is the
+        last line.
+        """
+        if self.NBSP_PLACEHOLDER in line:
+            line = line.replace(self.NBSP_PLACEHOLDER, u" ")
+        if not self.keep_empty_lines:
+            if line in (u"", u"\n"):
+                return
+            if not line.endswith(u"\n"):
+                line += u"\n"
+        if u"\\." in line:
+            line = const.ESCAPED_NUMBER_DOT_REGEX.sub(ur"\g<1>\g<2>", line)
+        self.lines.append(line)
+
+    def close(self):
+        """
+        Return all Markdown that has been written.
+        """
+        if self._pieces:
+            self.add_line(u"".join(self._pieces))
+            self._pieces = list()
+        return u"".join(self.lines)
+
+
+# html2text options used by Power Format Pack
+POWER_FORMAT_PACK_OPTIONS = dict(
+        body_width=0,
+        # disable the escaping of Markdown-sensitive characters
+        escape_md_section=escape_md_section_override)
+
+
+class HTMLToMarkdown(html2text.HTML2Text):
+    """
+    html2text converter that can be used for many conversions, and that
+    writes its output to a MarkdownLineFilter instead of a string. The
+    html2text attributes in `options` are set before every conversion.
+    Conversions don't change any global state, so different instances can
+    be used in different threads at the same time.
+    """
+
+    def __init__(self, options=None):
+        if options is None:
+            options = POWER_FORMAT_PACK_OPTIONS
+        self.options    = options
+        self.sink       = MarkdownLineFilter()
+        html2text.HTML2Text.__init__(self, out=self.write)
+
+    def prepare(self, keep_empty_lines=False):
+        """
+        Prepare for a new conversion. html2text keeps the state of a
+        conversion in the attributes that are set on initialization.
+        """
+        self.sink = MarkdownLineFilter(keep_empty_lines)
+        html2text.HTML2Text.__init__(self, out=self.write)
+        for (option, value) in self.options.iteritems():
+            setattr(self, option, value)
+
+    def write(self, s):
+        if s:
+            self.lastWasNL = s[-1] == "\n"
+            self.sink.write(s)
+
+    def convert(self, html, keep_empty_lines=False):
+        """
+        Return the Markdown for `html`. Empty lines are removed from the
+        result, unless `keep_empty_lines` is set to `True`.
+        """
+        self.prepare(keep_empty_lines)
+        self.feed(html)
+        self.feed("")
+        # flushes the remaining output to the sink
+        self.close()
+        return self.sink.close()
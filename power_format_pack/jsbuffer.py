@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2014-2016 Stefan van den Akker <srvandenakker.dev@gmail.com>
+#
+# This file is part of Power Format Pack.
+#
+# Power Format Pack is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# Power Format Pack is distributed in the hope that it will be
+# useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General
+# Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Power Format Pack. If not, see http://www.gnu.org/licenses/.
+
+"""
+Buffer for the JavaScript that is evaluated in the webview of the editor.
+"""
+
+import contextlib
+
+from profiling import PROFILER
+
+
+class JSCommandBuffer(object):
+    """
+    Collect JavaScript snippets for the webview `web` and evaluate them in
+    a single call. Snippets are only collected inside `batch()`; outside of
+    it they are evaluated right away.
+    """
+
+    def __init__(self, web):
+        self.web        = web
+        self._commands  = list()
+        self._depth     = 0
+
+    @staticmethod
+    def join(commands):
+        """
+        Return a script that runs every snippet in `commands` in its own
+        function, so that an error in one of them doesn't prevent the others
+        from running, just like separate calls.
+        """
+        return u"\n".join(u"""\
+(function () {{
+    try {{
+{}
+    }} catch (e) {{
+        console.log(e);
+    }}
+}})();""".format(command) for command in commands)
+
+    def eval(self, js):
+        if self._depth:
+            self._commands.append(js)
+        else:
+            self.web.eval(js)
+
+    @PROFILER.profile
+    def flush(self):
+        """
+        Evaluate all collected snippets in one call.
+        """
+        if not self._commands:
+            return
+        js = self.join(self._commands)
+        self._commands = list()
+        self.web.eval(js)
+
+    def evaluate(self, js):
+        """
+        Flush the collected snippets, so that `js` sees their changes, and
+        return the result of evaluating `js`.
+        """
+        self.flush()
+        return self.web.page().mainFrame().evaluateJavaScript(js)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Collect the snippets that are evaluated in the body of the `with`
+        statement and flush them at the end of the outermost batch.
+        """
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self.flush()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2014-2016 Stefan van den Akker <srvandenakker.dev@gmail.com>
+#
+# This file is part of Power Format Pack.
+#
+# Power Format Pack is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# Power Format Pack is distributed in the hope that it will be
+# useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General
+# Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Power Format Pack. If not, see http://www.gnu.org/licenses/.
+
+"""
+Proxies for modules that are only imported when they are first used, to
+keep the startup of Anki fast.
+"""
+
+
+class LazyModule(object):
+    """
+    Stand-in for the module `name` that imports it the first time one of its
+    attributes is used. `importer_globals` are the globals of the importing
+    module, so that `name` is found in the same way as with an `import`
+    statement in that module.
+    """
+
+    def __init__(self, name, importer_globals):
+        self.__dict__["_name"]      = name
+        self.__dict__["_globals"]   = importer_globals
+        self.__dict__["_module"]    = None
+
+    @property
+    def is_loaded(self):
+        return self._module is not None
+
+    def load(self):
+        """
+        Import the module if that hasn't happened yet and return it.
+        """
+        if self._module is None:
+            # a non-empty `fromlist` makes `__import__` return the submodule
+            # instead of the top level package
+            self.__dict__["_module"] = __import__(
+                    self._name, self._globals, None, ["__name__"], -1)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self.load(), attr, value)
+
+    def __repr__(self):
+        return "<LazyModule {!r} ({})>".format(
+                self._name, "loaded" if self.is_loaded else "not loaded")
+
+
+class LazyAttribute(object):
+    """
+    Stand-in for `from <module_name> import <name>`, for classes and
+    functions. The module is imported the first time the attribute is called.
+    """
+
+    def __init__(self, module_name, name, importer_globals):
+        self.module     = LazyModule(module_name, importer_globals)
+        self.name       = name
+
+    def resolve(self):
+        return getattr(self.module, self.name)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self):
+        return "<LazyAttribute {!r} of {!r}>".format(self.name, self.module)
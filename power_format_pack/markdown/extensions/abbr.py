@@ -33,8 +33,16 @@ class AbbrExtension(Extension):
 
     def extendMarkdown(self, md, md_globals):
         """ Insert AbbrPreprocessor before ReferencePreprocessor. """
+        self.md = md
+        md.registerExtension(self)
         md.preprocessors.add('abbr', AbbrPreprocessor(md), '<reference')
 
+    def reset(self):
+        """ Remove the abbreviations of the previous document. """
+        for key in list(self.md.inlinePatterns.keys()):
+            if key.startswith('abbr-'):
+                del self.md.inlinePatterns[key]
+
 
 class AbbrPreprocessor(Preprocessor):
     """ Abbreviation Preprocessor - parse text for abbr references. """
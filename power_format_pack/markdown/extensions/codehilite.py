@@ -51,9 +51,11 @@ try:
             print e  # TODO: log error
             raise ImportError
 
-    from pygments import highlight
-    from pygments.lexers import get_lexer_by_name, guess_lexer
+    from pygments import format as format_tokens, highlight, lex
+    from pygments.filters import CoalesceFilter
+    from pygments.lexers import get_lexer_by_name, guess_lexer_fast
     from pygments.formatters import get_formatter_by_name
+    from pygments.incremental import IncrementalHighlighter
 
     pygments = True
 except ImportError as e:
@@ -76,6 +78,64 @@ def parse_hl_lines(expr):
         return []
 
 
+class LexerCache(object):
+    """
+    Lexers by language and options, so that the lexer of a language is only
+    looked up and created once. Highlighting doesn't change most lexers, so
+    one instance can be used for all code blocks. Languages without a lexer
+    are remembered as well.
+    """
+
+    # lexers that keep state from the code they highlighted, which get a new
+    # instance for every code block
+    STATEFUL_LEXERS = frozenset(['HTTP', 'Modula-2'])
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lexers = {}
+
+    def get(self, lang, **options):
+        """
+        Return the lexer for `lang`. Raise a `ValueError` when there is none.
+        """
+        key = ((lang or '').lower(), tuple(sorted(options.items())))
+        try:
+            lexer = self._lexers[key]
+            self.hits += 1
+        except KeyError:
+            self.misses += 1
+            try:
+                lexer = get_lexer_by_name(lang, **options)
+            except ValueError:
+                lexer = None
+            self._lexers[key] = lexer
+        if lexer is None:
+            raise ValueError('no lexer for alias %r found' % lang)
+        if lexer.name in self.STATEFUL_LEXERS:
+            return type(lexer)(**options)
+        return lexer
+
+    def clear(self):
+        self._lexers.clear()
+
+    def stats(self):
+        """
+        Return a dictionary with information about the use of the cache.
+        """
+        total = self.hits + self.misses
+        return dict(hits=self.hits,
+                    misses=self.misses,
+                    hit_rate=(float(self.hits) / total) if total else 0.0,
+                    entries=len(self._lexers))
+
+
+LEXER_CACHE = LexerCache()
+
+if pygments:
+    INCREMENTAL_HIGHLIGHTER = IncrementalHighlighter()
+
+
 # ------------------ The Main CodeHilite Class ----------------------
 class CodeHilite(object):
     """
@@ -93,6 +153,20 @@ class CodeHilite(object):
     * guess_lang: (Boolean) Turn language auto-detection
       'on' or 'off' (on by default).
 
+    * guess_time_limit: Seconds the language detection may spend on lexers
+      that are not among the best candidates. None (the default) only tries
+      the candidates.
+
+    * lexer_engine: How the lexer matches its rules: 'rules' (the default)
+      tries the rules of a state one by one, 'combined' all at once.
+
+    * coalesce_tokens: (Boolean) Merge consecutive tokens that look the same
+      before they are formatted (on by default).
+
+    * incremental: (Boolean) Only highlight again the lines that changed
+      since one of the last code blocks that were highlighted (on by
+      default).
+
     * css_class: Set class name of wrapper div ('codehilite' by default).
 
     * hl_lines: (List of integers) Lines to emphasize, 1-indexed.
@@ -107,11 +181,17 @@ class CodeHilite(object):
 
     def __init__(self, src=None, linenums=None, guess_lang=True,
                  css_class="codehilite", lang=None, style='default',
-                 noclasses=False, tab_length=4, hl_lines=None, use_pygments=True):
+                 noclasses=False, tab_length=4, hl_lines=None, use_pygments=True,
+                 guess_time_limit=None, lexer_engine='rules',
+                 coalesce_tokens=True, incremental=True):
         self.src = src
         self.lang = lang
         self.linenums = linenums
         self.guess_lang = guess_lang
+        self.guess_time_limit = guess_time_limit
+        self.lexer_engine = lexer_engine
+        self.coalesce_tokens = coalesce_tokens
+        self.incremental = incremental
         self.css_class = css_class
         self.style = style
         self.noclasses = noclasses
@@ -137,21 +217,41 @@ class CodeHilite(object):
 
         if pygments and self.use_pygments:
             try:
-                lexer = get_lexer_by_name(self.lang)
+                lexer = LEXER_CACHE.get(self.lang, engine=self.lexer_engine)
             except ValueError:
                 try:
                     if self.guess_lang:
-                        lexer = guess_lexer(self.src)
+                        lexer = guess_lexer_fast(
+                            self.src, time_limit=self.guess_time_limit,
+                            engine=self.lexer_engine)
                     else:
-                        lexer = get_lexer_by_name('text')
+                        lexer = LEXER_CACHE.get('text',
+                                                engine=self.lexer_engine)
                 except ValueError:
-                    lexer = get_lexer_by_name('text')
+                    lexer = LEXER_CACHE.get('text', engine=self.lexer_engine)
             formatter = get_formatter_by_name('html',
                                               linenos=self.linenums,
                                               cssclass=self.css_class,
                                               style=self.style,
                                               noclasses=self.noclasses,
                                               hl_lines=self.hl_lines)
+            filters = []
+            if self.coalesce_tokens:
+                # tokens of different types only look the same with inline
+                # styles
+                filters.append(CoalesceFilter(
+                    style=self.style if self.noclasses else None))
+            if self.incremental and IncrementalHighlighter.supports(lexer):
+                # everything that changes the HTML of a line
+                key = (type(lexer), self.lexer_engine, self.style,
+                       self.noclasses, self.coalesce_tokens)
+                return INCREMENTAL_HIGHLIGHTER.highlight(
+                    self.src, lexer, formatter, filters, key=key)
+            if filters:
+                tokens = lex(self.src, lexer)
+                for filter_ in filters:
+                    tokens = filter_.filter(lexer, tokens)
+                return format_tokens(tokens, formatter)
             return highlight(self.src, lexer, formatter)
         else:
             # just escape and build markup usable by JS highlighting libs
@@ -241,6 +341,10 @@ class HiliteTreeprocessor(Treeprocessor):
                     block[0].text,
                     linenums=self.config['linenums'],
                     guess_lang=self.config['guess_lang'],
+                    guess_time_limit=self.config['guess_time_limit'],
+                    lexer_engine=self.config['lexer_engine'],
+                    coalesce_tokens=self.config['coalesce_tokens'],
+                    incremental=self.config['incremental'],
                     css_class=self.config['css_class'],
                     style=self.config['pygments_style'],
                     noclasses=self.config['noclasses'],
@@ -267,6 +371,20 @@ class CodeHiliteExtension(Extension):
                          "Use lines numbers. True=yes, False=no, None=auto"],
             'guess_lang': [True,
                            "Automatic language detection - Default: True"],
+            'guess_time_limit': [None,
+                                 "Seconds the language detection may spend "
+                                 "on unlikely languages - Default: None "
+                                 "(none at all)"],
+            'lexer_engine': ['rules',
+                             "How lexers match their rules: 'rules' "
+                             "or 'combined' - Default: 'rules'"],
+            'coalesce_tokens': [True,
+                                "Merge consecutive tokens that look the "
+                                "same - Default: True"],
+            'incremental': [True,
+                            "Only highlight the lines of a code block that "
+                            "changed since it was last highlighted - "
+                            "Default: True"],
             'css_class': ["codehilite",
                           "Set class name for wrapper <div> - "
                           "Default: codehilite"],
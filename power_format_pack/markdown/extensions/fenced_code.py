@@ -79,6 +79,12 @@ class FencedBlockPreprocessor(Preprocessor):
                         m.group('code'),
                         linenums=self.codehilite_conf['linenums'][0],
                         guess_lang=self.codehilite_conf['guess_lang'][0],
+                        guess_time_limit=self.codehilite_conf[
+                            'guess_time_limit'][0],
+                        lexer_engine=self.codehilite_conf['lexer_engine'][0],
+                        coalesce_tokens=self.codehilite_conf[
+                            'coalesce_tokens'][0],
+                        incremental=self.codehilite_conf['incremental'][0],
                         css_class=self.codehilite_conf['css_class'][0],
                         style=self.codehilite_conf['pygments_style'][0],
                         lang=(m.group('lang') or None),
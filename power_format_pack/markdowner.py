@@ -26,6 +26,7 @@ from PyQt4 import QtGui
 import utility
 import const
 import preferences
+from profiling import PROFILER
 
 
 class Markdowner(object):
@@ -41,7 +42,7 @@ class Markdowner(object):
                  current_field, selected_html):
         assert isinstance(html, unicode), "Input `html` is not Unicode"
         assert isinstance(selected_html, unicode), "Input `selected_html` is not Unicode"
-        self.c                              = utility.get_config_parser()
+        self.c                              = utility.get_config()
         self.editor_instance                = other
         self.parent_window                  = parent_window
         self.col                            = mw.col
@@ -55,6 +56,7 @@ class Markdowner(object):
         self._id                            = None
         self.isconverted                    = None
         self.md                             = None
+        self._md_data                       = None
         self._lastmodified                  = None
         self.has_data                       = self.get_data_from_field()
         if not self.has_data:
@@ -70,64 +72,104 @@ class Markdowner(object):
         else:
             const.MARKDOWN_PREFS["disable_buttons"] = False
 
+    @PROFILER.profile
     def apply_markdown(self):
         self.cancel_html = self.html
         has_def_list = False
         if "<dl>" in self.html:
             has_def_list = True
-            self.create_correct_md_for_def_list()
+            with PROFILER.stage(u"markdowner.apply_markdown.def_list"):
+                self.create_correct_md_for_def_list()
             self.html = self.note.fields[self.current_field]
-        clean_md = utility.convert_html_to_markdown(self.html)
-        if has_def_list:
-            clean_md = utility.remove_leading_whitespace_from_dd_element(clean_md)
-        clean_md = utility.remove_whitespace_before_abbreviation_definition(
-                clean_md)
-        clean_md_escaped = utility.escape_html_chars(clean_md)
+        with PROFILER.stage(u"markdowner.apply_markdown.html_to_markdown"):
+            clean_md = utility.convert_html_to_markdown(self.html)
+            if has_def_list:
+                clean_md = utility.remove_leading_whitespace_from_dd_element(
+                        clean_md)
+            clean_md = utility.remove_whitespace_before_abbreviation_definition(
+                    clean_md)
+            clean_md_escaped = utility.escape_html_chars(clean_md)
         if not clean_md:
             return
         # check for changed Markdown between the stored data and the current text
         if (self.has_data and self.isconverted == "True"):
-            compare_md = utility.convert_markdown_to_html(self.md)
-            compare_md = utility.put_colons_in_html_def_list(compare_md)
-            compare_md = utility.convert_html_to_markdown(compare_md)
-            if has_def_list:
-                compare_md = utility.remove_leading_whitespace_from_dd_element(compare_md)
-            compare_md = utility.remove_whitespace_before_abbreviation_definition(
-                    compare_md)
-            if not any(x in compare_md for x in("&amp;", "&quot;", "&apos;",
-                                                "&gt;", "&lt;")):
-                compare_md_escaped = utility.escape_html_chars(compare_md)
-                compare_md = compare_md_escaped
-            if (utility.is_same_markdown(clean_md_escaped, compare_md) or
+            with PROFILER.stage(u"markdowner.apply_markdown.compare"):
+                compare_md = utility.render_markdown(self.md)[1]
+                if has_def_list:
+                    compare_md = utility.remove_leading_whitespace_from_dd_element(compare_md)
+                compare_md = utility.remove_whitespace_before_abbreviation_definition(
+                        compare_md)
+                if not any(x in compare_md for x in("&amp;", "&quot;", "&apos;",
+                                                    "&gt;", "&lt;")):
+                    compare_md_escaped = utility.escape_html_chars(compare_md)
+                    compare_md = compare_md_escaped
+                is_same = utility.is_same_markdown(clean_md_escaped, compare_md)
+            if (is_same or
                    preferences.PREFS.get(const.MARKDOWN_ALWAYS_REVERT)):
-                self.revert_to_stored_markdown()
+                with PROFILER.stage(u"markdowner.apply_markdown.revert"):
+                    self.revert_to_stored_markdown()
             else:
                 self.handle_conflict()
         else:
-            # make abbreviations behave correctly
-            new_html = utility.convert_markdown_to_html(clean_md)
-            # needed for proper display of images
-            if "<img" in new_html:
-                new_html = utility.unescape_html(new_html)
-            html_with_data = utility.make_data_ready_to_insert(
-                    self.current_note_id_and_field, "True",
-                    clean_md_escaped, new_html)
-            self.insert_markup_in_field(
-                    html_with_data, self.editor_instance.currentField)
-            self.align_elements()
-            const.MARKDOWN_PREFS["disable_buttons"] = True
-            self.warn_about_changes(self.editor_instance,
-                                    self.current_field,
-                                    const.MARKDOWN_BG_COLOR)
+            with PROFILER.stage(u"markdowner.apply_markdown.markdown_to_html"):
+                # make abbreviations behave correctly
+                new_html = utility.convert_markdown_to_html(clean_md)
+                # needed for proper display of images
+                if "<img" in new_html:
+                    new_html = utility.unescape_html(new_html)
+                html_with_data = utility.make_data_ready_to_insert(
+                        self.current_note_id_and_field, "True",
+                        clean_md_escaped, new_html)
+            with PROFILER.stage(u"markdowner.apply_markdown.insert"):
+                self.insert_markup_in_field(
+                        html_with_data, self.editor_instance.currentField)
+                self.align_elements()
+                const.MARKDOWN_PREFS["disable_buttons"] = True
+                self.warn_about_changes(self.editor_instance,
+                                        self.current_field,
+                                        const.MARKDOWN_BG_COLOR)
+
+    @property
+    def md(self):
+        """
+        The Markdown stored in the field. It is only decoded the first time
+        it is needed.
+        """
+        if self._md is None and self._md_data:
+            md_data = self._md_data
+            self._md_data = None
+            self.load_md_data(md_data)
+        return self._md
+
+    @md.setter
+    def md(self, value):
+        self._md = value
+        self._md_data = None
 
     def get_data_from_field(self):
         """
         Get the HTML from the current field and try to extract Markdown data
         from it. The side effect of calling this function is that several
-        instance variables get set. Return True when data was found in the
-        field, False otherwise.
+        instance variables get set. When the data has a header, only the
+        header is read; the data itself is decoded when `md` is first used.
+        Return True when data was found in the field, False otherwise.
         """
         compr_dict = utility.get_md_data_from_string(self.html)
+        if not compr_dict:
+            return False
+        (header, _data) = utility.split_md_data(compr_dict)
+        if header is not None:
+            self.md             = None
+            self._md_data       = compr_dict
+            self.isconverted    = header.get("isconverted")
+            return True
+        return self.load_md_data(compr_dict)
+
+    def load_md_data(self, compr_dict):
+        """
+        Decode the Markdown data `compr_dict` and set the instance variables
+        accordingly. Return True when the data is valid, False otherwise.
+        """
         md_dict = utility.decompress_and_json_load(compr_dict)
         if md_dict and md_dict == "corrupted":
             # TODO: fallback when JSON is corrupted
@@ -145,7 +187,7 @@ class Markdowner(object):
         """
         Put markup in the specified field.
         """
-        self.editor_instance.web.eval("""
+        self.editor_instance.js_buffer.eval("""
             document.getElementById('f%s').innerHTML = %s;
         """ % (field, json.dumps(unicode(markup))))
 
@@ -154,12 +196,12 @@ class Markdowner(object):
         Disable the specified contenteditable field.
         """
         if preferences.PREFS.get(const.MARKDOWN_OVERRIDE_EDITING):
-            warning_text = self.c.get(const.CONFIG_TOOLTIPS,
-                                      "md_warning_editing_enabled_tooltip")
+            warning_text = self.c.tooltip(
+                    "md_warning_editing_enabled_tooltip")
         else:
-            warning_text = self.c.get(const.CONFIG_TOOLTIPS,
-                                      "md_warning_editing_disabled_tooltip")
-        editor_instance.web.eval("""
+            warning_text = self.c.tooltip(
+                    "md_warning_editing_disabled_tooltip")
+        editor_instance.js_buffer.eval("""
             if (document.getElementById('mdwarn%s') === null) {
                 var style_tag_list = document.getElementsByTagName('style');
                 if (style_tag_list.length === 0) {
@@ -188,7 +230,7 @@ class Markdowner(object):
 
     @staticmethod
     def remove_warn_msg(editor_instance, field):
-        editor_instance.web.eval("""
+        editor_instance.js_buffer.eval("""
             if (document.getElementById('mdwarn%s') !== null) {
                 var field = document.getElementById('f%s');
                 field.classList.remove('mdstyle');
@@ -251,15 +293,15 @@ class Markdowner(object):
         the Markdown, 1 for overwriting the data, and QMessageBox.Cancel for
         no action.
         """
+        # show the field as it is now behind the dialog
+        self.editor_instance.js_buffer.flush()
         mess = QtGui.QMessageBox(self.parent_window)
         mess.setIcon(QtGui.QMessageBox.Warning)
         # TODO: think about putting the text of the dialog in property files
-        mess.setWindowTitle(self.c.get(const.CONFIG_WINDOW_TITLES,
-                                       "md_overwrite_warning"))
-        mess.setText(self.c.get(const.CONFIG_WARNINGS,
-                                "md_overwrite_warning_text"))
-        mess.setInformativeText(self.c.get(const.CONFIG_WARNINGS,
-                                "md_overwrite_warning_additional_text"))
+        mess.setWindowTitle(self.c.window_title("md_overwrite_warning"))
+        mess.setText(self.c.warning("md_overwrite_warning_text"))
+        mess.setInformativeText(
+                self.c.warning("md_overwrite_warning_additional_text"))
         replaceButton = QtGui.QPushButton("&Replace", mess)
         mess.addButton(replaceButton, QtGui.QMessageBox.ApplyRole)
         mess.addButton("&Overwrite", QtGui.QMessageBox.ApplyRole)
@@ -274,20 +316,20 @@ class Markdowner(object):
         Code blocks can be given a specific `code_direction`.
         """
         # align text in code blocks to the left
-        self.editor_instance.web.eval("""
+        self.editor_instance.js_buffer.eval("""
             $('.codehilite').attr('align', 'left');
         """)
 
         # align the code block itself
         if preferences.PREFS.get(const.MARKDOWN_CODE_DIRECTION) != const.LEFT:
-            self.editor_instance.web.eval("""
+            self.editor_instance.js_buffer.eval("""
                 var table = '<table><tbody><tr><td></td></tr></tbody></table>';
                 $('.codehilite:not(.codehilitetable .codehilite)').wrap(table);
                 $('.codehilite').parents().filter('table').addClass('codehilitetable').attr('align', '%s');
             """ % preferences.PREFS.get(const.MARKDOWN_CODE_DIRECTION))
 
         # footnotes
-        self.editor_instance.web.eval("""
+        self.editor_instance.js_buffer.eval("""
             var elems = document.getElementsByTagName('*');
             var regex = /fn:/;
             for (var i = 0; i < elems.length; i++) {
@@ -299,7 +341,7 @@ class Markdowner(object):
         """)
 
         # definition lists, lists
-        self.editor_instance.web.eval("""
+        self.editor_instance.js_buffer.eval("""
             var elems = document.querySelectorAll('dt,dd,li');
             for (var i = 0; i < elems.length; i++) {
                 elems[i].setAttribute('align', 'left');
@@ -311,7 +353,7 @@ class Markdowner(object):
         Change the input `md` to make sure it will transform to the
         correct HTML.
         """
-        self.editor_instance.web.eval("""\
+        self.editor_instance.js_buffer.eval("""\
             var dds = document.getElementsByTagName('dd');
             for (var i = 0; i < dds.length; i++) {
                 var theDD = dds[i];
@@ -330,5 +372,8 @@ class Markdowner(object):
             }
         """)
         self.editor_instance.web.setFocus()
-        self.editor_instance.web.eval("focusField(%d);" % self.current_field)
+        self.editor_instance.js_buffer.eval(
+                "focusField(%d);" % self.current_field)
+        # saving reads the fields from the webview
+        self.editor_instance.js_buffer.flush()
         self.editor_instance.saveNow()
@@ -23,6 +23,8 @@ import utility
 import const
 import preferences
 from prefhelper import PrefHelper
+from profiling import PROFILER
+from batchmarkdown import MarkdownDataMigration
 
 
 class ExtraButtons_Options(QtGui.QMenu):
@@ -34,7 +36,7 @@ class ExtraButtons_Options(QtGui.QMenu):
         super(ExtraButtons_Options, self).__init__()
         self.main_window = main_window
         self.radio_buttons = list()
-        self.c = utility.get_config_parser()
+        self.c = utility.get_config()
 
     def button_switch(self, state, name, callback=None):
         """
@@ -114,9 +116,42 @@ class ExtraButtons_Options(QtGui.QMenu):
                 self.main_window)
         doc_action.triggered.connect(self.show_doc_dialog)
 
+        md_data_migration_action = QtGui.QAction(
+                self.c.get(const.CONFIG_MENU_NAMES, "md_data_migration_action"),
+                self.main_window)
+        md_data_migration_action.triggered.connect(
+                lambda: MarkdownDataMigration(self.main_window).run())
+
+        profiling_action = QtGui.QAction(
+                self.c.get(const.CONFIG_MENU_NAMES, "profiling_action"),
+                self.main_window)
+        profiling_action.triggered.connect(self.save_profiling_data)
+
         sub_menu.addAction(options_action)
         sub_menu.addAction(about_action)
         sub_menu.addAction(doc_action)
+        sub_menu.addSeparator()
+        sub_menu.addAction(md_data_migration_action)
+        sub_menu.addAction(profiling_action)
+
+    def save_profiling_data(self):
+        path = QtGui.QFileDialog.getSaveFileName(
+                self.main_window,
+                self.c.window_title("profiling"),
+                PrefHelper.get_profiling_path(),
+                "JSON (*.json)")
+        if not path:
+            return
+        try:
+            PROFILER.dump(unicode(path))
+        except IOError as e:
+            print e  # TODO: log error
+            return
+        QtGui.QMessageBox.information(
+                self.main_window,
+                self.c.window_title("profiling"),
+                self.c.label("profiling_saved_label").format(
+                        len(PROFILER.histograms)))
 
     def show_doc_dialog(self):
         dialog = QtGui.QDialog(self)
@@ -262,6 +297,41 @@ class ExtraButtons_Options(QtGui.QMenu):
 
         return self.put_elems_in_box((cb,), const.HBOX, const.WIDGET)
 
+    def markdown_persist_cache_option(self):
+        cb = self.create_checkbox(const.MARKDOWN_PERSIST_CACHE,
+                                  None,
+                                  self.c.get(const.CONFIG_LABELS,
+                                             "persist_cache_cb_label"))
+        utility.set_tool_tip(cb, self.c.get(const.CONFIG_TOOLTIPS,
+                                            "persist_cache_cb_tooltip"))
+
+        return self.put_elems_in_box((cb,), const.HBOX, const.WIDGET)
+
+    def markdown_warm_up_option(self):
+        cb = self.create_checkbox(const.MARKDOWN_WARM_UP,
+                                  None,
+                                  self.c.get(const.CONFIG_LABELS,
+                                             "warm_up_cb_label"))
+        utility.set_tool_tip(cb, self.c.get(const.CONFIG_TOOLTIPS,
+                                            "warm_up_cb_tooltip"))
+
+        return self.put_elems_in_box((cb,), const.HBOX, const.WIDGET)
+
+    def profiling_option(self):
+        cb = self.create_checkbox(const.PROFILING,
+                                  None,
+                                  self.c.get(const.CONFIG_LABELS,
+                                             "profiling_cb_label"),
+                                  self.update_profiler)
+        utility.set_tool_tip(cb, self.c.get(const.CONFIG_TOOLTIPS,
+                                            "profiling_cb_tooltip"))
+
+        return self.put_elems_in_box((cb,), const.HBOX, const.WIDGET)
+
+    @staticmethod
+    def update_profiler():
+        PROFILER.enabled = bool(preferences.PREFS.get(const.PROFILING))
+
     def markdown_linenums_option(self):
         linenums_cb = self.create_checkbox(const.MARKDOWN_LINE_NUMS,
                                            None,
@@ -362,6 +432,15 @@ class ExtraButtons_Options(QtGui.QMenu):
         # override disabled buttons in rendered Markdown
         md_vbox.addLayout(self.override_disabled_buttons_rendered_markdown())
 
+        # keep the rendered Markdown between sessions
+        md_vbox.addLayout(self.markdown_persist_cache_option())
+
+        # load the Markdown modules after startup
+        md_vbox.addLayout(self.markdown_warm_up_option())
+
+        # time the steps of the Markdown conversion
+        md_vbox.addLayout(self.profiling_option())
+
         md_vbox.setSpacing(self.c.getint(const.CONFIG_QT, "spacing_buttons"))
 
         md_groupbox.setLayout(md_vbox)
@@ -380,6 +459,9 @@ class ExtraButtons_Options(QtGui.QMenu):
                                                 const.MARKDOWN_CODE_DIRECTION,
                                                 const.BUTTON_PLACEMENT,
                                                 const.MARKDOWN_OVERRIDE_EDITING,
+                                                const.MARKDOWN_PERSIST_CACHE,
+                                                const.PROFILING,
+                                                const.MARKDOWN_WARM_UP,
                                                 const.MARKDOWN,
                                                 const.STYLE_TABLE
                                             )]
@@ -527,3 +609,4 @@ class ExtraButtons_Options(QtGui.QMenu):
                     PrefHelper.load_preferences_from_disk()):
                 print "Reverting preferences..."
                 preferences.PREFS = PrefHelper.load_preferences_from_disk()
+                self.update_profiler()
@@ -36,7 +36,7 @@ class OrderedList(QtGui.QDialog):
         config_path = os.path.join(PrefHelper.get_addons_folder(),
                                    const.FOLDER_NAME,
                                    const.CONFIG_FILENAME)
-        self.c = utility.get_config_parser(config_path)
+        self.c = utility.get_config(config_path)
 
         if not fixed:
             self.show_dialog_window()
@@ -41,6 +41,24 @@ class PrefHelper(object):
                             const.FOLDER_NAME,
                             ".extra_buttons_prefs")
 
+    @staticmethod
+    def get_render_cache_path():
+        return os.path.join(PrefHelper.get_addons_folder(),
+                            const.FOLDER_NAME,
+                            const.RENDER_CACHE_FILENAME)
+
+    @staticmethod
+    def get_regex_cache_path():
+        return os.path.join(PrefHelper.get_addons_folder(),
+                            const.FOLDER_NAME,
+                            const.REGEX_CACHE_DIRNAME)
+
+    @staticmethod
+    def get_profiling_path():
+        return os.path.join(PrefHelper.get_addons_folder(),
+                            const.FOLDER_NAME,
+                            const.PROFILING_FILENAME)
+
     @staticmethod
     def get_keybindings_path():
         if isMac:
@@ -91,6 +109,9 @@ class PrefHelper(object):
                 const.MARKDOWN_LINE_NUMS:           False,
                 const.MARKDOWN_ALWAYS_REVERT:       False,
                 const.MARKDOWN_OVERRIDE_EDITING:    False,
+                const.MARKDOWN_PERSIST_CACHE:       False,
+                const.PROFILING:                    False,
+                const.MARKDOWN_WARM_UP:             True,
                 const.BUTTON_PLACEMENT:             "adjacent",
                 const.CODE:                         True,
                 const.UNORDERED_LIST:               True,
@@ -269,7 +290,7 @@ class PrefHelper(object):
         config_path = os.path.join(PrefHelper.get_addons_folder(),
                                    const.FOLDER_NAME,
                                    const.CONFIG_FILENAME)
-        c = utility.get_config_parser(config_path)
+        c = utility.get_config(config_path)
 
         contents = c.get(const.CONFIG_KEYBINDINGS, "help_text")
         contents += u"\n\n{\n"
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2014-2016 Stefan van den Akker <srvandenakker.dev@gmail.com>
+#
+# This file is part of Power Format Pack.
+#
+# Power Format Pack is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# Power Format Pack is distributed in the hope that it will be
+# useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General
+# Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Power Format Pack. If not, see http://www.gnu.org/licenses/.
+
+"""
+Opt-in timing of the stages of the Markdown conversion. The time spent in
+each stage is kept in a histogram in memory, which can be written to a file
+to find out what makes a toggle slow.
+"""
+
+import codecs
+import contextlib
+import ctypes
+import functools
+import sys
+import timeit
+
+from anki.utils import json
+
+
+def _get_monotonic_clock():
+    """
+    Return a function that returns the seconds of a monotonic clock. On
+    Linux that is `CLOCK_MONOTONIC`; Python 2 has no portable monotonic
+    clock, so elsewhere the best timer of `timeit` is used, which is
+    monotonic on Windows.
+    """
+    if not sys.platform.startswith("linux"):
+        return timeit.default_timer
+
+    class timespec(ctypes.Structure):
+        _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+    try:
+        clock_gettime = ctypes.CDLL("libc.so.6").clock_gettime
+    except (OSError, AttributeError) as e:
+        print e  # TODO: log error
+        return timeit.default_timer
+    clock_gettime.argtypes = [ctypes.c_int, ctypes.POINTER(timespec)]
+    CLOCK_MONOTONIC = 1
+    ts = timespec()
+    ts_pointer = ctypes.pointer(ts)
+
+    def monotonic():
+        if clock_gettime(CLOCK_MONOTONIC, ts_pointer):
+            return timeit.default_timer()
+        return ts.tv_sec + ts.tv_nsec * 1e-9
+
+    return monotonic
+
+
+monotonic = _get_monotonic_clock()
+
+
+class StageHistogram(object):
+    """
+    Number of times a stage took a certain time, counted in buckets with
+    upper bounds in milliseconds `bounds`. The last bucket counts the times
+    that are larger than the largest bound.
+    """
+
+    BOUNDS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+    def __init__(self, bounds=BOUNDS):
+        self.bounds     = bounds
+        self.buckets    = [0] * (len(bounds) + 1)
+        self.count      = 0
+        self.total      = 0.0
+        self.min        = None
+        self.max        = None
+
+    def add(self, ms):
+        index = 0
+        for bound in self.bounds:
+            if ms <= bound:
+                break
+            index += 1
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += ms
+        if self.min is None or ms < self.min:
+            self.min = ms
+        if self.max is None or ms > self.max:
+            self.max = ms
+
+    def to_dict(self):
+        labels = [u"<={}".format(bound) for bound in self.bounds]
+        labels.append(u">{}".format(self.bounds[-1]))
+        return dict(count=self.count,
+                    total_ms=self.total,
+                    mean_ms=(self.total / self.count) if self.count else 0.0,
+                    min_ms=self.min,
+                    max_ms=self.max,
+                    buckets=dict(zip(labels, self.buckets)))
+
+
+class _NullStage(object):
+    """
+    Stage that does nothing, used when profiling is disabled.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Profiler(object):
+    """
+    Collect the time spent in named stages. When `enabled` is False, timing
+    a stage costs no more than an attribute lookup and an empty `with`
+    statement.
+    """
+
+    def __init__(self, enabled=False, clock=monotonic):
+        self.enabled    = enabled
+        self.clock      = clock
+        self.histograms = dict()
+
+    def record(self, name, seconds):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = StageHistogram()
+        histogram.add(seconds * 1000.0)
+
+    def stage(self, name):
+        """
+        Return a context manager that records the time spent in its body
+        under `name`.
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return self._timed_stage(name)
+
+    @contextlib.contextmanager
+    def _timed_stage(self, name):
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.record(name, self.clock() - start)
+
+    def profile(self, func):
+        """
+        Decorator that records the time spent in `func` under the name of
+        its module and the function name, e.g. `utility.unescape_html`.
+        """
+        name = u"{}.{}".format(func.__module__.rpartition(".")[2],
+                               func.__name__)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            start = self.clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, self.clock() - start)
+
+        return wrapper
+
+    def clear(self):
+        self.histograms.clear()
+
+    def stats(self):
+        """
+        Return a dictionary with the histogram of each stage.
+        """
+        return dict((name, histogram.to_dict())
+                    for (name, histogram) in self.histograms.iteritems())
+
+    def dump(self, path):
+        """
+        Write the histograms to the file `path` as JSON.
+        """
+        with codecs.open(path, "w", encoding="utf8") as f:
+            f.write(json.dumps(self.stats(), indent=4, sort_keys=True))
+
+
+PROFILER = Profiler()
@@ -13,7 +13,7 @@
 import re
 
 from pygments.token import String, Comment, Keyword, Name, Error, Whitespace, \
-    string_to_tokentype
+    Text, Token, string_to_tokentype
 from pygments.filter import Filter
 from pygments.util import get_list_opt, get_int_opt, get_bool_opt, \
      get_choice_opt, ClassNotFound, OptionError, text_type, string_types
@@ -339,6 +339,128 @@ class TokenMergeFilter(Filter):
             yield current_type, current_value
 
 
+class CoalesceFilter(Filter):
+    """Merges consecutive tokens that a formatter would render the same
+    way, so that it has fewer tokens to go through and fewer elements to
+    write.
+
+    Consecutive tokens with the same token type are always merged, like
+    the `TokenMergeFilter` does, but their values are joined once per run
+    instead of once per token. The ``Error`` tokens of unknown characters
+    and the whitespace of many lexers come out one character or line at a
+    time, so the runs can be long.
+
+    Options accepted:
+
+    `style` : string or Style subclass
+       The style of a formatter that writes a style per token, like the
+       `HtmlFormatter` with the `noclasses` option. Consecutive tokens
+       whose types have the same style in it are then merged as well,
+       together with the whitespace between them on the same line if it
+       would look the same with their style (same background color,
+       underline and border).
+       The merged token keeps the type of its first token, so don't give a
+       style for a formatter that writes token types, like CSS classes.
+       The default is ``None``.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self, **options):
+        Filter.__init__(self, **options)
+        style = options.get('style')
+        if isinstance(style, string_types):
+            from pygments.styles import get_style_by_name
+            style = get_style_by_name(style)
+        self.style = style
+        # token type -> number of its style and of the style of whitespace
+        # in it, for self.style
+        self._style_ids = {}
+        self._space_ids = {}
+        self._ids = {}
+
+    def _add_token_type(self, ttype):
+        styled_ttype = ttype
+        styles = self.style._styles
+        while styled_ttype not in styles:
+            styled_ttype = styled_ttype.parent
+        if styled_ttype is Text or styled_ttype is Token:
+            # left to the style of the whole block by formatters
+            ndef = ('', 0, 0, 0, '', '', 0, 0, 0)
+        else:
+            ndef = tuple(styles[styled_ttype])
+        ids = self._ids
+        style_id = self._style_ids[ttype] = ids.setdefault(ndef, len(ids))
+        # only the background, underline and border of whitespace show
+        self._space_ids[ttype] = ids.setdefault(ndef[3:6], len(ids))
+        return style_id
+
+    def filter(self, lexer, stream):
+        if self.style is None:
+            return self._merge_same_types(stream)
+        return self._merge_same_styles(stream)
+
+    def _merge_same_types(self, stream):
+        current_type = None
+        values = []
+        for ttype, value in stream:
+            if ttype is not current_type:
+                if current_type is not None:
+                    yield current_type, u''.join(values)
+                    values = []
+                current_type = ttype
+            values.append(value)
+        if current_type is not None:
+            yield current_type, u''.join(values)
+
+    def _merge_same_styles(self, stream):
+        style_ids = self._style_ids
+        space_ids = self._space_ids
+        current_type = None
+        current_values = []
+        current_id = None
+        current_space_id = None
+        # whitespace after the current token, that is merged into it if
+        # the next token has the same style
+        spaces = []
+        for ttype, value in stream:
+            if not value:
+                # nothing to write, and it would hide where a line ends
+                continue
+            if ttype is current_type:
+                style_id = current_id
+            else:
+                try:
+                    style_id = style_ids[ttype]
+                except KeyError:
+                    style_id = self._add_token_type(ttype)
+            if style_id == current_id:
+                if spaces:
+                    current_values.extend([space for _, space in spaces])
+                    del spaces[:]
+                current_values.append(value)
+            elif (space_ids[ttype] == current_space_id and
+                  value.isspace() and '\n' not in value and
+                  current_values[-1][-1:] != '\n'):
+                # merging whitespace across lines saves nothing, as the
+                # HTML formatter ends all spans at the end of a line
+                spaces.append((ttype, value))
+            else:
+                if current_type is not None:
+                    yield current_type, u''.join(current_values)
+                    if spaces:
+                        for token in self._merge_same_types(spaces):
+                            yield token
+                        del spaces[:]
+                current_type = ttype
+                current_values = [value]
+                current_id = style_id
+                current_space_id = space_ids[ttype]
+        if current_type is not None:
+            yield current_type, u''.join(current_values)
+            for token in self._merge_same_types(spaces):
+                yield token
+
 FILTERS = {
     'codetagify':     CodeTagFilter,
     'keywordcase':    KeywordCaseFilter,
@@ -347,4 +469,5 @@ FILTERS = {
     'whitespace':     VisibleWhitespaceFilter,
     'gobble':         GobbleFilter,
     'tokenmerge':     TokenMergeFilter,
+    'coalesce':       CoalesceFilter,
 }
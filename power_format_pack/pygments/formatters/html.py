@@ -42,6 +42,11 @@ def escape_html(text, table=_escape_html_table):
     return text.translate(table)
 
 
+# (formatter class, style, class prefix) -> (ttype2class, class2style,
+# inline spans), see `HtmlFormatter._create_stylesheet`
+_stylesheet_cache = {}
+
+
 def _get_ttype_class(ttype):
     fname = STANDARD_TYPES.get(ttype)
     if fname:
@@ -438,8 +443,18 @@ class HtmlFormatter(Formatter):
         return cls
 
     def _create_stylesheet(self):
-        t2c = self.ttype2class = {Token: ''}
-        c2s = self.class2style = {}
+        # the tables only depend on the style and the class names, so they
+        # are built once and shared by all formatters, which only read them;
+        # the inline spans of the token types are added as they are used
+        key = (type(self), self.style, self.classprefix)
+        tables = _stylesheet_cache.get(key)
+        if tables is None:
+            tables = _stylesheet_cache[key] = self._build_stylesheet() + ({},)
+        self.ttype2class, self.class2style, self._inline_spans = tables
+
+    def _build_stylesheet(self):
+        t2c = {Token: ''}
+        c2s = {}
         for ttype, ndef in self.style:
             name = self._get_css_class(ttype)
             style = ''
@@ -460,6 +475,7 @@ class HtmlFormatter(Formatter):
                 # save len(ttype) to enable ordering the styles by
                 # hierarchy (necessary for CSS cascading rules!)
                 c2s[name] = (style[:-2], ttype, len(ttype))
+        return t2c, c2s
 
     def get_style_defs(self, arg=None):
         """
@@ -707,6 +723,8 @@ class HtmlFormatter(Formatter):
         # for <span style=""> lookup only
         getcls = self.ttype2class.get
         c2s = self.class2style
+        # token type -> (styled token type, opening span)
+        spans = self._inline_spans
         escape_table = _escape_html_table
         tagsfile = self.tagsfile
 
@@ -714,11 +732,17 @@ class HtmlFormatter(Formatter):
         line = ''
         for ttype, value in tokensource:
             if nocls:
-                cclass = getcls(ttype)
-                while cclass is None:
-                    ttype = ttype.parent
-                    cclass = getcls(ttype)
-                cspan = cclass and '<span style="%s">' % c2s[cclass][0] or ''
+                span = spans.get(ttype)
+                if span is None:
+                    styled_ttype = ttype
+                    cclass = getcls(styled_ttype)
+                    while cclass is None:
+                        styled_ttype = styled_ttype.parent
+                        cclass = getcls(styled_ttype)
+                    span = spans[ttype] = (
+                        styled_ttype,
+                        cclass and '<span style="%s">' % c2s[cclass][0] or '')
+                ttype, cspan = span
             else:
                 cls = self._get_css_classes(ttype)
                 cspan = cls and '<span class="%s">' % cls or ''
@@ -818,7 +842,27 @@ class HtmlFormatter(Formatter):
         use several different wrappers that process the original source
         linewise, e.g. line number generators.
         """
-        source = self._format_lines(tokensource)
+        self._format_source(self._format_lines(tokensource), outfile)
+
+    def format_lines(self, lines, outfile):
+        """
+        Write ``lines``, the HTML of each line of a text as
+        `format_line_tokens` returns it, wrapped like `format_unencoded`
+        wraps the lines of a token stream.
+        """
+        self._format_source(((1, line) for line in lines), outfile)
+
+    def format_line_tokens(self, tokensource):
+        """
+        Return an iterator over the HTML of each line of the tokens in
+        ``tokensource``, without any wrapping. The HTML of a line only
+        depends on the tokens of that line, so lines formatted earlier
+        can be combined with new ones by `format_lines`.
+        """
+        for t, line in self._format_lines(tokensource):
+            yield line
+
+    def _format_source(self, source, outfile):
         if self.hl_lines:
             source = self._highlight_lines(source)
         if not self.nowrap:
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+    pygments.incremental
+    ~~~~~~~~~~~~~~~~~~~~
+
+    Highlighting of texts that only differ in a few lines from a text that
+    was highlighted before, like a code block that is edited and
+    highlighted again.
+
+    For the texts it highlights, `IncrementalHighlighter` keeps the tokens
+    of the lexer, and for each line its HTML and the state stack of the
+    lexer at its start. When a new text shares its first and last lines
+    with one of these texts, only the lines from the first change up to
+    the first unchanged line where the lexer is back in the state it had
+    there before are formatted again. The tokens and HTML of all other
+    lines are taken from the earlier text.
+
+    The lexer goes on from its state at the start of a line `resume_margin`
+    lines before the first change. Its tokens on those lines are compared
+    with the earlier ones, and the whole text is highlighted again if they
+    differ, as a rule looked ahead into the changes then. A rule that looks
+    ahead further than that from an earlier line is not noticed. After the
+    changes, lexing stops together with formatting.
+
+    This only works for `RegexLexer` subclasses that don't change how
+    their text is lexed, with filters that don't change the HTML of a line
+    because of other lines, and with the `HtmlFormatter`, which writes
+    each line on its own.
+
+    :copyright: Copyright 2006-2015 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+from itertools import islice
+from operator import itemgetter
+
+from pygments.filter import apply_filters
+from pygments.lexer import RegexLexer, ExtendedRegexLexer
+from pygments.util import StringIO
+
+try:
+    from itertools import imap
+except ImportError:  # pragma: no cover
+    imap = map
+
+__all__ = ['IncrementalHighlighter']
+
+
+def _split_lines(text):
+    """Split `text` after each newline."""
+    if not text:
+        return []
+    lines = [line + u'\n' for line in text.split(u'\n')]
+    if text.endswith(u'\n'):
+        lines.pop()
+    else:
+        lines[-1] = lines[-1][:-1]
+    return lines
+
+
+def _func(method):
+    return getattr(method, '__func__', method)
+
+
+class _Text(object):
+    """A text that was highlighted, split into lines."""
+
+    __slots__ = ('key', 'lines', 'tokens', 'states', 'counts', 'html')
+
+    def __init__(self, key, lines, tokens, states, counts, html):
+        self.key = key
+        #: the lines of the text, with their newline
+        self.lines = lines
+        #: the (tokentype, value) pairs of the lexer, before any filter
+        self.tokens = tokens
+        #: the state stack of the lexer at the start of each line, or None
+        #: if the lexer is in the middle of a token there
+        self.states = states
+        #: the number of tokens before each line with a state
+        self.counts = counts
+        #: the HTML of each line
+        self.html = html
+
+
+class IncrementalHighlighter(object):
+    """Highlight texts with a lexer and an `HtmlFormatter`, formatting
+    again only the lines that changed since one of the last `max_texts`
+    texts that were highlighted. The lexer goes through the
+    `resume_margin` lines before the first change again, to notice rules
+    that look ahead into it.
+    """
+
+    def __init__(self, max_texts=16, resume_margin=20):
+        self.max_texts = max_texts
+        self.resume_margin = resume_margin
+        self.hits = 0
+        self.misses = 0
+        # most recently highlighted text last
+        self._texts = []
+
+    @staticmethod
+    def supports(lexer):
+        """Return whether `lexer` goes through its text the way the
+        highlighter expects."""
+        return (isinstance(lexer, RegexLexer) and
+                not isinstance(lexer, ExtendedRegexLexer) and
+                _func(type(lexer).get_tokens_unprocessed) is
+                _func(RegexLexer.get_tokens_unprocessed))
+
+    def highlight(self, text, lexer, formatter, filters=(), key=None):
+        """Return the HTML of `text` highlighted with `lexer`, the filters
+        of the lexer and `filters`, and `formatter`, like
+        `pygments.highlight` does.
+
+        Texts are only compared with earlier texts that were highlighted
+        with the same `key`, which has to stand for the lexer, the filters
+        and the options of the formatter that change the HTML of a line.
+        """
+        text = lexer._preprocess_lexer_input(text)
+        lines = _split_lines(text)
+        (old, prefix, suffix) = self._find_text(key, lines)
+        if old is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._texts.remove(old)
+        filters = list(lexer.filters) + list(filters)
+        if old is None:
+            new = self._highlight_lines(text, lines, lexer, formatter,
+                                        filters, key)
+        elif old.lines == lines:
+            new = old
+        else:
+            new = self._highlight_changes(text, lines, lexer, formatter,
+                                          filters, old, prefix, suffix)
+        self._texts.append(new)
+        del self._texts[:-self.max_texts]
+        outfile = StringIO()
+        formatter.format_lines(new.html, outfile)
+        return outfile.getvalue()
+
+    def _find_text(self, key, lines):
+        """Return the earlier text with `key` that shares the most first
+        and last lines with `lines`, and the numbers of those lines."""
+        best = (None, 0, 0)
+        for old in reversed(self._texts):
+            if old.key != key:
+                continue
+            old_lines = old.lines
+            if old_lines == lines:
+                return (old, len(lines), 0)
+            size = min(len(old_lines), len(lines))
+            prefix = 0
+            while prefix < size and old_lines[prefix] == lines[prefix]:
+                prefix += 1
+            suffix = 0
+            while (suffix < size - prefix and
+                   old_lines[-1 - suffix] == lines[-1 - suffix]):
+                suffix += 1
+            if prefix + suffix > best[1] + best[2]:
+                best = (old, prefix, suffix)
+        return best
+
+    def _highlight_changes(self, text, lines, lexer, formatter, filters,
+                           old, prefix, suffix):
+        """Highlight `text`, reusing what is left of the earlier text `old`
+        that has the same `prefix` first and `suffix` last lines."""
+        # the last line with a state up to the first change, and the one
+        # the lexer goes on from
+        start = min(prefix, len(old.lines) - 1)
+        while old.states[start] is None:
+            start -= 1
+        resume = max(start - self.resume_margin, 0)
+        while old.states[resume] is None:
+            resume -= 1
+        count = old.counts[start]
+        resume_count = old.counts[resume]
+        line_states = {}
+        tokens = lexer.get_tokens_from(text, sum(imap(len, lines[:resume])),
+                                       old.states[resume], line_states)
+        if count > resume_count and (
+                list(islice(imap(itemgetter(1, 2), tokens),
+                            count - resume_count)) !=
+                old.tokens[resume_count:count]):
+            # a rule looked ahead into the changes
+            return self._highlight_lines(text, lines, lexer, formatter,
+                                         filters, old.key)
+        return self._highlight_lines(text, lines, lexer, formatter, filters,
+                                     old.key, old, start, len(lines) - suffix,
+                                     tokens, line_states)
+
+    def _highlight_lines(self, text, lines, lexer, formatter, filters, key,
+                         old=None, start=0, resync_start=None, tokens=None,
+                         line_states=None):
+        """Highlight the lines of `text` from `start` on, until a line from
+        `resync_start` on is reached with the same state as in `old`.
+        `tokens` are those of the lexer from the start of line `start`."""
+        if old is None:
+            line_states = {}
+            tokens = lexer.get_tokens_from(text, 0, ('root',), line_states)
+            old = _Text(key, [], [], [('root',)], [0], [])
+            resync_start = len(lines)
+        # the lines of the new and earlier text are the same from
+        # `resync_start` on, but a rule may look back at the line before
+        resync_start += 1
+        offset = len(old.lines) - len(lines)
+        pos = sum(imap(len, lines[:start]))
+        line_states[pos] = old.states[start]
+        # the number of tokens before the start of a line with a state
+        counts = {pos: old.counts[start]}
+        new_tokens = old.tokens[:old.counts[start]]
+
+        def collect(tokens):
+            append = new_tokens.append
+            for index, ttype, value in tokens:
+                if index in line_states and index not in counts:
+                    counts[index] = len(new_tokens)
+                append((ttype, value))
+                yield ttype, value
+
+        stream = apply_filters(collect(tokens), filters, lexer)
+        html = old.html[:start]
+        states = old.states[:start]
+        new_counts = old.counts[:start]
+        index = start
+        for line in formatter.format_line_tokens(stream):
+            count = counts.get(pos)
+            state = line_states.get(pos) if count is not None else None
+            if (resync_start <= index < len(lines) and state is not None and
+                    state == old.states[index + offset]):
+                old_index = index + offset
+                shift = count - old.counts[old_index]
+                del new_tokens[count:]
+                new_tokens.extend(old.tokens[old.counts[old_index]:])
+                html.extend(old.html[old_index:])
+                states.extend(old.states[old_index:])
+                new_counts.extend(old_count + shift
+                                  if old_count is not None else None
+                                  for old_count in old.counts[old_index:])
+                break
+            html.append(line)
+            states.append(state)
+            new_counts.append(count if state is not None else None)
+            if index < len(lines):
+                pos += len(lines[index])
+            index += 1
+        else:
+            if index != len(lines):
+                # a filter added or removed lines: keep the HTML of this
+                # text, but format all of it again when it changes
+                states = [('root',)] + [None] * (len(lines) - 1)
+                new_counts = [0] + [None] * (len(lines) - 1)
+        return _Text(key, lines, new_tokens, states, new_counts, html)
+
+    def clear(self):
+        self._texts = []
+
+    def stats(self):
+        total = self.hits + self.misses
+        return dict(hits=self.hits,
+                    misses=self.misses,
+                    hit_rate=(float(self.hits) / total) if total else 0.0,
+                    entries=len(self._texts))
@@ -20,7 +20,8 @@ from pygments.filter import apply_filters, Filter
 from pygments.filters import get_filter_by_name
 from pygments.token import Error, Text, Other, _TokenType
 from pygments.util import get_bool_opt, get_int_opt, get_list_opt, \
-    make_analysator, text_type, add_metaclass, iteritems, Future, guess_decode
+    get_choice_opt, make_analysator, text_type, add_metaclass, iteritems, \
+    Future, guess_decode
 from pygments.regexopt import regex_opt
 
 __all__ = ['Lexer', 'RegexLexer', 'ExtendedRegexLexer', 'DelegatingLexer',
@@ -36,6 +37,14 @@ _encoding_map = [(b'\xef\xbb\xbf', 'utf-8'),
 
 _default_analyse = staticmethod(lambda x: 0.0)
 
+#: a `pygments.regexcache.RegexCache` that compiles the regular expressions
+#: of the token definitions, or None to compile them with `re.compile`
+regex_cache = None
+
+# parts of a regular expression that refer to one of its groups, which no
+# longer works when it is combined with other ones
+_groupref_re = re.compile(r'\\[1-9]|\(\?P=|\(\?\(')
+
 
 class LexerMeta(type):
     """
@@ -76,6 +85,11 @@ class Lexer(object):
         library, if it is installed.
     ``inencoding``
         Overrides the ``encoding`` if given.
+    ``engine``
+        How a `RegexLexer` finds the rule that matches: ``'rules'`` tries
+        the rules of a state one by one, ``'combined'`` tries them all at
+        once with one regular expression per state (default: ``'rules'``).
+        Both give the same tokens.  Other lexers ignore this option.
     """
 
     #: Name of the lexer
@@ -104,6 +118,8 @@ class Lexer(object):
         self.tabsize = get_int_opt(options, 'tabsize', 0)
         self.encoding = options.get('encoding', 'guess')
         self.encoding = options.get('inencoding') or self.encoding
+        self.engine = get_choice_opt(options, 'engine',
+                                     ['rules', 'combined'], 'rules')
         self.filters = []
         for filter_ in get_list_opt(options, 'filters', ()):
             self.add_filter(filter_)
@@ -146,6 +162,19 @@ class Lexer(object):
         Also preprocess the text, i.e. expand tabs and strip it if
         wanted and applies registered filters.
         """
+        text = self._preprocess_lexer_input(text)
+
+        def streamer():
+            for i, t, v in self.get_tokens_unprocessed(text):
+                yield t, v
+        stream = streamer()
+        if not unfiltered:
+            stream = apply_filters(stream, self.filters, self)
+        return stream
+
+    def _preprocess_lexer_input(self, text):
+        """Apply preprocessing such as decoding the input, removing BOM and
+        normalizing newlines."""
         if not isinstance(text, text_type):
             if self.encoding == 'guess':
                 text, _ = guess_decode(text)
@@ -187,14 +216,7 @@ class Lexer(object):
             text = text.expandtabs(self.tabsize)
         if self.ensurenl and not text.endswith('\n'):
             text += '\n'
-
-        def streamer():
-            for i, t, v in self.get_tokens_unprocessed(text):
-                yield t, v
-        stream = streamer()
-        if not unfiltered:
-            stream = apply_filters(stream, self.filters, self)
-        return stream
+        return text
 
     def get_tokens_unprocessed(self, text):
         """
@@ -415,6 +437,24 @@ class words(Future):
         return regex_opt(self.words, prefix=self.prefix, suffix=self.suffix)
 
 
+class _CombinedTokendefs(dict):
+    """
+    Processed token definitions for the ``'combined'`` engine, see
+    `RegexLexerMeta.get_combined_tokendefs`.
+    """
+
+    def __init__(self, lexer_class, tokendefs):
+        dict.__init__(self)
+        self.lexer_class = lexer_class
+        self.tokendefs = tokendefs
+
+    def __missing__(self, state):
+        # the compiled programs are stored by the lexer once it is done
+        scanners = self[state] = \
+            self.lexer_class._combine_rules(self.tokendefs[state])
+        return scanners
+
+
 class RegexLexerMeta(LexerMeta):
     """
     Metaclass for RegexLexer, creates the self._tokens attribute from
@@ -423,6 +463,8 @@ class RegexLexerMeta(LexerMeta):
 
     def _process_regex(cls, regex, rflags, state):
         """Preprocess the regular expression component of a token definition."""
+        if regex_cache is not None:
+            return regex_cache.compile(cls, regex, rflags).match
         if isinstance(regex, Future):
             regex = regex.get()
         return re.compile(regex, rflags).match
@@ -518,8 +560,79 @@ class RegexLexerMeta(LexerMeta):
         tokendefs = tokendefs or cls.tokens[name]
         for state in list(tokendefs):
             cls._process_state(tokendefs, processed, state)
+        if regex_cache is not None:
+            regex_cache.store(cls)
         return processed
 
+    def _combine_rules(cls, rules):
+        """Return the scanners that try `rules` of a processed state in
+        order, see `get_combined_tokendefs`."""
+        base_flags = re.compile(u'', cls.flags).flags
+        scanners = []
+        group = 1
+        sources = []
+        indexed_rules = {}
+        for rule in rules + [None]:
+            pattern = rule and getattr(rule[0], '__self__', None)
+            combinable = pattern is not None and (
+                not pattern.pattern or
+                (pattern.flags == base_flags and
+                 not cls.flags & re.VERBOSE and
+                 not _groupref_re.search(pattern.pattern)))
+            if (indexed_rules and
+                    (not combinable or group + pattern.groups >= 100)):
+                # the rules so far go in a scanner of their own
+                joined = None
+                if len(indexed_rules) > 1:
+                    try:
+                        source = '|'.join(sources)
+                        if regex_cache is not None:
+                            joined = regex_cache.compile(cls, source,
+                                                         cls.flags)
+                        else:
+                            joined = re.compile(source, cls.flags)
+                    except Exception:
+                        # e.g. the same group name in two rules, or byte
+                        # strings that are not ASCII next to unicode ones
+                        pass
+                if joined is not None:
+                    scanners.append((joined.match, indexed_rules, None))
+                else:
+                    scanners.extend((r[0], None, r)
+                                    for (_, r) in sorted(indexed_rules.items()))
+                group = 1
+                sources = []
+                indexed_rules = {}
+            if rule is None:
+                break
+            if combinable:
+                indexed_rules[group] = rule
+                sources.append('(%s)' % pattern.pattern)
+                group += 1 + pattern.groups
+            else:
+                scanners.append((rule[0], None, rule))
+        return scanners
+
+    def get_combined_tokendefs(cls, tokendefs):
+        """Return the processed `tokendefs` for the ``'combined'`` engine:
+        the rules of each state are joined into as few regular expressions
+        as possible.
+
+        A state is a list of ``(rexmatch, rules, rule)`` scanners that are
+        tried in order.  `rules` maps the index of the group around each
+        rule in the regular expression of `rexmatch` to the rule, so
+        ``rules[m.lastindex]`` is the rule that matched.  If `rules` is
+        None, `rexmatch` is that of the single `rule`.  Rules that refer to
+        their groups, or that have flags of their own, are not combined.
+        The rules of a state are combined when the state is first entered.
+        """
+        key = id(tokendefs)
+        combined = cls._combined_tokens.get(key)
+        if combined is None or combined.tokendefs is not tokendefs:
+            combined = cls._combined_tokens[key] = \
+                _CombinedTokendefs(cls, tokendefs)
+        return combined
+
     def get_tokendefs(cls):
         """
         Merge tokens from superclasses in MRO order, returning a single tokendef
@@ -573,6 +686,7 @@ class RegexLexerMeta(LexerMeta):
         """Instantiate cls after preprocessing its token definitions."""
         if '_tokens' not in cls.__dict__:
             cls._all_tokens = {}
+            cls._combined_tokens = {}
             cls._tmpname = 0
             if hasattr(cls, 'token_variants') and cls.token_variants:
                 # don't process yet
@@ -620,11 +734,33 @@ class RegexLexer(Lexer):
 
         ``stack`` is the inital stack (default: ``['root']``)
         """
-        pos = 0
+        if self.engine == 'combined':
+            return self._get_tokens_combined(text, stack)
+        return self._get_tokens_by_rule(text, stack)
+
+    def get_tokens_from(self, text, pos, stack, line_states):
+        """
+        Split ``text`` into (index, tokentype, value) tuples from the index
+        ``pos`` on, with the state stack ``stack`` there.
+
+        Whenever the lexer goes on at the start of a line, the state stack
+        is stored as a tuple in the dict ``line_states`` by the index of
+        the line. Lexing the same text from such a line with its state
+        stack gives the same tokens as lexing it from the start, so an
+        edited text only has to be lexed again from the last of these
+        lines before the edit.
+        """
+        if self.engine == 'combined':
+            return self._get_tokens_combined(text, stack, pos, line_states)
+        return self._get_tokens_by_rule(text, stack, pos, line_states)
+
+    def _get_tokens_by_rule(self, text, stack, pos=0, line_states=None):
         tokendefs = self._tokens
         statestack = list(stack)
         statetokens = tokendefs[statestack[-1]]
         while 1:
+            if line_states is not None and text[pos - 1:pos] == '\n':
+                line_states[pos] = tuple(statestack)
             for rexmatch, action, new_state in statetokens:
                 m = rexmatch(text, pos)
                 if m:
@@ -668,6 +804,66 @@ class RegexLexer(Lexer):
                 except IndexError:
                     break
 
+    def _get_tokens_combined(self, text, stack, pos=0, line_states=None):
+        tokendefs = self.__class__.get_combined_tokendefs(self._tokens)
+        statestack = list(stack)
+        statetokens = tokendefs[statestack[-1]]
+        while 1:
+            if line_states is not None and text[pos - 1:pos] == '\n':
+                line_states[pos] = tuple(statestack)
+            for rexmatch, rules, rule in statetokens:
+                m = rexmatch(text, pos)
+                if m:
+                    if rules is not None:
+                        rule = rules[m.lastindex]
+                    action = rule[1]
+                    new_state = rule[2]
+                    if action is not None:
+                        if type(action) is _TokenType:
+                            yield pos, action, m.group()
+                        else:
+                            if rules is not None:
+                                # callbacks expect the groups of their rule
+                                m = rule[0](text, pos)
+                            for item in action(self, m):
+                                yield item
+                    pos = m.end()
+                    if new_state is not None:
+                        # state transition
+                        if isinstance(new_state, tuple):
+                            for state in new_state:
+                                if state == '#pop':
+                                    statestack.pop()
+                                elif state == '#push':
+                                    statestack.append(statestack[-1])
+                                else:
+                                    statestack.append(state)
+                        elif isinstance(new_state, int):
+                            # pop
+                            del statestack[new_state:]
+                        elif new_state == '#push':
+                            statestack.append(statestack[-1])
+                        else:
+                            assert False, "wrong state def: %r" % new_state
+                        statetokens = tokendefs[statestack[-1]]
+                    break
+            else:
+                try:
+                    if text[pos] == '\n':
+                        # at EOL, reset state to "root"
+                        statestack = ['root']
+                        statetokens = tokendefs['root']
+                        yield pos, Text, u'\n'
+                        pos += 1
+                        continue
+                    yield pos, Error, text[pos]
+                    pos += 1
+                except IndexError:
+                    break
+        if regex_cache is not None:
+            # once for all states that were combined while lexing
+            regex_cache.store(self.__class__)
+
 
 class LexerContext(object):
     """
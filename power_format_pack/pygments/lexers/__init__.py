@@ -9,8 +9,13 @@
     :license: BSD, see LICENSE for details.
 """
 
+# `math` would be the pygments.lexers.math module otherwise
+from __future__ import absolute_import
+
 import re
 import sys
+import math
+import time
 import types
 import fnmatch
 from os.path import basename
@@ -18,14 +23,25 @@ from os.path import basename
 from pygments.lexers._mapping import LEXERS
 from pygments.modeline import get_filetype_from_buffer
 from pygments.plugin import find_plugin_lexers
-from pygments.util import ClassNotFound, itervalues, guess_decode
+from pygments.util import ClassNotFound, itervalues, iteritems, guess_decode
 
 
 __all__ = ['get_lexer_by_name', 'get_lexer_for_filename', 'find_lexer_class',
-           'guess_lexer'] + list(LEXERS)
+           'guess_lexer', 'guess_lexer_fast'] + list(LEXERS)
 
 _lexer_cache = {}
 _pattern_cache = {}
+# alias -> (module name, lexer name) of the builtin lexers, see
+# `_get_alias_index`
+_alias_index = None
+# word -> (weight, names of the lexer classes with the word in their
+# fingerprint), see `_get_fingerprint_index`
+_fingerprint_index = None
+_word_re = re.compile(r'[a-z_][a-z0-9_]+')
+_shebang_re = re.compile(r'#!\s*(\S+)(?:[ \t]+(\S+))?')
+# lexers that recognise markup by its structure rather than by keywords,
+# see `guess_lexer_fast`
+_MARKUP_LEXERS = ('HtmlLexer', 'XmlLexer', 'XsltLexer', 'DtdLexer')
 
 
 def _fn_matches(fn, glob):
@@ -44,6 +60,21 @@ def _load_lexers(module_name):
         _lexer_cache[cls.name] = cls
 
 
+def _get_alias_index():
+    """Return a dictionary that maps the aliases of the builtin lexers to
+    their module and name. It is built on first use; when several lexers
+    share an alias, the first one in `LEXERS` wins, like in a linear scan.
+    """
+    global _alias_index
+    if _alias_index is None:
+        index = {}
+        for module_name, name, aliases, _, _ in itervalues(LEXERS):
+            for alias in aliases:
+                index.setdefault(alias, (module_name, name))
+        _alias_index = index
+    return _alias_index
+
+
 def get_all_lexers():
     """Return a generator of tuples in the form ``(name, aliases,
     filenames, mimetypes)`` of all know lexers.
@@ -81,11 +112,12 @@ def get_lexer_by_name(_alias, **options):
         raise ClassNotFound('no lexer for alias %r found' % _alias)
 
     # lookup builtin lexers
-    for module_name, name, aliases, _, _ in itervalues(LEXERS):
-        if _alias.lower() in aliases:
-            if name not in _lexer_cache:
-                _load_lexers(module_name)
-            return _lexer_cache[name](**options)
+    builtin = _get_alias_index().get(_alias.lower())
+    if builtin is not None:
+        module_name, name = builtin
+        if name not in _lexer_cache:
+            _load_lexers(module_name)
+        return _lexer_cache[name](**options)
     # continue with lexers from setuptools entrypoints
     for cls in find_plugin_lexers():
         if _alias.lower() in cls.aliases:
@@ -253,6 +285,114 @@ def guess_lexer(_text, **options):
     return best_lexer[1](**options)
 
 
+def _get_fingerprint_index():
+    """Return an index of the words in the keyword fingerprints of the
+    lexers. Each word is weighted by how rare it is among the lexers.
+    """
+    global _fingerprint_index
+    if _fingerprint_index is None:
+        from pygments.lexers._fingerprints import FINGERPRINTS
+        lexers_by_word = {}
+        for key, words in iteritems(FINGERPRINTS):
+            for word in words:
+                lexers_by_word.setdefault(word, []).append(key)
+        num_lexers = float(len(FINGERPRINTS))
+        _fingerprint_index = dict(
+            (word, (math.log(num_lexers / len(keys)), tuple(keys)))
+            for word, keys in iteritems(lexers_by_word))
+    return _fingerprint_index
+
+
+def _rank_lexers_by_fingerprint(_text, max_chars=4096):
+    """Return the names of the lexer classes whose fingerprint has words in
+    common with the text, best match first.
+    """
+    index = _get_fingerprint_index()
+    scores = {}
+    for word in set(_word_re.findall(_text[:max_chars].lower())):
+        entry = index.get(word)
+        if entry is not None:
+            weight, keys = entry
+            for key in keys:
+                scores[key] = scores.get(key, 0.0) + weight
+    return sorted(scores, key=lambda key: (-scores[key], key))
+
+
+def _get_lexer_from_shebang(_text, **options):
+    """Return a lexer for the interpreter in the shebang line of the text,
+    or None.
+    """
+    match = _shebang_re.match(_text)
+    if not match:
+        return None
+    interpreter = basename(match.group(1))
+    if interpreter == 'env' and match.group(2):
+        interpreter = basename(match.group(2))
+    # python3.4 -> python3 -> python
+    for alias in (interpreter, interpreter.split('.')[0],
+                  interpreter.rstrip('0123456789.')):
+        try:
+            return get_lexer_by_name(alias, **options)
+        except ClassNotFound:
+            pass
+    return None
+
+
+def guess_lexer_fast(_text, max_candidates=10, time_limit=None, **options):
+    """Guess a lexer like `guess_lexer`, without importing every lexer.
+
+    The modeline and the shebang line are checked first. After that only
+    ``analyse_text`` of the `max_candidates` lexers whose keyword
+    fingerprint fits the text best is run, and of the markup lexers if the
+    text has a ``<`` in it, as markup has few keywords to go by. When
+    `time_limit` is a number of seconds, the other lexers are tried as well,
+    until that much time has passed.
+
+    Raises ClassNotFound if no lexer is found.
+    """
+    ft = get_filetype_from_buffer(_text)
+    if ft is not None:
+        try:
+            return get_lexer_by_name(ft, **options)
+        except ClassNotFound:
+            pass
+    lexer = _get_lexer_from_shebang(_text, **options)
+    if lexer is not None:
+        return lexer
+
+    start = time.time()
+    best_lexer = [0.0, None]
+    tried = set()
+    keys = _rank_lexers_by_fingerprint(_text)[:max_candidates]
+    if '<' in _text:
+        keys += [key for key in _MARKUP_LEXERS if key not in keys]
+    candidates = [LEXERS[key] for key in keys]
+    for module_name, name, _, _, _ in candidates:
+        if name not in _lexer_cache:
+            _load_lexers(module_name)
+        lexer = _lexer_cache[name]
+        tried.add(lexer)
+        rv = lexer.analyse_text(_text)
+        if rv == 1.0:
+            return lexer(**options)
+        if rv > best_lexer[0]:
+            best_lexer[:] = (rv, lexer)
+    if time_limit is not None:
+        for lexer in _iter_lexerclasses():
+            if time.time() - start > time_limit:
+                break
+            if lexer in tried:
+                continue
+            rv = lexer.analyse_text(_text)
+            if rv == 1.0:
+                return lexer(**options)
+            if rv > best_lexer[0]:
+                best_lexer[:] = (rv, lexer)
+    if not best_lexer[0] or best_lexer[1] is None:
+        raise ClassNotFound('no lexer matching the text found')
+    return best_lexer[1](**options)
+
+
 class _automodule(types.ModuleType):
     """Automatically import lexers."""
 
@@ -0,0 +1,382 @@
+# -*- coding: utf-8 -*-
+"""
+    pygments.lexers._fingerprints
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Keyword fingerprints of the builtin lexers, used by `guess_lexer_fast`
+    to pick the lexers that are worth running ``analyse_text`` on, without
+    importing all lexer modules. This file is generated by itself. Run it
+    from the lexers folder after changing the token definitions of a lexer.
+
+    Do not alter the FINGERPRINTS dictionary by hand.
+
+    :copyright: Copyright 2006-2015 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+from __future__ import print_function
+
+FINGERPRINTS = {
+    'ABAPLexer': ('abbreviated', 'adjacent', 'aliases', 'analyzer', 'authority', 'badi', 'bit_set', 'blocks', 'boolc', 'boolx', 'boundary', 'changing', 'char_off', 'charlen', 'checkbox', 'client', 'cmax', 'cmin', 'collect', 'communication', 'comparing', 'components', 'concat_lines_of', 'concatenate', 'condense', 'constants', 'contains_any_not_of', 'contains_any_of', 'contexts', 'corresponding', 'count_any_not_of', 'count_any_of', 'country', 'customer', 'dataset', 'dbmaxlen', 'demand', 'detail', 'dialog', 'divide', 'duplicates', 'endat', 'endclass', 'enddo', 'endform', 'ending', 'endloop', 'endmethod', 'endmodule', 'endselect', 'enhancement', 'exceptions', 'exporting', 'extended', 'fields', 'find_any_not_of', 'find_any_of', 'find_end', 'found', 'frac', 'frames', 'from_mixed', 'groups', 'hashed', 'hotspot', 'importing', 'infotypes', 'ing', 'inheriting', 'initialization', 'intensified', 'interfaces', 'intervals', 'inverted', 'mark', 'matchcode', 'maximum', 'minimum', 'modif', 'nesting', 'nmax', 'nmin', 'nodes', 'non', 'numofchar', 'obligatory', 'percentage', 'pf', 'pool', 'pools', 'processing', 'pushbutton', 'radiobutton', 'raising', 'ranges', 'rescale', 'reserve', 'resolution', 'separated', 'shift_left', 'shift_right', 'specified', 'stamp', 'starting', 'statics', 'submit', 'subscreen', 'substring_after', 'substring_before', 'substring_from', 'substring_to', 'subtract', 'summary', 'summing', 'supply', 'suppress', 'tabbed', 'titlebar', 'to_lower', 'to_mixed', 'to_upper', 'transformation', 'transporting', 'uline', 'under', 'upadte', 'via', 'xstrlen'),
+    'ActionScript3Lexer': ('arguments', 'as', 'break', 'case', 'catch', 'class', 'const', 'continue', 'default', 'do', 'dynamic', 'each', 'else', 'extends', 'false', 'final', 'for', 'function', 'get', 'if', 'implements', 'import', 'in', 'include', 'infinity', 'instanceof', 'interface', 'internal', 'intrinsic', 'is', 'namespace', 'nan', 'native', 'new', 'null', 'override', 'package', 'private', 'protected', 'public', 'return', 'set', 'static', 'super', 'switch', 'this', 'throw', 'true', 'try', 'typeof', 'undefined', 'var', 'void', 'while', 'with'),
+    'ActionScriptLexer': ('accessibility', 'accessibilityproperties', 'actionscriptversion', 'activityevent', 'antialiastype', 'applicationdomain', 'asbroadcaster', 'asyncerrorevent', 'avm1movie', 'bevelfilter', 'bitmapdata', 'bitmapdatachannel', 'bitmapfilter', 'bitmapfilterquality', 'bitmapfiltertype', 'blendmode', 'blurfilter', 'capsstyle', 'colormatrixfilter', 'colortransform', 'contextmenu', 'contextmenubuiltinitems', 'contextmenuevent', 'contextmenuitem', 'convultionfilter', 'csmsettings', 'dataevent', 'definitionerror', 'deleteobjectsample', 'displacmentmapfilter', 'displacmentmapfiltermode', 'displayobject', 'displayobjectcontainer', 'dropshadowfilter', 'endian', 'eoferror', 'errorevent', 'evalerror', 'eventdispatcher', 'eventphase', 'externalinterface', 'filefilter', 'filereference', 'filereferencelist', 'focusdirection', 'focusevent', 'fontstyle', 'fonttype', 'framelabel', 'fullscreenevent', 'glowfilter', 'gradientbevelfilter', 'gradientglowfilter', 'gradienttype', 'graphics', 'gridfittype', 'httpstatusevent', 'ibitmapdrawable', 'id3info', 'idatainput', 'idataoutput', 'idynamicpropertyoutputidynamicpropertywriter', 'ieventdispatcher', 'iexternalizable', 'illegaloperationerror', 'ime', 'imeconversionmode', 'imeevent', 'interactiveobject', 'interpolationmethod', 'invalidswferror', 'invokeevent', 'ioerror', 'ioerrorevent', 'jointstyle', 'keyboardevent', 'keylocation', 'linescalemode', 'loader', 'loadercontext', 'loaderinfo', 'loadvars', 'localconnection', 'memoryerror', 'microphone', 'morphshape', 'mouseevent', 'movieclip', 'moviecliploader', 'netconnection', 'netstatusevent', 'netstream', 'newobjectsample', 'objectencoding', 'pixelsnapping', 'printjoboptions', 'printjoborientation', 'progressevent', 'qname', 'rangeerror', 'referenceerror', 'scene', 'scripttimeouterror', 'securitydomain', 'securityerror', 'securityerrorevent', 'securitypanel', 'sharedobject', 'sharedobjectflushstatus', 'simplebutton', 'soundchannel', 'soundloadercontext', 'soundmixer', 'soundtransform', 'spreadmethod', 'sprite', 'stackoverflowerror', 'stagealign', 'stagedisplaystate', 'stagequality', 'stagescalemode', 'statictext', 'statusevent', 'stylesheet', 'swfversion', 'syncevent', 'textcolortype', 'textfield'),
+    'AdaLexer': ('abort', 'abs', 'abstract', 'accept', 'access', 'address', 'aliased', 'all', 'and', 'array', 'at', 'begin', 'body', 'boolean', 'byte', 'case', 'character', 'constant', 'controlled', 'count', 'cursor', 'declare', 'delay', 'delta', 'digits', 'do', 'duration', 'else', 'elsif', 'end', 'entry', 'exception', 'exit', 'false', 'file_mode', 'file_type', 'float', 'for', 'function', 'generator', 'generic', 'goto', 'if', 'in', 'integer', 'interface', 'is', 'limited', 'long_float', 'long_integer', 'long_long_float', 'long_long_integer', 'loop', 'mod', 'natural', 'new', 'not', 'null', 'of', 'or', 'others', 'out', 'overriding', 'package', 'positive', 'pragma', 'private', 'procedure', 'protected', 'raise', 'range', 'record', 'reference_type', 'rem', 'renames', 'requeue', 'return', 'reverse', 'select', 'separate', 'short_float', 'short_integer', 'short_short_float', 'short_short_integer', 'string', 'subtype', 'synchronized', 'tagged', 'task', 'terminate', 'then', 'true', 'type', 'until', 'use', 'when', 'while', 'wide_character', 'wide_string', 'with', 'xor'),
+    'AgdaLexer': ('abstract', 'codata', 'coinductive', 'constructor', 'data', 'field', 'forall', 'hiding', 'import', 'in', 'inductive', 'infix', 'infixl', 'infixr', 'instance', 'let', 'module', 'mutual', 'open', 'pattern', 'postulate', 'primitive', 'private', 'prop', 'quote', 'quotegoal', 'quoteterm', 'record', 'renaming', 'rewrite', 'set', 'syntax', 'tactic', 'unquote', 'unquotedecl', 'using', 'where', 'with'),
+    'AlloyLexer': ('abstract', 'all', 'and', 'as', 'assert', 'but', 'check', 'disj', 'else', 'enum', 'exactly', 'expect', 'extends', 'fact', 'for', 'fun', 'iden', 'iff', 'implies', 'in', 'int', 'let', 'lone', 'module', 'no', 'none', 'one', 'open', 'or', 'pred', 'run', 'seq', 'set', 'sig', 'some', 'sum', 'this', 'univ', 'when'),
+    'AmbientTalkLexer': ('alias', 'def', 'deftype', 'exclude', 'false', 'import', 'jlobby', 'lobby', 'nil', 'true'),
+    'AntlrActionScriptLexer': ('actionscript', 'language'),
+    'AntlrCSharpLexer': ('csharp2', 'language'),
+    'AntlrCppLexer': ('language',),
+    'AntlrLexer': ('catch', 'finally', 'fragment', 'grammar', 'lexer', 'options', 'parser', 'private', 'protected', 'public', 'returns', 'scope', 'throws', 'tokens', 'tree'),
+    'AntlrObjectiveCLexer': ('language', 'objc'),
+    'AntlrPerlLexer': ('language', 'perl5'),
+    'AntlrPythonLexer': ('language', 'python'),
+    'AntlrRubyLexer': ('language', 'ruby'),
+    'ApacheConfLexer': ('alert', 'all', 'any', 'crit', 'debug', 'dns', 'double', 'email', 'emerg', 'error', 'full', 'group', 'inetd', 'info', 'min', 'minimal', 'none', 'notice', 'off', 'on', 'os', 'productonly', 'registry', 'script', 'standalone', 'user', 'warn'),
+    'AppleScriptLexer': ('about', 'above', 'activate', 'activated', 'active', 'against', 'alert', 'animate', 'apart', 'application', 'around', 'aside', 'attachment', 'awake', 'became', 'become', 'begins', 'behind', 'below', 'beneath', 'beside', 'bounds', 'button', 'changed', 'changing', 'clicked', 'closed', 'collapse', 'combo', 'come', 'comes', 'conclude', 'considering', 'contain', 'contained', 'deminiaturized', 'diacriticals', 'dialog', 'disks', 'dismiss', 'does', 'doesn', 'drag', 'dragged', 'drawer', 'duplicate', 'editing', 'eighth', 'ended', 'ends', 'entered', 'erty', 'exited', 'exposed', 'fifth', 'fit', 'folder', 'formatter', 'front', 'gmt', 'greater', 'highlight', 'hyphens', 'idle', 'ignoring', 'indicator', 'isn', 'items', 'its', 'launch', 'launched', 'launching', 'loaded', 'localized', 'middle', 'miniaturize', 'miniaturized', 'moved', 'movie', 'nd', 'nib', 'ninth', 'onto', 'opened', 'panel', 'paragraph', 'pasteboard', 'plugin', 'popup', 'posix', 'punctuation', 'quoted', 'rd', 'reply', 'representation', 'resign', 'resigned', 'resized', 'responder', 'responses', 'scripting', 'secure', 'settings', 'seventh', 'should', 'shown', 'since', 'sixth', 'slider', 'starts', 'stepper', 'strings', 'summarize', 'synchronize', 'tenth', 'terms', 'that', 'timeout', 'toolbar', 'untitled', 'updated', 'was', 'well', 'wheel', 'whith', 'whose', 'will', 'zoomed'),
+    'ArduinoLexer': ('__', '_t', 'alignas', 'alignof', 'asm', 'blockingoffload', 'catch', 'char', 'class', 'const_cast', 'constexpr', 'decltype', 'delete', 'dynamic_cast', 'event', 'explicit', 'export', 'final', 'friend', 'interface', 'multiple_inheritance', 'mutable', 'namespace', 'new', 'noexcept', 'nullptr', 'offload', 'operator', 'outer', 'override', 'private', 'protected', 'public', 'reinterpret_cast', 'restrict', 'single_inheritance', 'static_assert', 'static_cast', 'super', 'template', 'this', 'thread_local', 'throw', 'throws', 'try', 'typeid', 'typename', 'using', 'uuidof', 'virtual', 'virtual_inheritance'),
+    'AspectJLexer': ('abstract', 'assert', 'boolean', 'break', 'byte', 'case', 'catch', 'char', 'class', 'const', 'continue', 'default', 'do', 'double', 'else', 'enum', 'extends', 'false', 'final', 'finally', 'float', 'for', 'goto', 'if', 'implements', 'import', 'instanceof', 'int', 'interface', 'long', 'native', 'new', 'null', 'package', 'private', 'protected', 'public', 'return', 'short', 'static', 'strictfp', 'super', 'switch', 'synchronized', 'this', 'throw', 'throws', 'transient', 'true', 'try', 'void', 'volatile', 'while'),
+    'AsymptoteLexer': ('abscissa', 'access', 'and', 'arc', 'arrowhead', 'atleast', 'binarytree', 'binarytreenode', 'block', 'bool', 'bool3', 'bounds', 'bqe', 'braid', 'break', 'case', 'circle', 'conic', 'continue', 'controls', 'coord', 'coordsys', 'cputime', 'curl', 'cycle', 'do', 'ellipse', 'else', 'explicit', 'false', 'file', 'filltype', 'fitresult', 'for', 'frame', 'from', 'grid3', 'guide', 'horner', 'hsv', 'hyperbola', 'if', 'import', 'include', 'indexedtransform', 'int', 'inversion', 'key', 'label', 'legend', 'light', 'line', 'linefit', 'margint', 'marker', 'mass', 'new', 'newframe', 'null', 'object', 'operator', 'pair', 'parabola', 'path', 'path3', 'pen', 'picture', 'point', 'position', 'private', 'projection', 'public', 'quote', 'real', 'restricted', 'return', 'revolution', 'scalet', 'scientific', 'segment', 'side', 'slice', 'splitface', 'static', 'string', 'struct', 'surface', 'tension', 'tensionspecifier', 'this', 'ticklocate', 'ticksgridt', 'tickvalues', 'transform', 'transformation', 'tree', 'treenode', 'triangle', 'trilinear', 'triple', 'true', 'typedef', 'unravel', 'vector', 'vertex', 'void', 'while'),
+    'AutoItLexer': ('and', 'byref', 'case', 'continueloop', 'dim', 'do', 'else', 'elseif', 'endfunc', 'endif', 'endregion', 'endselect', 'exit', 'exitloop', 'for', 'forcedef', 'forceref', 'func', 'global', 'if', 'include', 'local', 'next', 'not', 'once', 'or', 'region', 'return', 'select', 'step', 'then', 'to', 'until', 'wend', 'while'),
+    'AutohotkeyLexer': ('allowsamelinecomments', 'autotrim', 'blockinput', 'click', 'clipboardtimeout', 'clipwait', 'commentflag', 'controlclick', 'controlfocus', 'controlget', 'controlgetfocus', 'controlgetpos', 'controlgettext', 'controlmove', 'controlsend', 'controlsendraw', 'controlsettext', 'coordmode', 'detecthiddentext', 'detecthiddenwindows', 'drive', 'driveget', 'drivespacefree', 'envadd', 'envdiv', 'envget', 'envmult', 'envset', 'envsub', 'envupdate', 'errorstdout', 'escapechar', 'exitapp', 'fileappend', 'filecopy', 'filecopydir', 'filecreatedir', 'filecreateshortcut', 'filedelete', 'filegetattrib', 'filegetshortcut', 'filegetsize', 'filegettime', 'filegetversion', 'fileinstall', 'filemove', 'filemovedir', 'fileread', 'filereadline', 'filerecycle', 'filerecycleempty', 'fileremovedir', 'fileselectfile', 'fileselectfolder', 'filesetattrib', 'filesettime', 'formattime', 'getkeystate', 'groupactivate', 'groupadd', 'groupclose', 'groupdeactivate', 'gui', 'guicontrol', 'guicontrolget', 'hotkey', 'hotkeyinterval', 'hotkeymodifiertimeout', 'hotstring', 'ifequal', 'ifexist', 'ifgreater', 'ifgreaterorequal', 'ifinstring', 'ifless', 'iflessorequal', 'ifmsgbox', 'ifnotequal', 'ifnotexist', 'ifnotinstring', 'ifwinactive', 'ifwinexist', 'ifwinnotactive', 'ifwinnotexist', 'imagesearch', 'includeagain', 'inidelete', 'iniread', 'iniwrite', 'inputbox', 'installkeybdhook', 'installmousehook', 'keyhistory', 'keywait', 'listhotkeys', 'listlines', 'listvars', 'maxhotkeysperinterval', 'maxmem', 'maxthreads', 'maxthreadsbuffer', 'maxthreadsperhotkey', 'mouseclick', 'mouseclickdrag', 'mousegetpos', 'mousemove', 'msgbox', 'noenv', 'notrayicon', 'onexit', 'outputdebug', 'pixelgetcolor', 'pixelsearch', 'postmessage', 'regdelete', 'regread', 'regwrite', 'runas', 'runwait', 'sendevent', 'sendinput', 'sendmode', 'sendplay', 'sendraw', 'setbatchlines', 'setcapslockstate', 'setcontroldelay', 'setdefaultmousespeed'),
+    'AwkLexer': ('argc', 'argind', 'argv', 'atan2', 'begin', 'break', 'close', 'continue', 'convfmt', 'cos', 'delete', 'do', 'else', 'end', 'environ', 'errno', 'exit', 'exp', 'fflush', 'fieldwidths', 'filename', 'fnr', 'for', 'fs', 'function', 'gensub', 'getline', 'gsub', 'if', 'ignorecase', 'index', 'int', 'length', 'log', 'match', 'next', 'nextfile', 'nf', 'nr', 'ofmt', 'ofs', 'orfs', 'print', 'printf', 'rand', 'return', 'rlength', 'rs', 'rstart', 'rt', 'sin', 'split', 'sprintf', 'sqrt', 'srand', 'strftime', 'sub', 'subsep', 'substr', 'system', 'systime', 'tolower', 'toupper', 'while'),
+    'BaseMakefileLexer': ('export',),
+    'BashLexer': ('alias', 'ba', 'bat', 'bg', 'bin', 'bind', 'break', 'builtin', 'caller', 'case', 'cd', 'cmd', 'command', 'compgen', 'complete', 'continue', 'declare', 'dirs', 'disown', 'do', 'done', 'echo', 'elif', 'else', 'enable', 'esac', 'eval', 'exe', 'exec', 'exit', 'export', 'false', 'fc', 'fg', 'fi', 'for', 'function', 'getopts', 'hash', 'help', 'history', 'if', 'jobs', 'kill', 'let', 'local', 'logout', 'popd', 'printf', 'pushd', 'pwd', 'read', 'readonly', 'return', 'select', 'set', 'sh', 'shift', 'shopt', 'source', 'suspend', 'test', 'then', 'time', 'times', 'trap', 'true', 'type', 'typeset', 'ulimit', 'umask', 'unalias', 'unset', 'until', 'wait', 'while'),
+    'BatchLexer': ('call', 'cd', 'choice', 'cls', 'cmdextversion', 'defined', 'del', 'deltree', 'do', 'echo', 'else', 'endlocal', 'errorlevel', 'exist', 'for', 'goto', 'if', 'md', 'off', 'on', 'pause', 'set', 'setlocal', 'shift'),
+    'BlitzBasicLexer': ('asc', 'case', 'chr', 'const', 'data', 'default', 'delete', 'dim', 'each', 'else', 'elseif', 'end', 'endif', 'exit', 'false', 'field', 'for', 'forever', 'function', 'global', 'gosub', 'goto', 'if', 'include', 'insert', 'len', 'local', 'new', 'next', 'null', 'pi', 'read', 'repeat', 'restore', 'return', 'select', 'step', 'then', 'to', 'true', 'type', 'until', 'wend', 'while'),
+    'BlitzMaxLexer': ('abs', 'abstract', 'asc', 'assert', 'byte', 'case', 'catch', 'chr', 'const', 'continue', 'default', 'defdata', 'delete', 'double', 'eachin', 'else', 'elseif', 'end', 'endextern', 'endfunction', 'endif', 'endmethod', 'endselect', 'endtry', 'endtype', 'endwhile', 'exit', 'extends', 'extern', 'false', 'field', 'final', 'float', 'for', 'forever', 'framework', 'function', 'global', 'goto', 'if', 'import', 'incbin', 'incbinlen', 'incbinptr', 'include', 'int', 'len', 'local', 'long', 'max', 'method', 'min', 'mod', 'module', 'moduleinfo', 'new', 'next', 'null', 'pi', 'private', 'ptr', 'public', 'readdata', 'release', 'repeat', 'restoredata', 'return', 'sar', 'select', 'self', 'sgn', 'shl', 'short', 'shr', 'sizeof', 'step', 'strict', 'super', 'superstrict', 'then', 'throw', 'to', 'true', 'try', 'type', 'until', 'var', 'varptr', 'wend', 'while'),
+    'BooLexer': ('__eval__', '__switch__', 'abstract', 'and', 'array', 'as', 'assert', 'break', 'callable', 'cast', 'checked', 'class', 'constructor', 'continue', 'def', 'destructor', 'do', 'elif', 'else', 'ensure', 'enum', 'enumerate', 'event', 'except', 'false', 'filter', 'final', 'for', 'from', 'get', 'getter', 'given', 'goto', 'if', 'import', 'in', 'interface', 'internal', 'is', 'isa', 'len', 'lock', 'map', 'matrix', 'max', 'min', 'namespace', 'normalarrayindexing', 'not', 'null', 'of', 'or', 'otherwise', 'override', 'partial', 'pass', 'print', 'private', 'property', 'protected', 'public', 'raise', 'range', 'rawarrayindexing', 'ref', 'required', 'return', 'self', 'set', 'static', 'struct', 'super', 'transient', 'true', 'try', 'typeof', 'unchecked', 'unless', 'using', 'virtual', 'when', 'while', 'yield', 'yieldall', 'zip'),
+    'BroLexer': ('_expire', '_func', 'add', 'addr', 'alarm', 'any', 'attr', 'bool', 'break', 'case', 'const', 'continue', 'count', 'counter', 'create', 'default', 'delete', 'disable_print_hook', 'do', 'double', 'else', 'encrypt', 'enum', 'event', 'expire', 'export', 'file', 'for', 'function', 'global', 'group', 'hook', 'if', 'in', 'int', 'interval', 'local', 'log', 'match', 'mergeable', 'module', 'net', 'next', 'of', 'optional', 'pattern', 'persistent', 'port', 'print', 'priority', 'raw_output', 'read', 'record', 'redef', 'return', 'rotate_', 'schedule', 'set', 'size', 'string', 'subnet', 'switch', 'synchronized', 'table', 'time', 'timer', 'type', 'vector', 'when', 'while', 'write'),
+    'BugsLexer': ('abs', 'arccos', 'arccosh', 'arcsin', 'arcsinh', 'arctan', 'arctanh', 'cloglog', 'cos', 'cosh', 'cumulative', 'cut', 'dbern', 'dbeta', 'dbin', 'dcat', 'dchisqr', 'ddexp', 'ddirch', 'density', 'deviance', 'dexp', 'df', 'dflat', 'dgamma', 'dgev', 'dggamma', 'dgpar', 'dhyper', 'dlnorm', 'dlogis', 'dloglik', 'dmnorm', 'dmt', 'dmulti', 'dnegbin', 'dnorm', 'dpar', 'dpois', 'dt', 'dunif', 'dweib', 'dwish', 'eigen', 'equals', 'expr', 'for', 'gammap', 'icloglog', 'ilogit', 'in', 'inprod', 'integral', 'interp', 'inverse', 'lin', 'log', 'logdet', 'logfact', 'loggam', 'logit', 'max', 'mean', 'min', 'model', 'ode', 'phi', 'post', 'postm', 'pow', 'prior', 'probit', 'prod', 'rank', 'ranked', 'replicate', 'round', 'sd', 'sin', 'sinh', 'solution', 'sort', 'sqrt', 'step', 'sum', 'tan', 'tanh', 'trunc', 'vals', 'value', 'valuem'),
+    'CLexer': ('__inline', '__m', '_inline', '_t', 'asm', 'assume', 'auto', 'based', 'bool', 'break', 'case', 'cdecl', 'char', 'const', 'continue', 'declspec', 'default', 'do', 'double', 'el', 'else', 'endif', 'enum', 'except', 'extern', 'false', 'fastcall', 'finally', 'float', 'for', 'forceinline', 'goto', 'identifier', 'if', 'ifdef', 'include', 'inline', 'int', 'int16', 'int32', 'int64', 'int8', 'leave', 'long', 'naked', 'noop', 'null', 'raise', 'register', 'restrict', 'restricted', 'return', 'se', 'short', 'signed', 'sizeof', 'static', 'stdcall', 'struct', 'switch', 'thread', 'true', 'try', 'typedef', 'typename', 'unaligned', 'union', 'unsigned', 'void', 'volatile', 'w64', 'wchar_t', 'while'),
+    'CMakeLexer': ('apple', 'borland', 'cmake_minimum_required', 'cygwin', 'fatal_error', 'flags', 'mingw', 'msvc', 'msvc60', 'msvc70', 'msvc71', 'msvc80', 'msvc90', 'msvc_ide', 'unix', 'version', 'win32'),
+    'CSharpAspxLexer': ('language', 'page', 'script'),
+    'Ca65Lexer': ('adc', 'and', 'asl', 'bcc', 'bcs', 'beq', 'bit', 'bmi', 'bne', 'bpl', 'brk', 'bvc', 'bvs', 'cl', 'cmp', 'cp', 'de', 'eor', 'in', 'jmp', 'jsr', 'ld', 'lsr', 'nop', 'ora', 'ro', 'rt', 'sbc', 'se', 'st', 'ta', 'tsx', 'txs'),
+    'CadlLexer': ('after', 'allow_archetype', 'and', 'before', 'cardinality', 'closed', 'exclude', 'existence', 'for_all', 'group', 'implies', 'include', 'not', 'occurrences', 'or', 'there_exists', 'use_archetype', 'use_node', 'xor'),
+    'CbmBasicV2Lexer': ('abs', 'and', 'asc', 'atn', 'chr', 'close', 'clr', 'cmd', 'cont', 'cos', 'data', 'def', 'dim', 'end', 'exp', 'fn', 'for', 'fre', 'get', 'go', 'if', 'input', 'int', 'left', 'len', 'let', 'list', 'load', 'log', 'mid', 'new', 'next', 'not', 'on', 'open', 'or', 'peek', 'poke', 'pos', 'print', 'read', 'restore', 'return', 'right', 'rnd', 'run', 'save', 'sgn', 'sin', 'spc', 'sqr', 'step', 'stop', 'str', 'sub', 'sys', 'tab', 'tan', 'then', 'to', 'usr', 'val', 'verify', 'wait'),
+    'CeylonLexer': ('abstracts', 'alias', 'assembly', 'assert', 'assign', 'break', 'case', 'catch', 'class', 'continue', 'dynamic', 'else', 'exists', 'extends', 'false', 'finally', 'for', 'function', 'given', 'if', 'import', 'in', 'interface', 'is', 'let', 'module', 'new', 'nonempty', 'null', 'object', 'of', 'out', 'outer', 'package', 'return', 'satisfies', 'super', 'switch', 'then', 'this', 'throw', 'true', 'try', 'value', 'void', 'while'),
+    'Cfengine3Lexer': ('body', 'bundle', 'control', 'int', 'real', 'slist', 'string'),
+    'ChaiscriptLexer': ('attr', 'break', 'catch', 'continue', 'def', 'do', 'else', 'eval', 'false', 'for', 'fun', 'if', 'in', 'return', 'throw', 'true', 'try', 'var', 'while'),
+    'ChapelLexer': ('align', 'atomic', 'begin', 'bool', 'break', 'by', 'class', 'cobegin', 'coforall', 'complex', 'config', 'const', 'continue', 'delete', 'dmapped', 'do', 'domain', 'else', 'enum', 'export', 'extern', 'false', 'for', 'forall', 'if', 'imag', 'in', 'index', 'inline', 'inout', 'int', 'iter', 'label', 'lambda', 'let', 'local', 'module', 'new', 'nil', 'noinit', 'on', 'opaque', 'otherwise', 'out', 'param', 'pragma', 'private', 'proc', 'public', 'range', 'real', 'record', 'reduce', 'ref', 'return', 'scan', 'select', 'serial', 'single', 'sparse', 'string', 'subdomain', 'sync', 'then', 'true', 'type', 'uint', 'union', 'use', 'var', 'when', 'where', 'while', 'with', 'yield', 'zip'),
+    'CheetahLexer': ('end', 'slurp'),
+    'ClayLexer': ('__arg__', '__column__', '__file__', '__line__', 'alias', 'and', 'as', 'break', 'case', 'catch', 'continue', 'default', 'define', 'else', 'enum', 'eval', 'external', 'false', 'finally', 'for', 'forceinline', 'forward', 'goto', 'if', 'import', 'in', 'inline', 'instance', 'newtype', 'noinline', 'not', 'onerror', 'or', 'overload', 'private', 'public', 'record', 'ref', 'return', 'rvalue', 'staticassert', 'switch', 'throw', 'true', 'try', 'var', 'variant', 'when', 'while'),
+    'ClojureLexer': ('accessor', 'agent', 'aget', 'alength', 'alter', 'apply', 'aset', 'assoc', 'await', 'bean', 'binding', 'butlast', 'cast', 'children', 'comment', 'commute', 'comp', 'comparator', 'complement', 'concat', 'cond', 'conj', 'cons', 'constantly', 'cycle', 'dec', 'definline', 'definterface', 'defmacro', 'defmethod', 'defmulti', 'defn', 'defonce', 'defproject', 'defprotocol', 'defrecord', 'defstruct', 'deftype', 'deref', 'difference', 'disj', 'dissoc', 'distinct', 'doall', 'doc', 'dorun', 'doseq', 'dosync', 'dotimes', 'doto', 'down', 'drop', 'edit', 'ensure', 'ffirst', 'find', 'flush', 'fn', 'fnseq', 'frest', 'gensym', 'identity', 'inc', 'interleave', 'intersection', 'into', 'iterate', 'keys', 'keyword', 'last', 'left', 'lefts', 'locking', 'macroexpand', 'mapcat', 'memfn', 'merge', 'meta', 'name', 'newline', 'node', 'ns', 'nth', 'nthrest', 'parse', 'partial', 'path', 'peek', 'pop', 'pr', 'println', 'prn', 'project', 'proxy', 'quot', 'quote', 'rand', 'reduce', 'refer', 'rem', 'remove', 'replicate', 'resolve', 'rest', 'reverse', 'rfirst', 'rights', 'root', 'rrest', 'rseq', 'second', 'send', 'seq', 'slurp', 'some', 'str', 'subs', 'subvec', 'symbol', 'sync', 'take', 'test', 'up', 'val', 'vals', 'vector', 'zipmap', 'zipper'),
+    'ClojureScriptLexer': ('accessor', 'agent', 'aget', 'alength', 'alter', 'apply', 'aset', 'assoc', 'await', 'bean', 'binding', 'butlast', 'cast', 'children', 'comment', 'commute', 'comp', 'comparator', 'complement', 'concat', 'cond', 'conj', 'cons', 'constantly', 'cycle', 'dec', 'definline', 'definterface', 'defmacro', 'defmethod', 'defmulti', 'defn', 'defonce', 'defproject', 'defprotocol', 'defrecord', 'defstruct', 'deftype', 'deref', 'difference', 'disj', 'dissoc', 'distinct', 'doall', 'doc', 'dorun', 'doseq', 'dosync', 'dotimes', 'doto', 'down', 'drop', 'edit', 'ensure', 'ffirst', 'find', 'flush', 'fn', 'fnseq', 'frest', 'gensym', 'identity', 'inc', 'interleave', 'intersection', 'into', 'iterate', 'keys', 'keyword', 'last', 'left', 'lefts', 'locking', 'macroexpand', 'mapcat', 'memfn', 'merge', 'meta', 'name', 'newline', 'node', 'ns', 'nth', 'nthrest', 'parse', 'partial', 'path', 'peek', 'pop', 'pr', 'println', 'prn', 'project', 'proxy', 'quot', 'quote', 'rand', 'reduce', 'refer', 'rem', 'remove', 'replicate', 'resolve', 'rest', 'reverse', 'rfirst', 'rights', 'root', 'rrest', 'rseq', 'second', 'send', 'seq', 'slurp', 'some', 'str', 'subs', 'subvec', 'symbol', 'sync', 'take', 'test', 'up', 'val', 'vals', 'vector', 'zipmap', 'zipper'),
+    'CobolLexer': ('advancing', 'allocate', 'alphabet', 'alphabetic', 'alphanumeric', 'also', 'alternateany', 'are', 'area', 'areas', 'ascending', 'automatic', 'autoterminate', 'based', 'bell', 'blink', 'bottom', 'cancel', 'chaining', 'characters', 'col', 'collating', 'cols', 'columns', 'comma', 'comp', 'computational', 'compute', 'converting', 'corr', 'corresponding', 'crt', 'currency', 'de', 'debugging', 'declaratives', 'delimited', 'depending', 'detail', 'disk', 'divide', 'division', 'duplicates', 'ebcdic', 'environment', 'eol', 'eop', 'eos', 'evaluate', 'fd', 'filler', 'footing', 'giving', 'goback', 'greater', 'heading', 'highlight', 'identification', 'ignoring', 'indexed', 'indicate', 'initialized', 'initiate', 'invalid', 'just', 'justified', 'less', 'limits', 'linage', 'linkage', 'lowlight', 'manual', 'multiple', 'multiply', 'negative', 'nulls', 'numbers', 'occurs', 'omitted', 'organization', 'other', 'overflow', 'overline', 'paragraph', 'pic', 'picture', 'plus', 'pointer', 'present', 'previous', 'printer', 'printing', 'procedures', 'proceed', 'quotes', 'rd', 'recording', 'records', 'redefines', 'reel', 'reference', 'remainder', 'removal', 'renames', 'replacing', 'reporting', 'reports', 'repository', 'reserve', 'rewind', 'rounded', 'same', 'secure', 'sentence', 'sequential', 'sharing', 'standard', 'subtract', 'suppress', 'symbolic', 'tallying', 'tape', 'than', 'unstring', 'upon', 'words', 'yyyyddd', 'yyyymmdd'),
+    'CoffeeScriptLexer': ('array', 'boolean', 'break', 'by', 'catch', 'class', 'continue', 'date', 'decodeuri', 'decodeuricomponent', 'delete', 'document', 'else', 'encodeuri', 'encodeuricomponent', 'error', 'eval', 'extends', 'false', 'finally', 'for', 'function', 'if', 'in', 'infinity', 'instanceof', 'isfinite', 'isnan', 'loop', 'math', 'nan', 'netscape', 'new', 'no', 'null', 'number', 'object', 'of', 'off', 'on', 'own', 'packages', 'parsefloat', 'parseint', 'regexp', 'return', 'string', 'sun', 'super', 'switch', 'then', 'this', 'throw', 'true', 'try', 'typeof', 'undefined', 'unless', 'until', 'when', 'while', 'window', 'yes'),
+    'ColdfusionLexer': ('any', 'array', 'binary', 'boolean', 'break', 'case', 'catch', 'component', 'continue', 'date', 'default', 'do', 'else', 'false', 'for', 'function', 'guid', 'if', 'in', 'len', 'null', 'numeric', 'property', 'query', 'required', 'return', 'string', 'struct', 'switch', 'true', 'try', 'uuid', 'var', 'while', 'xml'),
+    'CommonLispLexer': ('nil',),
+    'CoqLexer': ('after', 'apply', 'arguments', 'asr', 'assumption', 'auto', 'autorewrite', 'axiom', 'bind', 'bool_congr', 'canonical', 'change', 'check', 'clear', 'coercion', 'cofix', 'cofixpoint', 'coinductive', 'compute', 'congr', 'contextual', 'contradiction', 'corollary', 'cut', 'cutrewrite', 'defined', 'definition', 'delimit', 'destruct', 'discriminate', 'done', 'elim', 'exact', 'example', 'exists2', 'fact', 'field', 'fix', 'fixpoint', 'fold', 'forall', 'fun', 'generalize', 'goal', 'graph', 'have', 'hint', 'hnf', 'hypotheses', 'hypothesis', 'idtac', 'implicit', 'implicits', 'induction', 'inductive', 'injection', 'inside', 'intro', 'intros', 'inversion', 'land', 'last', 'left', 'lemma', 'lor', 'loss', 'lsl', 'ltac', 'lxor', 'morphism', 'move', 'nat_congr', 'nat_norm', 'nosimpl', 'notation', 'omega', 'outside', 'parameter', 'parameters', 'pattern', 'pose', 'prenex', 'printing', 'projections', 'proof', 'prop', 'proposition', 'qed', 'record', 'refine', 'reflexivity', 'relation', 'remark', 'rename', 'require', 'reserved', 'resolve', 'revert', 'rewrite', 'ring', 'romega', 'save', 'scope', 'search', 'section', 'show', 'simpl', 'solve', 'split', 'strict', 'structure', 'suff', 'suffices', 'symmetry', 'tactic', 'tauto', 'theorem', 'transitivity', 'trivial', 'unfold', 'unit', 'unlock', 'unset', 'variable', 'variables', 'view', 'without', 'wlog'),
+    'CppLexer': ('__', '_t', 'alignas', 'alignof', 'asm', 'blockingoffload', 'catch', 'char', 'class', 'const_cast', 'constexpr', 'decltype', 'delete', 'dynamic_cast', 'event', 'explicit', 'export', 'final', 'friend', 'include', 'interface', 'multiple_inheritance', 'mutable', 'namespace', 'new', 'noexcept', 'nullptr', 'offload', 'operator', 'outer', 'override', 'private', 'protected', 'public', 'reinterpret_cast', 'restrict', 'single_inheritance', 'static_assert', 'static_cast', 'super', 'template', 'this', 'thread_local', 'throw', 'throws', 'try', 'typeid', 'typename', 'using', 'uuidof', 'virtual', 'virtual_inheritance'),
+    'CrocLexer': ('as', 'assert', 'break', 'case', 'catch', 'class', 'continue', 'default', 'do', 'else', 'false', 'finally', 'for', 'foreach', 'function', 'global', 'if', 'import', 'in', 'is', 'local', 'module', 'namespace', 'null', 'return', 'scope', 'super', 'switch', 'this', 'throw', 'true', 'try', 'vararg', 'while', 'with', 'yield'),
+    'CryptolLexer': ('arith', 'as', 'bit', 'cmp', 'else', 'export', 'extern', 'false', 'fin', 'hiding', 'if', 'import', 'inf', 'lg2', 'max', 'min', 'module', 'newtype', 'pragma', 'property', 'qualified', 'then', 'true', 'type', 'where', 'width'),
+    'CssLexer': ('aliceblue', 'antiquewhite', 'aquamarine', 'armenian', 'aural', 'avoid', 'azimuth', 'azure', 'baseline', 'beige', 'bisque', 'blanchedalmond', 'blueviolet', 'bolder', 'brown', 'burlywood', 'cadetblue', 'chartreuse', 'chocolate', 'condensed', 'continuous', 'coral', 'cornflowerblue', 'cornsilk', 'crimson', 'crop', 'crosshair', 'cue', 'cursive', 'cyan', 'darkblue', 'darkcyan', 'darkgoldenrod', 'darkgray', 'darkgreen', 'darkkhaki', 'darkmagenta', 'darkolivegreen', 'darkorange', 'darkorchid', 'darkred', 'darksalmon', 'darkseagreen', 'darkslateblue', 'darkslategray', 'darkturquoise', 'darkviolet', 'dashed', 'deeppink', 'deepskyblue', 'dimgray', 'dodgerblue', 'dotted', 'elevation', 'embed', 'fantasy', 'faster', 'firebrick', 'floralwhite', 'forestgreen', 'gainsboro', 'georgian', 'ghostwhite', 'gold', 'goldenrod', 'greenyellow', 'groove', 'hebrew', 'higher', 'hiragana', 'honeydew', 'hotpink', 'important', 'indianred', 'indigo', 'inset', 'ivory', 'katakana', 'khaki', 'larger', 'lavender', 'lavenderblush', 'lawngreen', 'leftwards', 'lemonchiffon', 'lightblue', 'lightcoral', 'lightcyan', 'lighter', 'lightgoldenrodyellow', 'lightgreen', 'lightgrey', 'lightpink', 'lightsalmon', 'lightseagreen', 'lightskyblue', 'lightslategray', 'lightsteelblue', 'lightyellow', 'limegreen', 'linen', 'loud', 'lowercase', 'ltr', 'magenta', 'marks', 'mediumaquamarine', 'mediumblue', 'mediumorchid', 'mediumpurple', 'mediumseagreen', 'mediumslateblue', 'mediumspringgreen', 'mediumturquoise', 'mediumvioletred', 'midnightblue', 'mintcream', 'mistyrose', 'moccasin', 'monospace', 'narrower', 'navajowhite', 'nowrap', 'oblique', 'oldlace', 'olivedrab', 'opacity', 'orange'),
+    'CudaLexer': ('__inline', '__m', '_inline', '_t', 'asm', 'assume', 'auto', 'based', 'bool', 'break', 'case', 'cdecl', 'char', 'const', 'continue', 'declspec', 'default', 'do', 'double', 'el', 'else', 'endif', 'enum', 'except', 'extern', 'false', 'fastcall', 'finally', 'float', 'for', 'forceinline', 'goto', 'identifier', 'if', 'inline', 'int', 'int16', 'int32', 'int64', 'int8', 'leave', 'long', 'naked', 'noop', 'null', 'raise', 'register', 'restrict', 'restricted', 'return', 'se', 'short', 'signed', 'sizeof', 'static', 'stdcall', 'struct', 'switch', 'thread', 'true', 'try', 'typedef', 'typename', 'unaligned', 'union', 'unsigned', 'void', 'volatile', 'w64', 'wchar_t', 'while'),
+    'CypherLexer': ('all', 'any', 'as', 'asc', 'by', 'create', 'delete', 'desc', 'distinct', 'foreach', 'in', 'is', 'limit', 'match', 'none', 'not', 'null', 'order', 'return', 'set', 'single', 'skip', 'start', 'union', 'unique', 'where', 'with'),
+    'CythonLexer': ('__import__', 'abs', 'all', 'and', 'any', 'api', 'apply', 'as', 'assert', 'basestring', 'bin', 'bool', 'break', 'buffer', 'by', 'bytearray', 'bytes', 'callable', 'chr', 'class', 'classmethod', 'cmp', 'coerce', 'compile', 'complex', 'continue', 'cp', 'ctypedef', 'def', 'del', 'delattr', 'dict', 'dir', 'divmod', 'elif', 'ellipsis', 'enum', 'enumerate', 'eval', 'except', 'exec', 'execfile', 'exit', 'extern', 'false', 'file', 'filter', 'finally', 'float', 'for', 'from', 'frozenset', 'getattr', 'gil', 'global', 'globals', 'hasattr', 'hash', 'hex', 'id', 'import', 'in', 'include', 'inline', 'input', 'int', 'intern', 'is', 'isinstance', 'issubclass', 'iter', 'lambda', 'len', 'list', 'locals', 'long', 'map', 'max', 'min', 'next', 'nogil', 'none', 'not', 'notimplemented', 'null', 'object', 'oct', 'open', 'or', 'ord', 'pass', 'pow', 'print', 'property', 'public', 'raise', 'range', 'raw_input', 'readonly', 'reduce', 'reload', 'repr', 'return', 'reversed', 'round', 'self', 'set', 'setattr', 'slice', 'sorted', 'staticmethod', 'str', 'struct', 'sum', 'super', 'true', 'try', 'tuple', 'type', 'unichr', 'unicode', 'union', 'vars', 'while', 'with', 'xrange', 'yield', 'zip'),
+    'DLexer': ('__date__', '__eof__', '__file__', '__function__', '__gshared', '__line__', '__module__', '__parameters', '__pretty_function__', '__time__', '__timestamp__', '__traits', '__vector', '__vendor__', '__version__', 'abstract', 'alias', 'align', 'asm', 'assert', 'auto', 'body', 'bool', 'break', 'byte', 'case', 'cast', 'catch', 'cdouble', 'cent', 'cfloat', 'char', 'class', 'const', 'continue', 'creal', 'dchar', 'debug', 'default', 'delegate', 'delete', 'deprecated', 'do', 'double', 'dstring', 'else', 'enum', 'export', 'extern', 'false', 'final', 'finally', 'float', 'for', 'foreach', 'foreach_reverse', 'function', 'goto', 'idouble', 'if', 'ifloat', 'immutable', 'import', 'in', 'inout', 'int', 'interface', 'invariant', 'ireal', 'is', 'lazy', 'long', 'macro', 'mixin', 'module', 'new', 'nothrow', 'null', 'out', 'override', 'package', 'pragma', 'private', 'protected', 'ptrdiff_t', 'public', 'pure', 'real', 'ref', 'return', 'scope', 'shared', 'short', 'size_t', 'static', 'string', 'struct', 'super', 'switch', 'synchronized', 'template', 'this', 'throw', 'true', 'try', 'typedef', 'typeid', 'typeof', 'ubyte', 'ucent', 'uint', 'ulong', 'union', 'unittest', 'ushort', 'version', 'void', 'volatile', 'wchar', 'while', 'with', 'wstring'),
+    'DarcsPatchLexer': ('adddir', 'addfile', 'hunk', 'move', 'replace', 'rmdir', 'rmfile', 'tag'),
+    'DartLexer': ('abstract', 'as', 'assert', 'bool', 'break', 'case', 'catch', 'class', 'const', 'continue', 'default', 'do', 'double', 'dynamic', 'else', 'export', 'extends', 'factory', 'false', 'final', 'finally', 'for', 'get', 'hide', 'if', 'implements', 'import', 'in', 'int', 'is', 'library', 'native', 'new', 'null', 'num', 'object', 'of', 'operator', 'part', 'return', 'set', 'show', 'source', 'static', 'string', 'super', 'switch', 'this', 'throw', 'true', 'try', 'typedef', 'var', 'void', 'while'),
+    'DebianControlLexer': ('build', 'depends', 'description', 'installed', 'maintainer', 'md5sum', 'python', 'sha1', 'sha256', 'size', 'version'),
+    'DgLexer': ('__import__', 'abs', 'all', 'and', 'any', 'bin', 'bind', 'bool', 'bytearray', 'bytes', 'chr', 'classmethod', 'cmp', 'compile', 'complex', 'delattr', 'dict', 'dir', 'divmod', 'drop', 'dropwhile', 'ellipsis', 'enumerate', 'eval', 'except', 'exhaust', 'false', 'filter', 'finally', 'flip', 'float', 'for', 'format', 'frozenset', 'fst', 'getattr', 'globals', 'hasattr', 'hash', 'head', 'hex', 'id', 'if', 'import', 'in', 'init', 'input', 'int', 'is', 'isinstance', 'issubclass', 'iter', 'iterate', 'last', 'len', 'list', 'locals', 'map', 'max', 'memoryview', 'min', 'next', 'none', 'not', 'notimplemented', 'object', 'oct', 'open', 'or', 'ord', 'otherwise', 'pow', 'print', 'property', 'raise', 'range', 'repr', 'reversed', 'round', 'self', 'set', 'setattr', 'slice', 'snd', 'sorted', 'staticmethod', 'str', 'subclass', 'sum', 'super', 'tail', 'take', 'takewhile', 'true', 'tuple', 'type', 'vars', 'where', 'while', 'with', 'yield', 'zip'),
+    'DiffLexer': ('diff', 'index'),
+    'DjangoLexer': ('and', 'as', 'block', 'comment', 'context', 'else', 'endcomment', 'endraw', 'extends', 'false', 'filter', 'forloop', 'if', 'ignore', 'import', 'in', 'is', 'loop', 'missing', 'none', 'not', 'or', 'out', 'raw', 'recursive', 'reversed', 'scoped', 'super', 'true', 'with'),
+    'DockerLexer': ('add', 'cmd', 'entrypoint', 'env', 'expose', 'from', 'maintainer', 'onbuild', 'run', 'volume', 'workdir'),
+    'DtdLexer': ('any', 'attlist', 'cdata', 'doctype', 'element', 'empty', 'entities', 'entity', 'fixed', 'id', 'idref', 'idrefs', 'implied', 'lang', 'ndata', 'nmtoken', 'nmtokens', 'notation', 'pcdata', 'public', 'required', 'space', 'system', 'xml'),
+    'DylanLexer': ('body', 'case', 'expression', 'name', 'token', 'variable'),
+    'ECLLexer': ('__compressed__', 'all', 'any', 'apply', 'ascii', 'assert', 'atmost', 'before', 'best', 'between', 'big_endian', 'boolean', 'build', 'buildindex', 'checkpoint', 'counter', 'csv', 'data', 'decimal', 'deprecated', 'descend', 'ebcdic', 'encrypt', 'endmacro', 'evaluate', 'except', 'exclusive', 'expire', 'export', 'extend', 'fail', 'failcode', 'failmessage', 'failure', 'few', 'first', 'flat', 'full', 'global', 'group', 'header', 'heading', 'hole', 'ifblock', 'independent', 'integer', 'joined', 'keep', 'keydiff', 'keyed', 'keypatch', 'last', 'left', 'limit', 'load', 'loadxml', 'local', 'locale', 'lookup', 'macro', 'many', 'maxcount', 'maxlength', 'named', 'nocase', 'noroot', 'noscan', 'nosort', 'nothor', 'notify', 'only', 'onwarning', 'opt', 'outer', 'output', 'overwrite', 'packed', 'parallel', 'partition', 'pattern', 'penalty', 'persist', 'physicallength', 'pipe', 'priority', 'qstring', 'quote', 'real', 'record', 'recovery', 'relationship', 'repeat', 'right', 'rule', 'scan', 'self', 'separator', 'sequential', 'service', 'shared', 'skew', 'skip', 'soapcall', 'sql', 'store', 'stored', 'success', 'terminator', 'thor', 'threshold', 'token', 'transform', 'trim', 'udecimal', 'unicode', 'unicodeorder', 'unsigned', 'unsorted', 'validate', 'varstring', 'varunicode', 'virtual', 'wait', 'whole', 'wild', 'within', 'xml', 'xpath'),
+    'ECLexer': ('__on_register_module', 'any_object', 'bool', 'byte', 'class', 'class_data', 'class_default_property', 'class_designer', 'class_fixed', 'class_no_expansion', 'class_property', 'database_open', 'dbfield', 'dbindex', 'dbtable', 'define', 'delete', 'dllexport', 'dllimport', 'firewatchers', 'get', 'import', 'incref', 'int64', 'isset', 'namespace', 'new', 'new0', 'null', 'private', 'property', 'property_category', 'public', 'register', 'remote', 'renew', 'renew0', 'set', 'stdcall', 'stopwatching', 'subclass', 'this', 'thisclass', 'typed_object', 'uint', 'uint16', 'uint32', 'uint64', 'unichar', 'using', 'value', 'virtual', 'watch', 'watchable'),
+    'EiffelLexer': ('across', 'agent', 'alias', 'all', 'and', 'as', 'assign', 'attached', 'attribute', 'check', 'class', 'convert', 'create', 'current', 'debug', 'deferred', 'detachable', 'do', 'else', 'elseif', 'end', 'ensure', 'expanded', 'export', 'external', 'false', 'feature', 'from', 'frozen', 'if', 'implies', 'inherit', 'inspect', 'invariant', 'like', 'local', 'loop', 'none', 'not', 'note', 'obsolete', 'old', 'once', 'only', 'or', 'precursor', 'redefine', 'rename', 'require', 'rescue', 'result', 'retry', 'select', 'separate', 'then', 'true', 'undefine', 'until', 'variant', 'void', 'when', 'xor'),
+    'ErlangLexer': ('after', 'andalso', 'append_element', 'atom_to_list', 'band', 'binary_to_list', 'binary_to_term', 'bit_size', 'bitstring_to_list', 'bnot', 'bor', 'bsl', 'bsr', 'bump_reductions', 'bxor', 'byte_size', 'cancel_timer', 'check_process_code', 'cond', 'delete_module', 'demonitor', 'disconnect_node', 'display', 'div', 'element', 'erase', 'float_to_list', 'fun_info', 'fun_to_list', 'function_exported', 'garbage_collect', 'get_keys', 'group_leader', 'hd', 'integer_to_list', 'iolist_size', 'iolist_to_binary', 'is_atom', 'is_binary', 'is_bitstring', 'is_boolean', 'is_builtin', 'is_float', 'is_function', 'is_integer', 'is_list', 'is_number', 'is_pid', 'is_port', 'is_process_alive', 'is_record', 'is_reference', 'is_tuple', 'link', 'list_to_atom', 'list_to_binary', 'list_to_bitstring', 'list_to_existing_atom', 'list_to_float', 'list_to_integer', 'list_to_pid', 'list_to_tuple', 'load_module', 'localtime_to_universaltime', 'make_tuple', 'md5', 'md5_final', 'md5_update', 'memory', 'module_loaded', 'monitor', 'monitor_node', 'node', 'nodes', 'open_port', 'orelse', 'phash', 'phash2', 'pid_to_list', 'port_call', 'port_close', 'port_command', 'port_connect', 'port_control', 'port_info', 'port_to_list', 'process_display', 'process_flag', 'process_info', 'purge_module', 'put', 'query', 'read_timer', 'receive', 'ref_to_list', 'register', 'rem', 'resume_process', 'send', 'send_after', 'send_nosuspend', 'set_cookie', 'setelement', 'spawn', 'spawn_link', 'spawn_monitor', 'spawn_opt', 'split_binary', 'start_timer', 'statistics', 'suspend_process', 'system_flag', 'system_info', 'system_monitor', 'system_profile', 'term_to_binary', 'tl', 'trace', 'trace_delivered', 'trace_info', 'trace_pattern', 'trunc', 'tuple_size', 'tuple_to_list', 'universaltime_to_localtime', 'unlink', 'unregister', 'whereis'),
+    'EvoqueLexer': ('begin', 'else', 'end', 'evoque', 'fi', 'overlay', 'rof'),
+    'FSharpLexer': ('abstract', 'and', 'as', 'assert', 'atomic', 'base', 'begin', 'bool', 'break', 'byte', 'char', 'checked', 'class', 'component', 'const', 'constraint', 'constructor', 'continue', 'decimal', 'default', 'delegate', 'do', 'done', 'double', 'downcast', 'downto', 'eager', 'elif', 'else', 'end', 'endif', 'enum', 'event', 'exception', 'exn', 'extern', 'external', 'false', 'finally', 'fixed', 'float', 'float32', 'for', 'fun', 'function', 'functor', 'global', 'if', 'in', 'include', 'inherit', 'inline', 'int16', 'int32', 'int64', 'int8', 'interface', 'internal', 'lazy', 'let', 'light', 'line', 'list', 'match', 'member', 'method', 'mixin', 'module', 'mutable', 'namespace', 'nativeint', 'new', 'not', 'nowarn', 'null', 'obj', 'object', 'of', 'open', 'or', 'override', 'parallel', 'private', 'process', 'protected', 'public', 'pure', 'rec', 'return', 'sbyte', 'sealed', 'select', 'single', 'static', 'string', 'struct', 'tailcall', 'then', 'to', 'trait', 'true', 'try', 'type', 'uint16', 'uint32', 'uint64', 'uint8', 'unativeint', 'unit', 'upcast', 'use', 'val', 'virtual', 'void', 'volatile', 'when', 'while', 'with', 'yield'),
+    'FactorLexer': ('accumulate', 'alien', 'align', 'bi', 'bignum', 'bitand', 'bitnot', 'bitor', 'bitxor', 'bl', 'boa', 'build', 'builtin', 'callcc0', 'callcc1', 'callstack', 'cleanup', 'cleave', 'collector', 'compose', 'condition', 'contents', 'continuation', 'counter', 'curry', 'cut', 'datastack', 'defer', 'denominator', 'deprecated', 'die', 'dip', 'dup', 'dupd', 'exchange', 'exclude', 'first2', 'first3', 'first4', 'fixnum', 'flip', 'flushable', 'foldable', 'follow', 'forget', 'fourth', 'glue', 'halves', 'harvest', 'hashcode', 'head', 'hook', 'ifcc', 'immutable', 'inc', 'indices', 'infimum', 'initialize', 'interleave', 'intersection', 'iota', 'keep', 'lengthen', 'log2', 'longer', 'longest', 'main', 'memo', 'mismatch', 'most', 'namestack', 'neg', 'nip', 'nl', 'nth', 'nths', 'numerator', 'over', 'padding', 'partition', 'pick', 'postpone', 'predicate', 'prepend', 'prepose', 'produce', 'product', 'qualified', 'ratio', 'rational', 'read1', 'readln', 'recip', 'recover', 'repetition', 'replicate', 'restarts', 'retainstack', 'rethrow', 'rot', 'selector', 'sgn', 'shorten', 'shorter', 'shortest', 'sift', 'singleton', 'singletons', 'slot', 'snip', 'spread', 'sq', 'subseq', 'substitute', 'suffix', 'supremum', 'surround', 'swap', 'swapd', 'third', 'toggle', 'tri', 'typed', 'unclip', 'unuse', 'unzip', 'wrapper', 'write1'),
+    'FancyLexer': ('array', 'block', 'case', 'catch', 'class', 'def', 'directory', 'enumerable', 'falseclass', 'fancyenumerable', 'fancyspec', 'file', 'finally', 'hash', 'match', 'method', 'nilclass', 'number', 'object', 'package', 'range', 'retry', 'return', 'return_local', 'set', 'stack', 'string', 'symbol', 'trueclass', 'try', 'tuple'),
+    'FantomLexer': ('abstract', 'as', 'break', 'case', 'catch', 'class', 'const', 'continue', 'default', 'do', 'else', 'enum', 'facet', 'false', 'final', 'finally', 'for', 'get', 'if', 'internal', 'is', 'isnot', 'it', 'make', 'mixin', 'native', 'new', 'null', 'once', 'override', 'private', 'protected', 'public', 'readonly', 'return', 'set', 'static', 'super', 'switch', 'this', 'throw', 'true', 'try', 'using', 'virtual', 'while'),
+    'FelixLexer': ('_deref', '_svc', 'address', 'all', 'any', 'array', 'assert', 'attempt', 'axiom', 'byte', 'caddress', 'call', 'callback', 'caseno', 'cclass', 'charcp', 'charp', 'code', 'complex', 'compound', 'cont', 'cstruct', 'ctor', 'ctypes', 'cvaddress', 'dcomplex', 'def', 'dimaginary', 'done', 'downto', 'elif', 'endattempt', 'endcase', 'endif', 'endmatch', 'except', 'exceptions', 'expect', 'forall', 'forget', 'fork', 'fun', 'functor', 'gen', 'goto', 'ident', 'imaginary', 'incomplete', 'inherit', 'instance', 'int16', 'int32', 'int64', 'int8', 'isin', 'jump', 'lambda', 'lcomplex', 'ldouble', 'let', 'limaginary', 'list', 'long', 'loop', 'lvalue', 'match', 'module', 'namespace', 'noexpand', 'nonterm', 'obj', 'of', 'offset', 'open', 'opt', 'parse', 'proc', 'raise', 'reduce', 'ref', 'regexp', 'reglex', 'regmatch', 'rename', 'root', 'self', 'short', 'slice', 'struct', 'the', 'this', 'tiny', 'to', 'typecase', 'typeclass', 'typedef', 'typematch', 'typeof', 'uchar', 'ucharcp', 'ucharp', 'uint', 'uint16', 'uint32', 'uint64', 'uint8', 'ulong', 'union', 'unit', 'upto', 'ushort', 'ustring', 'utiny', 'uvlong', 'vaddress', 'val', 'var', 'varray', 'vlong', 'void', 'vshort', 'wchar', 'when', 'where', 'whilst', 'wstring', 'xor', 'yield'),
+    'FortranLexer': ('achar', 'adjustl', 'adjustr', 'aimag', 'aint', 'allocatable', 'allocated', 'allstop', 'amax', 'amin', 'amod', 'anint', 'associate', 'associated', 'atomic_define', 'atomic_ref', 'backspace', 'besj', 'besjn', 'bessel_j0', 'bessel_j1', 'bessel_jn', 'bessel_y0', 'bessel_y1', 'bessel_yn', 'besy', 'besyn', 'bge', 'bgt', 'ble', 'blockdata', 'blt', 'btest', 'c_alert', 'c_associated', 'c_backspace', 'c_bool', 'c_carriage_return', 'c_char', 'c_double', 'c_double_complex', 'c_f_pointer', 'c_f_procpointer', 'c_float', 'c_float_complex', 'c_form_feed', 'c_funloc', 'c_funptr', 'c_horizontal_tab', 'c_int', 'c_int16_t', 'c_int32_t', 'c_int64_t', 'c_int8_t', 'c_int_fast16_t', 'c_int_fast32_t', 'c_int_fast64_t', 'c_int_fast8_t', 'c_int_least16_t', 'c_int_least32_t', 'c_int_least64_t', 'c_int_least8_t', 'c_intmax_t', 'c_intptr_t', 'c_loc', 'c_long', 'c_long_double', 'c_long_double_complex', 'c_long_long', 'c_new_line', 'c_null_char', 'c_null_funptr', 'c_null_ptr', 'c_ptr', 'c_short', 'c_signed_char', 'c_size_t', 'c_sizeof', 'c_vertical_tab', 'cabs', 'ccos', 'cexp', 'clog', 'cmplx', 'codimension', 'command_argument_count', 'concurrrent', 'conjg', 'contiguous', 'cpu_time', 'cshift', 'csin', 'csqrt', 'dabs', 'dacos', 'dasin', 'datan', 'date_and_time', 'dbesj', 'dbesjn', 'dbesy', 'dbesyn', 'dble', 'dcos', 'dcosh', 'ddim', 'decode', 'derf', 'derfc', 'dint', 'dlog', 'dmax', 'dmin', 'dmod', 'dnint', 'dprod', 'dshiftl', 'dshiftr', 'dsign', 'dsin', 'dsinh', 'dsqrt', 'dtan', 'dtanh', 'dtime', 'elemental', 'enumerator', 'eoshift'),
+    'FoxProLexer': ('_alignment', '_asciicols', '_asciirows', '_assist', '_beautify', '_box', '_browser', '_builder', '_calcmem', '_calcvalue', '_cliptext', '_converter', '_coverage', '_curobj', '_dblclick', '_diarydate', '_dos', '_foxdoc', '_foxref', '_gallery', '_gengraph', '_genhtml', '_genmenu', '_genpd', '_genscrn', '_genxtab', '_getexpr', '_include', '_incseek', '_indent', '_lmargin', '_mac', '_menudesigner', '_mline', '_padvance', '_pageno', '_pagetotal', '_pbpage', '_pcolno', '_pcopies', '_pdriver', '_pdsetup', '_pecode', '_peject', '_pepage', '_plength', '_plineno', '_ploffset', '_ppitch', '_pquality', '_pretext', '_pscode', '_pspacing', '_pwait', '_reportbuilder', '_reportoutput', '_reportpreview', '_rmargin', '_samples', '_scctext', '_screen', '_shell', '_spellchk', '_startup', '_tabs', '_tally', '_taskpane', '_text', '_throttle', '_toolbox', '_tooltiptimeout', '_transport', '_triggerlevel', '_unix', '_vfp', '_windows', '_wizard', '_wrap', 'alternate', 'ansi', 'aplabout', 'app', 'assist', 'autosave', 'blocksize', 'brstatus', 'calculate', 'carry', 'century', 'compatible', 'confirm', 'deactivate', 'deleted', 'development', 'dohistory', 'eject', 'endprintjob', 'endscan', 'endtext', 'filer', 'getexpr', 'headings', 'helpfilter', 'hours', 'intensity', 'keycomp', 'logerrors', 'macdesktop', 'machelp', 'mackey', 'memowidth', 'multilocks', 'nocptrans', 'odometer', 'pdsetup', 'readborder', 'readerror', 'reprocess', 'runscript', 'safety', 'scoreboard', 'sticky', 'sysmenu', 'talk', 'textmerge', 'thisform', 'thisformset', 'trbetween'),
+    'GAPLexer': ('and', 'assert', 'bind_global', 'bindglobal', 'break', 'continue', 'declare', 'do', 'elif', 'else', 'end', 'fi', 'for', 'function', 'if', 'in', 'info', 'install', 'isbound', 'local', 'mod', 'not', 'od', 'or', 'quit', 'rec', 'repeat', 'return', 'then', 'trynextmethod', 'unbind', 'until', 'while'),
+    'GLShaderLexer': ('asm', 'attribute', 'bool', 'break', 'bvec2', 'bvec3', 'bvec4', 'cast', 'centroid', 'class', 'const', 'continue', 'default', 'discard', 'do', 'double', 'dvec2', 'dvec3', 'dvec4', 'else', 'enum', 'extern', 'external', 'false', 'fixed', 'float', 'for', 'fvec2', 'fvec3', 'fvec4', 'goto', 'half', 'highp', 'hvec2', 'hvec3', 'hvec4', 'if', 'in', 'inline', 'inout', 'input', 'int', 'interface', 'invariant', 'ivec2', 'ivec3', 'ivec4', 'long', 'lowp', 'mat2', 'mat2x2', 'mat2x3', 'mat2x4', 'mat3mat4', 'mat3x2', 'mat3x3', 'mat3x4', 'mat4x2', 'mat4x3', 'mat4x4', 'mediump', 'namespace', 'noinline', 'out', 'output', 'packed', 'precision', 'public', 'return', 'sampler1d', 'sampler1dshadow', 'sampler2d', 'sampler2drect', 'sampler2drectshadow', 'sampler2dshadow', 'sampler3drect', 'sampler3dsamplercube', 'short', 'sizeof', 'static', 'struct', 'switch', 'template', 'this', 'true', 'typedef', 'uniform', 'union', 'unsigned', 'using', 'varying', 'vec2', 'vec3', 'vec4', 'void', 'volatile', 'while'),
+    'GasLexer': ('data', 'section', 'text'),
+    'GenshiLexer': ('py',),
+    'GenshiTextLexer': ('choose', 'end', 'otherwise', 'when', 'with'),
+    'GherkinLexer': (u'aber', u'ablon', u'ablonas', u'abstrakt', u'achtergrond', u'adaj', u'adavek', u'ady', u'akkor', u'ale', u'aleshores', u'ali', u'allora', u'alors', u'als', u'ama', u'amlinellol', u'angenommen', u'anrhegedig', u'antecedentes', u'antecedents', u'arwedd', u'atesa', u'atunci', u'b4', u'baggrund', u'bakgrund', u'bakgrunn', u'beispiele', u'bet', u'blokes', u'buh', u'cand', u'caracter', u'cefndir', u'cen', u'cenario', u'cept', u'ch', u'cho', u'cija', u'ciwo', u'cobber', u'condi', u'conditii', u'contesto', u'contexte', u'contexto', u'contoh', u'crikey', u'cuando', u'dac', u'daca', u'dado', u'dan', u'dann', u'dar', u'dasar', u'dato', u'dello', u'den', u'dengan', u'dis', u'diyelim', u'donada', u'donat', u'donita', u'donn', u'dun', u'duota', u'eeldades', u'egenskab', u'egenskap', u'ejemplos', u'eksempler', u'ekzemploj', u'eli', u'en', u'enghreifftiau', u'enia', u'ent', u'entao', u'entonces', u'er', u'escenari', u'escenario', u'esempi', u'esquema', u'et', u'etant', u'examples', u'examplz', u'exempel', u'exemplele', u'exemples', u'exemplos', u'fakat', u'fitur', u'fonctionnalit', u'fono', u'forgat', u'funcionalidade', u'funcionalitat', u'functionalitate', u'functionaliteit', u'funkcionalit', u'funkcionalnost', u'funktionalit', u'funzionalit', u'gegeben', u'gegeven', u'gitt', u'givet', u'givun', u'got', u'gotta', u'grundlage', u'ha', u'hai', u'haz', u'hu', u'iadavka', u'iai', u'ii', u'ionalitate', u'ir', u'ja', u'je'),
+    'GnuplotLexer': ('al', 'allw', 'allwi', 'allwin', 'allwind', 'allwindo', 'allwindow', 'allwindows', 'ang', 'angl', 'angles', 'ar', 'arr', 'arro', 'au', 'aut', 'autos', 'autosc', 'autosca', 'autoscal', 'autoscale', 'axe', 'axi', 'bina', 'binar', 'bmar', 'bmarg', 'bmargi', 'bmargin', 'bord', 'borde', 'boxw', 'boxwi', 'boxwid', 'boxwidt', 'boxwidth', 'button1', 'button2', 'button3', 'cbda', 'cbdat', 'cbdata', 'cbdti', 'cbdtic', 'cbdtics', 'cbl', 'cbla', 'cblab', 'cblabe', 'cblabel', 'cbmti', 'cbmtic', 'cbmtics', 'cbr', 'cbra', 'cbran', 'cbrang', 'cbrange', 'cbti', 'cbtic', 'cbtics', 'clab', 'clabe', 'cle', 'clea', 'cli', 'cnt', 'cntr', 'cntrp', 'cntrpa', 'cntrpar', 'cntrpara', 'cntrparam', 'colorb', 'colorbo', 'colorbox', 'conto', 'contou', 'da', 'dat', 'dataf', 'datafi', 'datafil', 'datafile', 'decimalsi', 'decimalsig', 'decimalsign', 'dg', 'dgr', 'dgri', 'dgrid', 'dgrid3', 'dgrid3d', 'dum', 'dumm', 'dummy', 'enc', 'enco', 'encod', 'encodi', 'encodin', 'ev', 'eve', 'ever', 'exi', 'fontp', 'fontpa', 'fontpat', 'fontpath', 'fu', 'functi', 'functio', 'gnuplot', 'gr', 'gri', 'he', 'hel', 'hi', 'hid', 'hidd', 'hidde', 'hidden3', 'hidden3d', 'his', 'histo', 'histor', 'historys', 'historysi'),
+    'GoLexer': ('append', 'bool', 'break', 'byte', 'cap', 'case', 'chan', 'close', 'complex', 'complex128', 'complex64', 'const', 'continue', 'copy', 'default', 'defer', 'delete', 'else', 'error', 'fallthrough', 'false', 'float', 'float32', 'float64', 'for', 'func', 'go', 'goto', 'if', 'imag', 'import', 'int', 'int16', 'int32', 'int64', 'int8', 'interface', 'iota', 'len', 'make', 'map', 'new', 'nil', 'package', 'panic', 'print', 'println', 'range', 'real', 'recover', 'return', 'rune', 'select', 'string', 'struct', 'switch', 'true', 'type', 'uint', 'uint16', 'uint32', 'uint64', 'uint8', 'uintptr', 'var'),
+    'GoloLexer': ('and', 'array', 'asinterfaceinstance', 'augment', 'break', 'case', 'catch', 'continue', 'else', 'false', 'finally', 'for', 'foreach', 'fun', 'function', 'if', 'import', 'in', 'is', 'isnt', 'let', 'list', 'local', 'map', 'match', 'module', 'not', 'null', 'oftype', 'or', 'orifnull', 'otherwise', 'pimp', 'print', 'println', 'raise', 'readln', 'return', 'set', 'struct', 'then', 'throw', 'true', 'try', 'tuple', 'var', 'vector', 'when', 'while'),
+    'GosuLexer': ('abstract', 'as', 'block', 'boolean', 'break', 'byte', 'case', 'catch', 'char', 'class', 'classpath', 'construct', 'continue', 'default', 'delegate', 'do', 'double', 'else', 'enhancement', 'enum', 'eval', 'extends', 'false', 'final', 'finally', 'float', 'for', 'foreach', 'function', 'get', 'if', 'implements', 'in', 'index', 'infinity', 'int', 'interface', 'internal', 'long', 'nan', 'new', 'null', 'outer', 'override', 'package', 'private', 'property', 'protected', 'public', 'readonly', 'represents', 'return', 'set', 'short', 'static', 'statictypeof', 'super', 'switch', 'this', 'throw', 'transient', 'true', 'try', 'typeas', 'typeis', 'typeof', 'uses', 'using', 'var', 'void', 'while'),
+    'GroffLexer': ('th',),
+    'GroovyLexer': ('abstract', 'as', 'assert', 'bat', 'bin', 'boolean', 'break', 'byte', 'case', 'catch', 'char', 'class', 'cmd', 'const', 'continue', 'def', 'default', 'do', 'double', 'else', 'enum', 'exe', 'extends', 'false', 'final', 'finally', 'float', 'for', 'goto', 'groovy', 'if', 'implements', 'import', 'in', 'instanceof', 'int', 'interface', 'long', 'native', 'new', 'null', 'package', 'private', 'protected', 'public', 'return', 'short', 'static', 'strictfp', 'super', 'switch', 'synchronized', 'this', 'throw', 'throws', 'transient', 'true', 'try', 'void', 'volatile', 'while'),
+    'HandlebarsLexer': ('each', 'else', 'if', 'in', 'log', 'unless', 'with'),
+    'HaskellLexer': (u'as', 'case', 'class', 'data', 'default', 'deriving', 'do', 'else', u'hiding', 'if', 'import', 'in', 'infix', 'instance', 'let', 'module', 'newtype', 'of', 'qualified', 'then', 'type', 'where'),
+    'HaxeLexer': ('abstract', 'break', 'case', 'cast', 'catch', 'class', 'continue', 'default', 'do', 'dynamic', 'else', 'enum', 'extends', 'extern', 'false', 'for', 'from', 'function', 'get', 'if', 'implements', 'import', 'in', 'inline', 'interface', 'macro', 'never', 'new', 'null', 'override', 'package', 'private', 'public', 'return', 'set', 'static', 'switch', 'this', 'throw', 'to', 'true', 'try', 'typedef', 'untyped', 'using', 'var', 'while'),
+    'HtmlDjangoLexer': ('html',),
+    'HtmlGenshiLexer': ('py',),
+    'HtmlLexer': ('cdata', 'html', 'script', 'style'),
+    'HtmlPhpLexer': ('html',),
+    'HtmlSmartyLexer': ('html',),
+    'HttpLexer': ('delete', 'get', 'head', 'http', 'options', 'patch', 'post', 'put', 'trace'),
+    'HxmlLexer': ('as3', 'classes', 'cmd', 'cp', 'cpp', 'debug', 'flash', 'front', 'gen', 'header', 'hx', 'inline', 'js', 'lib', 'main', 'namespace', 'neko', 'no', 'opt', 'output', 'php', 'prompt', 'remap', 'resource', 'source', 'stage', 'strict', 'swf', 'swf9', 'times', 'traces', 'use', 'version', 'xml'),
+    'HyLexer': ('__import__', 'abs', 'all', 'any', 'apply', 'assert', 'assoc', 'basestring', 'bin', 'bool', 'buffer', 'bytearray', 'bytes', 'callable', 'car', 'cdr', 'chr', 'classmethod', 'cmp', 'coerce', 'compile', 'complex', 'cond', 'cycle', 'dec', 'def', 'defclass', 'defmacro', 'defn', 'defun', 'del', 'delattr', 'dict', 'dir', 'distinct', 'divmod', 'drop', 'elif', 'ellipsis', 'enumerate', 'eval', 'except', 'exec', 'execfile', 'exit', 'file', 'filter', 'finally', 'first', 'fn', 'foreach', 'frozenset', 'get', 'getattr', 'global', 'globals', 'hasattr', 'hash', 'hex', 'id', 'inc', 'input', 'intern', 'is', 'isinstance', 'issubclass', 'iter', 'iterate', 'kwapply', 'lambda', 'len', 'let', 'list', 'list_comp', 'locals', 'long', 'map', 'max', 'min', 'next', 'none', 'notimplemented', 'nth', 'object', 'oct', 'open', 'ord', 'pass', 'pow', 'print', 'progn', 'property', 'quasiquote', 'quote', 'raise', 'range', 'raw_input', 'reduce', 'reload', 'remove', 'repeat', 'repeatedly', 'repr', 'rest', 'reversed', 'round', 'self', 'setattr', 'setv', 'slice', 'sorted', 'staticmethod', 'str', 'sum', 'super', 'take', 'take_nth', 'take_while', 'tuple', 'unichr', 'unicode', 'unless', 'unquote', 'vars', 'when', 'xrange', 'yield', 'zip'),
+    'HybrisLexer': ('__file__', '__inc_path__', '__lib_path__', '__line__', '__version__', 'accept', 'atan2', 'base64decode', 'base64encode', 'call_method', 'ceil', 'cgi', 'clientsocket', 'connect', 'console', 'contains', 'crc32', 'directory', 'dll', 'dllcall', 'dllcall_argv', 'dllclose', 'dlllink', 'dllopen', 'dyn_functions', 'env', 'exception', 'fabs', 'fclose', 'fgets', 'fmod', 'fopen', 'fork', 'fread', 'fromxml', 'fseek', 'fsize', 'ftell', 'fwrite', 'gc_collect', 'gc_collect_threshold', 'gc_mm_items', 'gc_mm_usage', 'getpeername', 'getpid', 'getsockname', 'has', 'http_download', 'http_get', 'http_post', 'isalias', 'isarray', 'ischar', 'isfloat', 'isint', 'ismap', 'isstring', 'keys', 'kill', 'listen', 'log10', 'md5', 'md5_file', 'me', 'methodreference', 'methods', 'mkfifo', 'mknod', 'mount', 'pack', 'pclose', 'pcre_replace', 'pipe', 'pop', 'popen', 'printf', 'println', 'process', 'pthread_create', 'pthread_create_argv', 'pthread_exit', 'pthread_join', 'pthread_kill', 'readdir', 'readline', 'recv', 'remove', 'runnable', 'runner', 'serial_close', 'serial_fcntl', 'serial_get_attr', 'serial_get_ispeed', 'serial_get_ospeed', 'serial_open', 'serial_read', 'serial_set_attr', 'serial_set_ispeed', 'serial_set_ospeed', 'serial_write', 'server', 'serversocket', 'settimeout', 'sha1', 'sha2', 'sleep', 'smtp_send', 'socket', 'strdate', 'strtime', 'substr', 'thread', 'ticks', 'toint', 'tostring', 'toxml', 'trim', 'umount', 'umount2', 'unmap', 'urldecode', 'urlencode', 'user_functions', 'usleep', 'var_names', 'var_values', 'xml_load', 'xml_parse'),
+    'IDLLexer': ('a_correlate', 'adapt_hist_equal', 'alog10', 'amoeba', 'annotate', 'app_user_dir', 'app_user_dir_query', 'arg_present', 'array_equal', 'array_indices', 'ascii_template', 'bandpass_filter', 'bandreject_filter', 'bar_plot', 'barplot', 'beseli', 'beselj', 'beselk', 'besely', 'bilinear', 'bin_date', 'binary_template', 'bindgen', 'bit_ffs', 'bit_population', 'blas_axpy', 'blk_con', 'box_cursor', 'broyden', 'butterworth', 'bytarr', 'byteorder', 'bytscl', 'c_correlate', 'caldat', 'call_external', 'call_function', 'call_procedure', 'canny', 'chebyshev', 'check_math', 'chisqr_cvf', 'chisqr_pdf', 'choldc', 'cholsol', 'cindgen', 'cir_3pnt', 'clust_wts', 'cluster_tree', 'cmyk_convert', 'color_convert', 'color_exchange', 'color_quan', 'color_range_map', 'colorize_sample', 'colormap_applicable', 'colormap_gradient', 'colormap_rotation', 'colortable', 'comfit', 'command_line_args', 'compile_opt', 'complexarr', 'complexround', 'compute_mesh_normals', 'congrid', 'constrained_min', 'convert_coord', 'convol_fft', 'coord2to3', 'copy_lun', 'correlate', 'cramer', 'create_cursor', 'create_struct', 'create_view', 'crossp', 'crvlength', 'ct_luminance', 'cti_test', 'curvefit', 'cv_coord', 'cvttobm', 'cw_animate', 'cw_animate_getp', 'cw_animate_load', 'cw_animate_run', 'cw_arcball', 'cw_bgroup', 'cw_clr_index', 'cw_colorsel', 'cw_defroi', 'cw_field', 'cw_filesel', 'cw_form', 'cw_fslider', 'cw_light_editor', 'cw_light_editor_get', 'cw_light_editor_set', 'cw_orient', 'cw_palette_editor', 'cw_palette_editor_get', 'cw_palette_editor_set', 'cw_pdmenu', 'cw_rgbslider', 'cw_tmpl', 'cw_zoom', 'db_exists', 'dblarr', 'dcindgen', 'dcomplexarr', 'define_key', 'define_msgblk', 'define_msgblk_from_file', 'defroi', 'defsysv', 'delvar', 'dendro_plot', 'dendrogram', 'deriv', 'derivsig', 'dfpmin', 'dialog_dbconnect', 'dialog_message', 'dialog_pickfile', 'dialog_printersetup', 'dialog_printjob', 'dialog_read_image'),
+    'IdrisLexer': ('abstract', 'access', 'auto', 'case', 'class', 'codata', 'compute', 'data', 'default', 'do', 'dsl', 'dynamic', 'else', 'error_handlers', 'exact', 'flag', 'freeze', 'hide', 'if', 'implicit', 'import', 'impossible', 'in', 'include', 'infix', 'instance', 'intro', 'intros', 'language', 'let', 'lib', 'link', 'logging', 'module', 'mutual', 'name', 'namespace', 'of', 'parameters', 'partial', 'pattern', 'postulate', 'prefix', 'private', 'proof', 'public', 'record', 'refine', 'rewrite', 'static', 'syntax', 'tactics', 'term', 'then', 'total', 'trivial', 'using', 'where', 'with'),
+    'IgorLexer': ('abortonrte', 'abortonvalue', 'break', 'case', 'catch', 'char', 'constant', 'continue', 'default', 'dfref', 'do', 'doprompt', 'double', 'else', 'elseif', 'end', 'endfor', 'endif', 'endmacro', 'endstructure', 'endswitch', 'endtry', 'float', 'for', 'funcref', 'function', 'if', 'int16', 'int32', 'macro', 'menu', 'multithread', 'nvar', 'override', 'picture', 'proc', 'prompt', 'return', 'static', 'strconstant', 'string', 'strswitch', 'struct', 'structure', 'submenu', 'svar', 'switch', 'threadsafe', 'try', 'uchar', 'uint16', 'uint32', 'variable', 'wave', 'while', 'window'),
+    'Inform6Lexer': (u'_ret', 'additive', 'box__routine', 'ca__pr', 'cdefart', 'cindefart', 'cl__ms', 'copy__primitive', 'cp__tab', 'creature', 'da__pr', 'db__pr', 'defart', 'dict_char_size', 'dict_entry_bytes', 'dict_is_unicode', 'dict_word_size', 'dynam__string', 'elder', 'eldest', 'englishnumber', 'expressions', 'fake_action', 'float_infinity', 'float_nan', 'float_ninfinity', 'give', 'glk', 'glk__wrap', 'gobj_ext_start', 'gobj_total_length', 'gobjfield_chain', 'gobjfield_child', 'gobjfield_name', 'gobjfield_parent', 'gobjfield_proptab', 'gobjfield_sibling', 'grammar__version', 'hasnt', 'held', 'ia__pr', 'ib__pr', 'ifnot', 'ifv3', 'ifv5', 'indefart', 'indirect', 'indiv_prop_start', 'infix__watching', 'initstr', 'linker', 'lowstring', 'main__', 'meta__class', 'metaclass', 'module_mode', 'multiexcept', 'multiheld', 'multiinside', 'nearby', 'notin', 'noun', 'num_attr_bytes', 'ob__move', 'ob__remove', 'objectloop', 'oc__cl', 'ofclass', 'op__pr', 'print__addr', 'print__pname', 'print_to_array', 'printshortname', 'r_process', 'ra__pr', 'ra__sc', 'recreate', 'remaining', 'rfalse', 'rl__pr', 'roman', 'rt__chg', 'rt__chgt', 'rt__chldb', 'rt__chldw', 'rt__chpr', 'rt__chprinta', 'rt__chprintc', 'rt__chprinto', 'rt__chprints', 'rt__chps', 'rt__chr', 'rt__chstb', 'rt__chstw', 'rt__cht', 'rt__err', 'rt__trps', 'rtrue', 'rv__pr', 'score', 'sender', 'spaces', 'statusline', 'strict_mode', 'stub', 'sw__var', 'switches', 'symb__tab', 'sys__glob0', 'sys__glob1', 'sys__glob2', 'sys_statusline_flag', 'system_file', 'target_glulx', 'target_zcode', 'temp__global2', 'temp__global3', 'temp__global4', 'temp_global', 'terminating', 'unsigned__compare', 'use_modules', 'verb', 'verbs', 'wordsize', 'wv__pr', 'younger', 'youngest'),
+    'IoLexer': ('args', 'clone', 'coroutine', 'do', 'dofile', 'dostring', 'else', 'elseif', 'file', 'for', 'if', 'list', 'map', 'method', 'object', 'sequence', 'then'),
+    'IokeLexer': ('after', 'and', 'andcombiner', 'arity', 'around', 'aspects', 'assignment', 'astext', 'availablerestarts', 'base', 'basebehavior', 'become', 'before', 'bind', 'boolean', 'break', 'call', 'case', 'cell', 'celldescriptiondict', 'cellnames', 'cellowner', 'cells', 'cellsummary', 'compositeregexp', 'concatenatetext', 'cond', 'condition', 'conditions', 'continue', 'createdecimal', 'createnumber', 'createregexp', 'createtext', 'datetime', 'defaultmacro', 'defaultmethod', 'defaultsyntax', 'definitions', 'derive', 'destructuring', 'dict', 'do', 'documentation', 'ensure', 'error', 'eval', 'filesystem', 'findrestart', 'flowcontrol', 'freeze', 'frozen', 'gensym', 'ground', 'handle', 'handler', 'hash', 'hook', 'identity', 'in', 'inspect', 'internal', 'invokerestart', 'io', 'iokeground', 'is', 'kind', 'let', 'lexicalblock', 'lexicalmacro', 'list', 'literals', 'loop', 'match', 'message', 'method', 'mimic', 'mimics', 'mixins', 'nand', 'nandcombiner', 'nativemethod', 'nor', 'norcombiner', 'not', 'notcombiner', 'notice', 'number', 'or', 'orcombiner', 'origin', 'otherwise', 'pair', 'pointcut', 'prependmimic', 'print', 'println', 'range', 'reflection', 'reflector', 'regexp', 'removeallmimics', 'removecell', 'removemimic', 'rescue', 'restart', 'runtime', 'same', 'send', 'sequence', 'set', 'signal', 'stacktraceastext', 'struct', 'symbol', 'system', 'text', 'thaw', 'tuple', 'undefinecell', 'uniquehexid', 'unless', 'until', 'use', 'warn', 'with', 'xor', 'xorcombiner'),
+    'IrcLogsLexer': ('and', 'as', 'bracket', 'closing', 'date', 'digits', 'for', 'groups', 'irssi', 'message', 'nick', 'of', 'opening', 'or', 'others', 'paren', 'rest', 'separated', 'separator', 'space', 'star', 'symbols', 'the', 'time', 'timestamp', 'weechat', 'whitespace', 'xchat'),
+    'IsabelleLexer': ('adhoc_overloading', 'apply_end', 'apply_trace', 'approximate', 'arities', 'assumes', 'atom_decl', 'attribute_setup', 'avoids', 'ax_specification', 'axiomatization', 'binder', 'binds', 'bnf', 'bnf_axiomatization', 'boogie_file', 'c_defs', 'c_types', 'cartouche', 'case_of_simps', 'checking', 'class_deps', 'class_instance', 'class_relation', 'classrel', 'codatatype', 'code_abort', 'code_class', 'code_const', 'code_datatype', 'code_deps', 'code_identifier', 'code_include', 'code_instance', 'code_module', 'code_modulename', 'code_monad', 'code_pred', 'code_printing', 'code_reflect', 'code_reserved', 'code_thms', 'code_type', 'coinductive_set', 'congs', 'constrains', 'consts', 'cpodef', 'crunch', 'crunch_ignore', 'datatype_compat', 'datatype_new', 'datatype_new_compat', 'datatypes', 'default_sort', 'defer_recdef', 'defines', 'defining', 'defs', 'display_drafts', 'domain_isomorphism', 'domaindef', 'enriched_type', 'equivariance', 'export_code', 'extract_type', 'find_consts', 'find_theorems', 'find_unused_assms', 'fixes', 'fixrec', 'free_constructors', 'full_prf', 'fun_cases', 'guess', 'hence', 'hide_class', 'hide_const', 'hide_fact', 'hide_type', 'hoarestate', 'import_const_map', 'import_file', 'import_tptp', 'import_type_map', 'inductive_cases', 'inductive_set', 'inductive_simps', 'install_c_file', 'install_c_types', 'interpretation', 'judgment', 'keywords', 'lemmas', 'lift_definition', 'lifting_forget', 'lifting_update', 'local_setup', 'locale_deps', 'memsafe', 'method_setup', 'ml', 'ml_command', 'ml_file', 'ml_prf', 'ml_val', 'module_name', 'monos', 'moreover', 'morphisms', 'nitpick', 'nitpick_params', 'no_adhoc_overloading', 'no_discs_sels', 'no_notation', 'no_syntax', 'no_translations', 'no_type_notation', 'nominal_datatype', 'nominal_function', 'nominal_inductive', 'nominal_inductive2', 'nominal_primrec', 'nominal_termination', 'nonterminal', 'notepad', 'notes', 'obtains'),
+    'JadeLexer': ('import',),
+    'JagsLexer': ('abs', 'acos', 'acosh', 'arccos', 'arccosh', 'arcsin', 'arcsinh', 'arctan', 'arctanh', 'asin', 'asinh', 'atan', 'bern', 'beta', 'cloglog', 'cos', 'cosh', 'data', 'dbern', 'dbetabin', 'dbin', 'dbinom', 'dcat', 'dchiqsqr', 'dchisq', 'ddexp', 'ddirch', 'ddirich', 'dexp', 'df', 'dhyper', 'dmnorm', 'dmt', 'dmulti', 'dnbinom', 'dt', 'dunif', 'dweibull', 'dwish', 'equals', 'exp', 'for', 'gamma', 'gen', 'icloglog', 'ifelse', 'ilogit', 'in', 'inprod', 'interp', 'inverse', 'lin', 'lnorm', 'log', 'logdet', 'logfact', 'loggam', 'logis', 'logit', 'max', 'mean', 'min', 'model', 'nchisqr', 'negbin', 'norm', 'par', 'phi', 'pois', 'pow', 'probit', 'prod', 'rank', 'round', 'sd', 'sin', 'sinh', 'sort', 'sqrt', 'step', 'sum', 'tan', 'tanh', 'trunc', 'var', 'weib'),
+    'JasminLexer': ('aaload', 'aastore', 'aconst_null', 'aload_0', 'aload_1', 'aload_2', 'aload_3', 'aload_w', 'anewarray', 'areturn', 'arraylength', 'astore', 'astore_0', 'astore_1', 'astore_2', 'astore_3', 'astore_w', 'athrow', 'baload', 'bastore', 'bipush', 'caload', 'castore', 'checkcast', 'd2f', 'd2i', 'd2l', 'dadd', 'daload', 'dastore', 'dcmpg', 'dcmpl', 'dconst_0', 'dconst_1', 'ddiv', 'dload', 'dload_0', 'dload_1', 'dload_2', 'dload_3', 'dload_w', 'dmul', 'dneg', 'drem', 'dreturn', 'dstore', 'dstore_0', 'dstore_1', 'dstore_2', 'dstore_3', 'dstore_w', 'dsub', 'dup2', 'dup2_x1', 'dup2_x2', 'dup_x1', 'dup_x2', 'enclosing', 'f2d', 'f2i', 'f2l', 'faload', 'fastore', 'fcmpg', 'fcmpl', 'fconst_0', 'fconst_1', 'fconst_2', 'fload', 'fload_0', 'fload_1', 'fload_2', 'fload_3', 'fload_w', 'fneg', 'fpstrict', 'freturn', 'fstore', 'fstore_0', 'fstore_1', 'fstore_2', 'fstore_3', 'fstore_w', 'getstatic', 'goto_w', 'i2b', 'i2c', 'i2d', 'i2f', 'i2l', 'i2s', 'iadd', 'iaload', 'iastore', 'iconst_0', 'iconst_1', 'iconst_2', 'iconst_3', 'iconst_4', 'iconst_5', 'iconst_m1', 'if_acmpeq', 'if_acmpne', 'if_icmpeq', 'if_icmpge', 'if_icmpgt', 'if_icmple', 'if_icmplt', 'if_icmpne', 'ifeq', 'ifge', 'ifgt', 'ifle', 'iflt', 'ifne', 'ifnonnull', 'ifnull', 'iinc', 'iinc_w', 'iload', 'iload_0', 'iload_1', 'iload_2', 'iload_3', 'iload_w', 'imul', 'ineg', 'int2byte'),
+    'JavaLexer': ('abstract', 'assert', 'boolean', 'break', 'byte', 'case', 'catch', 'char', 'class', 'const', 'continue', 'default', 'do', 'double', 'else', 'enum', 'extends', 'false', 'final', 'finally', 'float', 'for', 'goto', 'if', 'implements', 'import', 'instanceof', 'int', 'interface', 'long', 'native', 'new', 'null', 'package', 'private', 'protected', 'public', 'return', 'short', 'static', 'strictfp', 'super', 'switch', 'synchronized', 'this', 'throw', 'throws', 'transient', 'true', 'try', 'void', 'volatile', 'while'),
+    'JavascriptLexer': ('abstract', 'array', 'boolean', 'break', 'byte', 'case', 'catch', 'char', 'class', 'const', 'continue', 'date', 'debugger', 'decodeuri', 'decodeuricomponent', 'default', 'delete', 'do', 'document', 'double', 'else', 'encodeuri', 'encodeuricomponent', 'enum', 'error', 'eval', 'export', 'extends', 'false', 'final', 'finally', 'float', 'for', 'function', 'goto', 'if', 'implements', 'import', 'in', 'infinity', 'instanceof', 'int', 'interface', 'isfinite', 'isnan', 'let', 'long', 'math', 'nan', 'native', 'netscape', 'new', 'null', 'number', 'object', 'package', 'packages', 'parsefloat', 'parseint', 'private', 'protected', 'public', 'regexp', 'return', 'short', 'static', 'string', 'sun', 'super', 'switch', 'synchronized', 'this', 'throw', 'throws', 'transient', 'true', 'try', 'typeof', 'undefined', 'var', 'void', 'volatile', 'while', 'window', 'with', 'yield'),
+    'JsonLexer': ('false', 'null', 'true'),
+    'JuliaLexer': ('abstract', 'any', 'applicable', 'assert', 'baremodule', 'bat', 'begin', 'bin', 'bitstype', 'bool', 'break', 'catch', 'ccall', 'cmd', 'complex128', 'complex64', 'const', 'continue', 'convert', 'dlopen', 'dlsym', 'do', 'edit', 'else', 'elseif', 'end', 'eps', 'error', 'exe', 'exit', 'export', 'finalizer', 'float32', 'float64', 'for', 'function', 'global', 'hash', 'if', 'im', 'immutable', 'import', 'importall', 'in', 'inf', 'int', 'int16', 'int32', 'int64', 'int8', 'invoke', 'is', 'isa', 'isequal', 'julia', 'let', 'load', 'local', 'macro', 'method_exists', 'module', 'nan', 'new', 'none', 'nothing', 'ntuple', 'pi', 'promote', 'promote_type', 'quote', 'realmax', 'realmin', 'return', 'sizeof', 'subtype', 'system', 'throw', 'try', 'tuple', 'type', 'typealias', 'typemax', 'typemin', 'typeof', 'uid', 'uint', 'uint16', 'uint32', 'uint64', 'uint8', 'using', 'while', 'whos'),
+    'KalLexer': ('and', 'array', 'bitwise', 'boolean', 'break', 'but', 'catch', 'class', 'continue', 'date', 'decodeuri', 'decodeuricomponent', 'delete', 'document', 'doesnt', 'else', 'encodeuri', 'encodeuricomponent', 'error', 'eval', 'except', 'exist', 'exists', 'fail', 'false', 'finally', 'for', 'from', 'function', 'if', 'in', 'infinity', 'inherits', 'instanceof', 'is', 'isfinite', 'isnan', 'isnt', 'math', 'method', 'mod', 'nan', 'netscape', 'new', 'no', 'none', 'not', 'nothing', 'null', 'number', 'object', 'of', 'off', 'on', 'or', 'otherwise', 'packages', 'parallel', 'parsefloat', 'parseint', 'print', 'property', 'raise', 'regexp', 'return', 'run', 'safe', 'series', 'string', 'sun', 'super', 'task', 'throw', 'true', 'try', 'typeof', 'undefined', 'unless', 'until', 'value', 'wait', 'when', 'while', 'window', 'with', 'xor', 'yes'),
+    'KconfigLexer': ('bool', 'choice', 'comment', 'config', 'default', 'defconfig_list', 'endchoice', 'endif', 'endmenu', 'env', 'help', 'hex', 'if', 'int', 'mainmenu', 'menu', 'menuconfig', 'modules', 'option', 'prompt', 'range', 'select', 'source', 'string', 'tristate'),
+    'KokaLexer': ('alias', 'as', 'assigned', 'catch', 'con', 'cotype', 'cs', 'elif', 'else', 'enum', 'error', 'exists', 'external', 'file', 'finally', 'for', 'forall', 'foreach', 'fun', 'function', 'if', 'import', 'include', 'indexed', 'infix', 'infixl', 'infixr', 'inline', 'instance', 'interface', 'js', 'match', 'module', 'private', 'public', 'qualified', 'rec', 'rectype', 'ref', 'repeat', 'return', 'some', 'struct', 'then', 'try', 'type', 'val', 'var', 'while', 'with', 'yield'),
+    'KotlinLexer': ('abstract', 'annotation', 'as', 'break', 'by', 'catch', 'class', 'continue', 'do', 'else', 'enum', 'false', 'final', 'finally', 'for', 'fun', 'get', 'if', 'import', 'in', 'inner', 'internal', 'is', 'null', 'object', 'open', 'out', 'override', 'package', 'private', 'protected', 'public', 'reified', 'return', 'set', 'super', 'this', 'throw', 'trait', 'true', 'try', 'type', 'val', 'var', 'vararg', 'when', 'where', 'while'),
+    'LSLLexer': ('_at_edge', '_by_two', '_camera', '_channel', '_cone', '_cost', '_empty', '_enable', '_local', '_mask', '_media', '_minus_', '_object', '_object_entry', '_only', '_owner', '_pause_at_waypoints', '_pec', '_pixels', '_reached', '_rez', '_script_count', '_squares', '_start', '_url', 'accel', 'access_', 'account_for_skipped_frames', 'agents', 'airplane', 'all_', 'all_sides', 'allow_', 'allow_damage', 'allow_direct_teleport', 'allowed_', 'allowed_drop', 'alt_image_enable', 'always_run', 'angle_', 'angular', 'anim_on', 'animation', 'anyone', 'arm', 'at_', 'attach_', 'attached_point', 'attachments', 'auto_', 'auto_align', 'autopilot', 'avatar', 'avatar_center', 'avoid_', 'avoidance_mode', 'away', 'balloon', 'ban_list', 'bank', 'banking_', 'banned_agent_', 'bark', 'behindness_', 'belly', 'bf_', 'blend_func_', 'blobs', 'block_fly', 'block_grab', 'block_terraform', 'boat', 'body_', 'bodypart', 'born', 'bounce', 'bounds_error', 'bricks', 'bright', 'bump_', 'bump_shiny', 'buoyancy', 'burst_', 'busy', 'buy', 'by_', 'camera_', 'camera_decoupled', 'cast_shadows', 'cast_time_exceeded', 'center_', 'change_links', 'changed_', 'character_', 'character_time', 'chest', 'chin', 'click_action_', 'clothing', 'cmd_', 'collision', 'collisions', 'concrete', 'content_type_', 'control_', 'controls_', 'convex', 'count_', 'create_', 'creator', 'crouching', 'custom_header', 'damage', 'data_', 'data_flags', 'dataserver', 'debit', 'decay_', 'decel', 'deflection_', 'deg_to_rad', 'denied', 'desired_', 'dest', 'dest_color', 'details_', 'detect_phantom', 'disable_'),
+    'LassoCssLexer': ('padding',),
+    'LassoHtmlLexer': ('html',),
+    'LassoJavascriptLexer': ('function',),
+    'LassoLexer': ('abort', 'ascending', 'average', 'bin', 'bw', 'by', 'bytes', 'cache', 'cn', 'data', 'database_names', 'database_schemanames', 'database_tablenames', 'date', 'decimal', 'define', 'define_tag', 'define_type', 'descending', 'duration', 'email_batch', 'encode_set', 'eq', 'equals', 'ew', 'frozen', 'ft', 'full', 'group', 'gte', 'handle', 'handle_error', 'handle_failure', 'header', 'html_comment', 'if_empty', 'if_false', 'if_null', 'if_true', 'inherited', 'inline', 'integer', 'into', 'iterate', 'join', 'lasso', 'lasso9', 'lassoscript', 'link', 'link_currentaction', 'link_currentgroup', 'link_currentrecord', 'link_detail', 'link_firstgroup', 'link_firstrecord', 'link_lastgroup', 'link_lastrecord', 'link_nextgroup', 'link_nextrecord', 'link_prevgroup', 'link_prevrecord', 'list', 'ljax_target', 'log', 'loop', 'loop_abort', 'loop_continue', 'loop_count', 'lte', 'map', 'match', 'max', 'min', 'minimal', 'namespace_using', 'no_square_brackets', 'none', 'noprocess', 'on', 'order', 'output_none', 'pair', 'params', 'params_up', 'parent', 'portal', 'protect', 'provide', 'queue', 'records', 'referer', 'referrer', 'repeating', 'require', 'resultset', 'return_value', 'returnhome', 'rows', 'run_children', 'rx', 'search_args', 'search_arguments', 'select', 'self', 'skip', 'soap_definetag', 'soap_lastrequest', 'soap_lastresponse', 'sort_args', 'sort_arguments', 'split_thread', 'stack', 'staticarray', 'sum', 'tag', 'tag_name', 'take', 'thread', 'thread_atomic', 'tie', 'to', 'trait', 'value_list', 'variable', 'where', 'xml', 'yield', 'yieldhome'),
+    'LeanLexer': ('abbreviation', 'add_rewrite', 'alias', 'assume', 'axiom', 'begin', 'by', 'calc', 'calc_refl', 'calc_subst', 'calc_trans', 'check', 'coercion', 'conjecture', 'constant', 'constants', 'context', 'corollary', 'definition', 'else', 'end', 'eval', 'example', 'exit', 'export', 'expose', 'exposing', 'extends', 'forall', 'from', 'fun', 'have', 'help', 'hiding', 'hypothesis', 'if', 'import', 'in', 'including', 'inductive', 'infix', 'infixl', 'infixr', 'inline', 'instance', 'irreducible', 'lemma', 'let', 'match', 'namespace', 'notation', 'obtain', 'opaque', 'opaque_hint', 'open', 'options', 'parameter', 'parameters', 'pi', 'postfix', 'precedence', 'prefix', 'print', 'private', 'proof', 'prop', 'protected', 'qed', 'reducible', 'renaming', 'section', 'set_option', 'show', 'structure', 'tactic_hint', 'take', 'then', 'theorem', 'type', 'universe', 'using', 'variable', 'variables', 'with'),
+    'LimboLexer': ('adt', 'alt', 'array', 'big', 'break', 'byte', 'case', 'chan', 'con', 'continue', 'cyclic', 'do', 'else', 'exitfor', 'fn', 'hd', 'if', 'implement', 'import', 'include', 'int', 'iota', 'len', 'list', 'load', 'module', 'nil', 'of', 'orpick', 'real', 'ref', 'return', 'self', 'spawn', 'string', 'tagof', 'tl', 'to', 'type', 'while'),
+    'LiquidLexer': ('capture', 'case', 'comment', 'contains', 'cycle', 'else', 'elsif', 'end', 'endcomment', 'endraw', 'false', 'if', 'not', 'raw', 'true', 'unless', 'when'),
+    'LiveScriptLexer': ('array', 'boolean', 'break', 'by', 'catch', 'class', 'const', 'continue', 'date', 'decodeuri', 'decodeuricomponent', 'delete', 'document', 'else', 'encodeuri', 'encodeuricomponent', 'error', 'eval', 'extends', 'false', 'finally', 'for', 'function', 'if', 'in', 'infinity', 'instanceof', 'isfinite', 'isnan', 'loop', 'math', 'nan', 'netscape', 'new', 'no', 'null', 'number', 'object', 'of', 'off', 'on', 'own', 'packages', 'parsefloat', 'parseint', 'regexp', 'return', 'string', 'sun', 'super', 'switch', 'then', 'this', 'throw', 'til', 'to', 'true', 'try', 'typeof', 'undefined', 'unless', 'until', 'var', 'void', 'when', 'while', 'window', 'yes'),
+    'LlvmLexer': ('acq_rel', 'acquire', 'addrspace', 'alignstack', 'alloca', 'alwaysinline', 'appending', 'arcp', 'arm_aapcs_vfpcc', 'arm_aapcscc', 'arm_apcscc', 'ashr', 'atomicrmw', 'available_externally', 'bitcast', 'blockaddress', 'br', 'ccc', 'cmpxchg', 'cold', 'coldcc', 'datalayout', 'dbg', 'extern_weak', 'extractelement', 'extractvalue', 'fastcc', 'fcmp', 'fp128', 'fpext', 'fptosi', 'fptoui', 'fptrunc', 'getelementptr', 'getresult', 'icmp', 'inbounds', 'indirectbr', 'initialexec', 'inlinehint', 'inreg', 'insertelement', 'insertvalue', 'intel_ocl_bicc', 'inteldialect', 'inttoptr', 'landingpad', 'linker_private', 'linker_private_weak', 'linkonce', 'linkonce_odr', 'localdynamic', 'localexec', 'malloc', 'metadata', 'monotonic', 'msp430_intrcc', 'nest', 'ninf', 'nnan', 'noalias', 'nobuiltin', 'nocapture', 'noduplicate', 'noimplicitfloat', 'nonlazybind', 'noredzone', 'noreturn', 'nounwind', 'nsw', 'nsz', 'nuw', 'oeq', 'oge', 'ogt', 'ole', 'olt', 'optnone', 'optsize', 'personality', 'ppc_fp128', 'ptrtoint', 'ptx_device', 'ptx_kernel', 'readnone', 'returned', 'returns_twice', 'sanitize_address', 'sanitize_memory', 'sanitize_thread', 'sdiv', 'seq_cst', 'sext', 'sge', 'sgt', 'shufflevector', 'sideeffect', 'signext', 'singlethread', 'sitofp', 'sle', 'slt', 'spir_func', 'spir_kernel', 'srem', 'sret', 'ssp', 'sspreq', 'sspstrong', 'udiv', 'ueq', 'uge', 'ugt', 'uitofp', 'ule', 'ult', 'umax', 'umin', 'une', 'unnamed_addr', 'uno', 'unwind', 'urem', 'uwtable', 'va_arg', 'weak_odr', 'x86_64_sysvcc', 'x86_64_win64cc'),
+    'LogosLexer': ('config', 'ctor', 'end', 'group', 'hook', 'init', 'log', 'new', 'orig', 'subclass'),
+    'LogtalkLexer': ('_events', '_expansion', '_flag', '_logtalk_flag', '_module', '_part', '_property', '_term', 'abolish', 'acyclic_term', 'allable', 'alls', 'arg', 'at_end_of_stream', 'atom', 'atom_', 'ax', 'bag', 'bolish', 'built_in', 'ca', 'canonical', 'category', 'ceiling', 'char_code', 'char_conversion', 'clause', 'clude', 'co', 'coding', 'compare', 'complements', 'copy_term', 'curren', 'current', 'current_', 'current_event', 'current_predicate', 'des', 'el', 'end_', 'es_class', 'et_', 'eta_', 'expand_', 'extends_', 'fa', 'flush_output', 'fo', 'forward', 'fractional', 'functor', 'goal', 'ground', 'halt', 'har', 'hars', 'ibrary_path', 'ic', 'ignore', 'il', 'imp', 'ind', 'instantiat', 'iscontiguous', 'itialization', 'lements', 'lements_protocol', 'lf', 'll', 'logtalk', 'logtalk_', 'logtalk_make', 'lse', 'make', 'mp', 'mplements_object', 'ncat', 'nder', 'ndif', 'nforms_to_protocol', 'nl', 'non_terminal', 'nstantiates', 'number_c', 'numbervars', 'oad', 'oad_context', 'od', 'ode', 'oinductive', 'ompound', 'onvar', 'op', 'orts', 'orts_category', 'peek', 'phrase', 'predicate', 'predicate_property', 'prolog', 'protocol', 'qrt', 'reate', 'reexport', 'retract', 'se', 'set_stream_position', 'specializ', 'specializes', 'ssert', 'stream_property', 'sub_atom', 'subsumes_term', 'sure_loaded', 't_', 't_prolog_flag', 'tch', 'term', 'term_variables', 'threaded', 'ultifile', 'umber', 'unify_with_occurs_check', 'urrent', 'xport', 'ynamic', 'ynchronized'),
+    'LuaLexer': ('and', 'break', 'do', 'else', 'elseif', 'end', 'false', 'for', 'function', 'if', 'in', 'local', 'nil', 'not', 'or', 'repeat', 'return', 'then', 'true', 'until', 'while'),
+    'MOOCodeLexer': ('break', 'continue', 'else', 'elseif', 'endfor', 'endfork', 'endif', 'endtry', 'endwhile', 'except', 'finally', 'for', 'fork', 'if', 'in', 'length', 'random', 'return', 'try', 'while'),
+    'MakoLexer': ('doc', 'end', 'include', 'inherit', 'namespace', 'page'),
+    'MaqlLexer': ('add', 'alias', 'all', 'alter', 'and', 'as', 'asc', 'attribute', 'between', 'bigint', 'bottom', 'by', 'column', 'columns', 'count', 'create', 'dataset', 'datatype', 'date', 'decimal', 'default', 'define', 'desc', 'description', 'dimension', 'dimensions', 'double', 'drop', 'except', 'fact', 'false', 'filter', 'folder', 'for', 'from', 'fullset', 'hyperlink', 'identifier', 'in', 'include', 'int', 'key', 'keys', 'label', 'labels', 'like', 'limit', 'match', 'metric', 'modify', 'not', 'on', 'or', 'order', 'other', 'parent', 'pf', 'primary', 'report', 'row', 'rows', 'select', 'synchronize', 'table', 'template', 'title', 'top', 'true', 'type', 'varchar', 'visual', 'when', 'where', 'with', 'without'),
+    'MasonLexer': ('def', 'doc', 'method'),
+    'MatlabLexer': ('accumarray', 'acosd', 'acot', 'acotd', 'acoth', 'acsc', 'acscd', 'acsch', 'airy', 'ans', 'asec', 'asecd', 'asech', 'asind', 'atand', 'besselh', 'besseli', 'besselj', 'besselk', 'bessely', 'betainc', 'betaln', 'blkdiag', 'bsxfun', 'cart2pol', 'cart2sph', 'circshift', 'classdef', 'compan', 'cosd', 'cot', 'cotd', 'coth', 'cplxpair', 'csc', 'cscd', 'csch', 'diag', 'disp', 'dot', 'ellipj', 'ellipke', 'enumerated', 'eps', 'erfcx', 'erfinv', 'events', 'expint', 'expm1', 'eye', 'factor', 'factorial', 'flipdim', 'fliplr', 'flipud', 'freqspace', 'gallery', 'gammainc', 'gammaln', 'hadamard', 'hankel', 'hilb', 'hsv2rgb', 'hypot', 'ind2sub', 'inf', 'invhilb', 'ipermute', 'isempty', 'isequal', 'isequalwithequalnans', 'isinf', 'isprime', 'isreal', 'isscalar', 'isvector', 'legendre', 'linspace', 'log1p', 'logspace', 'magic', 'meshgrid', 'nchoosek', 'ndgrid', 'ndims', 'nextpow2', 'nthroot', 'numel', 'ones', 'parfor', 'pascal', 'perms', 'permute', 'pol2cart', 'pow2', 'primes', 'properties', 'psi', 'randn', 'rat', 'rats', 'reallog', 'realmax', 'realmin', 'realpow', 'realsqrt', 'repmat', 'reshape', 'rgb2hsv', 'rosser', 'rot90', 'secd', 'sech', 'shiftdim', 'sind', 'sph2cart', 'spmd', 'squeeze', 'sub2ind', 'tand', 'toeplitz', 'tril', 'triu', 'unwrap', 'vander', 'why', 'wilkinson', 'zeros'),
+    'MiniDLexer': ('as', 'assert', 'break', 'case', 'catch', 'class', 'continue', 'default', 'do', 'else', 'false', 'finally', 'for', 'foreach', 'function', 'global', 'if', 'import', 'in', 'is', 'local', 'module', 'namespace', 'null', 'return', 'scope', 'super', 'switch', 'this', 'throw', 'true', 'try', 'vararg', 'while', 'with', 'yield'),
+    'ModelicaLexer': ('abs', 'acos', 'actualstream', 'algorithm', 'annotation', 'array', 'asin', 'assert', 'assertionlevel', 'atan', 'atan2', 'backsample', 'block', 'boolean', 'cardinality', 'cat', 'ceil', 'change', 'clock', 'connect', 'connections', 'connector', 'constant', 'constrainedby', 'cos', 'cosh', 'cross', 'delay', 'der', 'diagonal', 'discrete', 'div', 'each', 'edge', 'elseif', 'elsewhen', 'encapsulated', 'end', 'enumeration', 'equation', 'exit', 'exp', 'expandable', 'extends', 'external', 'externalobject', 'fill', 'final', 'floor', 'flow', 'getinstancename', 'hold', 'homotopy', 'identity', 'impure', 'initial', 'inner', 'input', 'instream', 'integer', 'interval', 'inverse', 'ispresent', 'linspace', 'log', 'log10', 'loop', 'matrix', 'max', 'min', 'mod', 'model', 'ndims', 'noclock', 'noevent', 'nondiscrete', 'ones', 'operator', 'outer', 'outerproduct', 'output', 'package', 'parameter', 'partial', 'pre', 'previous', 'product', 'protected', 'public', 'pure', 'real', 'record', 'redeclare', 'reinit', 'rem', 'replaceable', 'rooted', 'sample', 'scalar', 'semilinear', 'shiftsample', 'sign', 'sin', 'sinh', 'size', 'skew', 'smooth', 'spatialdistribution', 'sqrt', 'stateselect', 'stream', 'string', 'subsample', 'sum', 'supersample', 'symmetric', 'tan', 'tanh', 'terminal', 'terminate', 'then', 'time', 'transpose', 'type', 'vector', 'when', 'within', 'zeros'),
+    'MonkeyLexer': ('abstract', 'and', 'array', 'bool', 'case', 'catch', 'class', 'const', 'continue', 'default', 'eachin', 'else', 'elseif', 'end', 'endif', 'error', 'exit', 'extends', 'extern', 'false', 'field', 'final', 'float', 'for', 'forever', 'function', 'global', 'if', 'implements', 'import', 'inline', 'int', 'interface', 'local', 'method', 'mod', 'module', 'new', 'next', 'not', 'null', 'object', 'or', 'print', 'private', 'property', 'public', 'repeat', 'return', 'select', 'self', 'shl', 'shr', 'step', 'strict', 'string', 'super', 'then', 'throw', 'to', 'true', 'try', 'until', 'void', 'wend', 'while'),
+    'MoonScriptLexer': ('and', 'break', 'class', 'do', 'else', 'elseif', 'export', 'extends', 'false', 'for', 'from', 'if', 'import', 'in', 'nil', 'not', 'or', 'return', 'self', 'super', 'switch', 'then', 'true', 'using', 'when', 'while', 'with'),
+    'MozPreprocHashLexer': ('define', 'defined', 'elif', 'elifdef', 'elifndef', 'else', 'endif', 'error', 'expand', 'filter', 'if', 'ifdef', 'ifndef', 'include', 'includesubst', 'literal', 'undef', 'unfilter'),
+    'MqlLexer': ('_digits', '_lasterror', '_period', '_point', '_randomseed', '_stopflag', '_symbol', '_uninitreason', 'ask', 'bars', 'bid', 'bool', 'char', 'close', 'color', 'datetime', 'digits', 'double', 'float', 'high', 'input', 'int', 'long', 'low', 'open', 'point', 'short', 'string', 'time', 'uchar', 'uint', 'ulong', 'ushort', 'void', 'volume'),
+    'MscgenLexer': ('abox', 'box', 'msc', 'note', 'rbox'),
+    'MuPADLexer': ('and', 'assuming', 'axiom', 'begin', 'break', 'case', 'category', 'delete', 'div', 'do', 'dom', 'domain', 'downto', 'elif', 'else', 'end', 'end_axiom', 'end_case', 'end_category', 'end_domain', 'end_for', 'end_if', 'end_proc', 'end_repeat', 'end_while', 'for', 'frame', 'from', 'if', 'in', 'inherits', 'intersect', 'local', 'minus', 'mod', 'next', 'not', 'of', 'option', 'or', 'otherwise', 'proc', 'procname', 'repeat', 'save', 'step', 'subset', 'then', 'to', 'union', 'until', 'while', 'xor'),
+    'MySqlLexer': ('alter', 'analyze', 'asensitive', 'auto_increment', 'between', 'bigint', 'blob', 'both', 'cascade', 'change', 'charset', 'collate', 'column', 'condition', 'constraint', 'convert', 'current_date', 'current_time', 'current_timestamp', 'current_user', 'database', 'databases', 'datetime', 'day_hour', 'day_microsecond', 'day_minute', 'day_second', 'delayed', 'desc', 'describe', 'deterministic', 'distinctrow', 'dual', 'enclosed', 'engine', 'escaped', 'explain', 'fetch', 'float4', 'float8', 'foreign', 'fulltext', 'grant', 'having', 'high_priority', 'hour_microsecond', 'hour_minute', 'hour_second', 'ignore', 'infile', 'inner', 'insensitive', 'int1', 'int2', 'int3', 'int4', 'interval', 'iterate', 'keys', 'leading', 'leave', 'lines', 'localtime', 'localtimestamp', 'longblob', 'longtext', 'low_priority', 'mediumblob', 'mediumint', 'mediumtext', 'minute_microsecond', 'minute_second', 'modifies', 'natural', 'no_write_to_binlog', 'optimize', 'optionally', 'outfile', 'precision', 'primary', 'purge', 'raid0', 'reads', 'references', 'restrict', 'revoke', 'rlike', 'schema', 'schemas', 'second_microsecond', 'sensitive', 'separator', 'smallint', 'soname', 'spatial', 'specific', 'sql', 'sql_big_result', 'sql_calc_found_rows', 'sql_small_result', 'sqlexception', 'sqlstate', 'sqlwarning', 'ssl', 'starting', 'straight_join', 'tables', 'terminated', 'timestamp', 'tinyblob', 'tinyint', 'tinytext', 'trailing', 'trigger', 'undo', 'unlock', 'usage', 'utc_date', 'utc_time', 'utc_timestamp', 'varbinary', 'varchar', 'varcharacter', 'varying', 'x509', 'year', 'year_month', 'zerofill'),
+    'MyghtyLexer': ('def', 'method'),
+    'NSISLexer': ('_localized', 'addincludedir', 'addplugindir', 'addversionkey', 'admintools', 'allow', 'appdata', 'appendfile', 'autoclose', 'autoclosewindow', 'bkcolor', 'brandingimage', 'brandingtext', 'bringtofront', 'bufsize', 'buttontext', 'caption', 'cdburn_area', 'changeui', 'checkbitmap', 'clearerrors', 'cmps', 'cmpu', 'colors', 'commonfiles', 'completedtext', 'componenttext', 'compress', 'cookies', 'copyfiles', 'cpy', 'crccheck', 'ctlcolors', 'curinsttype', 'currentaddress', 'datablockoptimize', 'datesave', 'delfilefile', 'desktop', 'detailprint', 'details', 'detailsbuttontext', 'dictsize', 'divider', 'dlgitem', 'dllversion', 'documents', 'dword', 'enabled', 'enablewindow', 'enumreg', 'errors', 'ettext', 'exename', 'expandenvstrings', 'favorites', 'fileattributes', 'fileexists', 'filetime', 'flushini', 'fonts', 'forceselection', 'fullpathname', 'functionaddress', 'hidewindow', 'hwndparent', 'ini', 'inistr', 'initpluginsdir', 'insertmacro', 'inst', 'instdirerror', 'instdll', 'insttypes', 'internet_cache', 'ionlevel', 'iswindow', 'labeladdress', 'langstring', 'lates', 'loadlanguagefile', 'localappdata', 'lockwindow', 'miscbuttontext', 'music', 'nethood', 'nsisdir', 'nstdetails', 'outpath', 'packhdr', 'pictures', 'plugindir', 'pluginsdir', 'pluginunload', 'printhood', 'productversion', 'programfiles', 'programs', 'progressflags', 'quicklaunch', 'reboot', 'rebootflag', 'recent', 'regdll', 'regdword', 'regkey', 'requestexecutionlevel', 'reservefile', 'rootdirinstall', 'searchpath', 'sendto', 'shellvarcontext', 'shortcut', 'skipfiles', 'spacetexts', 'startmenu', 'startup', 'staticbkcolor', 'subsection', 'sysdir', 'tempfilename', 'tempfilesymbol', 'uni', 'uninst', 'uninstall', 'uninstaller', 'uninstpage', 'videos'),
+    'NasmLexer': ('absolute', 'align', 'bits', 'byte', 'common', 'cpu', 'cr', 'dr', 'endstruc', 'equ', 'export', 'extern', 'global', 'group', 'import', 'library', 'mm', 'module', 'org', 'res', 'section', 'seg', 'segment', 'st', 'strict', 'struc', 'times', 'tr', 'uppercase', 'use16', 'use32', 'word', 'wrt'),
+    'NesCLexer': ('abstract', 'as', 'async', 'atomic', 'call', 'command', 'component', 'components', 'configuration', 'event', 'extends', 'generic', 'implementation', 'includes', 'interface', 'module', 'new', 'norace', 'nx_int16_t', 'nx_int32_t', 'nx_int64_t', 'nx_int8_t', 'nx_struct', 'nx_uint16_t', 'nx_uint32_t', 'nx_uint64_t', 'nx_uint8_t', 'nx_union', 'post', 'provides', 'signal', 'task', 'uses'),
+    'NewLispLexer': ('abort', 'acosh', 'address', 'amb', 'append', 'args', 'asinh', 'assoc', 'atan2', 'atanh', 'beta', 'betai', 'bind', 'binomial', 'bits', 'callback', 'ceil', 'chop', 'clean', 'cond', 'cons', 'context', 'cpymem', 'crc32', 'curry', 'dec', 'destroy', 'det', 'device', 'difference', 'directory', 'div', 'doargs', 'dolist', 'dostring', 'dotimes', 'dotree', 'dump', 'dup', 'encrypt', 'env', 'erf', 'expand', 'explode', 'extend', 'factor', 'fft', 'find', 'flat', 'flt', 'fn', 'fork', 'fv', 'gammai', 'gammaln', 'gcd', 'ifft', 'inc', 'intersect', 'invert', 'irr', 'lambda', 'letex', 'letn', 'lookup', 'main', 'mat', 'member', 'mul', 'multiply', 'normal', 'now', 'nper', 'npv', 'nth', 'ostype', 'pack', 'parse', 'peek', 'pipe', 'pmt', 'pop', 'pow', 'prefix', 'println', 'process', 'push', 'pv', 'quote', 'random', 'randomize', 'receive', 'regex', 'reset', 'rest', 'rotate', 'search', 'seed', 'seek', 'semaphore', 'send', 'sequence', 'series', 'setf', 'setq', 'sgn', 'share', 'signal', 'silent', 'sleep', 'slice', 'spawn', 'swap', 'sym', 'symbols', 'sync', 'term', 'timer', 'trace', 'transpose', 'tree', 'trim', 'unicode', 'unify', 'unpack', 'utf8', 'utf8len', 'uuid'),
+    'NewspeakLexer': ('class', 'false', 'mixin', 'newsqueak2', 'nil', 'private', 'protected', 'public', 'self', 'super', 'true'),
+    'NginxConfLexer': ('include',),
+    'NimrodLexer': ('a_', 'b_', 'c_', 'd_', 'e_', 'f_', 'g_', 'h_', 'i_', 'j_', 'k_', 'l_', 'm_', 'n_', 'o_', 'p_', 'q_', 'r_', 's_', 't_', 'u_', 'v_', 'w_', 'x_', 'y_'),
+    'NitLexer': ('__debug__', 'abort', 'abstract', 'and', 'as', 'assert', 'break', 'class', 'continue', 'do', 'else', 'end', 'enum', 'extern', 'false', 'for', 'fun', 'if', 'implies', 'import', 'in', 'init', 'interface', 'intern', 'intrude', 'is', 'isa', 'isset', 'label', 'loop', 'module', 'new', 'not', 'null', 'nullable', 'once', 'or', 'package', 'private', 'protected', 'public', 'readable', 'redef', 'return', 'self', 'super', 'then', 'true', 'type', 'universal', 'var', 'while', 'writable'),
+    'NixLexer': ('abort', 'and', 'assert', 'basenameof', 'builtins', 'derivation', 'dirof', 'else', 'if', 'import', 'in', 'inherit', 'isnull', 'let', 'map', 'mkderivation', 'mkif', 'or', 'rec', 'removeattrs', 'then', 'throw', 'tostring', 'with'),
+    'NumPyLexer': ('__import__', 'abs', 'all', 'and', 'any', 'apply', 'as', 'assert', 'basestring', 'bat', 'bin', 'bool', 'break', 'buffer', 'bytearray', 'bytes', 'callable', 'chr', 'class', 'classmethod', 'cmd', 'cmp', 'coerce', 'compile', 'complex', 'continue', 'def', 'del', 'delattr', 'dict', 'dir', 'divmod', 'elif', 'ellipsis', 'else', 'enumerate', 'eval', 'except', 'exe', 'exec', 'execfile', 'exit', 'false', 'file', 'filter', 'finally', 'float', 'for', 'from', 'frozenset', 'getattr', 'global', 'globals', 'hasattr', 'hash', 'hex', 'id', 'if', 'import', 'in', 'input', 'int', 'intern', 'is', 'isinstance', 'issubclass', 'iter', 'lambda', 'len', 'list', 'locals', 'long', 'map', 'max', 'min', 'next', 'none', 'not', 'notimplemented', 'numpy', 'object', 'oct', 'open', 'or', 'ord', 'pass', 'pow', 'print', 'property', 'pythonw', 'raise', 'range', 'raw_input', 'reduce', 'reload', 'repr', 'return', 'reversed', 'round', 'self', 'set', 'setattr', 'slice', 'sorted', 'staticmethod', 'str', 'sum', 'super', 'true', 'try', 'tuple', 'type', 'unichr', 'unicode', 'vars', 'while', 'with', 'xrange', 'yield', 'zip'),
+    'ObjectiveCLexer': ('__autoreleasing', '__block', '__bridge', '__bridge_transfer', '__strong', '__weak', 'assign', 'atomic', 'bool', 'boolean', 'class', 'copy', 'false', 'getter', 'ibaction', 'iboutlet', 'id', 'imp', 'implementation', 'in', 'inout', 'instancetype', 'interface', 'nil', 'no', 'nonatomic', 'out', 'protocol', 'readonly', 'readwrite', 'release', 'retain', 'sel', 'self', 'setter', 'sint16', 'sint32', 'sint8', 'strong', 'super', 'true', 'typeof', 'uint16', 'uint32', 'uint8', 'unichar', 'unsafe_unretained', 'weak', 'yes'),
+    'ObjectiveCppLexer': ('__autoreleasing', '__block', '__bridge', '__bridge_transfer', '__strong', '__weak', 'assign', 'atomic', 'bool', 'boolean', 'class', 'copy', 'false', 'getter', 'ibaction', 'iboutlet', 'id', 'imp', 'implementation', 'in', 'inout', 'instancetype', 'interface', 'nil', 'no', 'nonatomic', 'out', 'protocol', 'readonly', 'readwrite', 'release', 'retain', 'sel', 'self', 'setter', 'sint16', 'sint32', 'sint8', 'strong', 'super', 'true', 'typeof', 'uint16', 'uint32', 'uint8', 'unichar', 'unsafe_unretained', 'weak', 'yes'),
+    'ObjectiveJLexer': ('__proto__', 'abs', 'accessors', 'acos', 'action', 'array', 'asin', 'atan', 'atan2', 'bool', 'boolean', 'break', 'case', 'catch', 'ceil', 'char', 'class', 'continue', 'cos', 'date', 'decodeuri', 'decodeuricomponent', 'default', 'delete', 'do', 'document', 'double', 'dynamic', 'else', 'encode', 'encodeuri', 'encodeuricomponent', 'end', 'endif', 'error', 'eval', 'exp', 'false', 'finally', 'float', 'floor', 'for', 'function', 'ibaction', 'iboutlet', 'id', 'if', 'implementation', 'import', 'in', 'include', 'infinity', 'instanceof', 'int', 'interface', 'isfinite', 'isnan', 'ln10', 'ln2', 'log10e', 'log2e', 'long', 'math', 'max', 'min', 'nan', 'netscape', 'new', 'nil', 'no', 'null', 'number', 'object', 'outlet', 'packages', 'parsefloat', 'parseint', 'pi', 'pi2', 'pi_2', 'pow', 'private', 'property', 'protected', 'protocol', 'prototype', 'public', 'rand', 'regexp', 'return', 'round', 'sel', 'selector', 'self', 'short', 'signed', 'sin', 'sqrt', 'sqrt1_2', 'sqrt2', 'string', 'sun', 'super', 'switch', 'synchronized', 'synthesize', 'tan', 'this', 'throw', 'true', 'try', 'typeof', 'undefined', 'unsigned', 'var', 'void', 'while', 'window', 'with', 'yes'),
+    'OcamlLexer': ('and', 'array', 'as', 'asr', 'assert', 'begin', 'bool', 'char', 'class', 'constraint', 'do', 'done', 'downto', 'else', 'end', 'exception', 'external', 'false', 'float', 'for', 'fun', 'function', 'functor', 'if', 'in', 'include', 'inherit', 'initializer', 'int', 'land', 'lazy', 'let', 'list', 'lor', 'lsl', 'lxor', 'match', 'method', 'mod', 'module', 'mutable', 'new', 'object', 'of', 'open', 'or', 'private', 'raise', 'rec', 'sig', 'string', 'struct', 'then', 'to', 'true', 'try', 'type', 'unit', 'val', 'value', 'virtual', 'when', 'while', 'with'),
+    'OctaveLexer': ('accumdim', 'addlistener', 'addpath', 'addproperty', 'addtodate', 'allchild', 'amd', 'anova', 'arch_fit', 'arch_rnd', 'arch_test', 'argnames', 'arma_rnd', 'arrayfun', 'asctime', 'assignin', 'atexit', 'autoreg_matrix', 'autumn', 'available_graphics_toolkits', 'balance', 'barh', 'bartlett', 'bartlett_test', 'beep_on_error', 'betacdf', 'betainv', 'betapdf', 'betarnd', 'bicgstab', 'bicubic', 'bincoeff', 'binocdf', 'binoinv', 'binopdf', 'binornd', 'bitmax', 'bitpack', 'bitshift', 'blackman', 'bone', 'brighten', 'cauchy_inv', 'cauchy_pdf', 'cauchy_rnd', 'caxis', 'ccolamd', 'celldisp', 'cellfun', 'cellslices', 'cgs', 'chisquare_test_homogeneity', 'chisquare_test_independence', 'choldelete', 'cholinsert', 'cholinv', 'cholshift', 'cholupdate', 'clf', 'closereq', 'colamd', 'colloc', 'colormap', 'colperm', 'comet', 'command_line_path', 'common_size', 'commutation_matrix', 'compare_versions', 'compass', 'completion_append_char', 'completion_matches', 'condest', 'confirm_recursive_rmdir', 'contourc', 'contourf', 'contrast', 'convhull', 'convhulln', 'convn', 'cool', 'copper', 'cor', 'cor_test', 'corrcoef', 'crash_dumps_octave_core', 'cstrcat', 'csymamd', 'ctranspose', 'cumtrapz', 'daspk', 'daspk_options', 'dasrt_options', 'dassl_options', 'datestr', 'datetick', 'dbclear', 'dbdown', 'dblquad', 'dbstack', 'dbstatus', 'dbstop', 'dbup', 'dbwhere', 'deal', 'debug_on_error', 'debug_on_interrupt', 'debug_on_warning', 'deconv', 'default_save_options', 'delaunay', 'delaunayn', 'dellistener', 'demo', 'diffpara', 'discrete_cdf', 'discrete_inv', 'discrete_pdf', 'discrete_rnd', 'divergence', 'dlmread', 'dlmwrite', 'dmperm', 'do_string_escapes', 'doc_cache_file', 'dsearchn', 'duplication_matrix', 'durbinlevinson'),
+    'OocLexer': ('abstract', 'as', 'break', 'case', 'class', 'const', 'continue', 'cover', 'do', 'else', 'extends', 'extern', 'fallthrough', 'false', 'final', 'for', 'from', 'func', 'if', 'implement', 'import', 'in', 'include', 'inline', 'interface', 'new', 'null', 'operator', 'proto', 'return', 'static', 'super', 'switch', 'this', 'true', 'use', 'version', 'while'),
+    'OpaLexer': ('and', 'as', 'begin', 'case', 'client', 'css', 'database', 'db', 'do', 'else', 'end', 'external', 'forall', 'function', 'if', 'import', 'match', 'module', 'or', 'package', 'parser', 'rec', 'server', 'then', 'type', 'val', 'with', 'xml_parser'),
+    'OpenEdgeLexer': ('abso', 'absol', 'absolu', 'absolut', 'accelerator', 'accum', 'accumu', 'accumul', 'accumula', 'accumulat', 'advise', 'ambig', 'ambigu', 'ambiguo', 'ambiguou', 'ambiguous', 'analyz', 'anywhere', 'asce', 'ascen', 'ascend', 'ascendi', 'ascendin', 'attri', 'attrib', 'attribu', 'attribut', 'avail', 'availa', 'availab', 'availabl', 'available', 'ave', 'aver', 'avera', 'averag', 'backg', 'backgr', 'backgro', 'backgrou', 'backgroun', 'backwards', 'batch', 'bgc', 'bgco', 'bgcol', 'bgcolo', 'bgcolor', 'buttons', 'caps', 'centere', 'centered', 'chained', 'chara', 'charac', 'charact', 'characte', 'codepage', 'colu', 'colum', 'compares', 'compiler', 'connected', 'cpcase', 'cpcoll', 'cpinternal', 'cplog', 'cpprint', 'cprcodein', 'cprcodeout', 'cpstream', 'cpterm', 'curs', 'curso', 'dataservers', 'dbcodepage', 'dbcollation', 'dbname', 'dbparam', 'dbrest', 'dbrestr', 'dbrestri', 'dbrestric', 'dbrestrict', 'dbrestricti', 'dbrestrictio', 'dbrestriction', 'dbrestrictions', 'dbtaskid', 'dbvers', 'dbversi', 'dbversio', 'dbversion', 'dcolor', 'debu', 'decrypt', 'defi', 'defin', 'dele', 'delet', 'desce', 'descen', 'descendi', 'descendin', 'deselection', 'dicti', 'dictio', 'diction', 'dictiona', 'dictionar', 'discon', 'disconn', 'disconne', 'disconnec', 'displ', 'displa', 'endkey', 'extent', 'fgc', 'fgco', 'fgcol', 'fgcolo', 'fgcolor', 'filled', 'filters', 'finder', 'fore', 'foreg'),
+    'PanLexer': ('append', 'base64_decode', 'base64_encode', 'bind', 'clone', 'create', 'debug', 'declaration', 'delete', 'deprecated', 'digest', 'else', 'error', 'escape', 'exists', 'extensible', 'file_contents', 'final', 'first', 'for', 'foreach', 'format', 'function', 'if', 'if_exists', 'include', 'index', 'is_boolean', 'is_defined', 'is_double', 'is_list', 'is_long', 'is_nlist', 'is_null', 'is_number', 'is_property', 'is_resource', 'is_string', 'key', 'length', 'list', 'match', 'matches', 'merge', 'next', 'nlist', 'object', 'path_exists', 'prefix', 'prepend', 'replace', 'return', 'splice', 'split', 'structure', 'substr', 'template', 'to_boolean', 'to_double', 'to_long', 'to_lowercase', 'to_string', 'to_uppercase', 'traceback', 'type', 'unescape', 'unique', 'valid', 'value', 'variable', 'while', 'with'),
+    'PawnLexer': ('bool', 'break', 'case', 'char', 'const', 'continue', 'default', 'do', 'else', 'endif', 'enum', 'false', 'float', 'for', 'goto', 'if', 'new', 'operator', 'public', 'return', 'sizeof', 'state', 'static', 'switch', 'tagof', 'true', 'while'),
+    'Perl6Lexer': ('abstraction', 'accepts', 'acosec', 'acosech', 'acotan', 'acotanh', 'anychar', 'approx', 'arity', 'associative', 'assuming', 'bless', 'buf1', 'buf16', 'buf2', 'buf32', 'buf4', 'buf64', 'buf8', 'cached', 'callsame', 'callwith', 'can', 'capitalize', 'capture', 'chars', 'chroot', 'circumfix', 'cis', 'classify', 'codepoint', 'codes', 'comb', 'contend', 'cosec', 'cosech', 'cotan', 'cotanh', 'decreasing', 'deep', 'deeply', 'defequiv', 'dies', 'does', 'eager', 'elems', 'elsewhere', 'equiv', 'evalfile', 'fatal', 'flunk', 'gethost', 'getpw', 'grapheme', 'graphs', 'hyper', 'increasing', 'irs', 'junction', 'keybag', 'keyextractor', 'keyhash', 'keyset', 'kitchensink', 'kv', 'lastcall', 'lift', 'lives', 'looser', 'matcher', 'maybe', 'minmax', 'nextsame', 'nextwith', 'nfc', 'nfd', 'nfkc', 'nfkd', 'niecza', 'nok', 'nonce', 'oo', 'orderingpair', 'ors', 'p5chomp', 'p5chop', 'pairs', 'parsed', 'perl6', 'positional', 'postcircumfix', 'prec', 'pugs', 'quasi', 'rakudo', 'rat1', 'rat16', 'rat2', 'rat32', 'rat4', 'rat64', 'rat8', 'rejects', 'reparsed', 'roundrobin', 'runinstead', 'rw', 'sameaccent', 'samecase', 'slang', 'strand', 'submethod', 'succ', 'supersede', 'tighter', 'todo', 'trusts', 'uint1', 'uint2', 'uint4', 'unary', 'unlike', 'unpolar', 'v6', 'want', 'whatever', 'whence', 'wrap'),
+    'PerlLexer': ('__', '__end__', 'alarm', 'binmode', 'bless', 'caller', 'chdir', 'chmod', 'chomp', 'chop', 'chown', 'chroot', 'closedir', 'crypt', 'dbmclose', 'dbmopen', 'die', 'dump', 'endgrent', 'endhostent', 'endnetent', 'endprotoent', 'endpwent', 'endservent', 'err', 'fcntl', 'fileno', 'flock', 'formline', 'getc', 'getgrent', 'getgrgid', 'getgrnam', 'gethostbyaddr', 'gethostbyname', 'gethostent', 'getlogin', 'getnetbyaddr', 'getnetbyname', 'getnetent', 'getpeername', 'getpgrp', 'getppid', 'getpriority', 'getprotobyname', 'getprotobynumber', 'getprotoent', 'getpwent', 'getpwnam', 'getpwuid', 'getservbyname', 'getservbyport', 'getservent', 'getsockname', 'getsockopt', 'glob', 'gmtime', 'grep', 'ioctl', 'lc', 'lcfirst', 'listen', 'lstat', 'mkdir', 'msgctl', 'msgget', 'msgrcv', 'msgsnd', 'my', 'opendir', 'our', 'perl', 'pipe', 'prototype', 'quotemeta', 'readdir', 'readline', 'readlink', 'readpipe', 'recv', 'redo', 'rewinddir', 'rindex', 'scalar', 'seekdir', 'semctl', 'semget', 'semop', 'setgrent', 'sethostent', 'setnetent', 'setpgrp', 'setpriority', 'setprotoent', 'setpwent', 'setservent', 'setsockopt', 'shmctl', 'shmget', 'shmread', 'shmwrite', 'shutdown', 'socketpair', 'splice', 'srand', 'stat', 'std', 'study', 'symlink', 'syscall', 'sysopen', 'sysread', 'sysseek', 'syswrite', 'tell', 'telldir', 'tie', 'tied', 'tr', 'uc', 'ucfirst', 'umask', 'unshift', 'untie', 'utime', 'vec', 'waitpid', 'wantarray'),
+    'PhpLexer': ('__file__', '__line__', '__sleep', '__wakeup', 'abstract', 'and', 'array', 'as', 'break', 'case', 'catch', 'cfunction', 'class', 'clone', 'const', 'continue', 'declare', 'default', 'die', 'do', 'e_all', 'e_error', 'e_parse', 'e_warning', 'echo', 'else', 'elseif', 'empty', 'enddeclare', 'endfor', 'endforeach', 'endif', 'endswitch', 'endwhile', 'eval', 'exit', 'extends', 'false', 'final', 'finally', 'for', 'foreach', 'function', 'global', 'if', 'implements', 'include', 'include_once', 'interface', 'list', 'namespace', 'new', 'not', 'null', 'old_function', 'or', 'parent', 'php', 'php_os', 'php_user_filter', 'php_version', 'print', 'private', 'protected', 'public', 'require', 'require_once', 'return', 'static', 'stdclass', 'switch', 'this', 'throw', 'trait', 'true', 'try', 'use', 'var', 'virtual', 'while', 'xor', 'yield'),
+    'PigLexer': ('all', 'and', 'any', 'arrange', 'as', 'asc', 'assert', 'avg', 'bag', 'bigdecimal', 'biginteger', 'binstorage', 'by', 'bytearray', 'cache', 'case', 'cat', 'cd', 'chararray', 'cogroup', 'concat', 'copyfromlocal', 'copytolocal', 'count', 'cp', 'cross', 'datetime', 'declare', 'default', 'define', 'dense', 'desc', 'describe', 'diff', 'distinct', 'double', 'du', 'dump', 'eval', 'exex', 'explain', 'filter', 'flatten', 'float', 'foreach', 'full', 'generate', 'group', 'help', 'if', 'illustrate', 'import', 'inner', 'input', 'int', 'into', 'is', 'join', 'kill', 'left', 'limit', 'load', 'long', 'ls', 'map', 'matches', 'max', 'min', 'mkdir', 'mv', 'not', 'null', 'onschema', 'or', 'order', 'outer', 'output', 'parallel', 'pig', 'pigdump', 'pigstorage', 'pwd', 'quit', 'register', 'returns', 'right', 'rm', 'rmf', 'rollup', 'run', 'sample', 'set', 'ship', 'size', 'split', 'stderr', 'stdin', 'stdout', 'store', 'stream', 'sum', 'textloader', 'through', 'tokenize', 'tuple', 'union', 'using', 'void'),
+    'PikeLexer': ('__amigaos__', '__auto_bignum__', '__build__', '__date__', '__dir__', '__file__', '__line__', '__major__', '__minor__', '__nt__', '__pike__', '__real_build__', '__real_major__', '__real_minor__', '__real_version__', '__time__', '__version__', '_pragma', '_t', 'abstract', 'array', 'as', 'bool', 'break', 'case', 'catch', 'char', 'class', 'constant', 'continue', 'defined', 'do', 'double', 'else', 'extends', 'extern', 'false', 'final', 'float', 'for', 'from', 'function', 'gauge', 'if', 'implement', 'import', 'in', 'inline', 'int', 'interface', 'lambda', 'long', 'mapping', 'mixed', 'multiset', 'new', 'null', 'object', 'private', 'program', 'protected', 'proto', 'public', 'return', 'short', 'sscanf', 'static', 'static_assert', 'string', 'super', 'switch', 'this', 'throw', 'throws', 'true', 'use', 'version', 'void', 'while'),
+    'PlPgsqlLexer': ('admin', 'aggregate', 'analyse', 'anyarray', 'anyelement', 'anyenum', 'anynonarray', 'anyrange', 'assertion', 'asymmetric', 'bigserial', 'bytea', 'called', 'cascaded', 'catalog', 'characteristics', 'cidr', 'coalesce', 'comments', 'committed', 'concurrently', 'connection', 'constraints', 'conversion', 'cost', 'cstring', 'csv', 'current_catalog', 'current_role', 'current_schema', 'deferrable', 'definer', 'diagnostics', 'discard', 'encrypted', 'excluding', 'family', 'fdw_handler', 'float4', 'float8', 'following', 'greatest', 'hour', 'ilike', 'immediate', 'indexes', 'inet', 'initially', 'invoker', 'isolation', 'json', 'jsonb', 'language_handler', 'lateral', 'lc_collate', 'lc_ctype', 'leakproof', 'least', 'lseg', 'macaddr', 'materialized', 'maxvalue', 'minute', 'minvalue', 'money', 'notnull', 'nowait', 'nullif', 'nulls', 'oids', 'ordinality', 'owned', 'passing', 'password', 'pg_lsn', 'placing', 'plans', 'policy', 'preceding', 'prepared', 'procedural', 'reassign', 'recheck', 'repeatable', 'replica', 'savepoint', 'sequences', 'serial2', 'serial4', 'serial8', 'serializable', 'session_user', 'setof', 'similar', 'smallserial', 'snapshot', 'sqlstate', 'statement', 'storage', 'sysid', 'tablespace', 'timestamptz', 'timetz', 'trusted', 'tsquery', 'tsvector', 'txid_snapshot', 'unbounded', 'uncommitted', 'unencrypted', 'unlisten', 'unlogged', 'vacuum', 'validator', 'varbit', 'variadic', 'views', 'work', 'wrapper', 'xmlattributes', 'xmlconcat', 'xmlelement', 'xmlexists', 'xmlforest', 'xmlparse', 'xmlpi', 'xmlroot', 'xmlserialize'),
+    'PostScriptLexer': ('abs', 'add', 'all', 'aload', 'and', 'arc', 'arcn', 'array', 'atan', 'begin', 'bind', 'ceiling', 'charpath', 'clip', 'closepath', 'concat', 'concatmatrix', 'copy', 'cos', 'currentlinewidth', 'currentmatrix', 'currentpoint', 'curveto', 'cvi', 'cvs', 'def', 'defaultmatrix', 'dict', 'dictstackoverflow', 'div', 'dtransform', 'dup', 'else', 'end', 'eq', 'exch', 'exec', 'exit', 'exp', 'false', 'fill', 'findfont', 'floor', 'for', 'get', 'getinterval', 'grestore', 'gsave', 'gt', 'identmatrix', 'idiv', 'idtransform', 'if', 'index', 'invertmatrix', 'itransform', 'length', 'lineto', 'ln', 'load', 'log', 'loop', 'matrix', 'mod', 'moveto', 'mul', 'ne', 'neg', 'newpath', 'not', 'or', 'pathbbox', 'pathforall', 'pop', 'print', 'pstack', 'put', 'quit', 'rand', 'rangecheck', 'rcurveto', 'repeat', 'restore', 'rlineto', 'rmoveto', 'roll', 'rotate', 'round', 'run', 'save', 'scale', 'scalefont', 'setdash', 'setfont', 'setgray', 'setlinecap', 'setlinejoin', 'setlinewidth', 'setmatrix', 'setrgbcolor', 'shfill', 'show', 'showpage', 'sin', 'sqrt', 'stack', 'stringwidth', 'stroke', 'strokepath', 'sub', 'syntaxerror', 'transform', 'translate', 'true', 'truncate', 'typecheck', 'undefined', 'undefinedfilename', 'undefinedresult'),
+    'PostgresLexer': ('admin', 'aggregate', 'also', 'analyse', 'anyarray', 'anyelement', 'anyenum', 'anynonarray', 'anyrange', 'assertion', 'assignment', 'asymmetric', 'bigserial', 'bytea', 'called', 'cascaded', 'catalog', 'characteristics', 'cidr', 'coalesce', 'comments', 'committed', 'concurrently', 'connection', 'constraints', 'conversion', 'cost', 'cstring', 'csv', 'current_catalog', 'current_role', 'current_schema', 'deferrable', 'definer', 'discard', 'encrypted', 'excluding', 'family', 'fdw_handler', 'float4', 'float8', 'following', 'greatest', 'hour', 'ilike', 'immediate', 'indexes', 'inet', 'initially', 'invoker', 'isolation', 'json', 'jsonb', 'language_handler', 'lateral', 'lc_collate', 'lc_ctype', 'leakproof', 'least', 'lseg', 'macaddr', 'materialized', 'maxvalue', 'minute', 'minvalue', 'money', 'notnull', 'nowait', 'nullif', 'nulls', 'oids', 'ordinality', 'owned', 'passing', 'password', 'pg_lsn', 'placing', 'plans', 'policy', 'preceding', 'prepared', 'procedural', 'reassign', 'recheck', 'repeatable', 'replica', 'savepoint', 'sequences', 'serial2', 'serial4', 'serial8', 'serializable', 'session_user', 'setof', 'similar', 'smallserial', 'snapshot', 'statement', 'storage', 'sysid', 'tablespace', 'timestamptz', 'timetz', 'trusted', 'tsquery', 'tsvector', 'txid_snapshot', 'unbounded', 'uncommitted', 'unencrypted', 'unlisten', 'unlogged', 'vacuum', 'validator', 'varbit', 'variadic', 'views', 'work', 'wrapper', 'xmlattributes', 'xmlconcat', 'xmlelement', 'xmlexists', 'xmlforest', 'xmlparse', 'xmlpi', 'xmlroot', 'xmlserialize'),
+    'PovrayLexer': ('aa_level', 'aa_threshold', 'adaptive', 'adc_bailout', 'agate', 'agate_turb', 'ambient', 'ambient_light', 'aperture', 'arc_angle', 'area_light', 'assumed_gamma', 'atmosphere', 'atmospheric_attenuation', 'attenuating', 'bicubic_patch', 'black_hole', 'blur_samples', 'bounded_by', 'box_mapping', 'bozo', 'brick', 'brick_size', 'brightness', 'brilliance', 'bump_map', 'bump_size', 'bumps', 'bumpy1', 'bumpy2', 'bumpy3', 'caustics', 'clipped_by', 'color_map', 'colour', 'colour_map', 'composite', 'cone', 'confidence', 'conic_sweep', 'control0', 'control1', 'crackle', 'crand', 'cubic', 'cubic_spline', 'cylindrical_mapping', 'degrees', 'dents', 'distance_maximum', 'dust', 'dust_type', 'eccentricity', 'emitting', 'error_bound', 'fade_distance', 'fade_power', 'falloff', 'falloff_angle', 'file_exists', 'fisheye', 'flatness', 'focal_point', 'fog', 'fog_alt', 'fog_offset', 'fog_type', 'gif', 'global_settings', 'glowing', 'granite', 'gray_threshold', 'halo', 'height_field', 'hexagon', 'hf_gray_16', 'hollow', 'hypercomplex', 'image_map', 'incidence', 'irid', 'irid_wavelength', 'julia_fractal', 'lathe', 'leopard', 'light_source', 'linear_spline', 'linear_sweep', 'look_at', 'looks_like', 'low_error_factor', 'mandel', 'map_type', 'marble', 'material_map', 'max_intersections', 'max_iteration', 'max_trace_level', 'max_value', 'metallic', 'minimum_reuse', 'mortar', 'nearest_count', 'no_shadow', 'normal_map', 'number_of_waves', 'octaves', 'omnimax', 'onion', 'orthographic', 'panoramic', 'pattern1', 'pattern2', 'pattern3', 'perspective', 'pgm', 'phase', 'phong', 'phong_size', 'pigment', 'pigment_map', 'planar_mapping', 'png', 'point_at', 'pot', 'ppm', 'pwr', 'quadratic_spline'),
+    'PowerShellLexer': ('add', 'aggregate', 'alias', 'begin', 'break', 'catch', 'checkpoint', 'clear', 'cmdletbinding', 'compare', 'complete', 'connect', 'continue', 'convert', 'convertfrom', 'convertto', 'copy', 'cxnew', 'debug', 'default', 'disable', 'disconnect', 'do', 'dynamicparam', 'else', 'elseif', 'enable', 'end', 'enter', 'exit', 'expand', 'export', 'filter', 'finally', 'for', 'foreach', 'format', 'function', 'get', 'global', 'group', 'helpmessage', 'if', 'import', 'in', 'invoke', 'join', 'limit', 'local', 'mandatory', 'measure', 'move', 'new', 'out', 'param', 'parameter', 'parametersetname', 'ping', 'pop', 'position', 'private', 'process', 'push', 'read', 'receive', 'ref', 'register', 'remove', 'rename', 'reset', 'resize', 'resolve', 'restart', 'restore', 'resume', 'return', 'script', 'scroll', 'select', 'send', 'set', 'show', 'skip', 'sort', 'split', 'start', 'stop', 'suspend', 'switch', 'take', 'tee', 'test', 'throw', 'trace', 'trap', 'try', 'undo', 'unregister', 'until', 'update', 'use', 'validatecount', 'validatelength', 'validatepattern', 'validaterange', 'validateset', 'valuefrompipeline', 'valuefrompipelinebypropertyname', 'valuefromremainingarguments', 'wait', 'where', 'while', 'write'),
+    'ProtoBufLexer': ('bool', 'bytes', 'ctype', 'default', 'double', 'enum', 'extend', 'extensions', 'false', 'fixed32', 'fixed64', 'float', 'group', 'import', 'int32', 'int64', 'max', 'message', 'oneof', 'option', 'optional', 'package', 'packed', 'repeated', 'required', 'returns', 'rpc', 'service', 'sfixed32', 'sfixed64', 'sint32', 'sint64', 'string', 'to', 'true', 'uint32', 'uint64'),
+    'PuppetLexer': ('absent', 'alert', 'alias', 'and', 'audit', 'augeas', 'before', 'case', 'check', 'class', 'computer', 'configured', 'contained', 'create_resources', 'crit', 'cron', 'debug', 'default', 'define', 'defined', 'directory', 'else', 'elsif', 'emerg', 'err', 'exec', 'extlookup', 'fail', 'false', 'file', 'filebucket', 'fqdn_rand', 'generate', 'host', 'if', 'import', 'in', 'include', 'info', 'inherits', 'inline_template', 'installed', 'interface', 'k5login', 'latest', 'link', 'loglevel', 'macauthorization', 'mailalias', 'maillist', 'mcx', 'md5', 'mount', 'mounted', 'nagios_command', 'nagios_contact', 'nagios_contactgroup', 'nagios_host', 'nagios_hostdependency', 'nagios_hostescalation', 'nagios_hostextinfo', 'nagios_hostgroup', 'nagios_service', 'nagios_servicedependency', 'nagios_serviceescalation', 'nagios_serviceextinfo', 'nagios_servicegroup', 'nagios_timeperiod', 'node', 'noop', 'not', 'notice', 'notify', 'or', 'package', 'present', 'purged', 'realize', 'regsubst', 'resources', 'role', 'router', 'running', 'schedule', 'scheduled_task', 'search', 'selboolean', 'selmodule', 'service', 'sha1', 'shellquote', 'split', 'sprintf', 'ssh_authorized_key', 'sshkey', 'stage', 'stopped', 'subscribe', 'tag', 'tagged', 'template', 'tidy', 'true', 'undef', 'unmounted', 'user', 'versioncmp', 'vlan', 'warning', 'yumrepo', 'zfs', 'zone', 'zpool'),
+    'PyPyLogLexer': ('arraylen_gc', 'backend', 'call', 'call_assembler', 'call_loopinvariant', 'call_may_force', 'call_pure', 'call_release_gil', 'cast_float_to_int', 'cast_int_to_float', 'copystrcontent', 'counts', 'float_abs', 'float_add', 'float_eq', 'float_ge', 'float_gt', 'float_le', 'float_lt', 'float_mul', 'float_ne', 'float_neg', 'float_sub', 'float_truediv', 'force_token', 'getarrayitem_gc', 'getarrayitem_gc_pure', 'getarrayitem_raw', 'getfield_gc', 'getfield_gc_pure', 'getfield_raw', 'getinteriorfield_gc', 'guard_class', 'guard_false', 'guard_isnull', 'guard_no_exception', 'guard_no_overflow', 'guard_nonnull', 'guard_nonnull_class', 'guard_not_forced', 'guard_not_invalidated', 'guard_true', 'guard_value', 'instance_ptr_eq', 'instance_ptr_ne', 'int_add', 'int_add_ovf', 'int_and', 'int_eq', 'int_floordiv', 'int_ge', 'int_gt', 'int_is_true', 'int_is_zero', 'int_le', 'int_lshift', 'int_lt', 'int_mod', 'int_mul', 'int_mul_ovf', 'int_ne', 'int_or', 'int_rshift', 'int_sub', 'int_sub_ovf', 'int_xor', 'jit', 'log', 'mark_opaque_ptr', 'new', 'new_array', 'new_with_vtable', 'newstr', 'newunicode', 'ptr_eq', 'ptr_ne', 'quasiimmut_field', 'same_as', 'setarrayitem_gc', 'setarrayitem_raw', 'setfield_gc', 'setfield_raw', 'setinteriorfield_gc', 'strgetitem', 'strlen', 'strsetitem', 'uint_floordiv', 'uint_ge', 'uint_lt', 'unicodegetitem', 'unicodelen', 'unicodesetitem', 'virtual_ref', 'virtual_ref_finish'),
+    'Python3Lexer': ('__import__', 'abs', 'all', 'and', 'any', 'as', 'assert', 'async', 'await', 'bat', 'bin', 'bool', 'break', 'bytearray', 'bytes', 'chr', 'class', 'classmethod', 'cmd', 'cmp', 'compile', 'complex', 'continue', 'def', 'del', 'delattr', 'dict', 'dir', 'divmod', 'elif', 'ellipsis', 'else', 'enumerate', 'eval', 'except', 'exe', 'false', 'filter', 'finally', 'float', 'for', 'format', 'from', 'frozenset', 'getattr', 'global', 'globals', 'hasattr', 'hash', 'hex', 'id', 'if', 'import', 'in', 'input', 'int', 'is', 'isinstance', 'issubclass', 'iter', 'lambda', 'len', 'list', 'locals', 'map', 'max', 'memoryview', 'min', 'next', 'none', 'nonlocal', 'not', 'notimplemented', 'object', 'oct', 'open', 'or', 'ord', 'pass', 'pow', 'print', 'property', 'pythonw', 'raise', 'range', 'repr', 'return', 'reversed', 'round', 'self', 'set', 'setattr', 'slice', 'sorted', 'staticmethod', 'str', 'sum', 'super', 'true', 'try', 'tuple', 'type', 'vars', 'while', 'with', 'yield', 'zip'),
+    'Python3TracebackLexer': ('file', 'in', 'line'),
+    'PythonLexer': ('__import__', 'abs', 'all', 'and', 'any', 'apply', 'as', 'assert', 'basestring', 'bat', 'bin', 'bool', 'break', 'buffer', 'bytearray', 'bytes', 'callable', 'chr', 'class', 'classmethod', 'cmd', 'cmp', 'coerce', 'compile', 'complex', 'continue', 'def', 'del', 'delattr', 'dict', 'dir', 'divmod', 'elif', 'ellipsis', 'else', 'enumerate', 'eval', 'except', 'exe', 'exec', 'execfile', 'exit', 'false', 'file', 'filter', 'finally', 'float', 'for', 'from', 'frozenset', 'getattr', 'global', 'globals', 'hasattr', 'hash', 'hex', 'id', 'if', 'import', 'in', 'input', 'int', 'intern', 'is', 'isinstance', 'issubclass', 'iter', 'lambda', 'len', 'list', 'locals', 'long', 'map', 'max', 'min', 'next', 'none', 'not', 'notimplemented', 'object', 'oct', 'open', 'or', 'ord', 'pass', 'pow', 'print', 'property', 'pythonw', 'raise', 'range', 'raw_input', 'reduce', 'reload', 'repr', 'return', 'reversed', 'round', 'self', 'set', 'setattr', 'slice', 'sorted', 'staticmethod', 'str', 'sum', 'super', 'true', 'try', 'tuple', 'type', 'unichr', 'unicode', 'vars', 'while', 'with', 'xrange', 'yield', 'zip'),
+    'PythonTracebackLexer': ('file', 'in', 'line'),
+    'QBasicLexer': ('absolute', 'atn', 'base', 'beep', 'bload', 'bsave', 'byval', 'calls', 'cdbl', 'cdecl', 'chain', 'chdir', 'cint', 'circle', 'clear', 'clng', 'cls', 'color', 'com', 'command', 'common', 'csng', 'csrlin', 'cvd', 'cvdmbf', 'cvi', 'cvl', 'cvs', 'cvsmbf', 'defdbl', 'defint', 'deflng', 'defsng', 'defstr', 'dim', 'draw', 'environ', 'eof', 'eqv', 'erase', 'erdev', 'erl', 'err', 'fileattr', 'files', 'fix', 'fn', 'fre', 'freefile', 'gosub', 'hex', 'imp', 'inkey', 'inp', 'instr', 'interrupt', 'ioctl', 'kill', 'lbound', 'lcase', 'loc', 'locate', 'lock', 'lof', 'lpos', 'lprint', 'lset', 'ltrim', 'mid', 'mkd', 'mkdir', 'mkdmbf', 'mki', 'mkl', 'mks', 'mksmbf', 'oct', 'paint', 'palette', 'pcopy', 'peek', 'pen', 'play', 'pmap', 'point', 'poke', 'pos', 'preset', 'pset', 'put', 'random', 'randomize', 'redim', 'restore', 'resume', 'rmdir', 'rnd', 'rset', 'rtrim', 'sadd', 'screen', 'seek', 'seg', 'setmem', 'sgn', 'shared', 'shell', 'signal', 'single', 'sound', 'space', 'spc', 'sqr', 'stick', 'strig', 'swap', 'tab', 'timer', 'troff', 'tron', 'ubound', 'ucase', 'uevent', 'unlock', 'varptr', 'varseg', 'wend', 'width'),
+    'QmlLexer': ('abstract', 'array', 'boolean', 'break', 'byte', 'case', 'catch', 'char', 'class', 'const', 'continue', 'date', 'debugger', 'decodeuri', 'decodeuricomponent', 'default', 'delete', 'do', 'document', 'double', 'else', 'encodeuri', 'encodeuricomponent', 'enum', 'error', 'eval', 'export', 'extends', 'false', 'final', 'finally', 'float', 'for', 'function', 'goto', 'id', 'if', 'implements', 'import', 'in', 'infinity', 'instanceof', 'int', 'interface', 'isfinite', 'isnan', 'let', 'long', 'math', 'nan', 'native', 'netscape', 'new', 'null', 'number', 'object', 'package', 'packages', 'parsefloat', 'parseint', 'private', 'protected', 'public', 'regexp', 'return', 'short', 'static', 'string', 'sun', 'super', 'switch', 'synchronized', 'this', 'throw', 'throws', 'transient', 'true', 'try', 'typeof', 'undefined', 'var', 'void', 'volatile', 'while', 'window', 'with'),
+    'RPMSpecLexer': ('arch', 'attr', 'config', 'defattr', 'define', 'dir', 'doc', 'else', 'endif', 'exclude', 'find_lang', 'ghost', 'if', 'install', 'make', 'patch', 'path', 'prefix', 'setup', 'ure', 'verify'),
+    'RacketLexer': ('absent', 'add1', 'andmap', 'argmax', 'argmin', 'assf', 'assq', 'assv', 'augment', 'augride', 'banner', 'begin0', 'caaaar', 'caaadr', 'caaar', 'caadar', 'caaddr', 'caadr', 'caar', 'cadaar', 'cadadr', 'cadar', 'caddar', 'cadddr', 'caddr', 'cadr', 'car', 'cdaaar', 'cdaadr', 'cdaar', 'cdadar', 'cdaddr', 'cdadr', 'cdar', 'cddaar', 'cddadr', 'cddar', 'cdddar', 'cddddr', 'cdddr', 'cddr', 'cdr', 'compose', 'compose1', 'conjugate', 'cons', 'contract', 'contracted', 'curry', 'curryr', 'delay', 'denominator', 'displayln', 'dropf', 'eighth', 'eprintf', 'exn', 'expt', 'fifth', 'findf', 'flatten', 'foldl', 'foldr', 'fourth', 'fprintf', 'future', 'gensym', 'getenv', 'hasheq', 'hasheqv', 'inspect', 'instantiate', 'lcm', 'letrec', 'lib', 'listof', 'magnitude', 'mcar', 'mcdr', 'mcons', 'member', 'memf', 'memq', 'memv', 'modulo', 'negate', 'newline', 'ninth', 'numerator', 'ormap', 'overment', 'parameterize', 'permutations', 'place', 'planet', 'pregexp', 'provide', 'pubment', 'putenv', 'quasiquote', 'quasisyntax', 'quotient', 'rationalize', 'reader', 'remainder', 'remq', 'remv', 'seteq', 'seteqv', 'seventh', 'shuffle', 'sixth', 'splicing', 'sqr', 'srcloc', 'sub1', 'subbytes', 'submod', 'subprocess', 'takef', 'tenth', 'third', 'thunk', 'touch', 'unbox', 'unquote', 'unsyntax', 'vectorof'),
+    'RagelCLexer': ('lang',),
+    'RagelCppLexer': ('lang',),
+    'RagelDLexer': ('lang',),
+    'RagelEmbeddedLexer': ('indep', 'lang'),
+    'RagelJavaLexer': ('java', 'lang'),
+    'RagelLexer': ('access', 'action', 'alnum', 'alpha', 'alphtype', 'any', 'ascii', 'cntrl', 'digit', 'empty', 'extend', 'getkey', 'graph', 'include', 'lower', 'machine', 'print', 'punct', 'space', 'upper', 'write', 'xdigit', 'zlen'),
+    'RagelObjectiveCLexer': ('lang', 'objc'),
+    'RagelRubyLexer': ('lang', 'ruby'),
+    'RdLexer': ('cr', 'def', 'dots', 'endif', 'ifn', 'tab'),
+    'RebolLexer': ('rebol',),
+    'RegeditLexer': ('editor', 'hkey_', 'registry', 'windows'),
+    'ResourceLexer': ('alias', 'array', 'bin', 'import', 'int', 'intvector', 'offset', 'root', 'string', 'table'),
+    'RexxLexer': ('abbrev', 'abs', 'address', 'arg', 'b2x', 'bitand', 'bitor', 'bitxor', 'by', 'c2d', 'c2x', 'call', 'center', 'charin', 'charout', 'chars', 'compare', 'condition', 'copies', 'd2c', 'd2x', 'datatype', 'date', 'delstr', 'delword', 'digits', 'do', 'drop', 'else', 'end', 'errortext', 'exit', 'for', 'forever', 'form', 'format', 'fuzz', 'if', 'insert', 'interpret', 'iterate', 'lastpos', 'leave', 'left', 'length', 'linein', 'lineout', 'lines', 'max', 'min', 'nop', 'numeric', 'off', 'on', 'options', 'overlay', 'parse', 'pos', 'procedure', 'pull', 'push', 'queue', 'queued', 'random', 'return', 'reverse', 'rexx', 'right', 'say', 'select', 'sign', 'signal', 'sourceline', 'space', 'stream', 'strip', 'substr', 'subword', 'symbol', 'then', 'time', 'to', 'trace', 'translate', 'trunc', 'until', 'value', 'verify', 'while', 'word', 'wordindex', 'wordlength', 'wordpos', 'words', 'x2b', 'x2c', 'x2d', 'xrange'),
+    'RhtmlLexer': ('html',),
+    'RqlLexer': ('and', 'any', 'asc', 'being', 'cwetype', 'cwrelation', 'delete', 'desc', 'distinct', 'exists', 'false', 'groupby', 'having', 'insert', 'instance_of', 'is', 'limit', 'not', 'now', 'null', 'offset', 'or', 'orderby', 'set', 'today', 'true', 'union', 'where', 'with'),
+    'RslLexer': ('abs', 'all', 'always', 'any', 'as', 'axiom', 'bool', 'card', 'case', 'channel', 'chaos', 'char', 'class', 'devt_relation', 'dom', 'elems', 'elif', 'else', 'end', 'exists', 'extend', 'false', 'for', 'hd', 'hide', 'if', 'in', 'inds', 'initialise', 'int', 'inter', 'is', 'isin', 'len', 'let', 'local', 'ltl_assertion', 'nat', 'object', 'of', 'out', 'post', 'pre', 'read', 'real', 'rng', 'scheme', 'skip', 'stop', 'swap', 'test_case', 'text', 'then', 'theory', 'tl', 'transition_system', 'true', 'type', 'union', 'unit', 'until', 'use', 'value', 'variable', 'while', 'with', 'write'),
+    'RubyLexer': ('__', '__end__', '__id__', '__send__', 'abort', 'alias', 'ancestors', 'at_exit', 'attr', 'attr_accessor', 'attr_reader', 'attr_writer', 'autoload', 'bat', 'bin', 'binding', 'block_given', 'callcc', 'caller', 'chomp', 'chop', 'class_eval', 'class_variables', 'clone', 'cmd', 'const_defined', 'const_get', 'const_missing', 'const_set', 'constants', 'def', 'display', 'dup', 'elsif', 'ensure', 'eql', 'equal', 'exe', 'exec', 'extend', 'fail', 'fork', 'format', 'freeze', 'frozen', 'getc', 'gets', 'global_variables', 'gsub', 'hash', 'id', 'included_modules', 'initialize', 'inspect', 'instance_eval', 'instance_method', 'instance_methods', 'instance_of', 'instance_variable_get', 'instance_variable_set', 'instance_variables', 'integer', 'is_a', 'iterator', 'kind_of', 'lambda', 'line', 'load', 'local_variables', 'loop', 'method', 'method_defined', 'method_missing', 'methods', 'module_eval', 'module_function', 'name', 'nil', 'object_id', 'printf', 'private_class_method', 'private_instance_methods', 'private_method_defined', 'private_methods', 'proc', 'protected_instance_methods', 'protected_method_defined', 'protected_methods', 'public_class_method', 'public_instance_methods', 'public_method_defined', 'public_methods', 'putc', 'puts', 'raise', 'rand', 'readline', 'readlines', 'redo', 'require', 'rescue', 'respond_to', 'retry', 'ruby', 'scan', 'send', 'set_trace_func', 'singleton_methods', 'sleep', 'split', 'sprintf', 'srand', 'sub', 'syscall', 'system', 'taint', 'tainted', 'test', 'to_a', 'to_s', 'trace_var', 'trap', 'undef', 'unless', 'untaint', 'untrace_var', 'warn', 'yield'),
+    'RustLexer': ('alignof', 'as', 'asmut', 'asref', 'be', 'bool', 'box', 'break', 'clone', 'const', 'continue', 'copy', 'crate', 'default', 'do', 'doubleendediterator', 'drop', 'else', 'enum', 'eq', 'err', 'exactsizeiterator', 'extend', 'extern', 'f32', 'f64', 'false', 'fn', 'fnmut', 'fnonce', 'for', 'from', 'i16', 'i32', 'i64', 'i8', 'if', 'impl', 'in', 'into', 'intoiterator', 'isize', 'iterator', 'let', 'loop', 'match', 'mod', 'mut', 'none', 'offsetof', 'ok', 'once', 'option', 'ord', 'partialeq', 'partialord', 'priv', 'proc', 'pub', 'pure', 'ref', 'result', 'return', 'self', 'send', 'size', 'sized', 'sizeof', 'sliceconcatext', 'some', 'static', 'str', 'string', 'struct', 'sync', 'toowned', 'tostring', 'trait', 'true', 'type', 'typeof', 'u16', 'u32', 'u64', 'u8', 'unsafe', 'unsized', 'use', 'usize', 'vec', 'while', 'yield'),
+    'SLexer': ('addna', 'addtaskcallback', 'agrep', 'alist', 'anyduplicated', 'aperm', 'arrayind', 'asnamespace', 'ass3', 'ass4', 'attachnamespace', 'autoloader', 'backsolve', 'baseenv', 'bindingisactive', 'bindingislocked', 'bindtextdomain', 'bitwand', 'bitwnot', 'bitwor', 'bitwshiftl', 'bitwshiftr', 'bitwxor', 'bquote', 'browsercondition', 'browsersetdebug', 'browsertext', 'bzfile', 'casefold', 'cbind', 'charmatch', 'chartoraw', 'chartr', 'check_tzones', 'chol2inv', 'clearpushback', 'closeallconnections', 'colmeans', 'colnames', 'colsums', 'commandargs', 'computerestarts', 'conditioncall', 'conditionmessage', 'conflicts', 'contributors', 'cstack_info', 'debugonce', 'delayedassign', 'deparse', 'detach', 'dget', 'difftime', 'dimnames', 'dput', 'dquote', 'droplevels', 'duplicated', 'eapply', 'emptyenv', 'enc2native', 'enc2utf8', 'encodestring', 'enquote', 'environmentislocked', 'environmentname', 'evalq', 'fifo', 'findinterval', 'findpackageenv', 'formals', 'formatc', 'formatdl', 'forwardsolve', 'gcinfo', 'gctorture', 'gctorture2', 'getallconnections', 'getcallingdll', 'getcallingdlle', 'getconnection', 'getdllregisteredroutines', 'getelement', 'geterrmessage', 'getexportedvalue', 'gethook', 'getloadeddlls', 'getnamespace', 'getnamespaceexports', 'getnamespaceimports', 'getnamespaceinfo', 'getnamespacename', 'getnamespaceusers', 'getnamespaceversion', 'getnativesymbolinfo', 'getoption', 'getrversion', 'getsrclines', 'gettaskcallbacknames', 'gettextf', 'getwd', 'gl', 'globalenv', 'gregexpr', 'grepl', 'grepraw', 'gzcon', 'gzfile', 'iconv', 'iconvlist', 'icusetcollate', 'identical', 'importintoenv', 'interactive', 'inttobits', 'inttoutf8', 'invokerestartinteractively', 'isbasenamespace', 'isdebugged', 'isincomplete', 'isnamespace', 'isodate', 'isodatetime', 'isopen', 'isrestart', 'iss4', 'isseekable', 'istrue'),
+    'SMLLexer': ('abstype', 'and', 'case', 'datatype', 'do', 'else', 'end', 'eqtype', 'exception', 'fun', 'functor', 'handle', 'if', 'in', 'include', 'let', 'local', 'of', 'open', 'sig', 'signature', 'struct', 'structure', 'then', 'type', 'val', 'while', 'withtype'),
+    'SassLexer': ('and', 'aqua', 'black', 'blue', 'debug', 'extend', 'for', 'from', 'fuchsia', 'gray', 'green', 'if', 'import', 'include', 'lime', 'maroon', 'mixin', 'navy', 'not', 'olive', 'or', 'purple', 'red', 'silver', 'teal', 'through', 'to', 'warn', 'while', 'white', 'yellow'),
+    'ScalaLexer': (u'abstract', u'ca', 'class', u'ealed', u'ef', 'false', 'forsome', u'hile', 'import', u'inal', u'is', u'ith', u'ivate', u'lazy', u'lse', u'ly', u'match', u'mplicit', u'new', 'null', 'object', u'or', u'otected', u'override', 'package', u'pr', u'quires', u're', u'row', u'ry', u'se', u'some', u'tch', 'trait', 'true', u'turn', 'type', u'uper', u'va', u'xtends', u'yield'),
+    'ScamlLexer': ('import',),
+    'SchemeLexer': ('acos', 'alphabetic', 'angle', 'append', 'apply', 'asin', 'assoc', 'assq', 'assv', 'atan', 'caaaar', 'caaadr', 'caaar', 'caadar', 'caaddr', 'caadr', 'caar', 'cadaar', 'cadadr', 'cadar', 'caddar', 'cadddr', 'caddr', 'cadr', 'car', 'cc', 'cdaaar', 'cdaadr', 'cdaar', 'cdadar', 'cdaddr', 'cdadr', 'cdar', 'cddaar', 'cddadr', 'cddar', 'cdddar', 'cddddr', 'cdddr', 'cddr', 'cdr', 'ceiling', 'ci', 'complex', 'cond', 'cons', 'continuation', 'copy', 'cos', 'current', 'define', 'delay', 'denominator', 'display', 'downcase', 'dynamic', 'each', 'environment', 'eof', 'eq', 'equal', 'eqv', 'even', 'exact', 'expt', 'fill', 'floor', 'force', 'gcd', 'imag', 'inexact', 'interaction', 'lambda', 'lcm', 'length', 'letrec', 'lower', 'magnitude', 'make', 'member', 'memq', 'memv', 'modulo', 'negative', 'newline', 'number', 'numerator', 'numeric', 'odd', 'off', 'output', 'pair', 'part', 'peek', 'polar', 'port', 'positive', 'procedure', 'quasiquote', 'quote', 'quotient', 'rational', 'rationalize', 'ready', 'rectangular', 'ref', 'remainder', 'report', 'reverse', 'rules', 'scheme', 'splicing', 'sqrt', 'substring', 'symbol', 'syntax', 'tail', 'tan', 'transcript', 'truncate', 'unquote', 'upcase', 'upper', 'values', 'vector', 'whitespace', 'wind', 'zero'),
+    'ScilabLexer': ('_code2str', '_d', '_str2code', 'abcd', 'abinv', 'accept_func_default', 'accept_func_vfsa', 'acf', 'acoshm', 'acosm', 'add_demo', 'add_help_chapter', 'add_module_help_chapter', 'add_param', 'add_profiling', 'addcolor', 'addf', 'addhistory', 'addinter', 'addlocalizationdomain', 'addmodulepreferences', 'adj2sp', 'aff2ab', 'amell', 'ana_style', 'analpf', 'aplat', 'apropos', 'argn', 'arhnk', 'arl2', 'arl2_ius', 'arma2p', 'arma2ss', 'armac', 'armax', 'armax1', 'arobasestring2strings', 'arsimul', 'ascii2string', 'asciimat', 'asinhm', 'asinm', 'assert_checkalmostequal', 'assert_checkequal', 'assert_checkerror', 'assert_checkfalse', 'assert_checkfilesequal', 'assert_checktrue', 'assert_comparecomplex', 'assert_computedigits', 'assert_cond2reltol', 'assert_cond2reqdigits', 'assert_generror', 'atanhm', 'atanm', 'atomsautoload', 'atomsautoloadadd', 'atomsautoloaddel', 'atomsautoloadlist', 'atomscategorylist', 'atomscheckmodule', 'atomsdeptreeshow', 'atomsgetconfig', 'atomsgetinstalled', 'atomsgetinstalledpath', 'atomsgetloaded', 'atomsgetloadedpath', 'atomsinstall', 'atomsisinstalled', 'atomsisloaded', 'atomslist', 'atomsload', 'atomsquit', 'atomsremove', 'atomsrepositoryadd', 'atomsrepositorydel', 'atomsrepositorylist', 'atomsrestoreconfig', 'atomssaveconfig', 'atomssearch', 'atomssetconfig', 'atomsshow', 'atomssysteminit', 'atomssystemupdate', 'atomstest', 'atomsupdate', 'atomsversion', 'auread', 'auwrite', 'backslash', 'balanc', 'balreal', 'base2dec', 'bdiag', 'bench_run', 'bezout', 'bfinit', 'bilin', 'bilt', 'bin2dec', 'blkfc1i', 'blkslvi', 'bloc2exp', 'bloc2ss', 'block_parameter_error', 'bode', 'bode_asymp', 'bool2s', 'browsehistory', 'browsevar', 'bsplin3val', 'bstap', 'builddoc', 'buildouttb', 'buttmag', 'bvode', 'bvodes', 'bytecodewalk', 'c_link', 'cainv', 'calerf', 'calfrq', 'callblk', 'canon', 'captions', 'casc', 'cat_code'),
+    'ScssLexer': ('and', 'aqua', 'black', 'blue', 'debug', 'extend', 'for', 'from', 'fuchsia', 'gray', 'green', 'if', 'import', 'include', 'lime', 'maroon', 'media', 'mixin', 'navy', 'not', 'olive', 'or', 'purple', 'red', 'silver', 'teal', 'through', 'to', 'warn', 'while', 'white', 'yellow'),
+    'SmaliLexer': ('abstract', 'access', 'add', 'and', 'annotation', 'array', 'bridge', 'cast', 'catch', 'catchall', 'change', 'check', 'class', 'cmpl', 'const', 'constructor', 'data', 'declared', 'div', 'end', 'enum', 'epilogue', 'error', 'field', 'final', 'generic', 'get', 'if', 'illegal', 'implements', 'inline', 'instance', 'instantiation', 'interface', 'invoke', 'line', 'local', 'locals', 'method', 'move', 'mul', 'native', 'neg', 'no', 'not', 'of', 'or', 'packed', 'parameter', 'private', 'prologue', 'protected', 'public', 'put', 'registers', 'rem', 'restart', 'return', 'rsub', 'shl', 'shr', 'source', 'sparse', 'static', 'strictfp', 'sub', 'subannotation', 'such', 'super', 'switch', 'synchronized', 'synthetic', 'throw', 'to', 'transient', 'ushr', 'varargs', 'verification', 'volatile', 'vtable'),
+    'SmalltalkLexer': ('category', 'class', 'classvariablenames', 'commentstamp', 'false', 'iffalse', 'iftrue', 'instancevariablenames', 'methodsfor', 'new', 'nil', 'pooldictionaries', 'prior', 'self', 'subclass', 'super', 'thiscontext', 'timesrepeat', 'true', 'whilefalse', 'whiletrue'),
+    'SmartyLexer': ('false', 'file', 'foreach', 'if', 'include', 'null', 'php', 'true'),
+    'SnobolLexer': ('abort', 'any', 'apply', 'arb', 'arbno', 'bal', 'break', 'date', 'differ', 'dupl', 'eq', 'eval', 'fail', 'fence', 'ge', 'gt', 'ident', 'input', 'integer', 'le', 'len', 'lgt', 'load', 'lt', 'ne', 'notany', 'opsyn', 'output', 'pos', 'rem', 'remdr', 'replace', 'rpos', 'rtab', 'size', 'span', 'succeed', 'tab', 'terminal', 'time', 'trim', 'unload'),
+    'SourcePawnLexer': ('bool', 'case', 'const', 'continue', 'decl', 'default', 'else', 'endif', 'enum', 'false', 'float', 'for', 'if', 'native', 'new', 'operator', 'public', 'return', 'sizeof', 'static', 'struct', 'switch', 'true'),
+    'SourcesListLexer': ('deb', 'src'),
+    'SparqlLexer': ('add', 'all', 'as', 'ask', 'base', 'bind', 'bindings', 'by', 'clear', 'construct', 'copy', 'create', 'data', 'default', 'delete', 'describe', 'distinct', 'drop', 'filter', 'from', 'graph', 'group', 'in', 'insert', 'limit', 'load', 'minus', 'move', 'named', 'not', 'offset', 'optional', 'order', 'prefix', 'reduced', 'select', 'service', 'silent', 'union', 'using', 'where'),
+    'SqlLexer': ('ada', 'admin', 'allocate', 'analyse', 'are', 'asensitive', 'assertion', 'asymmetric', 'avg', 'bit_length', 'bitvar', 'breadth', 'called', 'catalog_name', 'char_length', 'character_length', 'character_set_catalog', 'character_set_name', 'character_set_schema', 'class_origin', 'clob', 'coalsece', 'cobol', 'collation_catalog', 'collation_name', 'collation_schema', 'column_name', 'command_function', 'command_function_code', 'completion', 'condition_number', 'connection_name', 'constraint_catalog', 'constraint_name', 'constraint_schema', 'corresponting', 'createdb', 'createuser', 'cube', 'current_path', 'cursor_name', 'datetime_interval_code', 'datetime_interval_precision', 'descriptor', 'deterministic', 'diagnostics', 'dispatch', 'dynamic_function', 'dynamic_function_code', 'existing', 'fortran', 'general', 'generated', 'grouping', 'hierarchy', 'inditcator', 'instantiable', 'key_member', 'key_type', 'lancompiler', 'locator', 'message_length', 'message_octet_length', 'message_text', 'modifies', 'more', 'mumps', 'nclob', 'nocreatedb', 'nocreateuser', 'nullable', 'octet_length', 'operation', 'overriding', 'pad', 'paramater_name', 'paramater_ordinal_position', 'paramater_specific_schema', 'parameter_mode', 'parameter_specific_catalog', 'parameter_specific_name', 'pendant', 'pli', 'preorder', 'referencing', 'returned_length', 'returned_octet_length', 'returned_sqlstate', 'rollup', 'routine_catalog', 'routine_name', 'routine_schema', 'row_count', 'save_point', 'schema_name', 'server_name', 'sets', 'specific', 'specific_name', 'specifictype', 'sqlcode', 'sqlerror', 'sqlexception', 'sqlwarninig', 'stype', 'subclass_origin', 'sublist', 'system_user', 'table_name', 'timezone_hour', 'timezone_minute', 'toast', 'transactions_committed', 'transactions_rolled_back', 'transation', 'transation_active', 'transforms', 'translation', 'trigger_catalog', 'trigger_name', 'trigger_schema', 'under', 'unnamed', 'unnest', 'user_defined_type_catalog', 'user_defined_type_name', 'user_defined_type_schema', 'whenever'),
+    'SquidConfLexer': ('access_log', 'acl', 'always_direct', 'announce_host', 'announce_period', 'announce_port', 'announce_to', 'anonymize_headers', 'append_domain', 'as_whois_server', 'auth_param_basic', 'authenticate_children', 'authenticate_program', 'authenticate_ttl', 'broken_posts', 'buffered_logs', 'cache_access_log', 'cache_announce', 'cache_dir', 'cache_dns_program', 'cache_effective_group', 'cache_effective_user', 'cache_host', 'cache_host_acl', 'cache_host_domain', 'cache_log', 'cache_mem', 'cache_mem_high', 'cache_mem_low', 'cache_mgr', 'cache_peer', 'cache_peer_access', 'cache_stoplist', 'cache_stoplist_pattern', 'cache_store_log', 'cache_swap', 'cache_swap_high', 'cache_swap_log', 'cache_swap_low', 'cachemgr_passwd', 'cahce_replacement_policy', 'client_db', 'client_lifetime', 'client_netmask', 'connect_timeout', 'coredump_dir', 'dead_peer_timeout', 'debug_options', 'delay_access', 'delay_class', 'delay_initial_bucket_level', 'delay_parameters', 'delay_pools', 'deny_info', 'dns_children', 'dns_defnames', 'dns_nameservers', 'dns_testnames', 'dstdomain', 'emulate_httpd_log', 'err_html_text', 'fake_user_agent', 'firewall_ip', 'forward_snmpd_port', 'forwarded_for', 'fqdncache_size', 'ftp_list_width', 'ftp_passive', 'ftp_user', 'ftpget_options', 'ftpget_program', 'half_closed_clients', 'header_access', 'header_replace', 'hierarchy_stoplist', 'high_page_fault_warning', 'high_response_time_warning', 'hosts_file', 'htcp_port', 'http_access', 'http_anonymizer', 'http_port', 'http_reply_access', 'httpd_accel', 'httpd_accel_host', 'httpd_accel_port', 'httpd_accel_uses_host_header', 'httpd_accel_with_proxy', 'icp_access', 'icp_hit_stale', 'icp_port', 'icp_query_timeout', 'ident_lookup', 'ident_lookup_access', 'ident_timeout', 'incoming_http_average', 'incoming_icp_average', 'inside_firewall', 'ipcache_high', 'ipcache_low', 'ipcache_size', 'local_domain', 'local_ip', 'log_fqdn', 'log_icp_queries', 'log_mime_hdrs', 'logfile_rotate', 'maximum_object_size', 'maximum_single_addr_tries', 'mcast_groups', 'mcast_icp_query_timeout', 'mcast_miss_addr', 'mcast_miss_encode_key', 'mcast_miss_port', 'memory_pools', 'memory_pools_limit', 'memory_replacement_policy', 'mime_table', 'min_http_poll_cnt', 'min_icp_poll_cnt', 'minimum_direct_hops', 'minimum_object_size', 'minimum_retry_timeout', 'miss_access', 'negative_dns_ttl', 'negative_ttl', 'neighbor_timeout', 'neighbor_type_domain'),
+    'SspLexer': ('val',),
+    'StanLexer': ('append_col', 'append_row', 'bernoulli', 'bernoulli_ccdf_log', 'bernoulli_cdf', 'bernoulli_cdf_log', 'bernoulli_log', 'bernoulli_logit', 'bernoulli_logit_log', 'bernoulli_rng', 'bessel_first_kind', 'bessel_second_kind', 'beta_binomial', 'beta_binomial_ccdf_log', 'beta_binomial_cdf', 'beta_binomial_cdf_log', 'beta_binomial_log', 'beta_binomial_rng', 'beta_ccdf_log', 'beta_cdf', 'beta_cdf_log', 'beta_log', 'beta_rng', 'binary_log_loss', 'binomial_ccdf_log', 'binomial_cdf', 'binomial_cdf_log', 'binomial_coefficient_log', 'binomial_log', 'binomial_logit', 'binomial_logit_log', 'binomial_rng', 'categorical', 'categorical_log', 'categorical_logit', 'categorical_logit_log', 'categorical_rng', 'cauchy', 'cauchy_ccdf_log', 'cauchy_cdf_log', 'cauchy_log', 'cauchy_rng', 'char16_t', 'char32_t', 'chi_square', 'chi_square_ccdf_log', 'chi_square_cdf', 'chi_square_cdf_log', 'chi_square_log', 'chi_square_rng', 'cholesky_decompose', 'cholesky_factor_corr', 'cholesky_factor_cov', 'columns_dot_product', 'columns_dot_self', 'corr_matrix', 'cov_matrix', 'cumulative_sum', 'diag_post_multiply', 'diag_pre_multiply', 'dims', 'dirichlet', 'dirichlet_log', 'dirichlet_rng', 'dot_self', 'double_exponential', 'double_exponential_ccdf_log', 'double_exponential_cdf', 'double_exponential_cdf_log', 'double_exponential_log', 'double_exponential_rng', 'eigenvalues_sym', 'eigenvectors_sym', 'exp2', 'exp_mod_normal', 'exp_mod_normal_ccdf_log', 'exp_mod_normal_cdf', 'exp_mod_normal_cdf_log', 'exp_mod_normal_log', 'exp_mod_normal_rng', 'exponential', 'exponential_ccdf_log', 'exponential_cdf', 'exponential_cdf_log', 'exponential_log', 'exponential_rng', 'falling_factorial', 'fdim', 'fma', 'fmax', 'fmin', 'frechet', 'frechet_ccdf_log', 'frechet_cdf', 'frechet_cdf_log', 'frechet_log', 'frechet_rng', 'fvar', 'gamma_ccdf_log', 'gamma_cdf', 'gamma_cdf_log', 'gamma_log', 'gamma_p', 'gamma_q', 'gamma_rng', 'gaussian_dlm_obs', 'gaussian_dlm_obs_log', 'get_lp', 'gumbel', 'gumbel_ccdf_log', 'gumbel_cdf', 'gumbel_cdf_log', 'gumbel_log', 'gumbel_rng', 'hypergeometric', 'hypergeometric_log', 'hypergeometric_rng', 'if_else', 'increment_log_prob', 'int_step', 'integrate_ode', 'inv_chi_square', 'inv_chi_square_ccdf_log', 'inv_chi_square_cdf', 'inv_chi_square_cdf_log', 'inv_chi_square_log', 'inv_chi_square_rng', 'inv_cloglog'),
+    'SwiftLexer': ('_arraybuffertype', '_bidirectionalindextype', '_cocoastringtype', '_collectiontype', '_comparable', '_extensiblecollectiontype', '_forwardindextype', '_incrementable', '_integerarithmetictype', '_integertype', '_objectivecbridgeable', '_randomaccessindextype', '_rawoptionsettype', '_sequence_type', '_sequencetype', '_signedintegertype', '_signednumbertype', '_sliceable', '_strideable', '_swiftnsarrayrequiredoverridestype', '_swiftnsarraytype', '_swiftnscopyingtype', '_swiftnsdictionaryrequiredoverridestype', '_swiftnsdictionarytype', '_swiftnsenumeratortype', '_swiftnsfastenumerationtype', '_swiftnsstringrequiredoverridestype', '_swiftnsstringtype', '_unsignedintegertype', 'absolutevaluable', 'advance', 'alignofvalue', 'anyclass', 'anyobject', 'arrayliteralconvertible', 'assertionfailure', 'associativity', 'autoreleasingunsafemutablepointer', 'availability', 'bidirectionalindextype', 'bidirectionalreverseview', 'bitwiseoperationstype', 'booleanliteralconvertible', 'booleanliteraltype', 'booleantype', 'c_argc', 'c_argv', 'cchar16', 'cchar32', 'cfunctionpointer', 'clong', 'clonglong', 'closedinterval', 'collectionofone', 'collectiontype', 'contiguousarray', 'convenience', 'copaquepointer', 'countelements', 'csignedchar', 'cunsignedint', 'cunsignedlong', 'cunsignedshort', 'cvalistpointer', 'cvarargtype', 'cwidechar', 'debugprint', 'debugprintable', 'debugprintln', 'deinit', 'dictionarygenerator', 'dictionaryindex', 'dictionaryliteralconvertible', 'didset', 'dropfirst', 'droplast', 'dynamictype', 'emptycollection', 'emptygenerator', 'enumerategenerator', 'enumeratesequence', 'equatable', 'extendedgraphemeclusterliteralconvertible', 'extendedgraphemeclustertype', 'extensiblecollectiontype', 'filtercollectionview', 'filtercollectionviewindex', 'filtergenerator', 'filtersequenceview', 'float80', 'floatingpointclassification', 'floatingpointtype', 'floatliteralconvertible', 'floatliteraltype', 'forwardindextype', 'generatorof', 'generatorofone', 'generatorsequence', 'generatortype', 'getvalist', 'halfopeninterval', 'hashable', 'heapbuffer', 'heapbufferstorage', 'implicitlyunwrappedoptional', 'indexinggenerator', 'integerarithmetictype', 'integerliteralconvertible', 'integerliteraltype', 'integertype', 'intervaltype', 'lazybidirectionalcollection', 'lazyforwardcollection', 'lazyrandomaccesscollection', 'lazysequence', 'lexicographicalcompare', 'mapcollectionview', 'mapsequencegenerator', 'mapsequenceview', 'maxelement', 'minelement', 'mirrordisposition', 'mirrortype', 'mutablecollectiontype', 'mutablesliceable', 'mutating', 'nilliteralconvertible', 'nonmutating'),
+    'SystemVerilogLexer': ('accept_on', 'always_comb', 'always_ff', 'always_latch', 'bins', 'binsof', 'buf', 'bufif0', 'bufif1', 'casex', 'casez', 'chandle', 'checker', 'clocking', 'cmos', 'cover', 'covergroup', 'coverpoint', 'deassign', 'defparam', 'design', 'dist', 'endchecker', 'endclass', 'endclocking', 'endconfig', 'endgenerate', 'endgroup', 'endinterface', 'endmodule', 'endpackage', 'endprimitive', 'endprogram', 'endproperty', 'endsequence', 'endspecify', 'endtable', 'endtask', 'eventually', 'expect', 'first_match', 'forkjoin', 'genvar', 'highz0', 'highz1', 'iff', 'ifnone', 'ignore_bins', 'illegal_bins', 'incdir', 'inside', 'join_any', 'join_none', 'liblist', 'localparam', 'logic', 'longint', 'macromodule', 'modport', 'negedge', 'nexttime', 'nmos', 'noshowcancelled', 'notif0', 'notif1', 'pmos', 'posedge', 'priority', 'pull0', 'pull1', 'pulldown', 'pullup', 'pulsestyle_ondetect', 'pulsestyle_onevent', 'randc', 'randcase', 'randsequence', 'rcmos', 'realtime', 'reg', 'reject_on', 'rnmos', 'rpmos', 'rtran', 'rtranif0', 'rtranif1', 's_always', 's_eventually', 's_nexttime', 's_until', 's_until_with', 'scalared', 'shortint', 'shortreal', 'showcancelled', 'small', 'specify', 'specparam', 'strong', 'strong0', 'strong1', 'supply0', 'supply1', 'sync_accept_on', 'sync_reject_on', 'throughout', 'timeprecision', 'timeunit', 'tranif0', 'tranif1', 'tri0', 'tri1', 'triand', 'trior', 'trireg', 'unique0', 'until_with', 'untyped', 'uwire', 'vectored', 'wait_order', 'wand', 'weak0', 'weak1', 'wildcard', 'wire', 'wor', 'woshortreal'),
+    'Tads3Lexer': ('__date__', '__debug', '__file__', '__line__', '__objref', '__tads3', '__tads_macro_format_version', '__tads_sys_', '__tads_system_name', '__tads_version_major', '__tads_version_minor', '__time__', 'argcount', 'badness', 'break', 'case', 'catch', 'class', 'construct', 'continue', 'default', 'defined', 'definingobj', 'delegated', 'dictionary', 'do', 'else', 'enum', 'error', 'export', 'extern', 'finalize', 'finally', 'for', 'foreach', 'function', 'goto', 'grammar', 'grammarinfo', 'grammartag', 'if', 'in', 'inherited', 'intrinsic', 'invokee', 'is', 'lexicalparent', 'listing', 'local', 'method', 'miscvocab', 'modify', 'multimethod', 'negate', 'new', 'nil', 'not', 'object', 'operator', 'property', 'propertyset', 'replace', 'replaced', 'return', 'self', 'sourcetextgroup', 'sourcetextgroupname', 'sourcetextgrouporder', 'sourcetextorder', 'static', 'step', 'string', 'switch', 'targetobj', 'targetprop', 'template', 'throw', 'token', 'transient', 'true', 'try', 'warn', 'while', 'xmp'),
+    'TclLexer': ('after', 'append', 'apply', 'array', 'bat', 'bgerror', 'bin', 'binary', 'break', 'catch', 'cd', 'chan', 'clock', 'close', 'cmd', 'concat', 'continue', 'dde', 'dict', 'else', 'elseif', 'encoding', 'eof', 'eq', 'error', 'eval', 'exe', 'exec', 'exit', 'expr', 'fblocked', 'fconfigure', 'fcopy', 'file', 'fileevent', 'flush', 'for', 'foreach', 'format', 'gets', 'glob', 'global', 'history', 'http', 'if', 'in', 'incr', 'info', 'interp', 'join', 'lappend', 'lassign', 'lindex', 'linsert', 'list', 'llength', 'load', 'loadtk', 'lrange', 'lrepeat', 'lreplace', 'lreverse', 'lsearch', 'lset', 'lsort', 'mathfunc', 'mathop', 'memory', 'msgcat', 'namespace', 'ne', 'ni', 'open', 'package', 'pid', 'pkg_mkindex', 'platform', 'proc', 'puts', 'pwd', 're_syntax', 'read', 'refchan', 'regexp', 'registry', 'regsub', 'rename', 'return', 'scan', 'seek', 'set', 'socket', 'source', 'split', 'string', 'subst', 'switch', 'tcl', 'tell', 'then', 'time', 'tm', 'trace', 'unknown', 'unload', 'unset', 'update', 'uplevel', 'upvar', 'variable', 'vwait', 'while'),
+    'TcshLexer': ('alias', 'alloc', 'bg', 'bindkey', 'break', 'breaksw', 'builtins', 'bye', 'caller', 'case', 'cd', 'chdir', 'complete', 'continue', 'default', 'dirs', 'echo', 'echotc', 'else', 'end', 'endif', 'endsw', 'eval', 'exec', 'exit', 'fg', 'filetest', 'foreach', 'getspath', 'getxvers', 'glob', 'goto', 'hashstat', 'history', 'hup', 'if', 'inlib', 'jobs', 'kill', 'limit', 'log', 'login', 'logout', 'ls', 'migrate', 'newgrp', 'nice', 'nohup', 'notify', 'onintr', 'popd', 'printenv', 'pushd', 'rehash', 'repeat', 'rootnode', 'sched', 'set', 'setenv', 'setpath', 'settc', 'setty', 'setxvers', 'shift', 'source', 'stop', 'suspend', 'switch', 'telltc', 'then', 'time', 'umask', 'unalias', 'uncomplete', 'unhash', 'universe', 'unlimit', 'unset', 'unsetenv', 'ver', 'wait', 'warp', 'watchlog', 'where', 'which', 'while'),
+    'TexLexer': ('elax', 'nput', 'ocumentclass', 'ocumentstyle'),
+    'TwigLexer': ('and', 'block', 'defined', 'divisibleby', 'else', 'elseif', 'empty', 'endraw', 'ends', 'endverbatim', 'even', 'false', 'filter', 'importconstant', 'in', 'is', 'isif', 'iterable', 'loop', 'none', 'not', 'null', 'odd', 'or', 'parent', 'raw', 'sameasmatches', 'starts', 'true', 'verbatim', 'with', 'xor'),
+    'TypeScriptLexer': ('abstract', 'array', 'as', 'bool', 'boolean', 'break', 'byte', 'case', 'catch', 'char', 'class', 'const', 'constructor', 'continue', 'date', 'debugger', 'declare', 'decodeuri', 'decodeuricomponent', 'default', 'delete', 'do', 'document', 'double', 'else', 'encodeuri', 'encodeuricomponent', 'enum', 'error', 'eval', 'export', 'extends', 'false', 'final', 'finally', 'float', 'for', 'function', 'goto', 'if', 'implements', 'import', 'in', 'infinity', 'instanceof', 'int', 'interface', 'isfinite', 'isnan', 'let', 'long', 'math', 'module', 'nan', 'native', 'netscape', 'new', 'null', 'number', 'object', 'package', 'packages', 'parsefloat', 'parseint', 'private', 'protected', 'public', 'regexp', 'return', 'short', 'static', 'string', 'sun', 'super', 'switch', 'synchronized', 'this', 'throw', 'throws', 'transient', 'true', 'try', 'typeof', 'undefined', 'var', 'void', 'volatile', 'while', 'window', 'with'),
+    'UrbiscriptLexer': ('and_eq', 'asm', 'assert', 'at', 'auto', 'barrier', 'binary', 'bitand', 'bitor', 'bool', 'boolean', 'callmessage', 'channel', 'char', 'closure', 'code', 'comparable', 'compl', 'const', 'const_cast', 'container', 'control', 'date', 'delete', 'dictionary', 'directory', 'duration', 'dynamic_cast', 'emit', 'enumeration', 'event', 'every', 'exception', 'executable', 'explicit', 'export', 'extern', 'external', 'file', 'finalizable', 'finally', 'foreach', 'formatinfo', 'formatter', 'freezeif', 'friend', 'global', 'goto', 'group', 'hash', 'inline', 'inputstream', 'internal', 'ioservice', 'job', 'kernel', 'lazy', 'list', 'loadable', 'lobby', 'location', 'logger', 'long', 'loop', 'loopn', 'math', 'mutable', 'mutex', 'namespace', 'nil', 'not_eq', 'onleave', 'or_eq', 'orderable', 'outputstream', 'pair', 'path', 'pattern', 'position', 'primitive', 'process', 'profile', 'protected', 'pseudolazy', 'pubsub', 'rangeiterable', 'regexp', 'register', 'reinterpret_cast', 'semaphore', 'server', 'short', 'signed', 'singleton', 'sizeof', 'socket', 'stackframe', 'static_cast', 'stopif', 'stream', 'struct', 'system', 'tag', 'template', 'this', 'timeout', 'traceable', 'trajectorygenerator', 'triplet', 'tuple', 'typedef', 'typeid', 'typename', 'union', 'unsigned', 'uobject', 'using', 'uvalue', 'uvar', 'var', 'virtual', 'void', 'volatile', 'waituntil', 'wchar_t', 'whenever', 'xor', 'xor_eq'),
+    'VGLLexer': ('and', 'compile_option', 'constant', 'copy', 'create', 'declare', 'delete', 'do', 'else', 'empty', 'enable', 'endif', 'endroutine', 'endwhile', 'error', 'exists', 'false', 'file', 'global', 'if', 'join', 'library', 'line', 'locked', 'name', 'notprotected', 'null', 'object', 'on', 'or', 'prompt', 'routine', 'set', 'then', 'true', 'value', 'while', 'windows', 'with'),
+    'ValaLexer': ('abstract', 'as', 'base', 'bool', 'break', 'case', 'catch', 'char', 'class', 'const', 'construct', 'continue', 'default', 'delegate', 'delete', 'do', 'double', 'dynamic', 'el', 'else', 'endif', 'ensures', 'enum', 'errordomain', 'extern', 'false', 'finally', 'float', 'for', 'foreach', 'get', 'if', 'in', 'inline', 'int', 'int16', 'int32', 'int64', 'int8', 'interface', 'internal', 'is', 'lock', 'long', 'namespace', 'new', 'null', 'out', 'override', 'owned', 'params', 'private', 'protected', 'public', 'ref', 'requires', 'return', 'se', 'set', 'short', 'signal', 'size_t', 'sizeof', 'ssize_t', 'static', 'string', 'struct', 'switch', 'this', 'throw', 'throws', 'time_t', 'true', 'try', 'typeof', 'uchar', 'uint', 'uint16', 'uint32', 'uint64', 'uint8', 'ulong', 'unichar', 'unowned', 'ushort', 'using', 'var', 'virtual', 'void', 'volatile', 'weak', 'while', 'yield', 'yields'),
+    'VbNetAspxLexer': ('language', 'page', 'script', 'vb'),
+    'VbNetLexer': ('addhandler', 'addressof', 'alias', 'andalso', 'binary', 'boolean', 'byref', 'byte', 'byval', 'call', 'cbool', 'cbyte', 'cchar', 'cdate', 'cdbl', 'cdec', 'char', 'cint', 'clng', 'cobj', 'compare', 'const', 'csbyte', 'cshort', 'csng', 'cstr', 'ctype', 'cuint', 'culng', 'cushort', 'date', 'decimal', 'declare', 'delegate', 'dim', 'directcast', 'double', 'each', 'elseif', 'endif', 'enum', 'erase', 'error', 'event', 'exit', 'explicit', 'externalchecksum', 'externalsource', 'finally', 'friend', 'get', 'gettype', 'global', 'gosub', 'goto', 'handles', 'implements', 'imports', 'inherits', 'integer', 'interface', 'isnot', 'let', 'lib', 'like', 'long', 'loop', 'me', 'mod', 'module', 'mustinherit', 'mustoverride', 'mybase', 'myclass', 'namespace', 'narrowing', 'next', 'nothing', 'notinheritable', 'notoverridable', 'object', 'of', 'off', 'on', 'operator', 'option', 'optional', 'orelse', 'overloads', 'overridable', 'overrides', 'paramarray', 'partial', 'property', 'protected', 'raiseevent', 'readonly', 'redim', 'region', 'removehandler', 'resume', 'sbyte', 'select', 'shadows', 'shared', 'short', 'single', 'step', 'stop', 'strict', 'structure', 'sub', 'synclock', 'text', 'to', 'trycast', 'typeof', 'uinteger', 'ulong', 'ushort', 'using', 'variant', 'wend', 'when', 'widening', 'withevents', 'writeonly', 'xor'),
+    'VelocityLexer': ('end', 'false', 'foreach', 'if', 'macro', 'null', 'true'),
+    'VerilogLexer': ('accelerate', 'always_comb', 'always_ff', 'always_latch', 'autoexpand_vectornets', 'automatic', 'bits', 'bitstoreal', 'bitstoshortreal', 'buf', 'bufif0', 'bufif1', 'casex', 'casez', 'celldefine', 'cmos', 'countdrivers', 'deassign', 'default_nettype', 'defparam', 'edge', 'endcelldefine', 'endgenerate', 'endmodule', 'endpackage', 'endprimitive', 'endprotect', 'endprotected', 'endspecify', 'endtable', 'endtask', 'expand_vectornets', 'fclose', 'fdisplay', 'finish', 'fmonitor', 'fopen', 'fstrobe', 'fwrite', 'genvar', 'getpattern', 'highz0', 'highz1', 'incsave', 'itor', 'localparam', 'logic', 'longint', 'macromodule', 'medium', 'monitor', 'monitoroff', 'monitoron', 'negedge', 'nmos', 'noaccelerate', 'noexpand_vectornets', 'nokey', 'nolog', 'noremove_gatenames', 'noremove_netnames', 'notif0', 'notif1', 'nounconnected_drive', 'pmos', 'posedge', 'primitive', 'printtimescale', 'protect', 'pull0', 'pull1', 'pulldown', 'pullup', 'rcmos', 'readmemb', 'readmemh', 'realtime', 'realtobits', 'reg', 'remove_gatenames', 'remove_netnames', 'reset_count', 'reset_value', 'resetall', 'rnmos', 'rpmos', 'rtoi', 'rtran', 'rtranif0', 'rtranif1', 'scalared', 'shortint', 'shortrealtobits', 'showscopes', 'showvariables', 'showvars', 'small', 'specify', 'specparam', 'sreadmemb', 'sreadmemh', 'stime', 'strength', 'strobe', 'strong0', 'strong1', 'supply0', 'supply1', 'timeformat', 'timescale', 'tran', 'tranif0', 'tranif1', 'tri', 'tri0', 'tri1', 'triand', 'trior', 'trireg', 'unconnected_drive', 'uwire', 'vectored', 'wand', 'weak0', 'weak1', 'wire', 'woshortreal', 'xnor'),
+    'VhdlLexer': ('abs', 'access', 'after', 'alias', 'all', 'and', 'architecture', 'array', 'assert', 'attribute', 'begin', 'bit', 'bit_vector', 'block', 'body', 'boolean', 'buffer', 'bus', 'case', 'character', 'component', 'configuration', 'constant', 'delay_length', 'disconnect', 'downto', 'else', 'elsif', 'end', 'entity', 'exit', 'file', 'file_open_kind', 'file_open_status', 'for', 'function', 'generate', 'generic', 'group', 'guarded', 'if', 'impure', 'in', 'inertial', 'inout', 'integer', 'is', 'label', 'library', 'linkage', 'literal', 'loop', 'map', 'mod', 'nand', 'natural', 'new', 'next', 'nor', 'not', 'null', 'of', 'on', 'open', 'or', 'others', 'out', 'package', 'port', 'positive', 'postponed', 'procedure', 'process', 'pure', 'range', 'record', 'register', 'reject', 'return', 'rol', 'ror', 'select', 'severity', 'severity_level', 'shared', 'signal', 'sla', 'sli', 'sra', 'srl', 'std_logic', 'std_logic_vector', 'std_ulogic', 'std_ulogic_vector', 'string', 'subtype', 'then', 'time', 'to', 'transport', 'type', 'units', 'until', 'use', 'variable', 'wait', 'when', 'while', 'with', 'xnor', 'xor'),
+    'VimLexer': ('bold', 'dark', 'else', 'elseif', 'endfunction', 'endif', 'fun', 'function', 'if', 'italic', 'let', 'light', 'none', 'py', 'underline'),
+    'XQueryLexer': ('amp', 'ancestor', 'and', 'apos', 'as', 'ascending', 'at', 'attribute', 'base', 'boundary', 'by', 'case', 'cast', 'castable', 'catch', 'child', 'collation', 'construction', 'copy', 'declare', 'default', 'define', 'descendant', 'descending', 'div', 'element', 'else', 'empty', 'encoding', 'eq', 'every', 'except', 'external', 'following', 'for', 'function', 'ge', 'greatest', 'gt', 'idiv', 'if', 'import', 'in', 'inherit', 'instance', 'instruction', 'intersect', 'is', 'item', 'le', 'least', 'let', 'lt', 'mod', 'module', 'namespace', 'namespaces', 'nbsp', 'ne', 'no', 'of', 'option', 'or', 'order', 'ordered', 'ordering', 'parent', 'preceding', 'preserve', 'processing', 'quot', 'return', 'satisfies', 'schema', 'self', 'sibling', 'some', 'space', 'stable', 'strip', 'then', 'to', 'treat', 'try', 'typeswitch', 'union', 'unordered', 'uri', 'variable', 'version', 'void', 'where', 'xquery'),
+    'XmlLexer': ('cdata',),
+    'XsltLexer': ('cdata', 'xsl'),
+    'XtendLexer': ('abstract', 'after', 'assert', 'before', 'boolean', 'break', 'byte', 'case', 'catch', 'char', 'class', 'const', 'continue', 'def', 'default', 'do', 'double', 'else', 'elseif', 'endfor', 'endif', 'enum', 'extends', 'false', 'final', 'finally', 'float', 'for', 'goto', 'if', 'implements', 'import', 'instanceof', 'int', 'interface', 'long', 'native', 'new', 'null', 'package', 'private', 'protected', 'public', 'return', 'separator', 'short', 'static', 'strictfp', 'super', 'switch', 'synchronized', 'this', 'throw', 'throws', 'transient', 'true', 'try', 'void', 'volatile', 'while'),
+    'ZephirLexer': ('_cookie', '_get', '_post', '_request', '_server', '_session', 'abstract', 'array', 'bool', 'boolean', 'break', 'case', 'catch', 'char', 'class', 'const', 'continue', 'count', 'date', 'default', 'delete', 'do', 'double', 'echo', 'else', 'empty', 'enum', 'export', 'extends', 'false', 'fetch', 'final', 'finally', 'float', 'for', 'function', 'goto', 'if', 'implements', 'import', 'in', 'inline', 'instanceof', 'int', 'interface', 'isset', 'iterator', 'let', 'likely', 'long', 'loop', 'namespace', 'native', 'new', 'null', 'private', 'protected', 'public', 'range', 'require', 'return', 'reverse', 'self', 'short', 'static', 'stdclass', 'string', 'switch', 'this', 'throw', 'throws', 'transient', 'true', 'try', 'typeof', 'uchar', 'ulong', 'undefined', 'unlikely', 'unset', 'unsigned', 'use', 'var', 'void', 'volatile', 'while', 'window', 'with'),
+}
+
+if __name__ == '__main__':  # pragma: no cover
+    import os
+    import re
+    import sys
+    import types
+
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+    from pygments.lexer import include, words
+    from pygments.lexers import _iter_lexerclasses
+    from pygments.token import Comment, Keyword, Name, Operator
+
+    # the token types whose literal words tell languages apart
+    token_types = (Keyword, Name.Builtin, Name.Tag, Comment.Preproc,
+                   Operator.Word)
+    max_words = 128
+    word_re = re.compile(r'^[a-z_][a-z0-9_]+$')
+    # parts of a regular expression that are not literal text
+    non_literal_re = re.compile(r'\\.|\[(?:\\.|[^\]])*\]|\(\?[^)]*?[:>)]'
+                                r'|\{\d*,?\d*\}')
+    literal_re = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+    def literal_words(regex):
+        if isinstance(regex, words):
+            candidates = regex.words
+        else:
+            candidates = literal_re.findall(non_literal_re.sub(' ', regex))
+        return set(w.lower() for w in candidates if word_re.match(w.lower()))
+
+    def token_types_of(action):
+        """Return the token types of a rule, also of `bygroups` callbacks."""
+        if not callable(action):
+            return (action,)
+        types = ()
+        for cell in getattr(action, '__closure__', None) or ():
+            if isinstance(cell.cell_contents, tuple):
+                types += cell.cell_contents
+        return types
+
+    def analyser_words(lexer):
+        """Return the literal words of the regular expressions and strings
+        that the own ``analyse_text`` of a lexer looks for, also through the
+        helpers of `pygments.util` it calls."""
+        analyser = lexer.__dict__.get('analyse_text')
+        if analyser is None:
+            return set()
+        # unwrap the staticmethod of `make_analysator`
+        func = analyser.__func__.__closure__[0].cell_contents
+        found_words = set()
+        codes = [(func.__code__, func.__globals__)]
+        docs = set([func.__doc__])
+        seen = set()
+        while codes:
+            code, namespace = codes.pop()
+            if code in seen:
+                continue
+            seen.add(code)
+            for const in code.co_consts:
+                if hasattr(const, 'co_consts'):
+                    codes.append((const, namespace))
+                elif (isinstance(const, str) and len(const) > 2
+                      and const not in docs):
+                    found_words |= literal_words(const)
+            for name in code.co_names:
+                helper = namespace.get(name)
+                if (isinstance(helper, types.FunctionType)
+                        and helper.__module__ == 'pygments.util'):
+                    codes.append((helper.__code__, helper.__globals__))
+                    docs.add(helper.__doc__)
+        return found_words
+
+    found = {}
+    for lexer in _iter_lexerclasses(plugins=False):
+        found_words = analyser_words(lexer)
+        for rules in getattr(lexer, 'tokens', {}).values():
+            for rule in rules:
+                if (not isinstance(rule, tuple) or isinstance(rule, include)
+                        or len(rule) < 2):
+                    continue
+                if any(action in token_type
+                       for action in token_types_of(rule[1])
+                       if not callable(action)
+                       for token_type in token_types):
+                    found_words |= literal_words(rule[0])
+        found[lexer.__name__] = found_words
+
+    # keep the words that are shared by the fewest lexers
+    document_frequency = {}
+    for found_words in found.values():
+        for word in found_words:
+            document_frequency[word] = document_frequency.get(word, 0) + 1
+    fingerprints = []
+    for key, found_words in sorted(found.items()):
+        if not found_words:
+            continue
+        kept = sorted(found_words,
+                      key=lambda w: (document_frequency[w], w))[:max_words]
+        fingerprints.append('%r: %r' % (key, tuple(sorted(kept))))
+
+    # extract useful sourcecode from this file
+    with open(__file__) as fp:
+        content = fp.read()
+    header = content[:content.find('FINGERPRINTS = {')]
+    footer = content[content.find("if __name__ == '__main__':"):]
+
+    # write new file
+    with open(__file__, 'w') as fp:
+        fp.write(header)
+        fp.write('FINGERPRINTS = {\n    %s,\n}\n\n' % ',\n    '.join(fingerprints))
+        fp.write(footer)
+
+    print('=== %d lexers processed.' % len(fingerprints))
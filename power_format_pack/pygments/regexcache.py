@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+    pygments.regexcache
+    ~~~~~~~~~~~~~~~~~~~
+
+    On-disk cache of the compiled regular expressions of `RegexLexer`
+    token definitions.
+
+    The first instantiation of a lexer class compiles all regular
+    expressions of its token definitions, running `regex_opt` for every
+    `words` list on the way. For the bigger lexers that takes tens of
+    milliseconds, in every new process. This cache keeps the outcome in a
+    file per lexer module: the source of each pattern after `regex_opt`,
+    its flags and the program that ``sre_compile`` made of it. Later
+    processes hand that program straight to ``_sre.compile``, so neither
+    `regex_opt` nor the parser and compiler of the ``re`` module run.
+
+    The files are only used by the Python version that wrote them. A file
+    is thrown away when the source of its lexer module changes. Any error
+    while reading or writing a file only means the patterns are compiled
+    as usual.
+
+    :copyright: Copyright 2006-2015 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import os
+import re
+import sys
+import hashlib
+import marshal
+
+try:
+    import _sre
+    import sre_compile
+    import sre_parse
+except ImportError:  # pragma: no cover
+    _sre = None
+
+__all__ = ['RegexCache']
+
+#: changes whenever the layout of the cache files changes
+FORMAT_VERSION = 1
+
+
+def _compile_program(regex, flags):
+    """Return the arguments of ``_sre.compile`` for `regex`, like
+    ``sre_compile.compile`` computes them."""
+    parsed = sre_parse.parse(regex, flags)
+    code = sre_compile._code(parsed, flags)
+    if parsed.pattern.groups > 100:
+        raise AssertionError(
+            "sorry, but this version only supports 100 named groups")
+    groupindex = dict(parsed.pattern.groupdict)
+    indexgroup = [None] * parsed.pattern.groups
+    for name, index in groupindex.items():
+        indexgroup[index] = name
+    return (regex, flags | parsed.pattern.flags, code,
+            parsed.pattern.groups - 1, groupindex, indexgroup)
+
+
+class RegexCache(object):
+    """Compile the regular expressions of token definitions, reusing the
+    compiled programs stored in `directory` by earlier processes.
+
+    The programs of the patterns of a lexer class are stored in the file
+    of the module that defines the class, when `store` is called after
+    the token definitions of the class are processed.
+    """
+
+    #: the ``_sre`` programs only fit the interpreter that produced them
+    supported = _sre is not None and sys.version_info[0] == 2
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.version = (FORMAT_VERSION, sys.version, sys.maxunicode,
+                        getattr(_sre, 'MAGIC', None),
+                        getattr(_sre, 'CODESIZE', None))
+        self.hits = 0
+        self.misses = 0
+        # module name -> [digest of the source, entries, changed]
+        self._modules = {}
+
+    @staticmethod
+    def make_key(regex, flags):
+        """Return the key of a regular expression (a string or a `words`
+        instance) with `flags`, or None if it can't be cached."""
+        if isinstance(regex, (str, type(u''))):
+            return (regex, flags)
+        if hasattr(regex, 'words'):
+            return (tuple(regex.words), regex.prefix, regex.suffix, flags)
+        return None
+
+    @staticmethod
+    def source_digest(module_name):
+        """Return a hash of the source of the module `module_name`, or None
+        if the source can't be read."""
+        filename = getattr(sys.modules.get(module_name), '__file__', None)
+        if not filename:
+            return None
+        if filename[-4:] in ('.pyc', '.pyo') and os.path.exists(filename[:-1]):
+            filename = filename[:-1]
+        try:
+            with open(filename, 'rb') as fp:
+                return hashlib.sha1(fp.read()).hexdigest()
+        except (IOError, OSError):
+            return None
+
+    def path(self, module_name):
+        return os.path.join(self.directory, module_name + '.cache')
+
+    def _get_module(self, module_name):
+        module = self._modules.get(module_name)
+        if module is None:
+            digest = self.source_digest(module_name)
+            entries = {}
+            try:
+                with open(self.path(module_name), 'rb') as fp:
+                    data = marshal.load(fp)
+                if data[0] == self.version and data[1] == digest:
+                    entries = data[2]
+            except Exception:
+                # missing, incomplete or foreign file
+                pass
+            module = self._modules[module_name] = [digest, entries, False]
+        return module
+
+    def compile(self, lexer, regex, flags):
+        """Return the compiled pattern of `regex` (a string or a `words`
+        instance) with `flags`, for a token definition of the class
+        `lexer`."""
+        key = self.supported and self.make_key(regex, flags)
+        if not key:
+            if hasattr(regex, 'get'):
+                regex = regex.get()
+            return re.compile(regex, flags)
+        module = self._get_module(lexer.__module__)
+        program = module[1].get(key)
+        if program is not None:
+            try:
+                pattern = _sre.compile(*program)
+            except Exception:
+                del module[1][key]
+            else:
+                self.hits += 1
+                return pattern
+        self.misses += 1
+        if hasattr(regex, 'get'):
+            regex = regex.get()
+        program = _compile_program(regex, flags)
+        module[1][key] = program
+        module[2] = True
+        return _sre.compile(*program)
+
+    def store(self, lexer):
+        """Write the programs of the module of the class `lexer` to its
+        file, if new ones were compiled. Return True when the file was
+        written."""
+        module = self._modules.get(lexer.__module__)
+        if module is None or not module[2]:
+            return False
+        path = self.path(lexer.__module__)
+        tmp_path = '%s.%d.tmp' % (path, os.getpid())
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            with open(tmp_path, 'wb') as fp:
+                marshal.dump((self.version, module[0], module[1]), fp)
+            try:
+                os.rename(tmp_path, path)
+            except OSError:
+                # Windows doesn't replace an existing file
+                os.remove(path)
+                os.rename(tmp_path, path)
+        except (IOError, OSError, ValueError):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+        module[2] = False
+        return True
+
+    def clear(self):
+        """Forget the programs in memory; the files are left alone."""
+        self._modules.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return dict(hits=self.hits,
+                    misses=self.misses,
+                    hit_rate=(float(self.hits) / total) if total else 0.0,
+                    entries=sum(len(module[1])
+                                for module in self._modules.values()))
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2014-2016 Stefan van den Akker <srvandenakker.dev@gmail.com>
+#
+# This file is part of Power Format Pack.
+#
+# Power Format Pack is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# Power Format Pack is distributed in the hope that it will be
+# useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General
+# Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Power Format Pack. If not, see http://www.gnu.org/licenses/.
+
+"""
+Cache for the results of rendering Markdown to HTML and back again.
+"""
+
+import codecs
+import collections
+import hashlib
+import os
+
+from anki.utils import json
+
+import const
+
+
+class RenderCache(object):
+    """
+    Least recently used cache that maps a key to a tuple of strings. The
+    total number of characters stored is kept under `max_size`. Saved
+    entries are only loaded again by a cache with the same `version`, as
+    another version of the add-on may render the same Markdown differently.
+    """
+
+    def __init__(self, max_size, version=const.VERSION):
+        self.max_size   = max_size
+        self.version    = version
+        self.size       = 0
+        self.hits       = 0
+        self.misses     = 0
+        self._entries   = collections.OrderedDict()
+
+    @staticmethod
+    def make_key(md, render_prefs):
+        """
+        Return a hash of the Markdown `md` and the preferences that influence
+        the rendering of it.
+        """
+        assert isinstance(md, unicode), "Input `md` is not Unicode"
+        sha = hashlib.sha1(md.encode("utf8"))
+        for pref in render_prefs:
+            sha.update(u"\0{}".format(pref).encode("utf8"))
+        return unicode(sha.hexdigest())
+
+    @staticmethod
+    def entry_size(key, value):
+        return len(key) + sum(len(s) for s in value)
+
+    def get(self, key):
+        """
+        Return the value stored for `key`, or `None` when there is none.
+        """
+        value = self._entries.pop(key, None)
+        if value is None:
+            self.misses += 1
+            return None
+        # put the entry back as the most recently used one
+        self._entries[key] = value
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Store the tuple `value` under `key`. Remove the least recently used
+        entries until the cache fits in its memory budget.
+        """
+        old_value = self._entries.pop(key, None)
+        if old_value is not None:
+            self.size -= self.entry_size(key, old_value)
+        size = self.entry_size(key, value)
+        if size > self.max_size:
+            return
+        self._entries[key] = tuple(value)
+        self.size += size
+        while self.size > self.max_size:
+            (old_key, old_value) = self._entries.popitem(last=False)
+            self.size -= self.entry_size(old_key, old_value)
+
+    def clear(self):
+        self._entries.clear()
+        self.size = 0
+
+    def stats(self):
+        """
+        Return a dictionary with information about the use of the cache.
+        """
+        total = self.hits + self.misses
+        return dict(hits=self.hits,
+                    misses=self.misses,
+                    hit_rate=(float(self.hits) / total) if total else 0.0,
+                    entries=len(self._entries),
+                    size=self.size,
+                    max_size=self.max_size)
+
+    def save(self, path):
+        """
+        Write the entries to the file `path`, least recently used first,
+        together with the version of the cache.
+        """
+        entries = [[key] + list(value)
+                   for (key, value) in self._entries.items()]
+        data = dict(version=self.version, entries=entries)
+        with codecs.open(path, "w", encoding="utf8") as f:
+            f.write(json.dumps(data))
+
+    def load(self, path):
+        """
+        Read entries from the file `path`. A missing or corrupted file, or
+        one saved by a cache with another version, leaves the cache
+        untouched. Return `True` when the entries of the file were read.
+        """
+        if not os.path.exists(path):
+            return False
+        try:
+            with codecs.open(path, encoding="utf8") as f:
+                data = json.loads(f.read())
+        except (ValueError, IOError) as e:
+            print e  # TODO: log error
+            return False
+        if not isinstance(data, dict) or data.get("version") != self.version:
+            return False
+        for entry in data.get("entries", ()):
+            if (isinstance(entry, list) and len(entry) > 1 and
+                    all(isinstance(s, unicode) for s in entry)):
+                self.put(entry[0], entry[1:])
+        return True
+
+
+RENDER_CACHE = RenderCache(const.RENDER_CACHE_MAX_SIZE)
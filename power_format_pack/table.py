@@ -34,7 +34,7 @@ class Table(object):
         self.editor_instance    = other
         self.parent_window      = parent_window
         self.selected_text      = selected_text
-        self.c                  = utility.get_config_parser()
+        self.c                  = utility.get_config()
         self.p                  = preferences.PREFS
 
         if self.p.get(const.STYLE_TABLE):
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+
+# the add-on imports Pygments as a top level package
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+from pygments import lexer
+from pygments.regexcache import RegexCache
+
+# rendering Markdown keeps the compiled regular expressions of the lexers in
+# the add-on folder, unless there already is a cache
+REGEX_CACHE_DIR = tempfile.mkdtemp()
+atexit.register(shutil.rmtree, REGEX_CACHE_DIR, True)
+lexer.regex_cache = RegexCache(REGEX_CACHE_DIR)
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import sys
+if "/usr/share/anki/" not in sys.path:
+    sys.path.append("/usr/share/anki/")
+from power_format_pack import utility
+from power_format_pack import const
+from power_format_pack import preferences
+from power_format_pack.batchmarkdown import convert_field_to_markdown
+
+
+class BatchMarkdownTester(unittest.TestCase):
+
+    def setUp(self):
+        preferences.PREFS = {const.MARKDOWN_SYNTAX_STYLE: "tango",
+                             const.MARKDOWN_LINE_NUMS: False,
+                             const.MARKDOWN_CODE_DIRECTION: const.LEFT}
+
+    # convert_field_to_markdown
+    def test_convert_field_to_markdown_returns_none_when_field_is_empty(self):
+        self.assertIsNone(convert_field_to_markdown(u"", "1-000"))
+
+    def test_convert_field_to_markdown_returns_none_when_field_contains_data(self):
+        html = utility.make_data_ready_to_insert(
+                "1-000", "True", u"**a**", u"<p><strong>a</strong></p>")
+        self.assertIsNone(convert_field_to_markdown(html, "1-000"))
+
+    def test_convert_field_to_markdown_returns_html_with_stored_markdown(self):
+        result      = convert_field_to_markdown(u"<div>**пицца**</div>", "1-000")
+        self.assertTrue(result.startswith(u"<p><strong>пицца</strong></p>"))
+        data        = utility.decompress_and_json_load(
+                        utility.get_md_data_from_string(result))
+        self.assertEqual(u"1-000", data.get("id"))
+        self.assertEqual(u"True", data.get("isconverted"))
+        self.assertEqual(u"**пицца**\n", data.get("md"))
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+import os
+import subprocess
+import sys
+import unittest
+
+from power_format_pack.benchmarks.importtime import HEAVY_MODULES, \
+    ImportTimer
+from power_format_pack.benchmarks.report import compare
+
+
+class ReportTester(unittest.TestCase):
+
+    # compare
+    def test_compare_marks_changes_larger_than_threshold(self):
+        old         = dict(timings={u"a": 1.0, u"b": 1.0, u"c": 1.0})
+        new         = dict(timings={u"a": 1.2, u"b": 0.8, u"c": 1.05})
+        expected    = [u"regression", u"improvement", u""]
+        result      = [row[4] for row in compare(old, new, threshold=0.1)]
+        self.assertEqual(expected, result)
+
+    def test_compare_ignores_keys_that_are_not_in_both_results(self):
+        old         = dict(timings={u"a": 1.0, u"b": 1.0})
+        new         = dict(timings={u"b": 1.0, u"c": 1.0})
+        expected    = [u"b"]
+        result      = [row[0] for row in compare(old, new)]
+        self.assertEqual(expected, result)
+
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))))
+
+
+class ImportTimerTester(unittest.TestCase):
+
+    # ImportTimer
+    def test_import_timer_records_modules_imported_in_body(self):
+        sys.modules.pop("power_format_pack.benchmarks.corpus", None)
+        with ImportTimer() as timer:
+            __import__("power_format_pack.benchmarks.corpus")
+        names = [name for entry in timer.entries for name in entry[1]]
+        self.assertIn("power_format_pack.benchmarks.corpus", names)
+        self.assertTrue(all(entry[2] >= 0 for entry in timer.entries))
+
+    def test_import_timer_restores_import_function(self):
+        import __builtin__
+        original = __builtin__.__import__
+        with ImportTimer():
+            pass
+        self.assertIs(original, __builtin__.__import__)
+
+    # main
+    def test_main_reports_no_heavy_module_imported_with_add_on(self):
+        # in a new interpreter, as the tests have imported them already
+        command = [sys.executable, "-m",
+                   "power_format_pack.benchmarks.importtime",
+                   "--min-us", "1000000"]
+        output = subprocess.check_output(command, cwd=REPO_DIR,
+                                         stderr=subprocess.STDOUT)
+        for name in HEAVY_MODULES:
+            self.assertIn("{:<15} not imported".format(name), output)
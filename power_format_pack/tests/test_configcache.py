@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import sys
+if "/usr/share/anki/" not in sys.path:
+    sys.path.append("/usr/share/anki/")
+from power_format_pack import const
+from power_format_pack.configcache import ConfigCache
+
+
+class ConfigCacheTester(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "config.ini")
+        self.write_config(u"Pizza")
+        self.config = ConfigCache(self.path, check_interval=0)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write_config(self, label, mtime=None):
+        with open(self.path, "w") as f:
+            f.write("[{}]\nlabel = {}\n\n[{}]\ntip = Tip\n".format(
+                const.CONFIG_LABELS, label, const.CONFIG_TOOLTIPS))
+        if mtime is not None:
+            os.utime(self.path, (mtime, mtime))
+
+    # parser
+    def test_parser_returns_same_parser_when_file_has_not_changed(self):
+        first       = self.config.parser()
+        second      = self.config.parser()
+        self.assertIs(first, second)
+
+    def test_parser_reads_file_again_when_mtime_changes(self):
+        self.write_config(u"Pizza", mtime=1000)
+        self.assertEqual(u"Pizza", self.config.label("label"))
+        self.write_config(u"Pasta", mtime=2000)
+        self.assertEqual(u"Pasta", self.config.label("label"))
+
+    def test_parser_does_not_check_file_within_check_interval(self):
+        config = ConfigCache(self.path, check_interval=3600)
+        self.write_config(u"Pizza", mtime=1000)
+        self.assertEqual(u"Pizza", config.label("label"))
+        self.write_config(u"Pasta", mtime=2000)
+        self.assertEqual(u"Pizza", config.label("label"))
+
+    def test_parser_throws_exception_when_file_does_not_exist(self):
+        config = ConfigCache(os.path.join(self.tmp_dir, "missing.ini"))
+        self.assertRaises(Exception, config.parser)
+
+    # tooltip
+    def test_tooltip_returns_value_from_tooltips_section(self):
+        self.assertEqual(u"Tip", self.config.tooltip("tip"))
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import unittest
+
+import sys
+if "/usr/share/anki/" not in sys.path:
+    sys.path.append("/usr/share/anki/")
+from power_format_pack import utility
+from power_format_pack.html2text import html2text
+from power_format_pack.htmltomarkdown import HTMLToMarkdown, MarkdownLineFilter
+
+
+class MarkdownLineFilterTester(unittest.TestCase):
+
+    # write
+    def test_write_joins_lines_that_are_written_in_pieces(self):
+        sink        = MarkdownLineFilter()
+        for piece in (u"пи", u"цца\n\n\nan", u"d", u"\nmore"):
+            sink.write(piece)
+        expected    = u"пицца\nand\nmore\n"
+        result      = sink.close()
+        self.assertEqual(expected, result)
+
+    def test_write_keeps_empty_lines_when_keep_empty_lines_is_true(self):
+        sink        = MarkdownLineFilter(keep_empty_lines=True)
+        sink.write(u"a\n\n")
+        sink.write(u"b")
+        expected    = u"a\n\nb"
+        result      = sink.close()
+        self.assertEqual(expected, result)
+
+    def test_write_undoes_escaping_of_dots_after_numbers(self):
+        sink        = MarkdownLineFilter()
+        sink.write(u"1\\")
+        sink.write(u". one\n2\\.\n")
+        expected    = u"1. one\n2.\n"
+        result      = sink.close()
+        self.assertEqual(expected, result)
+
+    def test_write_replaces_nbsp_placeholder_with_space(self):
+        sink        = MarkdownLineFilter()
+        sink.write(u"&nbsp_place_holder;\na&nbsp_place_holder;b\n")
+        expected    = u" \na b\n"
+        result      = sink.close()
+        self.assertEqual(expected, result)
+
+
+class HTMLToMarkdownTester(unittest.TestCase):
+
+    # convert
+    def test_convert_returns_same_markdown_when_converter_is_reused(self):
+        converter   = HTMLToMarkdown()
+        html        = u"<ol><li>one</li><li>two</li></ol><a href='x'>link</a>"
+        expected    = converter.convert(html)
+        converter.convert(u"<ul><li><b>other</b></li></ul>")
+        result      = converter.convert(html)
+        self.assertEqual(expected, result)
+
+    def test_convert_does_not_escape_markdown_characters(self):
+        converter   = HTMLToMarkdown()
+        expected    = u"# one\n1. two\n"
+        result      = converter.convert(u"# one<div>1. two</div>")
+        self.assertEqual(expected, result)
+
+    def test_convert_uses_html2text_escaping_when_options_are_empty(self):
+        converter   = HTMLToMarkdown(options=dict())
+        result      = converter.convert(u"<div>+ two</div>")
+        self.assertIn(u"\\+ two", result)
+        self.assertIs(html2text.escape_md_section,
+                      html2text.HTML2Text().escape_md_section)
+
+    # get_html_to_markdown_converter
+    def test_get_html_to_markdown_converter_returns_converter_per_thread(self):
+        converters  = list()
+        thread      = threading.Thread(target=lambda: converters.append(
+                        utility.get_html_to_markdown_converter()))
+        thread.start()
+        thread.join()
+        self.assertIs(utility.get_html_to_markdown_converter(),
+                      utility.get_html_to_markdown_converter())
+        self.assertIsNot(utility.get_html_to_markdown_converter(),
+                         converters[0])
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+import os
+import unittest
+
+import sys
+if "/usr/share/anki/" not in sys.path:
+    sys.path.append("/usr/share/anki/")
+# the add-on imports Pygments as a top level package
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+from pygments import format as format_tokens
+from pygments.filter import Filter, apply_filters
+from pygments.filters import CoalesceFilter
+from pygments.formatters import HtmlFormatter
+from pygments.incremental import IncrementalHighlighter
+from pygments.lexers import (_iter_lexerclasses, get_lexer_by_name,
+                             PythonConsoleLexer)
+
+from .test_lexer_engine import SAMPLE, SLOW_LEXERS
+
+
+CODE = u"".join(u"def f{0}(x):\n    return x + {0}  # {0}\n\n".format(i)
+                for i in range(50))
+
+
+class CountingFilter(Filter):
+
+    def __init__(self, **options):
+        Filter.__init__(self, **options)
+        self.count = 0
+
+    def filter(self, lexer, stream):
+        for ttype, value in stream:
+            self.count += 1
+            yield ttype, value
+
+
+class IncrementalTester(unittest.TestCase):
+
+    def setUp(self):
+        self.highlighter = IncrementalHighlighter()
+        self.formatter   = HtmlFormatter(style="tango", noclasses=True)
+
+    def highlight(self, text, lexer, filters=()):
+        return self.highlighter.highlight(text, lexer, self.formatter,
+                                          filters)
+
+    def full_highlight(self, text, lexer, filters=()):
+        tokens = apply_filters(lexer.get_tokens(text), filters, lexer)
+        return format_tokens(tokens, self.formatter)
+
+    def assertSameAsFull(self, lexer_name, texts):
+        lexer = get_lexer_by_name(lexer_name)
+        for text in texts:
+            filters = [CoalesceFilter(style="tango")]
+            self.assertEqual(self.full_highlight(text, lexer, filters),
+                             self.highlight(text, lexer, filters))
+
+    def test_edited_lines_give_same_html_as_full_highlight(self):
+        self.assertSameAsFull("python", [
+            CODE,
+            CODE.replace(u"return x + 20", u"return 'x' + 20"),
+            CODE.replace(u"def f20(x):\n", u"def f20(x):\n    x = 1\n"),
+            CODE.replace(u"    return x + 30  # 30\n", u""),
+            CODE.replace(u"# 40", u'"""'),
+            CODE])
+
+    def test_edits_that_change_earlier_tokens_give_same_html(self):
+        # the docstring rule of Python looks ahead across blank lines
+        self.assertSameAsFull("python", [
+            u'x = 1\n\n\n\n"""doc\nstring"""\n',
+            u'x = 1\n\n\n\n"""doc\nstring"""\n'.replace(u"x = 1", u"if x:"),
+            u'x = 1\n\n\n\n"""doc\nstring"""\n'])
+        self.assertSameAsFull("c", [
+            u"int a;\n/* a\n   b */\nint c;\n",
+            u"int a;\n/* a\n   b\nint c;\n",
+            u"int a;\n   b */\nint c;\n"])
+
+    def test_small_edit_only_formats_few_lines_again(self):
+        lexer = get_lexer_by_name("python")
+        self.highlight(CODE, lexer)
+        counter = CountingFilter()
+        self.highlight(CODE.replace(u"x + 25", u"y + 25"), lexer, [counter])
+        self.assertTrue(0 < counter.count < 40, counter.count)
+
+    def test_small_edit_is_lexed_again_from_few_lines_before(self):
+        lexer = get_lexer_by_name("python")
+        self.highlight(CODE, lexer)
+        starts = list()
+        get_tokens_from = lexer.get_tokens_from
+
+        def record_start(text, pos, stack, line_states):
+            starts.append(pos)
+            return get_tokens_from(text, pos, stack, line_states)
+
+        lexer.get_tokens_from = record_start
+        edited      = CODE.replace(u"x + 45", u"y + 45")
+        self.assertEqual(self.full_highlight(edited, lexer),
+                         self.highlight(edited, lexer))
+        line        = CODE[:CODE.index(u"x + 45")].count(u"\n")
+        first_line  = edited[:starts[0]].count(u"\n")
+        self.assertEqual(1, len(starts))
+        self.assertTrue(0 < line - first_line <= 20, first_line)
+
+    def test_same_text_is_not_formatted_again(self):
+        lexer = get_lexer_by_name("python")
+        html = self.highlight(CODE, lexer)
+        counter = CountingFilter()
+        self.assertEqual(html, self.highlight(CODE, lexer, [counter]))
+        self.assertEqual(0, counter.count)
+
+    def test_texts_with_other_key_are_not_reused(self):
+        lexer = get_lexer_by_name("python")
+        self.highlighter.highlight(CODE, lexer, self.formatter, key=1)
+        self.highlighter.highlight(CODE, lexer, self.formatter, key=2)
+        stats = self.highlighter.stats()
+        self.assertEqual(0, stats["hits"])
+        self.assertEqual(2, stats["misses"])
+        self.assertEqual(2, stats["entries"])
+
+    def test_keeps_at_most_max_texts(self):
+        self.highlighter = IncrementalHighlighter(max_texts=2)
+        lexer = get_lexer_by_name("python")
+        for i in range(3):
+            self.highlighter.highlight(CODE, lexer, self.formatter, key=i)
+        self.assertEqual(2, self.highlighter.stats()["entries"])
+        self.highlighter.clear()
+        self.assertEqual(0, self.highlighter.stats()["entries"])
+
+    def test_supports_only_plain_regex_lexers(self):
+        self.assertTrue(IncrementalHighlighter.supports(
+                get_lexer_by_name("python")))
+        self.assertFalse(IncrementalHighlighter.supports(
+                get_lexer_by_name("ruby")))
+        self.assertFalse(IncrementalHighlighter.supports(
+                PythonConsoleLexer()))
+
+    def test_edits_give_same_html_for_bundled_lexers(self):
+        lines = SAMPLE.splitlines(True)
+        middle = len(lines) // 2
+        edited = u"".join(lines[:middle] + [u"x = 'a\n"] + lines[middle:])
+        different = list()
+        for lexer_class in _iter_lexerclasses(plugins=False):
+            if lexer_class.__name__ in SLOW_LEXERS:
+                continue
+            lexer = lexer_class()
+            if not IncrementalHighlighter.supports(lexer):
+                continue
+            self.highlighter.clear()
+            for text in (SAMPLE, edited, SAMPLE):
+                if (self.highlight(text, lexer) !=
+                        self.full_highlight(text, lexer)):
+                    different.append(lexer_class.__name__)
+                    break
+        self.assertEqual([], different)
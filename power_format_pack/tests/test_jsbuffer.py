@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import sys
+if "/usr/share/anki/" not in sys.path:
+    sys.path.append("/usr/share/anki/")
+from power_format_pack.jsbuffer import JSCommandBuffer
+
+
+class FakeFrame(object):
+
+    def __init__(self, web):
+        self.web = web
+
+    def evaluateJavaScript(self, js):
+        self.web.calls.append(js)
+        return u"result"
+
+
+class FakeWeb(object):
+
+    def __init__(self):
+        self.calls = list()
+
+    def eval(self, js):
+        self.calls.append(js)
+
+    def page(self):
+        return self
+
+    def mainFrame(self):
+        return FakeFrame(self)
+
+
+class JSCommandBufferTester(unittest.TestCase):
+
+    def setUp(self):
+        self.web = FakeWeb()
+        self.buffer = JSCommandBuffer(self.web)
+
+    # eval
+    def test_eval_evaluates_js_right_away_outside_of_batch(self):
+        self.buffer.eval(u"a();")
+        self.buffer.eval(u"b();")
+        self.assertEqual([u"a();", u"b();"], self.web.calls)
+
+    # batch
+    def test_batch_evaluates_all_snippets_in_one_call(self):
+        with self.buffer.batch():
+            self.buffer.eval(u"a();")
+            self.buffer.eval(u"b();")
+            self.assertEqual([], self.web.calls)
+        self.assertEqual(1, len(self.web.calls))
+        self.assertLess(self.web.calls[0].index(u"a();"),
+                        self.web.calls[0].index(u"b();"))
+
+    def test_batch_flushes_at_end_of_outermost_batch(self):
+        with self.buffer.batch():
+            with self.buffer.batch():
+                self.buffer.eval(u"a();")
+            self.assertEqual([], self.web.calls)
+            self.buffer.eval(u"b();")
+        self.assertEqual(1, len(self.web.calls))
+
+    def test_batch_flushes_when_exception_is_raised(self):
+        try:
+            with self.buffer.batch():
+                self.buffer.eval(u"a();")
+                raise ValueError
+        except ValueError:
+            pass
+        self.assertEqual(1, len(self.web.calls))
+        self.buffer.eval(u"b();")
+        self.assertEqual(u"b();", self.web.calls[-1])
+
+    # flush
+    def test_flush_does_not_evaluate_anything_when_buffer_is_empty(self):
+        self.buffer.flush()
+        self.assertEqual([], self.web.calls)
+
+    # evaluate
+    def test_evaluate_flushes_snippets_before_reading(self):
+        with self.buffer.batch():
+            self.buffer.eval(u"a();")
+            result = self.buffer.evaluate(u"b();")
+        self.assertEqual(u"result", result)
+        self.assertEqual(2, len(self.web.calls))
+        self.assertIn(u"a();", self.web.calls[0])
+        self.assertEqual(u"b();", self.web.calls[1])
+
+    # join
+    def test_join_runs_every_snippet_in_its_own_function(self):
+        expected    = 2
+        result      = JSCommandBuffer.join([u"a();", u"b();"]).count(u"try {")
+        self.assertEqual(expected, result)
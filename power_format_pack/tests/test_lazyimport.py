@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+import sys
+import unittest
+
+if "/usr/share/anki/" not in sys.path:
+    sys.path.append("/usr/share/anki/")
+from power_format_pack import utility
+from power_format_pack import const
+from power_format_pack.lazyimport import LazyAttribute, LazyModule
+
+
+class LazyImportTester(unittest.TestCase):
+
+    # LazyModule
+    def test_lazy_module_is_not_loaded_before_first_use(self):
+        module = LazyModule("colorsys", globals())
+        self.assertFalse(module.is_loaded)
+
+    def test_lazy_module_loads_module_on_attribute_access(self):
+        module = LazyModule("colorsys", globals())
+        self.assertEqual((0.0, 0.0, 1.0), module.rgb_to_hsv(1.0, 1.0, 1.0))
+        self.assertTrue(module.is_loaded)
+
+    def test_lazy_module_returns_submodule_of_dotted_name(self):
+        module = LazyModule("os.path", globals())
+        self.assertIs(sys.modules["os.path"], module.load())
+
+    def test_lazy_module_finds_module_relative_to_importer(self):
+        module = LazyModule("const", vars(utility))
+        self.assertIs(const, module.load())
+
+    # LazyAttribute
+    def test_lazy_attribute_calls_attribute_of_module(self):
+        join = LazyAttribute("os.path", "join", globals())
+        self.assertEqual(u"a/b", join(u"a", u"b"))
+
+    # utility
+    def test_utility_renders_markdown_through_lazy_imports(self):
+        expected    = u"<p><strong>a</strong></p>"
+        result      = utility.convert_markdown_to_html(u"**a**")
+        self.assertEqual(expected, result)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+import os
+import unittest
+
+import sys
+if "/usr/share/anki/" not in sys.path:
+    sys.path.append("/usr/share/anki/")
+# the add-on imports Pygments as a top level package
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+from pygments.lexer import RegexLexer, bygroups, default, include, words
+from pygments.lexers import _iter_lexerclasses, get_lexer_by_name
+from pygments.token import Keyword, Name, Number, Punctuation, String, Text
+
+
+# a bit of many languages, so that most lexers get through many of their
+# states
+SAMPLE = u"""\
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+<!DOCTYPE html>
+<html lang="en"><head><style>p { color: #fff; margin: 0 1em; }</style>
+<script type="text/javascript">var x = /a+b/g.test("s"); // c</script>
+</head><body><p class='a'>Text &amp; more</p><!-- comment --></body></html>
+import os, re
+from . import x as y
+@decorator(1)
+def f(a, *args, **kwargs):
+    \"\"\"Docstring.\"\"\"
+    s = 'single' + "double %s" % u'ü' + r'\\d+' + b'\\x00'
+    return [i ** 2 for i in range(10) if i % 2 == 0]  # comment
+class A(object):
+    pass
+int main(void) { printf("%d\\n", 42); return 0x1F + 1.5e3; }
+/* block
+   comment */
+SELECT a, COUNT(*) FROM t WHERE b = 'x' GROUP BY a;
+echo "$HOME" ${VAR:-default} $(ls -l | grep foo) `date` <<EOF
+heredoc
+EOF
+[section]
+key = value ; comment
+(define (square x) (* x x))
+{"json": [1, 2.0, true, null, "\\u00e9"]}
+x := y -> z => w <= 3 >= 4 != 5 == 6 && !a || b
+\\begin{document} $x^2$ \\end{document}
+"""
+
+# lexers that take very long for SAMPLE, with either engine
+SLOW_LEXERS = frozenset(["ScssLexer"])
+
+
+class EngineTester(unittest.TestCase):
+
+    def make_lexer_class(self):
+        class TestLexer(RegexLexer):
+            tokens = {
+                'root': [
+                    include('whitespace'),
+                    (words(('if', 'else'), suffix=r'\b'), Keyword),
+                    (r'(def)(\s+)([a-z]+)', bygroups(Keyword, Text, Name)),
+                    (r'(["\'])(.*?)\1', String),
+                    (r'\d+', Number, 'number'),
+                    (r'[a-z]+', Name),
+                    (r'[()]', Punctuation),
+                ],
+                'number': [
+                    (r'\.\d+', Number),
+                    default('#pop'),
+                ],
+                'whitespace': [
+                    (r'\s+', Text),
+                ],
+            }
+        return TestLexer
+
+    def test_combined_engine_gives_same_tokens(self):
+        code = u"if def f('a' \"b\") 1.5 x else 2 $\n"
+        lexer_class = self.make_lexer_class()
+        self.assertEqual(list(lexer_class().get_tokens(code)),
+                         list(lexer_class(engine="combined").get_tokens(code)))
+
+    def test_combined_engine_combines_rules_without_group_references(self):
+        lexer = self.make_lexer_class()(engine="combined")
+        list(lexer.get_tokens(u"x"))
+        tokendefs = type(lexer).get_combined_tokendefs(lexer._tokens)
+        scanners = tokendefs["root"]
+        # the rule with a back reference splits the state in three
+        self.assertEqual(3, len(scanners))
+        self.assertEqual(3, len(scanners[0][1]))
+        self.assertIsNone(scanners[1][1])
+        self.assertEqual(3, len(scanners[2][1]))
+
+    def test_rules_engine_is_default(self):
+        self.assertEqual("rules", get_lexer_by_name("python").engine)
+
+    def test_combined_engine_gives_same_tokens_for_bundled_lexers(self):
+        different = list()
+        for lexer_class in _iter_lexerclasses(plugins=False):
+            if (not issubclass(lexer_class, RegexLexer) or
+                    lexer_class.__name__ in SLOW_LEXERS):
+                continue
+            expected = list(lexer_class().get_tokens(SAMPLE))
+            result = list(lexer_class(engine="combined").get_tokens(SAMPLE))
+            if result != expected:
+                different.append(lexer_class.__name__)
+        self.assertEqual([], different)
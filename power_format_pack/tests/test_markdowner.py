@@ -8,6 +8,7 @@ import time
 import sys
 if "/usr/share/anki/" not in sys.path:
     sys.path.append("/usr/share/anki/")
+from power_format_pack import utility
 from power_format_pack.markdowner import Markdowner
 
 
@@ -53,3 +54,25 @@ class MarkdownerTester(unittest.TestCase):
         self.assertRaises(AttributeError, getattr, markdowner, "_html")
         self.assertRaises(AttributeError, getattr, markdowner, "isconverted")
         self.assertRaises(AttributeError, getattr, markdowner, "_lastmodified")
+
+    def test_get_data_from_field_only_reads_header_when_data_has_header(self):
+        html        = utility.make_data_ready_to_insert(
+                        "1-000", "True", u"**пицца**", u"<p>пицца</p>")
+        markdowner  = Markdowner(html, 0)
+        expected    = True
+        result      = markdowner.get_data_from_field()
+        self.assertEqual(expected, result)
+
+        self.assertEqual("True", markdowner.isconverted)
+        self.assertIsNone(markdowner._md)
+        self.assertRaises(AttributeError, getattr, markdowner, "_id")
+
+    def test_md_is_decoded_when_it_is_first_used(self):
+        html        = utility.make_data_ready_to_insert(
+                        "1-000", "True", u"**пицца**", u"<p>пицца</p>")
+        markdowner  = Markdowner(html, 0)
+        markdowner.get_data_from_field()
+
+        self.assertEqual(u"**пицца**", markdowner.md)
+        self.assertEqual(u"1-000", markdowner._id)
+        self.assertEqual("True", markdowner.isconverted)
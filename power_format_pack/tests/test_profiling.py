@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import sys
+if "/usr/share/anki/" not in sys.path:
+    sys.path.append("/usr/share/anki/")
+from power_format_pack import profiling
+from power_format_pack.profiling import Profiler, StageHistogram
+
+
+class FakeClock(object):
+
+    def __init__(self, step):
+        self.step   = step
+        self.now    = 0.0
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+class ProfilingTester(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = Profiler(enabled=True, clock=FakeClock(0.002))
+
+    # monotonic
+    def test_monotonic_never_goes_back(self):
+        first       = profiling.monotonic()
+        second      = profiling.monotonic()
+        self.assertTrue(second >= first)
+
+    # StageHistogram
+    def test_add_counts_time_in_bucket_of_smallest_larger_bound(self):
+        histogram = StageHistogram((1, 10))
+        histogram.add(0.5)
+        histogram.add(1)
+        histogram.add(5)
+        histogram.add(50)
+        self.assertEqual([2, 1, 1], histogram.buckets)
+        self.assertEqual(4, histogram.count)
+        self.assertEqual(0.5, histogram.min)
+        self.assertEqual(50, histogram.max)
+
+    def test_to_dict_returns_mean_and_labelled_buckets(self):
+        histogram = StageHistogram((1, 10))
+        histogram.add(2)
+        histogram.add(4)
+        result      = histogram.to_dict()
+        self.assertEqual(3.0, result["mean_ms"])
+        self.assertEqual({u"<=1": 0, u"<=10": 2, u">10": 0}, result["buckets"])
+
+    # stage
+    def test_stage_records_time_spent_in_body(self):
+        with self.profiler.stage(u"stage"):
+            pass
+        histogram = self.profiler.histograms[u"stage"]
+        self.assertEqual(1, histogram.count)
+        self.assertAlmostEqual(2.0, histogram.total)
+
+    def test_stage_records_time_when_body_raises(self):
+        def raise_in_stage():
+            with self.profiler.stage(u"stage"):
+                raise ValueError()
+        self.assertRaises(ValueError, raise_in_stage)
+        self.assertEqual(1, self.profiler.histograms[u"stage"].count)
+
+    def test_stage_records_nothing_when_disabled(self):
+        self.profiler.enabled = False
+        with self.profiler.stage(u"stage"):
+            pass
+        self.assertEqual({}, self.profiler.histograms)
+
+    # profile
+    def test_profile_records_time_under_module_and_function_name(self):
+        @self.profiler.profile
+        def double(x):
+            return 2 * x
+        self.assertEqual(4, double(2))
+        self.assertEqual([u"test_profiling.double"],
+                         self.profiler.histograms.keys())
+
+    def test_profile_records_nothing_when_disabled(self):
+        @self.profiler.profile
+        def double(x):
+            return 2 * x
+        self.profiler.enabled = False
+        self.assertEqual(4, double(2))
+        self.assertEqual({}, self.profiler.histograms)
+
+    # dump
+    def test_dump_writes_histograms_as_json(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp_dir, "profiling.json")
+            with self.profiler.stage(u"stage"):
+                pass
+            self.profiler.dump(path)
+            with open(path) as f:
+                result = json.load(f)
+            self.assertEqual([u"stage"], result.keys())
+            self.assertEqual(1, result[u"stage"][u"count"])
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    # clear
+    def test_clear_removes_histograms(self):
+        with self.profiler.stage(u"stage"):
+            pass
+        self.profiler.clear()
+        self.assertEqual({}, self.profiler.stats())
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import unittest
+
+import sys
+if "/usr/share/anki/" not in sys.path:
+    sys.path.append("/usr/share/anki/")
+# the add-on imports Pygments as a top level package
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+from pygments import highlight
+from pygments.filters import CoalesceFilter
+from pygments.formatters import HtmlFormatter
+from pygments.formatters import html as html_formatter
+from pygments.lexers import get_lexer_by_name, guess_lexer, \
+    guess_lexer_fast
+from pygments.util import ClassNotFound
+from pygments.token import Error, Keyword, Name, Text
+from power_format_pack.markdown.extensions.codehilite import CodeHilite, \
+    LexerCache
+
+
+class PygmentsTester(unittest.TestCase):
+
+    def setUp(self):
+        self.lexer = get_lexer_by_name("python")
+
+    # HtmlFormatter._create_stylesheet
+    def test_formatters_with_same_style_share_stylesheet(self):
+        first       = HtmlFormatter(style="tango", noclasses=True)
+        second      = HtmlFormatter(style="tango", linenos=True)
+        self.assertIs(first.class2style, second.class2style)
+        self.assertIs(first.ttype2class, second.ttype2class)
+
+    def test_formatters_with_other_style_or_prefix_have_own_stylesheet(self):
+        tango       = HtmlFormatter(style="tango")
+        monokai     = HtmlFormatter(style="monokai")
+        prefixed    = HtmlFormatter(style="tango", classprefix="x-")
+        self.assertIsNot(tango.class2style, monokai.class2style)
+        self.assertIsNot(tango.class2style, prefixed.class2style)
+        self.assertIn(u"x-k", prefixed.class2style)
+
+    def test_shared_stylesheet_gives_same_html_as_new_one(self):
+        code = u"def f(x):\n    return x + 1  # add\n"
+        formatter = HtmlFormatter(style="emacs", noclasses=True)
+        expected    = highlight(code, self.lexer, formatter)
+        del html_formatter._stylesheet_cache[
+                (HtmlFormatter, formatter.style, u"")]
+        result      = highlight(code, self.lexer,
+                                HtmlFormatter(style="emacs", noclasses=True))
+        self.assertEqual(expected, result)
+        self.assertIn(u'<span style="', result)
+
+    # get_lexer_by_name
+    def test_get_lexer_by_name_finds_lexer_by_alias_in_any_case(self):
+        self.assertEqual(u"Python", get_lexer_by_name("py").name)
+        self.assertEqual(u"Python", get_lexer_by_name("PYTHON").name)
+
+    def test_get_lexer_by_name_raises_class_not_found_for_unknown_alias(self):
+        self.assertRaises(ClassNotFound, get_lexer_by_name, "no-such-language")
+
+    # guess_lexer_fast
+    def test_guess_lexer_fast_uses_modeline(self):
+        code = u"# vim: set ft=ruby:\nx = 1\n"
+        self.assertEqual(u"Ruby", guess_lexer_fast(code).name)
+
+    def test_guess_lexer_fast_uses_shebang_with_env_and_version(self):
+        self.assertEqual(u"Bash",
+                         guess_lexer_fast(u"#!/usr/bin/env bash\nls\n").name)
+        self.assertEqual(u"Python 3",
+                         guess_lexer_fast(u"#!/usr/bin/python3.4\nx\n").name)
+
+    def test_guess_lexer_fast_tries_lexers_with_matching_keywords(self):
+        code = (u"#include <stdio.h>\n"
+                u"int main(void) {\n    return 0;\n}\n")
+        self.assertEqual(u"C", guess_lexer_fast(code).name)
+        code = u"<!DOCTYPE html>\n<html><body></body></html>\n"
+        self.assertEqual(u"HTML", guess_lexer_fast(code).name)
+
+    def test_guess_lexer_fast_tries_markup_lexers_for_text_with_tags(self):
+        code = (u'<?xml version="1.0"?>\n'
+                u'<root>\n  <item a="1">x</item>\n</root>\n')
+        self.assertEqual(u"XML", guess_lexer_fast(code).name)
+        code = (u"<html><head><title>T</title></head>"
+                u"<body><p>x</p></body></html>\n")
+        self.assertEqual(guess_lexer(code).name, guess_lexer_fast(code).name)
+
+    def test_guess_lexer_fast_raises_class_not_found_without_match(self):
+        self.assertRaises(ClassNotFound, guess_lexer_fast, u"%% 1 %%")
+
+    def test_guess_lexer_fast_tries_other_lexers_within_time_limit(self):
+        code = u"#include <stdio.h>\n"
+        self.assertRaises(ClassNotFound, guess_lexer_fast, code,
+                          max_candidates=0)
+        self.assertRaises(ClassNotFound, guess_lexer_fast, code,
+                          max_candidates=0, time_limit=0)
+        self.assertEqual(u"C", guess_lexer_fast(code, max_candidates=0,
+                                                 time_limit=60).name)
+
+    # LexerCache
+    def test_lexer_cache_returns_same_lexer_for_same_language(self):
+        cache = LexerCache()
+        first       = cache.get("python")
+        second      = cache.get("Python")
+        self.assertIs(first, second)
+        self.assertEqual(dict(hits=1, misses=1, hit_rate=0.5, entries=1),
+                         cache.stats())
+
+    def test_lexer_cache_returns_other_lexer_for_other_options(self):
+        cache = LexerCache()
+        first       = cache.get("python")
+        second      = cache.get("python", stripnl=False)
+        self.assertIsNot(first, second)
+        self.assertFalse(second.stripnl)
+
+    def test_lexer_cache_remembers_unknown_language(self):
+        cache = LexerCache()
+        self.assertRaises(ValueError, cache.get, "no-such-language")
+        self.assertRaises(ValueError, cache.get, "no-such-language")
+        self.assertEqual(1, cache.hits)
+
+    def test_lexer_cache_returns_new_instance_of_stateful_lexer(self):
+        cache = LexerCache()
+        first       = cache.get("http")
+        second      = cache.get("http")
+        self.assertIsNot(first, second)
+
+    # CoalesceFilter
+    def test_coalesce_filter_merges_tokens_of_same_type(self):
+        tokens      = [(Error, u"$"), (Error, u"@"), (Text, u" "),
+                       (Text, u"\n"), (Error, u"$")]
+        result      = list(CoalesceFilter().filter(self.lexer, iter(tokens)))
+        self.assertEqual([(Error, u"$@"), (Text, u" \n"), (Error, u"$")],
+                         result)
+
+    def test_coalesce_filter_merges_long_runs_of_tokens(self):
+        tokens      = [(Error, u"$")] * 100000
+        for style in (None, "default"):
+            result  = list(CoalesceFilter(style=style).filter(self.lexer,
+                                                              iter(tokens)))
+            self.assertEqual([(Error, u"$" * 100000)], result)
+
+    def test_coalesce_filter_merges_tokens_of_same_style(self):
+        # Keyword.Constant has the style of Keyword in the default style
+        tokens      = [(Keyword, u"return"), (Text, u" "),
+                       (Keyword.Constant, u"None"), (Text, u" "),
+                       (Name, u"x"), (Text, u"\n")]
+        coalesce    = CoalesceFilter(style="default")
+        result      = list(coalesce.filter(self.lexer, iter(tokens)))
+        self.assertEqual([(Keyword, u"return None"), (Text, u" "),
+                          (Name, u"x\n")], result)
+
+    def test_coalesced_tokens_give_same_text_and_fewer_spans(self):
+        code = u"def f(x):\n    return lambda: x  # c\n" * 10
+        formatter   = HtmlFormatter(style="default", noclasses=True)
+        expected    = highlight(code, self.lexer, formatter)
+        lexer       = get_lexer_by_name("python")
+        lexer.add_filter("coalesce", style="default")
+        result      = highlight(code, lexer, formatter)
+        tag_re      = re.compile(u"<[^>]*>")
+        self.assertEqual(tag_re.sub(u"", expected), tag_re.sub(u"", result))
+        self.assertLess(result.count(u"<span"), expected.count(u"<span"))
+
+    def test_code_hilite_uses_rules_engine_by_default(self):
+        self.assertEqual("rules", CodeHilite(u"x").lexer_engine)
+
+    def test_code_hilite_coalesces_tokens_by_default(self):
+        code = u"return lambda: x"
+        expected    = CodeHilite(code, lang="python", noclasses=True,
+                                 coalesce_tokens=False).hilite()
+        result      = CodeHilite(code, lang="python", noclasses=True).hilite()
+        self.assertLess(len(result), len(expected))
+
+    def test_code_hilite_gives_same_html_when_highlighting_incrementally(self):
+        code = u"def f(x):\n    return x  # c\n" * 10
+        edited      = code.replace(u"return x", u"return 'x", 1)
+        for text in (code, edited, code):
+            for linenums in (False, True):
+                expected    = CodeHilite(text, lang="python", noclasses=True,
+                                         linenums=linenums,
+                                         incremental=False).hilite()
+                result      = CodeHilite(text, lang="python", noclasses=True,
+                                         linenums=linenums).hilite()
+                self.assertEqual(expected, result)
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+import sys
+if "/usr/share/anki/" not in sys.path:
+    sys.path.append("/usr/share/anki/")
+# the add-on imports Pygments as a top level package
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+from pygments import lexer
+from pygments.lexer import RegexLexer, words
+from pygments.lexers import get_lexer_by_name
+from pygments.regexcache import RegexCache
+from pygments.regexopt import regex_opt
+from pygments.token import Keyword, Name, Text
+
+
+class RegexCacheTester(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache = RegexCache(self.tmp_dir)
+        self.regex_cache = lexer.regex_cache
+
+    def tearDown(self):
+        lexer.regex_cache = self.regex_cache
+        shutil.rmtree(self.tmp_dir)
+
+    def make_lexer_class(self):
+        class TestLexer(RegexLexer):
+            tokens = {
+                'root': [
+                    (words(('if', 'else', 'while'), suffix=r'\b'), Keyword),
+                    (r'(?P<name>[a-z]+)', Name),
+                    (r'\s+', Text),
+                ],
+            }
+        return TestLexer
+
+    def test_compile_gives_same_pattern_as_re(self):
+        pattern = self.cache.compile(RegexCache, r"(?P<a>\w+)\s*=", re.M)
+        expected = re.compile(r"(?P<a>\w+)\s*=", re.M)
+        self.assertEqual(expected.pattern, pattern.pattern)
+        self.assertEqual(expected.flags, pattern.flags)
+        self.assertEqual(expected.groupindex, pattern.groupindex)
+        self.assertEqual(u"x", pattern.match(u"x = 1").group("a"))
+
+    def test_compile_optimizes_words(self):
+        pattern = self.cache.compile(RegexCache, words(("ab", "ac")), 0)
+        self.assertEqual(regex_opt(("ab", "ac")), pattern.pattern)
+
+    def test_stored_programs_are_used_by_new_cache(self):
+        self.cache.compile(RegexCache, r"a+b", 0)
+        self.assertTrue(self.cache.store(RegexCache))
+        self.assertFalse(self.cache.store(RegexCache))
+        cache = RegexCache(self.tmp_dir)
+        pattern = cache.compile(RegexCache, r"a+b", 0)
+        self.assertTrue(pattern.match(u"aab"))
+        self.assertEqual(dict(hits=1, misses=0, hit_rate=1.0, entries=1),
+                         cache.stats())
+
+    def test_programs_of_changed_module_are_not_used(self):
+        self.cache.compile(RegexCache, r"a+b", 0)
+        self.cache.store(RegexCache)
+        cache = RegexCache(self.tmp_dir)
+        cache.source_digest = lambda module_name: u"changed"
+        cache.compile(RegexCache, r"a+b", 0)
+        self.assertEqual(1, cache.misses)
+
+    def test_corrupted_file_is_ignored(self):
+        with open(self.cache.path(RegexCache.__module__), "wb") as f:
+            f.write(b"\x00garbage")
+        pattern = self.cache.compile(RegexCache, r"a+b", 0)
+        self.assertTrue(pattern.match(u"ab"))
+        self.assertTrue(self.cache.store(RegexCache))
+
+    def test_lexer_gives_same_tokens_with_cached_programs(self):
+        code = u"if x\nwhile y else z\n"
+        expected = list(self.make_lexer_class()().get_tokens(code))
+        lexer.regex_cache = self.cache
+        self.assertEqual(expected,
+                         list(self.make_lexer_class()().get_tokens(code)))
+        self.assertTrue(os.path.exists(self.cache.path(__name__)))
+        lexer.regex_cache = RegexCache(self.tmp_dir)
+        self.assertEqual(expected,
+                         list(self.make_lexer_class()().get_tokens(code)))
+        self.assertEqual(0, lexer.regex_cache.misses)
+
+    def test_builtin_lexer_gives_same_tokens_with_cached_programs(self):
+        code = u"def f(x):\n    return [y for y in x if y]  # c\n"
+        expected = list(get_lexer_by_name("python").get_tokens(code))
+        lexer.regex_cache = self.cache
+        python_lexer = type(get_lexer_by_name("python"))
+        del python_lexer._tokens
+        self.assertEqual(expected, list(python_lexer().get_tokens(code)))
+        lexer.regex_cache = RegexCache(self.tmp_dir)
+        del python_lexer._tokens
+        self.assertEqual(expected, list(python_lexer().get_tokens(code)))
+        self.assertEqual(0, lexer.regex_cache.misses)
+
+    def test_combined_engine_writes_file_once_per_text(self):
+        code = (u"def f(x):\n    '''doc'''\n"
+                u"    return 'a%s' % x  # c\nclass A(object):\n    pass\n")
+        writes = list()
+
+        class CountingCache(RegexCache):
+            def store(self, lexer_class):
+                written = RegexCache.store(self, lexer_class)
+                writes.append(written)
+                return written
+
+        lexer.regex_cache = CountingCache(self.tmp_dir)
+        python_lexer = type(get_lexer_by_name("python"))
+        del python_lexer._tokens
+        list(python_lexer(engine="combined").get_tokens(code))
+        # once for the rules, once for the states combined while lexing
+        self.assertEqual(2, writes.count(True))
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import sys
+if "/usr/share/anki/" not in sys.path:
+    sys.path.append("/usr/share/anki/")
+from power_format_pack.rendercache import RenderCache
+
+
+class RenderCacheTester(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = RenderCache(100)
+
+    # make_key
+    def test_make_key_throws_assertion_error_when_md_is_not_unicode(self):
+        self.assertRaises(AssertionError, RenderCache.make_key, "md", ())
+
+    def test_make_key_returns_same_key_for_same_md_and_prefs(self):
+        first       = RenderCache.make_key(u"пицца", (u"tango", False))
+        second      = RenderCache.make_key(u"пицца", (u"tango", False))
+        self.assertEqual(first, second)
+
+    def test_make_key_returns_different_key_when_prefs_differ(self):
+        first       = RenderCache.make_key(u"**a**", (u"tango", False))
+        second      = RenderCache.make_key(u"**a**", (u"tango", True))
+        self.assertNotEqual(first, second)
+
+    # get
+    def test_get_returns_none_and_counts_miss_when_key_is_unknown(self):
+        self.assertIsNone(self.cache.get(u"key"))
+        self.assertEqual(0, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+
+    def test_get_returns_value_and_counts_hit_when_key_is_stored(self):
+        self.cache.put(u"key", (u"<b>a</b>", u"**a**"))
+        expected    = (u"<b>a</b>", u"**a**")
+        result      = self.cache.get(u"key")
+        self.assertEqual(expected, result)
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(0, self.cache.misses)
+
+    # put
+    def test_put_removes_least_recently_used_entry_when_cache_is_full(self):
+        self.cache.put(u"a", (u"x" * 40,))
+        self.cache.put(u"b", (u"x" * 40,))
+        self.cache.get(u"a")
+        self.cache.put(u"c", (u"x" * 40,))
+        self.assertIsNone(self.cache.get(u"b"))
+        self.assertIsNotNone(self.cache.get(u"a"))
+        self.assertIsNotNone(self.cache.get(u"c"))
+        self.assertTrue(self.cache.size <= self.cache.max_size)
+
+    def test_put_does_not_store_value_that_is_larger_than_max_size(self):
+        self.cache.put(u"a", (u"x" * 200,))
+        self.assertIsNone(self.cache.get(u"a"))
+        self.assertEqual(0, self.cache.size)
+
+    def test_put_replaces_value_when_key_is_already_stored(self):
+        self.cache.put(u"a", (u"one",))
+        self.cache.put(u"a", (u"three",))
+        self.assertEqual((u"three",), self.cache.get(u"a"))
+        self.assertEqual(len(u"a") + len(u"three"), self.cache.size)
+
+    # save and load
+    def test_load_returns_entries_that_were_saved(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp_dir, "cache")
+            self.cache.put(u"a", (u"<p>пицца</p>", u"пицца"))
+            self.cache.save(path)
+            other = RenderCache(100)
+            self.assertTrue(other.load(path))
+            self.assertEqual((u"<p>пицца</p>", u"пицца"), other.get(u"a"))
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_load_returns_false_when_file_does_not_exist(self):
+        self.assertFalse(self.cache.load(u"/non/existing/path"))
+        self.assertEqual(0, self.cache.size)
+
+    def test_load_returns_false_when_file_has_other_version(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp_dir, "cache")
+            old = RenderCache(100, version=u"0.1")
+            old.put(u"a", (u"<p>a</p>", u"a"))
+            old.save(path)
+            self.assertFalse(self.cache.load(path))
+            self.assertIsNone(self.cache.get(u"a"))
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_load_returns_false_when_file_has_no_version(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp_dir, "cache")
+            with open(path, "w") as f:
+                f.write('[["a", "<p>a</p>", "a"]]')
+            self.assertFalse(self.cache.load(path))
+            self.assertIsNone(self.cache.get(u"a"))
+        finally:
+            shutil.rmtree(tmp_dir)
@@ -4,9 +4,12 @@ import re
 import base64
 import json
 import sys
+import zlib
 if "/usr/share/anki/" not in sys.path:
     sys.path.append("/usr/share/anki/")
 from power_format_pack import utility
+from power_format_pack import const
+from power_format_pack import preferences
 from power_format_pack.prefhelper import PrefHelper
 
 
@@ -210,6 +213,37 @@ def x[R](f: => R)
         self.assertEqual(expected, result)
         self.assertEqual(len(expected), len(result))
 
+    def test_replace_link_img_matches_replaces_link_outside_code_when_same_link_is_in_code(self):
+        image       = u"`[a](b c)` [a](b c)"
+        expected    = u"`[a](b c)` [a](b&#32;c)"
+        result = utility.replace_link_img_matches(self.whitespace_regex,
+                                                  "&#32;",
+                                                  image)
+        self.assertEqual(expected, result)
+
+    # escape_link_img_matches
+    def test_escape_link_img_matches_applies_substitutions_in_order(self):
+        image       = u"![i](a \\(1\\).jpg) `![i](a \\(1\\).jpg)`"
+        expected    = u"![i](a&#32;&#40;1&#41;.jpg) `![i](a \\(1\\).jpg)`"
+        result      = utility.escape_link_img_matches(
+                        image, ((self.left_paren_regex, u"&#40;"),
+                                (self.right_paren_regex, u"&#41;"),
+                                (self.whitespace_regex, u"&#32;")))
+        self.assertEqual(expected, result)
+
+    # get_code_spans
+    def test_get_code_spans_returns_start_and_end_of_inline_code_block(self):
+        s           = u"just `a` sentence"
+        expected    = [(5, 7)]
+        result      = utility.get_code_spans(s)
+        self.assertEqual(expected, result)
+
+    def test_get_code_spans_ignores_code_block_without_end(self):
+        s           = u"just `a sentence"
+        expected    = []
+        result      = utility.get_code_spans(s)
+        self.assertEqual(expected, result)
+
     # filter_indices
     def test_filter_indices_does_not_change_anything_when_no_overlap(self):
         positions1  = [[0, 20]]
@@ -721,11 +755,106 @@ def x[R](f: => R)
         result = utility.convert_clean_md_to_html(s, put_breaks=True)
         self.assertEqual(expected, result)
 
+    def test_convert_clean_md_to_html_returns_alternating_spaces_when_input_has_spaces_after_text(self):
+        s        = u"a   b    c"
+        expected = u"<div>a &nbsp; b &nbsp; &nbsp;c</div>"
+        result = utility.convert_clean_md_to_html(s)
+        self.assertEqual(expected, result)
+
+    def test_convert_clean_md_to_html_escapes_bare_ampersand_and_bracket(self):
+        s        = u"R& D -> &amp; &#39;"
+        expected = u"<div>R&amp; D -&gt; &amp; &#39;</div>"
+        result = utility.convert_clean_md_to_html(s)
+        self.assertEqual(expected, result)
+
+    def test_convert_clean_md_to_html_adds_semicolon_to_reference_without_semicolon(self):
+        s        = u"&nbsp\n&#39"
+        expected = u"<div><br /></div><div>&#39;</div>"
+        result = utility.convert_clean_md_to_html(s)
+        self.assertEqual(expected, result)
+
+    def test_convert_clean_md_to_html_keeps_tags_when_input_contains_html(self):
+        s        = u"<b>bold</b>\n\n"
+        expected = u"<div><b>bold</b></div><div><br /></div>"
+        result = utility.convert_clean_md_to_html(s, put_breaks=True)
+        self.assertEqual(expected, result)
+
+    def test_convert_clean_md_to_html_returns_same_html_as_html_parser(self):
+        s        = (u"  *a*  &lt;b&gt;\n\n\t\n &nbsp; \n&a.b & &foo;\n"
+                    u"    пицца > 1\n")
+        for put_breaks in (False, True):
+            expected = utility._convert_clean_md_to_html_with_soup(
+                    s, put_breaks=put_breaks)
+            result = utility.convert_clean_md_to_html(
+                    s, put_breaks=put_breaks)
+            self.assertEqual(expected, result)
+
     # convert_markdown_to_html
     def test_convert_markdown_to_html_throws_assertion_error_when_input_is_not_unicode(self):
         s           = ""
         self.assertRaises(AssertionError, utility.convert_markdown_to_html, s)
 
+    def test_convert_markdown_to_html_does_not_keep_abbreviations_of_previous_conversion(self):
+        preferences.PREFS = {const.MARKDOWN_SYNTAX_STYLE: "tango",
+                             const.MARKDOWN_LINE_NUMS: False}
+        utility.convert_markdown_to_html(u"HTML\n\n*[HTML]: Hyper Text")
+        expected    = u"<p>HTML</p>"
+        result      = utility.convert_markdown_to_html(u"HTML")
+        self.assertEqual(expected, result)
+
+    # render_many
+    def test_render_many_returns_empty_list_when_input_is_empty_list(self):
+        self.assertEqual([], utility.render_many([]))
+
+    def test_render_many_returns_html_in_same_order_as_input(self):
+        preferences.PREFS = {const.MARKDOWN_SYNTAX_STYLE: "tango",
+                             const.MARKDOWN_LINE_NUMS: False}
+        mds         = [u"**{}**".format(i) for i in xrange(200)]
+        expected    = [utility.convert_markdown_to_html(md) for md in mds]
+        result      = utility.render_many(mds, max_workers=2)
+        self.assertEqual(expected, result)
+
+    def test_init_render_worker_keeps_all_preferences_of_parent(self):
+        prefs       = {const.MARKDOWN_SYNTAX_STYLE: "tango",
+                       const.MARKDOWN_LINE_NUMS: False,
+                       u"other": 1}
+        utility._init_render_worker(dict(prefs))
+        self.assertEqual(prefs, preferences.PREFS)
+
+    # render_markdown
+    def test_render_markdown_returns_html_and_round_trip_markdown(self):
+        preferences.PREFS = {const.MARKDOWN_SYNTAX_STYLE: "tango",
+                             const.MARKDOWN_LINE_NUMS: False}
+        expected    = (u"<p><strong>text</strong></p>", u"**text**\n")
+        result      = utility.render_markdown(u"**text**")
+        self.assertEqual(expected, result)
+
+    def test_render_markdown_returns_cached_result_on_second_call(self):
+        preferences.PREFS = {const.MARKDOWN_SYNTAX_STYLE: "tango",
+                             const.MARKDOWN_LINE_NUMS: False}
+        first       = utility.render_markdown(u"*пицца*")
+        hits        = utility.RENDER_CACHE.hits
+        second      = utility.render_markdown(u"*пицца*")
+        self.assertIs(first, second)
+        self.assertEqual(hits + 1, utility.RENDER_CACHE.hits)
+
+    # get_markdown_converter
+    def test_get_markdown_converter_returns_same_instance_when_prefs_are_unchanged(self):
+        preferences.PREFS = {const.MARKDOWN_SYNTAX_STYLE: "tango",
+                             const.MARKDOWN_LINE_NUMS: False}
+        first       = utility.get_markdown_converter()
+        second      = utility.get_markdown_converter()
+        self.assertIs(first, second)
+
+    def test_get_markdown_converter_returns_new_instance_when_prefs_are_changed(self):
+        preferences.PREFS = {const.MARKDOWN_SYNTAX_STYLE: "tango",
+                             const.MARKDOWN_LINE_NUMS: False}
+        first       = utility.get_markdown_converter()
+        preferences.PREFS = {const.MARKDOWN_SYNTAX_STYLE: "monokai",
+                             const.MARKDOWN_LINE_NUMS: False}
+        second      = utility.get_markdown_converter()
+        self.assertIsNot(first, second)
+
 
     # get_md_data_from_string
     def test_get_md_data_from_string_throws_assertion_error_when_input_is_not_unicode(self):
@@ -810,19 +939,125 @@ def x[R](f: => R)
         result = utility.decompress_and_json_load(data)
         self.assertEqual(expected, result)
 
+    def test_decompress_and_json_load_returns_valid_json_when_data_is_compressed(self):
+        d           = dict(a=u"привет")
+        data        = unicode(base64.b64encode(
+                        "\x01" + zlib.compress(json.dumps(d))))
+        expected    = d
+        result = utility.decompress_and_json_load(data)
+        self.assertEqual(expected, result)
+
+    def test_decompress_and_json_load_returns_corrupted_when_compressed_data_is_invalid(self):
+        data        = unicode(base64.b64encode("\x01" + "not zlib"))
+        expected    = "corrupted"
+        result = utility.decompress_and_json_load(data)
+        self.assertEqual(expected, result)
+
     # json_dump_and_compress
     def test_json_dump_and_compress_returns_base64_string_when_input_is_dict(self):
         data        = dict(a="one")
-        expected    = unicode(base64.b64encode(json.dumps(data)))
+        expected    = unicode(base64.b64encode(
+                        "\x01" + zlib.compress(json.dumps(data), 9)))
         result      = utility.json_dump_and_compress(data)
         self.assertEqual(expected, result)
 
     def test_json_dump_and_compress_returns_base64_string_when_input_is_russian(self):
         data        = u"привет"
-        expected    = unicode(base64.b64encode(json.dumps(data)))
+        expected    = unicode(base64.b64encode(
+                        "\x01" + zlib.compress(json.dumps(data), 9)))
         result      = utility.json_dump_and_compress(data)
         self.assertEqual(expected, result)
 
+    def test_json_dump_and_compress_result_can_be_read_by_decompress_and_json_load(self):
+        data        = dict(md=u"**пицца**\n" * 100)
+        compressed  = utility.json_dump_and_compress(data)
+        self.assertEqual(data, utility.decompress_and_json_load(compressed))
+        self.assertTrue(len(compressed) < len(base64.b64encode(json.dumps(data))))
+
+    # compress_md_data
+    def test_compress_md_data_returns_same_string_when_input_contains_no_data(self):
+        s           = u"<div>text</div>"
+        self.assertEqual(s, utility.compress_md_data(s))
+
+    def test_compress_md_data_replaces_uncompressed_data_with_compressed_data(self):
+        d           = dict(id=u"1-000", md=u"**text**", isconverted=u"True")
+        s           = u"<p>text</p><!----SBAdata:{}---->".format(
+                        base64.b64encode(json.dumps(d)))
+        expected    = u"<p>text</p>" + utility.wrap_md_data(d)
+        result      = utility.compress_md_data(s)
+        self.assertEqual(expected, result)
+
+    def test_compress_md_data_adds_header_when_data_is_compressed_without_header(self):
+        d           = dict(id=u"1-000", md=u"**text**", isconverted=u"True")
+        s           = u"<p>text</p><!----SBAdata:{}---->".format(
+                        utility.json_dump_and_compress(d))
+        expected    = u"<p>text</p>" + utility.wrap_md_data(d)
+        result      = utility.compress_md_data(s)
+        self.assertEqual(expected, result)
+
+    def test_compress_md_data_returns_same_string_when_data_is_in_current_format(self):
+        s           = utility.make_data_ready_to_insert(
+                        "1-000", "True", u"text", u"<p>text</p>")
+        self.assertEqual(s, utility.compress_md_data(s))
+
+    # split_md_data
+    def test_split_md_data_returns_no_header_when_data_has_no_header(self):
+        expected    = (None, u"e30=")
+        result      = utility.split_md_data(u"e30=")
+        self.assertEqual(expected, result)
+
+    def test_split_md_data_returns_header_and_data_when_data_has_header(self):
+        expected    = (dict(isconverted=u"True", hash=u"372ea08cab33e71c"),
+                       u"e30=")
+        result      = utility.split_md_data(u"1:372ea08cab33e71c:e30=")
+        self.assertEqual(expected, result)
+
+    # get_md_data_key
+    def test_get_md_data_key_returns_header_values_when_data_has_header(self):
+        html        = (const.START_HTML_MARKER + u"1:372ea08cab33e71c:e30=" +
+                       const.END_HTML_MARKER)
+        expected    = (u"True", u"372ea08cab33e71c")
+        result      = utility.get_md_data_key(u"<p>text</p>" + html)
+        self.assertEqual(expected, result)
+
+    def test_get_md_data_key_returns_same_key_when_only_html_differs(self):
+        html        = (const.START_HTML_MARKER + u"1:372ea08cab33e71c:e30=" +
+                       const.END_HTML_MARKER)
+        self.assertEqual(utility.get_md_data_key(u"<p>a</p>" + html),
+                         utility.get_md_data_key(u"<p>b</p>" + html))
+
+    def test_get_md_data_key_returns_hash_when_data_has_no_header(self):
+        html        = const.START_HTML_MARKER + u"e30=" + const.END_HTML_MARKER
+        expected    = (None, utility.hash_text(u"e30="))
+        result      = utility.get_md_data_key(u"<p>a</p>" + html)
+        self.assertEqual(expected, result)
+
+    # hash_text
+    def test_hash_text_throws_assertion_error_when_text_is_not_unicode(self):
+        self.assertRaises(AssertionError, utility.hash_text, "text")
+
+    def test_hash_text_returns_different_hash_for_different_text(self):
+        self.assertEqual(utility.hash_text(u"пицца"),
+                         utility.hash_text(u"пицца"))
+        self.assertNotEqual(utility.hash_text(u"<b>a</b>"),
+                            utility.hash_text(u"<b>b</b>"))
+
+    # make_md_data_header
+    def test_make_md_data_header_returns_header_with_hash_of_markdown(self):
+        expected    = u"1:372ea08cab33e71c:"
+        result      = utility.make_md_data_header("True", u"text")
+        self.assertEqual(expected, result)
+
+    # decompress_and_json_load
+    def test_decompress_and_json_load_ignores_header(self):
+        d           = dict(a=u"one")
+        data        = u"1:372ea08cab33e71c:" + utility.json_dump_and_compress(d)
+        self.assertEqual(d, utility.decompress_and_json_load(data))
+
+    def test_compress_md_data_returns_same_string_when_data_is_corrupted(self):
+        s           = u"<p>text</p><!----SBAdata:randomtext---->"
+        self.assertEqual(s, utility.compress_md_data(s))
+
     # is_same_markdown
     def test_is_same_markdown_throws_assertion_error_when_input_is_not_unicode(self):
         s1      = ""
@@ -991,3 +1226,31 @@ is maintained by the W3C.
                        '<dt></dt><dd align="left">: </dd>\n<dd align="left">text</dd>\n</dl>'
         result      = utility.put_colons_in_html_def_list(s)
         self.assertEqual(expected, result)
+
+    def test_put_colons_in_html_def_list_puts_break_between_dd_and_dt_when_put_breaks_is_true(self):
+        s           = u'<dl><dt>a</dt><dd>one</dd><dt>b</dt><dd>two</dd></dl>'
+        expected    = u'<dl><dt>a</dt><dd>: one</dd><br /><dt>b</dt>' + \
+                       '<dd>: two</dd></dl>'
+        result      = utility.put_colons_in_html_def_list(s, put_breaks=True)
+        self.assertEqual(expected, result)
+
+    # align_html_elements
+    def test_align_html_elements_throws_assertion_error_when_input_is_not_unicode(self):
+        s           = "<ol><li>a</li></ol>"
+        self.assertRaises(AssertionError, utility.align_html_elements, s)
+
+    def test_align_html_elements_left_aligns_list_items(self):
+        s           = u"<ol><li>a</li></ol><dl><dt>b</dt><dd>c</dd></dl>"
+        expected    = u'<ol><li align="left">a</li></ol><dl>' + \
+                       '<dt align="left">b</dt><dd align="left">c</dd></dl>'
+        result      = utility.align_html_elements(s)
+        self.assertEqual(expected, result)
+
+    def test_align_html_elements_wraps_code_block_in_table_when_direction_is_not_left(self):
+        s           = u'<div class="codehilite"><pre>x</pre></div>'
+        expected    = u'<table class="codehilitetable" align="center">' + \
+                       '<tbody><tr><td><div class="codehilite" ' + \
+                       'align="left"><pre>x</pre></div></td></tr></tbody>' + \
+                       '</table>'
+        result      = utility.align_html_elements(s, u"center")
+        self.assertEqual(expected, result)
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import sys
+if "/usr/share/anki/" not in sys.path:
+    sys.path.append("/usr/share/anki/")
+from power_format_pack import utility
+from power_format_pack import const
+from power_format_pack import preferences
+from power_format_pack.prefhelper import PrefHelper
+from power_format_pack.warmup import MarkdownWarmUp
+
+
+class FakeTimer(object):
+    """
+    Collect the scheduled calls, instead of running them from an event loop.
+    """
+
+    def __init__(self):
+        self.calls = list()
+
+    def __call__(self, delay, callback):
+        self.calls.append((delay, callback))
+
+    def run_all(self):
+        while self.calls:
+            (_delay, callback) = self.calls.pop(0)
+            callback()
+
+
+class WarmUpTester(unittest.TestCase):
+
+    def setUp(self):
+        preferences.PREFS = PrefHelper.get_default_preferences()
+        self.timer = FakeTimer()
+        self.done = list()
+
+    def make_warm_up(self, steps):
+        return MarkdownWarmUp(steps, schedule=self.timer)
+
+    # start
+    def test_start_schedules_first_step_after_delay(self):
+        warm_up = self.make_warm_up(((u"a", lambda: self.done.append(u"a")),))
+        warm_up.start(delay=123)
+        self.assertEqual(123, self.timer.calls[0][0])
+        self.assertEqual([], self.done)
+
+    def test_start_does_nothing_when_already_started(self):
+        warm_up = self.make_warm_up(((u"a", lambda: self.done.append(u"a")),))
+        warm_up.start()
+        warm_up.start()
+        self.assertEqual(1, len(self.timer.calls))
+
+    # run_next_step
+    def test_run_next_step_runs_one_step_per_call(self):
+        warm_up = self.make_warm_up(((u"a", lambda: self.done.append(u"a")),
+                                     (u"b", lambda: self.done.append(u"b"))))
+        warm_up.start()
+        self.timer.calls.pop(0)[1]()
+        self.assertEqual([u"a"], self.done)
+        self.assertEqual(const.WARM_UP_STEP_INTERVAL, self.timer.calls[0][0])
+        self.timer.run_all()
+        self.assertEqual([u"a", u"b"], self.done)
+        self.assertTrue(warm_up.is_done)
+
+    def test_run_next_step_records_duration_of_each_step(self):
+        warm_up = self.make_warm_up(((u"a", lambda: None),
+                                     (u"b", lambda: None)))
+        warm_up.start()
+        self.timer.run_all()
+        self.assertEqual([u"a", u"b"], warm_up.durations.keys())
+        self.assertEqual(sum(warm_up.durations.values()), warm_up.total)
+
+    def test_run_next_step_continues_after_failing_step(self):
+        warm_up = self.make_warm_up(((u"a", lambda: 1 / 0),
+                                     (u"b", lambda: self.done.append(u"b"))))
+        warm_up.start()
+        self.timer.run_all()
+        self.assertEqual([u"b"], self.done)
+
+    def test_default_steps_prepare_markdown_rendering(self):
+        warm_up = MarkdownWarmUp(schedule=self.timer)
+        warm_up.start()
+        self.timer.run_all()
+        self.assertTrue(utility.markdown.is_loaded)
+        self.assertEqual([name for (name, _step) in MarkdownWarmUp.STEPS],
+                         warm_up.durations.keys())
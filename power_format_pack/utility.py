@@ -23,34 +23,54 @@ Utility module with helper functions that are needed throughout the addon.
 
 import base64
 import BeautifulSoup
+import bisect
+import hashlib
+import importlib
+import multiprocessing
 import re
 import string
+import threading
+import sys
 import time
-from power_format_pack.python_modules import ConfigParser
+import zlib
 import os
 
 from PyQt4 import QtGui
 from anki.utils import intTime, json, isMac
 from aqt.utils import isWin
 
-from html2text import html2text
-from html2text_overrides import escape_md_section_override
 import const
 import preferences
+from configcache import ConfigCache
+from lazyimport import LazyAttribute, LazyModule
 from prefhelper import PrefHelper
-
-import markdown
-from markdown.extensions import Extension
-from markdown.extensions.abbr import AbbrExtension
-from markdown.extensions.attr_list import AttrListExtension
-from markdown.extensions.codehilite import CodeHiliteExtension
-from markdown.extensions.def_list import DefListExtension
-from markdown.extensions.fenced_code import FencedCodeExtension
-from markdown.extensions.footnotes import FootnoteExtension
-from markdown.extensions.nl2br import Nl2BrExtension
-from markdown.extensions.sane_lists import SaneListExtension
-from markdown.extensions.smart_strong import SmartEmphasisExtension
-from markdown.extensions.tables import TableExtension
+from profiling import PROFILER
+from rendercache import RenderCache, RENDER_CACHE
+
+# Markdown, Pygments and html2text are only imported when they are first
+# used, because most sessions never convert any Markdown
+HTMLToMarkdown = LazyAttribute("htmltomarkdown", "HTMLToMarkdown", globals())
+markdown = LazyModule("markdown", globals())
+AbbrExtension = LazyAttribute("markdown.extensions.abbr",
+                              "AbbrExtension", globals())
+AttrListExtension = LazyAttribute("markdown.extensions.attr_list",
+                                  "AttrListExtension", globals())
+CodeHiliteExtension = LazyAttribute("markdown.extensions.codehilite",
+                                    "CodeHiliteExtension", globals())
+DefListExtension = LazyAttribute("markdown.extensions.def_list",
+                                 "DefListExtension", globals())
+FencedCodeExtension = LazyAttribute("markdown.extensions.fenced_code",
+                                    "FencedCodeExtension", globals())
+FootnoteExtension = LazyAttribute("markdown.extensions.footnotes",
+                                  "FootnoteExtension", globals())
+Nl2BrExtension = LazyAttribute("markdown.extensions.nl2br",
+                               "Nl2BrExtension", globals())
+SaneListExtension = LazyAttribute("markdown.extensions.sane_lists",
+                                  "SaneListExtension", globals())
+SmartEmphasisExtension = LazyAttribute("markdown.extensions.smart_strong",
+                                       "SmartEmphasisExtension", globals())
+TableExtension = LazyAttribute("markdown.extensions.tables",
+                               "TableExtension", globals())
 
 
 def validate_key_sequence(sequence, platform=u""):
@@ -165,6 +185,22 @@ def get_keybinding(keybindings, name_of_key):
     return string.capwords(keybinding, "+")
 
 
+# one HTMLToMarkdown instance per thread
+_html_to_markdown_converters = threading.local()
+
+
+def get_html_to_markdown_converter():
+    """
+    Return the HTMLToMarkdown instance that is shared by all conversions in
+    the current thread.
+    """
+    converter = getattr(_html_to_markdown_converters, "converter", None)
+    if converter is None:
+        converter = _html_to_markdown_converters.converter = HTMLToMarkdown()
+    return converter
+
+
+@PROFILER.profile
 def convert_html_to_markdown(org_html, keep_empty_lines=False):
     """
     Take an `org_html` string and return a Markdown string. Empty lines are
@@ -176,39 +212,15 @@ def convert_html_to_markdown(org_html, keep_empty_lines=False):
 
     assert isinstance(org_html, unicode), "Input `org_html` is not Unicode"
 
-    # disable the escaping of Markdown-sensitive characters
-    html2text.escape_md_section = escape_md_section_override
-    h = html2text.HTML2Text()
-    h.body_width = 0
-    md_text = h.handle(org_html)
-    clean_md = u""
-    if keep_empty_lines:
-        clean_md = md_text
-    else:
-        # remove white lines
-        for line in md_text.split(u"\n"):
-            if line:
-                clean_md += (line + u"\n")
-
-    # undo the html2text escaping of dots (which interferes
-    # with the creation of ordered lists)
-    dot_regex = re.compile(ur"(\d+)\\(\.\s)")
-    clean_md = re.sub(dot_regex, ur"\g<1>\g<2>", clean_md)
+    clean_md = get_html_to_markdown_converter().convert(
+            org_html, keep_empty_lines)
 
     # this is needed to keep inner parentheses and whitespace in links and
     # images from prematurely ending the Markdown syntax; e.g.
     # ![](image (1).jpg) would otherwise break on the whitespace in the
     # filename and the inner parentheses, so we change it to
     # ![](image&#32;&#40;1&#41;.jpg) to prevent this from happening
-    left_paren_regex = re.compile(ur"\\\(")
-    clean_md = replace_link_img_matches(
-            left_paren_regex, u"&#40;", clean_md)
-    right_paren_regex = re.compile(ur"\\\)")
-    clean_md = replace_link_img_matches(
-            right_paren_regex, u"&#41;", clean_md)
-    whitespace_regex = re.compile(ur"\s+")
-    clean_md = replace_link_img_matches(
-            whitespace_regex, u"&#32;", clean_md)
+    clean_md = escape_link_img_matches(clean_md, const.LINK_IMG_ESCAPES)
 
     assert isinstance(clean_md, unicode)
     return clean_md
@@ -260,6 +272,20 @@ def filter_indices(positions1, positions3):
     return None
 
 
+def get_code_spans(s):
+    """
+    Return a sorted list of tuples with the start and end positions of the
+    (inline) code blocks in `s`.
+    >>> get_code_spans(u"just `a` sentence")
+    [(5, 7)]
+    """
+    positions1 = get_indices(s, "`")
+    positions3 = get_indices(s, "```")
+    filter_indices(positions1, positions3)
+    return sorted((start, end) for (start, end) in positions1 + positions3
+                  if start > -1 and end > -1)
+
+
 def replace_link_img_matches(regex, new, s):
     """
     Escape characters in Markdown links and images that may break in
@@ -269,40 +295,76 @@ def replace_link_img_matches(regex, new, s):
                                  u"[](i .jpg)")
     u'[](i&#32;.jpg)'
     """
+    return escape_link_img_matches(s, ((regex, new),))
+
+
+def escape_link_img_matches(s, substitutions):
+    """
+    Apply the tuples (regex, replacement) in `substitutions` in turn to
+    every Markdown link and image in `s` that is not inside a (inline) code
+    block. The string is only walked once, however many links it contains.
+    """
 
     assert isinstance(s, unicode), "Input `s` is not Unicode"
 
     # don't escape anything when we're in a (inline) code block
-    positions1 = get_indices(s, "`")
-    positions3 = get_indices(s, "```")
-    filter_indices(positions1, positions3)
-    positions_combined = filter(lambda x: x[0] > -1 and x[1] > -1,
-                                positions1 + positions3)
-
-    result = re.finditer(const.IS_LINK_OR_IMG_REGEX, s)
-    if result:
-        for match in result:
-            # see if match is inside a code block
-            skip = False
-            start_match, end_match = match.span()
-            for (start_code, end_code) in positions_combined:
-                if start_match >= start_code and end_match <= end_code:
-                    skip = True
-                    break
-
-            if not skip:
-                str_to_be_replaced = match.group(0)
-                start = s.find(str_to_be_replaced)
-                end   = start + len(str_to_be_replaced)
-                replacement = re.sub(regex, new, str_to_be_replaced)
-                # put string back in original string
-                str_start = s[:start]
-                str_end = s[end:]
-                s = str_start + replacement + str_end
+    code_spans = get_code_spans(s)
+    code_starts = [start for (start, _) in code_spans]
+    # the furthest end of the code blocks that start at or before index i
+    max_code_ends = list()
+    max_code_end = -1
+    for (_, end) in code_spans:
+        max_code_end = max(max_code_end, end)
+        max_code_ends.append(max_code_end)
+
+    result = list()
+    last_end = 0
+    for match in const.IS_LINK_OR_IMG_REGEX.finditer(s):
+        start_match, end_match = match.span()
+        # see if match is inside a code block
+        index = bisect.bisect_right(code_starts, start_match) - 1
+        if index >= 0 and max_code_ends[index] >= end_match:
+            continue
+        replacement = match.group(0)
+        for (regex, new) in substitutions:
+            replacement = regex.sub(new, replacement)
+        result.append(s[last_end:start_match])
+        result.append(replacement)
+        last_end = end_match
+    result.append(s[last_end:])
+
+    s = u"".join(result)
     assert isinstance(s, unicode), "Result `s` is not Unicode"
     return s
 
 
+def _replace_space_run(match):
+    """
+    Return the HTML for a run of spaces: alternating non-breaking spaces and
+    spaces, starting with a non-breaking space at the beginning of a line.
+    """
+    num = match.end() - match.start()
+    if match.start() == 0:
+        pair = u"&nbsp; "
+        last = u"&nbsp;"
+    else:
+        pair = u" &nbsp;"
+        last = u" "
+    return pair * (num // 2) + (last if num % 2 else u"")
+
+
+def _replace_sgml_reference(match):
+    # references always end with a semicolon after parsing
+    if match.group(1) is not None:
+        return u"&#" + match.group(1) + u";"
+    return u"&" + match.group(2) + u";"
+
+
+def _escape_bare_char(match):
+    return {u"<": u"&lt;", u">": u"&gt;"}.get(match.group(0), u"&amp;")
+
+
+@PROFILER.profile
 def convert_clean_md_to_html(md, put_breaks=False):
     """
     Convert a string containing Markdown syntax to a string with HTML that
@@ -311,6 +373,38 @@ def convert_clean_md_to_html(md, put_breaks=False):
 
     assert isinstance(md, unicode), "Input `md` is not Unicode"
 
+    if u"<" in md:
+        # tags in the Markdown need a real HTML parser
+        return _convert_clean_md_to_html_with_soup(md, put_breaks)
+
+    lines = md.split(u"\n")
+    # a trailing newline doesn't start a new line
+    if lines[-1] == u"":
+        lines.pop()
+    result = list()
+    for line in lines:
+        line = const.SPACE_RUN_REGEX.sub(_replace_space_run, line)
+        # the text as it is read by BeautifulSoup
+        line = const.SGML_REFERENCE_REGEX.sub(_replace_sgml_reference, line)
+        # <div></div> needs to be a visible empty line, and lines that
+        # consist solely of (non-breakable) spaces are removed
+        if ((line or put_breaks) and
+                all(x == u"&nbsp;" for x in line.split())):
+            line = u"<br />"
+        else:
+            line = const.BARE_AMPERSAND_OR_BRACKET_REGEX.sub(
+                    _escape_bare_char, line)
+        result.append(u"<div>")
+        result.append(line)
+        result.append(u"</div>")
+    return u"".join(result)
+
+
+def _convert_clean_md_to_html_with_soup(md, put_breaks=False):
+    """
+    Convert a string containing Markdown syntax that may contain HTML tags
+    to a string with HTML that Anki expects.
+    """
     result = u"<div>"
     location_last_nbsp = -999999999  # take an unlike large previous occurence
     last_char = u""
@@ -357,6 +451,67 @@ def convert_clean_md_to_html(md, put_breaks=False):
     return result
 
 
+# `markdown.Markdown` instances, keyed by the preferences that affect the
+# generated HTML
+_markdown_converters = dict()
+
+
+def get_render_prefs():
+    """
+    Return a tuple with the preferences that affect the HTML generated from
+    Markdown.
+    """
+    return (preferences.PREFS.get(const.MARKDOWN_SYNTAX_STYLE),
+            preferences.PREFS.get(const.MARKDOWN_LINE_NUMS))
+
+
+def enable_regex_cache():
+    """
+    Let Pygments keep the compiled regular expressions of its lexers in the
+    add-on folder, so that the first code block of a language doesn't have
+    to compile them again in the next sessions.
+    """
+    # Pygments is imported as a top level package by the codehilite
+    # extension, so it must not be imported relative to this module
+    lexer = importlib.import_module("pygments.lexer")
+    if lexer.regex_cache is None:
+        regexcache = importlib.import_module("pygments.regexcache")
+        lexer.regex_cache = regexcache.RegexCache(
+                PrefHelper.get_regex_cache_path())
+
+
+def get_markdown_converter():
+    """
+    Return a `markdown.Markdown` instance configured with the current
+    preferences. An instance is only built the first time a combination of
+    preferences is seen; after that, the same instance is returned.
+    """
+    key = get_render_prefs()
+    (syntax_style, line_nums) = key
+    converter = _markdown_converters.get(key)
+    if converter is None:
+        converter = markdown.Markdown(output_format="xhtml1",
+            extensions=[
+                SmartEmphasisExtension(),
+                FencedCodeExtension(),
+                FootnoteExtension(),
+                AttrListExtension(),
+                DefListExtension(),
+                TableExtension(),
+                AbbrExtension(),
+                Nl2BrExtension(),
+                CodeHiliteExtension(
+                    noclasses=True,
+                    pygments_style=syntax_style,
+                    linenums=line_nums),
+                SaneListExtension()
+            ], lazy_ol=False)
+        _markdown_converters[key] = converter
+        enable_regex_cache()
+    return converter
+
+
+@PROFILER.profile
 def convert_markdown_to_html(clean_md):
     """
     Take a string `clean_md` and return a string where the Markdown syntax is
@@ -365,28 +520,100 @@ def convert_markdown_to_html(clean_md):
 
     assert isinstance(clean_md, unicode), "Input `clean_md` is not Unicode"
 
-    new_html = markdown.markdown(clean_md, output_format="xhtml1",
-        extensions=[
-            SmartEmphasisExtension(),
-            FencedCodeExtension(),
-            FootnoteExtension(),
-            AttrListExtension(),
-            DefListExtension(),
-            TableExtension(),
-            AbbrExtension(),
-            Nl2BrExtension(),
-            CodeHiliteExtension(
-                noclasses=True,
-                pygments_style=preferences.PREFS.get(const.MARKDOWN_SYNTAX_STYLE),
-                linenums=preferences.PREFS.get(const.MARKDOWN_LINE_NUMS)),
-            SaneListExtension()
-        ], lazy_ol=False)
+    # clear the state (footnotes, abbreviations, etc.) of the last conversion
+    converter = get_markdown_converter().reset()
+    new_html = converter.convert(clean_md)
 
     assert isinstance(new_html, unicode)
 
     return new_html
 
 
+def _init_render_worker(prefs):
+    """
+    Prepare a worker process of `iter_render_many` for rendering Markdown
+    with the preferences `prefs` of the parent process.
+    """
+    preferences.PREFS = prefs
+    # build the converter (and import Pygments) once per worker
+    get_markdown_converter()
+
+
+def _render_worker(md):
+    return convert_markdown_to_html(md)
+
+
+def iter_render_many(mds, max_workers=None):
+    """
+    Generator that yields the HTML for each of the Markdown strings in the
+    list `mds`, in the same order. Large lists are rendered by a pool of at
+    most `max_workers` processes (default: the number of CPUs) on Linux;
+    small lists, or other platforms, are rendered in this process.
+    """
+    pool = None
+    num_workers = 1
+    # Windows cannot fork: it would start a new instance of Anki instead;
+    # on OS X, forking the running Qt application without exec is unsafe
+    if (len(mds) >= const.RENDER_POOL_MIN_BATCH_SIZE and
+            sys.platform.startswith("linux")):
+        try:
+            num_workers = max_workers or multiprocessing.cpu_count()
+        except NotImplementedError:
+            num_workers = 1
+        num_workers = min(num_workers,
+                          len(mds) // const.RENDER_POOL_MIN_BATCH_SIZE)
+    if num_workers > 1:
+        try:
+            pool = multiprocessing.Pool(num_workers, _init_render_worker,
+                                        (dict(preferences.PREFS),))
+        except (OSError, ImportError) as e:
+            print e  # TODO: log error
+
+    if pool is None:
+        for md in mds:
+            yield convert_markdown_to_html(md)
+        return
+
+    chunksize = max(1, min(len(mds) // (num_workers * 4),
+                           const.RENDER_POOL_MAX_CHUNK_SIZE))
+    try:
+        for html in pool.imap(_render_worker, mds, chunksize):
+            yield html
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def render_many(mds, max_workers=None):
+    """
+    Return a list with the HTML for each of the Markdown strings in `mds`.
+    See `iter_render_many`.
+    """
+    return list(iter_render_many(mds, max_workers))
+
+
+@PROFILER.profile
+def render_markdown(md):
+    """
+    Return a tuple with the HTML that is created from the Markdown `md`, and
+    the Markdown that results from converting that HTML back again. Results
+    are cached, so rendering the same Markdown twice is cheap.
+    """
+
+    assert isinstance(md, unicode), "Input `md` is not Unicode"
+
+    key = RenderCache.make_key(md, get_render_prefs())
+    result = RENDER_CACHE.get(key)
+    if result is None:
+        html = convert_markdown_to_html(md)
+        round_trip_md = convert_html_to_markdown(
+                put_colons_in_html_def_list(html))
+        result = (html, round_trip_md)
+        RENDER_CACHE.put(key, result)
+
+    return result
+
+
 def is_same_html(html_one, html_two):
     """
     Return `True` when `html_one` is the same as `html_two`, `False` otherwise.
@@ -456,18 +683,22 @@ def merge_dicts(existing, new):
 
 def json_dump_and_compress(data):
     """
-    Take a string `data` and JSONify it. Return the resultant string, encoded
-    in base64.
+    Take a string `data`, JSONify it and compress it with zlib. Return the
+    resultant string, prefixed with the format byte and encoded in base64.
     """
 
-    ret = unicode(base64.b64encode(json.dumps(data)))
+    compressed = zlib.compress(json.dumps(data), 9)
+    ret = unicode(base64.b64encode(const.MD_DATA_FORMAT_ZLIB + compressed))
     assert isinstance(ret, unicode), "Output `ret` is not Unicode"
     return ret
 
 
+@PROFILER.profile
 def decompress_and_json_load(data):
     """
     Decode a base64-encoded string and return a string that is valid JSON.
+    Both the compressed format and the older, uncompressed base64-encoded
+    JSON are accepted.
     """
 
     if not data:
@@ -475,6 +706,8 @@ def decompress_and_json_load(data):
 
     assert isinstance(data, unicode), "Input `data` is not Unicode"
 
+    (_header, data) = split_md_data(data)
+
     try:
         b64data = base64.b64decode(data)
     except (TypeError, UnicodeEncodeError) as e:
@@ -482,6 +715,13 @@ def decompress_and_json_load(data):
         print e  # TODO: should be logged
         return "corrupted"
 
+    if b64data.startswith(const.MD_DATA_FORMAT_ZLIB):
+        try:
+            b64data = zlib.decompress(b64data[len(const.MD_DATA_FORMAT_ZLIB):])
+        except zlib.error as e:
+            print e  # TODO: should be logged
+            return "corrupted"
+
     try:
         ret = json.loads(b64data)
         return ret
@@ -509,16 +749,77 @@ def append_data_to_string(html, wrapped_compr_data):
     return html + wrapped_compr_data
 
 
+def hash_text(text):
+    """
+    Return a short hash of the string `text`.
+    """
+    assert isinstance(text, unicode), "Input `text` is not Unicode"
+    return unicode(hashlib.sha1(text.encode("utf8")).hexdigest()[:16])
+
+
+def make_md_data_header(isconverted, md):
+    """
+    Return the header that precedes the compressed Markdown data. It
+    contains the information that is needed when a field gains focus, so
+    that the data itself only has to be decoded when the Markdown is used.
+    >>> make_md_data_header("True", u"text")
+    u'1:372ea08cab33e71c:'
+    """
+    sep = const.MD_DATA_HEADER_SEPARATOR
+    return u"{}{}{}{}".format(u"1" if isconverted else u"0", sep,
+                              hash_text(md), sep)
+
+
+def split_md_data(compr_str):
+    """
+    Split the string `compr_str` that was extracted from a field into a
+    header and the compressed data. Return a tuple with a dictionary that
+    contains the header values (`None` if there is no header) and the
+    compressed data.
+    """
+    parts = compr_str.split(const.MD_DATA_HEADER_SEPARATOR, 2)
+    if len(parts) != 3:
+        return (None, compr_str)
+    (isconverted, md_hash, data) = parts
+    header = dict(isconverted=u"True" if isconverted == u"1" else False,
+                  hash=md_hash)
+    return (header, data)
+
+
+def get_md_data_key(html):
+    """
+    Return a key that identifies the Markdown data in the field `html` and
+    whether it was converted, read from the header of the data without
+    decoding it. Data in an older format without a header is identified by
+    a hash of all of it.
+    """
+    compr_str = get_md_data_from_string(html)
+    (header, _data) = split_md_data(compr_str)
+    if header is None:
+        return (None, hash_text(compr_str))
+    return (header.get("isconverted"), header.get("hash"))
+
+
+def wrap_md_data(md_dict):
+    """
+    Return a string with the header and the compressed Markdown data
+    `md_dict`, wrapped in the markers.
+    """
+    header = make_md_data_header(md_dict.get("isconverted"),
+                                 md_dict.get("md"))
+    return wrap_string(const.START_HTML_MARKER,
+                       header + json_dump_and_compress(md_dict),
+                       const.END_HTML_MARKER)
+
+
+@PROFILER.profile
 def make_data_ready_to_insert(unique_id, isconverted, md, html):
     md_dict = put_md_data_in_json_format(
             unique_id, isconverted, md)
-    md_dict_compr = json_dump_and_compress(md_dict)
-    wrapped_md_dict_compr = wrap_string(const.START_HTML_MARKER,
-                                        md_dict_compr,
-                                        const.END_HTML_MARKER)
-    return append_data_to_string(html, wrapped_md_dict_compr)
+    return append_data_to_string(html, wrap_md_data(md_dict))
 
 
+@PROFILER.profile
 def get_md_data_from_string(html):
     """
     Read a string `html` and extract compressed Markdown data from it, if
@@ -538,6 +839,28 @@ def get_md_data_from_string(html):
     return compr_str
 
 
+def compress_md_data(html):
+    """
+    Return a string `html` in which Markdown data that is stored in an older
+    format (uncompressed, or without a header) is replaced by the same data
+    in the current format. If there is no such data, `html` is returned
+    unchanged.
+    """
+    compr_str = get_md_data_from_string(html)
+    if not compr_str:
+        return html
+    (header, _data) = split_md_data(compr_str)
+    if header is not None:
+        return html
+    md_dict = decompress_and_json_load(compr_str)
+    if not md_dict or md_dict == "corrupted" or not isinstance(md_dict, dict):
+        return html
+    old_data = wrap_string(const.START_HTML_MARKER,
+                           compr_str,
+                           const.END_HTML_MARKER)
+    return html.replace(old_data, wrap_md_data(md_dict), 1)
+
+
 def counter(start=0, step=1):
     """
     Generator that creates infinite numbers.
@@ -548,6 +871,7 @@ def counter(start=0, step=1):
         num += step
 
 
+@PROFILER.profile
 def escape_html_chars(s):
     """
     Escape HTML characters in a string. Return a safe string.
@@ -596,10 +920,9 @@ def check_size_heading(s):
     """
     assert isinstance(s, unicode), "Input is not Unicode"
     # HTML headers go from <h1> to <h6>
-    regex = re.compile(ur"^(#{1,6})")
     s = s.strip()
     if s.startswith(u"#"):
-        size_heading = len(regex.match(s).group(1))
+        size_heading = len(const.HEADING_HASHES_REGEX.match(s).group(1))
         return size_heading
     else:
         return -1
@@ -634,6 +957,7 @@ def create_horizontal_rule():
     return frame
 
 
+@PROFILER.profile
 def unescape_html(html):
     return const.HTML_PARSER.unescape(html)
 
@@ -657,6 +981,7 @@ def end_safe_block(hashmap):
     hashmap[u"safe_block"] = False
 
 
+@PROFILER.profile
 def remove_whitespace_before_abbreviation_definition(md):
     """
     Remove the two leading spaces that are put by `html2text` when it
@@ -665,10 +990,10 @@ def remove_whitespace_before_abbreviation_definition(md):
     if not md:
         return md
     assert isinstance(md, unicode), "Input `md` is not Unicode"
-    regex = re.compile(r"( |\&nbsp;)+(\*\[.*?\]:)")
-    return re.sub(regex, r"\2", md)
+    return const.ABBR_DEFINITION_WHITESPACE_REGEX.sub(r"\2", md)
 
 
+@PROFILER.profile
 def remove_leading_whitespace_from_dd_element(md, add_newline=False):
     """
     Change the input `md` to make sure it will transform to the correct HTML.
@@ -677,17 +1002,19 @@ def remove_leading_whitespace_from_dd_element(md, add_newline=False):
         return md
     assert isinstance(md, unicode), "Input `md` is not Unicode"
     markdown = md
-    regex = re.compile(r"(\n) {4}(: .*?\n)")
-    result = re.findall(regex, markdown)
+    regex = const.INDENTED_DD_REGEX
+    result = regex.findall(markdown)
     replacement = r"\1\2\n" if add_newline else r"\1\2"
-    markdown = re.sub(regex, replacement, markdown, count=(len(result)-1))
-    markdown = re.sub(regex, r"\1\2", markdown)
+    markdown = regex.sub(replacement, markdown, count=(len(result)-1))
+    markdown = regex.sub(r"\1\2", markdown)
     return markdown
 
 
-def put_colons_in_html_def_list(html):
+@PROFILER.profile
+def put_colons_in_html_def_list(html, put_breaks=False):
     """
-    Insert colons as the first child of a `<dd>` tag.
+    Insert colons as the first child of a `<dd>` tag. When `put_breaks` is
+    `True`, also insert a `<br>` between a `<dd>` and a following `<dt>`.
     """
     assert isinstance(html, unicode), "Input `html` is not Unicode"
     if not html:
@@ -702,6 +1029,51 @@ def put_colons_in_html_def_list(html):
         if (prevSib is None or prevSib.name != u"dt"):
             continue
         dd.insert(0, u": ")
+        if put_breaks:
+            nextSib = dd.nextSibling
+            while unicode(nextSib) == u"\n":
+                nextSib = nextSib.nextSibling
+            if nextSib is not None and getattr(nextSib, "name", None) == u"dt":
+                parent = dd.parent
+                parent.insert(parent.contents.index(dd) + 1,
+                              BeautifulSoup.Tag(soup, u"br"))
+    return unicode(soup)
+
+
+@PROFILER.profile
+def align_html_elements(html, code_direction=const.LEFT):
+    """
+    Left align the footnotes, lists and code blocks in `html`, and align
+    the code blocks themselves according to `code_direction`. This does the
+    same as `Markdowner.align_elements` without the need for an editor.
+    """
+    assert isinstance(html, unicode), "Input `html` is not Unicode"
+    if not html:
+        return html
+    soup = BeautifulSoup.BeautifulSoup(html)
+    for code_block in soup.findAll(attrs={"class": "codehilite"}):
+        code_block["align"] = const.LEFT
+        if code_direction != const.LEFT:
+            table = BeautifulSoup.Tag(soup, "table",
+                                      [("class", "codehilitetable"),
+                                       ("align", code_direction)])
+            tbody = BeautifulSoup.Tag(soup, "tbody")
+            tr = BeautifulSoup.Tag(soup, "tr")
+            td = BeautifulSoup.Tag(soup, "td")
+            parent = code_block.parent
+            index = parent.contents.index(code_block)
+            code_block.extract()
+            parent.insert(index, table)
+            table.insert(0, tbody)
+            tbody.insert(0, tr)
+            tr.insert(0, td)
+            td.insert(0, code_block)
+    for footnote in soup.findAll(id=const.FOOTNOTE_ID_REGEX):
+        first_child = footnote.findChild(recursive=False)
+        if first_child is not None:
+            first_child["align"] = const.LEFT
+    for elem in soup.findAll(["dt", "dd", "li"]):
+        elem["align"] = const.LEFT
     return unicode(soup)
 
 
@@ -744,18 +1116,21 @@ def downArrow():
     return u"▾"
 
 
-def get_config_parser(path=None):
+_configs = dict()
+
+
+def get_config(path=None):
     """
-    Return a RawConfigParser for the specified path.
+    Return the process-wide ConfigCache for the specified path, which
+    defaults to the config file of the add-on.
     """
     if path is None:
         path = os.path.join(PrefHelper.get_addons_folder(),
                             const.FOLDER_NAME,
                             const.CONFIG_FILENAME)
-    config = ConfigParser.ConfigParser()
-    ret = config.read(path)
-    if not ret:
-        raise Exception("Could not read config file {!r}".format(path))
+    config = _configs.get(path)
+    if config is None:
+        config = _configs[path] = ConfigCache(path)
     return config
 
 
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2014-2016 Stefan van den Akker <srvandenakker.dev@gmail.com>
+#
+# This file is part of Power Format Pack.
+#
+# Power Format Pack is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# Power Format Pack is distributed in the hope that it will be
+# useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General
+# Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Power Format Pack. If not, see http://www.gnu.org/licenses/.
+
+"""
+Import and set up everything that is needed to render Markdown in the
+background, so that the first Markdown toggle doesn't have to.
+"""
+
+import collections
+import importlib
+
+from PyQt4 import QtCore
+
+import utility
+import const
+import preferences
+from profiling import PROFILER, monotonic
+
+
+def import_extensions():
+    """
+    Import the Markdown extensions, except for codehilite, which imports
+    Pygments and takes a step of its own. It has to come before this one,
+    because fenced_code uses it.
+    """
+    for extension in (utility.AbbrExtension,
+                      utility.AttrListExtension,
+                      utility.DefListExtension,
+                      utility.FencedCodeExtension,
+                      utility.FootnoteExtension,
+                      utility.Nl2BrExtension,
+                      utility.SaneListExtension,
+                      utility.SmartEmphasisExtension,
+                      utility.TableExtension):
+        extension.resolve()
+
+
+def import_syntax_style():
+    """
+    Import the Pygments style that is used to highlight code, and build the
+    stylesheet tables that the HTML formatters share.
+    """
+    # Pygments is imported as a top level package by the codehilite
+    # extension, so it must not be imported relative to this module
+    formatters = importlib.import_module("pygments.formatters")
+    formatters.HtmlFormatter(
+            style=preferences.PREFS.get(const.MARKDOWN_SYNTAX_STYLE),
+            noclasses=True)
+
+
+def prepare_lexer_guess():
+    """
+    Load the keyword fingerprints of the Pygments lexers, and the lexers
+    that are tried for a bit of code, as guessing the language of a code
+    block without one does.
+    """
+    lexers = importlib.import_module("pygments.lexers")
+    lexers.guess_lexer_fast(const.WARM_UP_CODE)
+
+
+def render_sample():
+    utility.convert_markdown_to_html(const.WARM_UP_MARKDOWN)
+
+
+class MarkdownWarmUp(object):
+    """
+    Run the steps of the warm-up one at a time, each in its own call from
+    the Qt event loop, so that the UI stays responsive in between. The time
+    each step took is kept in `durations`.
+    """
+
+    STEPS = ((u"markdown", utility.markdown.load),
+             (u"codehilite", utility.CodeHiliteExtension.resolve),
+             (u"extensions", import_extensions),
+             (u"converter", utility.get_markdown_converter),
+             (u"syntax_style", import_syntax_style),
+             (u"lexer_guess", prepare_lexer_guess),
+             (u"html_to_markdown", utility.get_html_to_markdown_converter),
+             (u"render", render_sample))
+
+    def __init__(self, steps=STEPS, schedule=QtCore.QTimer.singleShot):
+        self.schedule   = schedule
+        self.steps      = collections.deque(steps)
+        self.durations  = collections.OrderedDict()
+        self.started    = False
+
+    @property
+    def is_done(self):
+        return self.started and not self.steps
+
+    @property
+    def total(self):
+        """
+        Number of seconds the steps took, not counting the time between
+        them.
+        """
+        return sum(self.durations.itervalues())
+
+    def start(self, delay=const.WARM_UP_DELAY):
+        if self.started:
+            return
+        self.started = True
+        self.schedule(delay, self.run_next_step)
+
+    def run_next_step(self):
+        if not self.steps:
+            return
+        (name, step) = self.steps.popleft()
+        start = monotonic()
+        try:
+            with PROFILER.stage(u"warmup." + name):
+                step()
+        except Exception as e:
+            print e  # TODO: log error
+        self.durations[name] = monotonic() - start
+        if self.steps:
+            self.schedule(const.WARM_UP_STEP_INTERVAL, self.run_next_step)
+
+
+WARM_UP = MarkdownWarmUp()